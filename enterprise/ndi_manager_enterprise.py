@@ -7,12 +7,12 @@ import time
 import logging
 import threading
 from collections import deque
-from typing import Optional, Callable, Dict, Any, List
-from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any, List, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
 
-from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QMutexLocker, QWaitCondition
+from PyQt6.QtCore import QObject, pyqtSignal, QThread
 from PyQt6.QtGui import QImage
 
 try:
@@ -20,6 +20,11 @@ try:
 except ImportError:
     ndi = None
     
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+    
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +37,18 @@ class FrameQuality(Enum):
     PREVIEW = "preview"    # 360p max
 
 
+QUALITY_ORDER = [FrameQuality.FULL, FrameQuality.HIGH, 
+                 FrameQuality.MEDIUM, FrameQuality.LOW, FrameQuality.PREVIEW]
+
+QUALITY_LIMITS = {
+    FrameQuality.FULL: None,
+    FrameQuality.HIGH: (1920, 1080),
+    FrameQuality.MEDIUM: (1280, 720),
+    FrameQuality.LOW: (854, 480),
+    FrameQuality.PREVIEW: (640, 360)
+}
+
+
 @dataclass
 class NDIFrame:
     """Lightweight frame wrapper to minimize copying"""
@@ -41,66 +58,334 @@ class NDIFrame:
     height: int
     frame_number: int
     quality: FrameQuality = FrameQuality.FULL
+    _on_release: Optional[Callable[[], None]] = field(default=None, repr=False, compare=False)
     
     def release(self):
-        """Explicitly release frame data"""
+        """Explicitly release frame data (hands a ring slot back to the producer)"""
         self.data = None
+        on_release, self._on_release = self._on_release, None
+        if on_release:
+            on_release()
 
 
-class FrameBuffer:
+class FrameRing:
     """
-    Thread-safe ring buffer for frames
-    Implements zero-copy semantics where possible
+    Lock-free single-producer/single-consumer ring of preallocated frame slots
+    
+    The worker thread is the only producer: it copies each SDK frame into the
+    slot at write_seq and publishes it by advancing write_seq. The GUI thread
+    is the only consumer: it reads the slot at read_seq and hands it back by
+    advancing read_seq. Each counter has a single writer and an int attribute
+    store is atomic, so push/pop never take a lock. The producer only writes
+    a slot while write_seq - read_seq < capacity, i.e. after the consumer has
+    released it, and publishes only after the copy is complete.
+    
+    When the ring is full the incoming frame is dropped instead of overwriting
+    a slot the consumer may be reading. Slot storage is reallocated only when
+    a larger frame arrives, and only for a free slot.
     """
-    def __init__(self, max_size: int = 3):
-        self.buffer = deque(maxlen=max_size)
-        self.mutex = QMutex()
-        self.not_empty = QWaitCondition()
+    def __init__(self, capacity: int = 4):
+        self.capacity = capacity
+        self._storage: List[Optional[np.ndarray]] = [None] * capacity  # raw bytes per slot
+        self._views: List[Optional[np.ndarray]] = [None] * capacity    # shaped view of the last frame
+        self._meta: List[Tuple] = [()] * capacity                       # (timestamp, width, height, frame_number, quality)
+        self._write_seq = 0  # written by the producer only
+        self._read_seq = 0   # written by the consumer only
+        self._held = False   # consumer holds the slot at read_seq
+        
+        # Producer-side counters
         self.frame_count = 0
         self.dropped_frames = 0
+        self.reallocations = 0
+        # Consumer-side counter
+        self.skipped_frames = 0
         
-    def push(self, frame: NDIFrame) -> bool:
-        """Push frame to buffer, returns False if buffer was full"""
-        with QMutexLocker(self.mutex):
-            was_full = len(self.buffer) == self.buffer.maxlen
-            if was_full:
-                # Release oldest frame before dropping
-                old_frame = self.buffer[0]
-                old_frame.release()
-                self.dropped_frames += 1
-                
-            self.buffer.append(frame)
-            self.frame_count += 1
-            self.not_empty.wakeOne()
-            return not was_full
-            
-    def pop(self, timeout_ms: int = 100) -> Optional[NDIFrame]:
-        """Pop frame from buffer with timeout"""
-        with QMutexLocker(self.mutex):
-            if not self.buffer:
-                if not self.not_empty.wait(self.mutex, timeout_ms):
-                    return None
-                    
-            if self.buffer:
-                return self.buffer.popleft()
-            return None
-            
-    def clear(self):
-        """Clear all frames and release memory"""
-        with QMutexLocker(self.mutex):
-            for frame in self.buffer:
-                frame.release()
-            self.buffer.clear()
+    def __len__(self) -> int:
+        return self._write_seq - self._read_seq
+        
+    def _slot_view(self, index: int, shape, dtype) -> np.ndarray:
+        """Producer - writable view of a free slot shaped like the incoming frame"""
+        view = self._views[index]
+        if view is not None and view.shape == shape and view.dtype == dtype:
+            return view
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        storage = self._storage[index]
+        if storage is None or storage.nbytes < nbytes:
+            storage = np.empty(nbytes, dtype=np.uint8)
+            self._storage[index] = storage
+            self.reallocations += 1
+        view = storage[:nbytes].view(dtype).reshape(shape)
+        self._views[index] = view
+        return view
+        
+    def push(self, data: np.ndarray, timestamp: float, width: int, height: int,
+             frame_number: int, quality: FrameQuality = FrameQuality.FULL) -> bool:
+        """Producer - copy data into the next free slot and publish it. False if full (frame dropped)"""
+        write_seq = self._write_seq
+        if write_seq - self._read_seq >= self.capacity:
+            self.dropped_frames += 1
+            return False
             
+        index = write_seq % self.capacity
+        np.copyto(self._slot_view(index, data.shape, data.dtype), data)
+        self._meta[index] = (timestamp, width, height, frame_number, quality)
+        self.frame_count += 1
+        self._write_seq = write_seq + 1  # publish after the copy is complete
+        return True
+        
+    def pop(self) -> Optional[NDIFrame]:
+        """Consumer - oldest published frame, or None if empty
+        
+        The frame's data is a view into the slot; call frame.release() when
+        done with it. Only one frame may be held at a time.
+        """
+        if self._held or self._read_seq == self._write_seq:
+            return None
+        return self._lend(self._read_seq)
+        
+    def pop_latest(self) -> Optional[NDIFrame]:
+        """Consumer - newest published frame, releasing any older unread ones"""
+        if self._held:
+            return None
+        write_seq = self._write_seq
+        read_seq = self._read_seq
+        if read_seq == write_seq:
+            return None
+        if write_seq - read_seq > 1:
+            self.skipped_frames += write_seq - 1 - read_seq
+            self._read_seq = read_seq = write_seq - 1
+        return self._lend(read_seq)
+        
+    def _lend(self, read_seq: int) -> NDIFrame:
+        index = read_seq % self.capacity
+        timestamp, width, height, frame_number, quality = self._meta[index]
+        self._held = True
+        return NDIFrame(data=self._views[index], timestamp=timestamp, width=width, height=height,
+                        frame_number=frame_number, quality=quality, _on_release=self._release)
+        
+    def _release(self):
+        """Consumer - hand the held slot back to the producer"""
+        self._held = False
+        self._read_seq += 1
+        
     def stats(self) -> Dict[str, int]:
         """Get buffer statistics"""
-        with QMutexLocker(self.mutex):
-            return {
-                "current_size": len(self.buffer),
-                "total_frames": self.frame_count,
-                "dropped_frames": self.dropped_frames,
-                "drop_rate": self.dropped_frames / max(1, self.frame_count)
-            }
+        return {
+            "capacity": self.capacity,
+            "current_size": len(self),
+            "total_frames": self.frame_count,
+            "dropped_frames": self.dropped_frames,
+            "skipped_frames": self.skipped_frames,
+            "drop_rate": self.dropped_frames / max(1, self.frame_count + self.dropped_frames)
+        }
+
+
+_HALVE_MASK = np.uint32(0xFEFEFEFE)
+
+
+class _ScalePlan:
+    """Precomputed downscale for one quality level and one source format"""
+    __slots__ = ('kind', 'factor', 'size', 'dst', 'scratch')
+    
+    def __init__(self, kind: str, factor: int, size: Tuple[int, int], dst: np.ndarray, scratch: tuple):
+        self.kind = kind          # 'halve' / 'sum' / 'cv2'
+        self.factor = factor
+        self.size = size          # (width, height)
+        self.dst = dst            # preallocated output, reused every frame
+        self.scratch = scratch    # preallocated intermediates for the NumPy paths
+
+
+class QualityLadder:
+    """
+    Adaptive quality ladder with allocation-free downscaling
+    
+    Target sizes and destination buffers for every level are computed once
+    per source format. Power-of-two reductions of 4-byte pixels (BGRA/BGRX)
+    are done in NumPy without cv2 by repeated 2x2 averaging on uint32 views,
+    averaging all four channels at once with the carry-free identity
+    (a & b) + ((a ^ b) >> 1). Other ratios use cv2.resize into the
+    preallocated buffer when cv2 is installed, otherwise a uint16 box sum
+    over the strided views at the next integer factor that fits.
+    
+    Level changes are driven by the measured per-frame processing time
+    against the frame budget, with hysteresis: step down after the
+    smoothed load stays above high_watermark for down_dwell seconds, step
+    up only after it stays below low_watermark for up_dwell seconds.
+    """
+    
+    MAX_FACTOR = 16  # 16 * 16 * 255 still fits the uint16 accumulator
+    
+    def __init__(self, target_fps: float = 60, high_watermark: float = 0.8, low_watermark: float = 0.4,
+                 down_dwell: float = 0.5, up_dwell: float = 3.0, smoothing: float = 0.1,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.budget = 1.0 / target_fps
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.down_dwell = down_dwell
+        self.up_dwell = up_dwell
+        self.smoothing = smoothing
+        self.clock = clock
+        
+        self.level_index = 0
+        self.avg_process_time = 0.0
+        self.transitions = 0
+        self._over_since: Optional[float] = None
+        self._under_since: Optional[float] = None
+        self._last_change = clock()
+        
+        self._format = None
+        self._plans: Dict[FrameQuality, Optional[_ScalePlan]] = {}
+        
+    @property
+    def level(self) -> FrameQuality:
+        return QUALITY_ORDER[self.level_index]
+        
+    def set_level(self, level: FrameQuality):
+        self.level_index = QUALITY_ORDER.index(level)
+        self._over_since = self._under_since = None
+        self._last_change = self.clock()
+        
+    def record(self, process_time: float, now: Optional[float] = None) -> Optional[FrameQuality]:
+        """Feed one frame's processing time - returns the new level when it changes"""
+        now = self.clock() if now is None else now
+        self.avg_process_time += self.smoothing * (process_time - self.avg_process_time)
+        load = self.avg_process_time / self.budget
+        
+        if load > self.high_watermark and self.level_index < len(QUALITY_ORDER) - 1:
+            self._under_since = None
+            if self._over_since is None:
+                self._over_since = now
+            elif now - self._over_since >= self.down_dwell:
+                return self._step(1, now)
+        elif load < self.low_watermark and self.level_index > 0:
+            self._over_since = None
+            if self._under_since is None:
+                self._under_since = now
+            elif now - self._under_since >= self.up_dwell and now - self._last_change >= self.up_dwell:
+                return self._step(-1, now)
+        else:
+            self._over_since = self._under_since = None
+        return None
+        
+    def _step(self, direction: int, now: float) -> FrameQuality:
+        self.level_index += direction
+        self.transitions += 1
+        self._over_since = self._under_since = None
+        self._last_change = now
+        return self.level
+        
+    def plan(self, shape, dtype, level: FrameQuality) -> Optional[_ScalePlan]:
+        """Scale plan for a source format (None = pass through). Rebuilt only on format change"""
+        key = (tuple(shape), np.dtype(dtype))
+        if key != self._format:
+            self._format = key
+            self._plans = {quality: self._build_plan(shape, dtype, QUALITY_LIMITS[quality])
+                           for quality in QUALITY_ORDER}
+        return self._plans[level]
+        
+    def _build_plan(self, shape, dtype, limit) -> Optional[_ScalePlan]:
+        height, width = shape[:2]
+        if limit is None or (width <= limit[0] and height <= limit[1]):
+            return None
+            
+        scale = min(limit[0] / width, limit[1] / height)
+        exact = (int(width * scale), int(height * scale))
+        factor = width // exact[0] if exact[0] else 0
+        if factor < 2 or exact[0] * factor != width or exact[1] * factor != height:
+            if cv2 is not None:
+                return _ScalePlan('cv2', 0, exact, self._alloc(exact, shape, dtype), ())
+            factor = max(-(-width // limit[0]), -(-height // limit[1]))
+            
+        size = (width // factor, height // factor)
+        dst = self._alloc(size, shape, dtype)
+        pixel_bytes = np.dtype(dtype).itemsize * (shape[2] if len(shape) > 2 else 1)
+        if factor & (factor - 1) == 0 and len(shape) == 3 and pixel_bytes == 4:
+            # One stage per halving: (row average, its scratch, output, its scratch)
+            stages = []
+            stage_height, stage_width = size[1] * factor, size[0] * factor
+            while stage_height > size[1]:
+                stage_height //= 2
+                stage_width //= 2
+                rows = np.empty((stage_height, stage_width * 2), dtype=np.uint32)
+                out = (dst.view(np.uint32)[..., 0] if stage_height == size[1]
+                       else np.empty((stage_height, stage_width), dtype=np.uint32))
+                stages.append((rows, np.empty_like(rows), out, np.empty_like(out)))
+            return _ScalePlan('halve', factor, size, dst, tuple(stages))
+            
+        if cv2 is not None:
+            return _ScalePlan('cv2', factor, size, dst, ())
+        factor = min(factor, self.MAX_FACTOR)
+        size = (width // factor, height // factor)
+        dst = self._alloc(size, shape, dtype)
+        return _ScalePlan('sum', factor, size, dst, (np.empty(dst.shape, dtype=np.uint16),))
+        
+    @staticmethod
+    def _alloc(size: Tuple[int, int], shape, dtype) -> np.ndarray:
+        return np.empty((size[1], size[0]) + tuple(shape[2:]), dtype=dtype)
+        
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Downscale to the current level - returns data itself or the level's reused buffer"""
+        plan = self.plan(data.shape, data.dtype, self.level)
+        if plan is None:
+            return data
+        if plan.kind == 'cv2':
+            return cv2.resize(data, plan.size, dst=plan.dst, interpolation=cv2.INTER_AREA)
+            
+        width, height = plan.size
+        src = data[:height * plan.factor, :width * plan.factor]
+        if plan.kind == 'halve':
+            self._halve(src.view(np.uint32)[..., 0], plan.scratch)
+        else:
+            self._box_sum(src, plan.factor, plan.scratch[0], plan.dst)
+        return plan.dst
+        
+    @staticmethod
+    def _halve(src: np.ndarray, stages: tuple):
+        """2x2 average per stage, four 8-bit channels per uint32
+        
+        Rows use the floor average and columns the ceiling average
+        (a | b) - ((a ^ b) >> 1), so the bias cancels and every channel is
+        within 1 of the exact rounded box average.
+        """
+        for rows, rows_tmp, out, out_tmp in stages:
+            top, bottom = src[0::2], src[1::2]
+            np.bitwise_and(top, bottom, out=rows)
+            np.bitwise_xor(top, bottom, out=rows_tmp)
+            np.bitwise_and(rows_tmp, _HALVE_MASK, out=rows_tmp)  # keep bits from crossing channels
+            np.right_shift(rows_tmp, 1, out=rows_tmp)
+            np.add(rows, rows_tmp, out=rows)
+            
+            left, right = rows[:, 0::2], rows[:, 1::2]
+            np.bitwise_or(left, right, out=out)
+            np.bitwise_xor(left, right, out=out_tmp)
+            np.bitwise_and(out_tmp, _HALVE_MASK, out=out_tmp)
+            np.right_shift(out_tmp, 1, out=out_tmp)
+            np.subtract(out, out_tmp, out=out)
+            src = out
+            
+    @staticmethod
+    def _box_sum(src: np.ndarray, factor: int, acc: np.ndarray, dst: np.ndarray):
+        """Rounded box average at any integer factor via a uint16 accumulator"""
+        np.copyto(acc, src[0::factor, 0::factor])
+        for dy in range(factor):
+            for dx in range(factor):
+                if dy or dx:
+                    np.add(acc, src[dy::factor, dx::factor], out=acc)
+                    
+        count = factor * factor
+        np.add(acc, count // 2, out=acc)  # round to nearest
+        np.floor_divide(acc, count, out=acc)
+        np.copyto(dst, acc, casting='unsafe')
+        
+    def stats(self) -> Dict[str, Any]:
+        plan = self._plans.get(self.level)
+        return {
+            "level": self.level.value,
+            "load": self.avg_process_time / self.budget,
+            "transitions": self.transitions,
+            "output_size": plan.size if plan else None,
+            "scaler": plan.kind if plan else None
+        }
 
 
 class NDIWorkerEnterprise(QThread):
@@ -110,7 +395,7 @@ class NDIWorkerEnterprise(QThread):
     """
     
     # Signals
-    frame_ready = pyqtSignal(NDIFrame)  # Emits processed frames
+    frame_ready = pyqtSignal()          # A frame was published to frame_ring
     source_found = pyqtSignal(str)      # Emits when new source found
     error_occurred = pyqtSignal(str)    # Emits on errors
     stats_updated = pyqtSignal(dict)    # Performance statistics
@@ -121,7 +406,8 @@ class NDIWorkerEnterprise(QThread):
         self.receiver = None
         self.source_name = None
         self.running = False
-        self.frame_buffer = FrameBuffer(max_size=3)
+        self.frame_ring = FrameRing(capacity=4)
+        self.frame_counter = 0
         
         # Performance tracking
         self.last_frame_time = 0
@@ -132,6 +418,7 @@ class NDIWorkerEnterprise(QThread):
         self.current_quality = FrameQuality.FULL
         self.target_fps = 60
         self.actual_fps = 0
+        self.quality_ladder = QualityLadder(target_fps=self.target_fps)
         
         # Thread coordination
         self.source_lock = threading.Lock()
@@ -238,87 +525,60 @@ class NDIWorkerEnterprise(QThread):
         logger.info(f"Connected to NDI source: {self.source_name}")
         
     def _process_frames(self):
-        """Process frames with adaptive quality and zero-copy optimization"""
+        """Process frames with adaptive quality, copying each one into the frame ring"""
         if not self.receiver:
             return
             
-        start_time = time.time()
-        
         # Capture frame with minimal timeout
-        frame_type = ndi.recv_capture_v2(self.receiver, 16)  # 16ms for 60fps
+        frame_type, v_frame, a_frame, _ = ndi.recv_capture_v2(self.receiver, 16)  # 16ms for 60fps
         
         if frame_type == ndi.FRAME_TYPE_VIDEO:
-            # Get video frame
-            v_frame = ndi.recv_get_video_data(self.receiver)
-            if v_frame and v_frame.data is not None:
-                # Create frame wrapper (no copy yet)
-                frame = self._create_frame(v_frame)
-                
-                # Adaptive quality adjustment
-                if self.actual_fps < self.target_fps * 0.8:
-                    frame = self._reduce_quality(frame)
-                    
-                # Emit frame for processing
-                self.frame_ready.emit(frame)
-                
-                # Free NDI frame
+            # Processing time starts when the frame arrives, not while waiting for it
+            start_time = time.time()
+            try:
+                published = v_frame.data is not None and self._copy_to_ring(v_frame, start_time)
+            finally:
+                # The ring slot owns the pixels now (or the frame was dropped) - return the SDK buffer
                 ndi.recv_free_video_v2(self.receiver, v_frame)
                 
-                # Track timing
-                process_time = time.time() - start_time
-                self.processing_times.append(process_time)
-                self.frame_times.append(time.time())
+            if published:
+                self.frame_ready.emit()
                 
+            # Track timing
+            process_time = time.time() - start_time
+            self.processing_times.append(process_time)
+            self.frame_times.append(time.time())
+            
+            # Adaptive quality adjustment
+            level = self.quality_ladder.record(process_time)
+            if level is not None:
+                logger.info(f"Quality {self.current_quality.value} -> {level.value} "
+                            f"(processing {self.quality_ladder.avg_process_time * 1000:.1f} ms)")
+                self.current_quality = level
+            
+        elif frame_type == ndi.FRAME_TYPE_AUDIO:
+            ndi.recv_free_audio_v2(self.receiver, a_frame)
+            
         elif frame_type == ndi.FRAME_TYPE_NONE:
             # No frame available - efficient wait
             self.stop_event.wait(0.001)  # 1ms wait
             
-    def _create_frame(self, ndi_frame) -> NDIFrame:
-        """Create frame wrapper with minimal copying"""
-        # Only copy if we need to modify the data
-        if self.current_quality == FrameQuality.FULL:
-            # Zero-copy reference
-            data = ndi_frame.data
-        else:
-            # Need to copy for resizing
-            data = np.copy(ndi_frame.data)
-            
-        return NDIFrame(
-            data=data,
-            timestamp=time.time(),
-            width=ndi_frame.xres,
-            height=ndi_frame.yres,
-            frame_number=ndi_frame.frame_number,
-            quality=self.current_quality
-        )
-        
-    def _reduce_quality(self, frame: NDIFrame) -> NDIFrame:
-        """Reduce frame quality for better performance"""
-        # Quality reduction logic
-        quality_map = {
-            FrameQuality.FULL: (1920, 1080),
-            FrameQuality.HIGH: (1920, 1080),
-            FrameQuality.MEDIUM: (1280, 720),
-            FrameQuality.LOW: (854, 480),
-            FrameQuality.PREVIEW: (640, 360)
-        }
-        
-        max_width, max_height = quality_map[self.current_quality]
-        
-        if frame.width > max_width or frame.height > max_height:
-            # Calculate scale
-            scale = min(max_width / frame.width, max_height / frame.height)
-            new_width = int(frame.width * scale)
-            new_height = int(frame.height * scale)
-            
-            # Use optimized resize
-            import cv2
-            frame.data = cv2.resize(frame.data, (new_width, new_height), 
-                                   interpolation=cv2.INTER_LINEAR)
-            frame.width = new_width
-            frame.height = new_height
+    def _copy_to_ring(self, ndi_frame, timestamp: float) -> bool:
+        """Copy (or downscale) an SDK frame into the next ring slot"""
+        data = ndi_frame.data
+        if self.current_quality != FrameQuality.FULL:
+            data = self._reduce_quality(data)
             
-        return frame
+        self.frame_counter += 1
+        height, width = data.shape[:2]
+        return self.frame_ring.push(data, timestamp, width, height,
+                                    self.frame_counter, self.current_quality)
+        
+    def _reduce_quality(self, data: np.ndarray) -> np.ndarray:
+        """Reduce frame quality for better performance (into the ladder's preallocated buffer)"""
+        if self.quality_ladder.level != self.current_quality:
+            self.quality_ladder.set_level(self.current_quality)
+        return self.quality_ladder.apply(data)
         
     def _emit_statistics(self):
         """Emit performance statistics"""
@@ -335,36 +595,27 @@ class NDIWorkerEnterprise(QThread):
                 "target_fps": self.target_fps,
                 "quality": self.current_quality.value,
                 "avg_process_time_ms": avg_process_time * 1000,
-                "buffer_stats": self.frame_buffer.stats()
+                "quality_ladder": self.quality_ladder.stats(),
+                "buffer_stats": self.frame_ring.stats()
             }
             
             self.stats_updated.emit(stats)
             
-            # Adaptive quality adjustment
-            if self.actual_fps < self.target_fps * 0.8:
-                self._decrease_quality()
-            elif self.actual_fps > self.target_fps * 0.95 and avg_process_time < 0.010:
-                self._increase_quality()
-                
         self.last_frame_time = time.time()
         
     def _decrease_quality(self):
         """Decrease quality for better performance"""
-        quality_order = [FrameQuality.FULL, FrameQuality.HIGH, 
-                        FrameQuality.MEDIUM, FrameQuality.LOW, FrameQuality.PREVIEW]
-        current_idx = quality_order.index(self.current_quality)
-        if current_idx < len(quality_order) - 1:
-            self.current_quality = quality_order[current_idx + 1]
+        if self.current_quality != QUALITY_ORDER[-1]:
+            self.current_quality = QUALITY_ORDER[QUALITY_ORDER.index(self.current_quality) + 1]
             logger.info(f"Decreased quality to {self.current_quality.value}")
+            self.quality_ladder.set_level(self.current_quality)
             
     def _increase_quality(self):
         """Increase quality when performance allows"""
-        quality_order = [FrameQuality.FULL, FrameQuality.HIGH, 
-                        FrameQuality.MEDIUM, FrameQuality.LOW, FrameQuality.PREVIEW]
-        current_idx = quality_order.index(self.current_quality)
-        if current_idx > 0:
-            self.current_quality = quality_order[current_idx - 1]
+        if self.current_quality != QUALITY_ORDER[0]:
+            self.current_quality = QUALITY_ORDER[QUALITY_ORDER.index(self.current_quality) - 1]
             logger.info(f"Increased quality to {self.current_quality.value}")
+            self.quality_ladder.set_level(self.current_quality)
             
     def _cleanup_receiver(self):
         """Clean up current receiver"""
@@ -380,8 +631,6 @@ class NDIWorkerEnterprise(QThread):
             ndi.find_destroy(self.finder)
             self.finder = None
             
-        self.frame_buffer.clear()
-        
         if ndi:
             ndi.destroy()
             
@@ -389,7 +638,6 @@ class NDIWorkerEnterprise(QThread):
         """Graceful stop"""
         self.running = False
         self.stop_event.set()
-        self.frame_buffer.not_empty.wakeAll()
         
         # Wait for thread to finish
         if not self.wait(5000):  # 5 second timeout
@@ -484,15 +732,24 @@ class NDIManagerEnterprise(QObject):
         self.connected = False
         self.connection_state_changed.emit(False)
         
-    def _on_frame_ready(self, frame: NDIFrame):
-        """Process frame and emit for display"""
+    def _on_frame_ready(self):
+        """Take the newest frame from the ring, convert and emit for display"""
+        worker = self.worker
+        if not worker:
+            return
+            
+        # Queued signals can outnumber frames - older ones find the ring already drained
+        frame = worker.frame_ring.pop_latest()
+        if frame is None:
+            return
+            
         try:
             # Convert to QImage
             qimage = self.frame_processor.convert_to_qimage(frame)
             if qimage:
                 self.frame_received.emit(qimage)
         finally:
-            # Always release frame
+            # Always release frame - returns the slot to the worker
             frame.release()
             
     def _on_error(self, error_msg: str):
@@ -519,17 +776,22 @@ class FrameProcessor:
     
     @staticmethod
     def convert_to_qimage(frame: NDIFrame) -> Optional[QImage]:
-        """Convert NDI frame to QImage with zero-copy when possible"""
+        """Convert NDI frame to a QImage that owns its pixels
+        
+        frame.data is a ring slot that is reused once the frame is released,
+        while the display keeps the QImage until the next frame, so the
+        pixels are detached with a single copy here.
+        """
         try:
             if frame.data is None:
                 return None
                 
             height, width = frame.data.shape[:2]
-            bytes_per_line = width * 4  # BGRA format
+            bytes_per_line = frame.data.strides[0]  # BGRA format
             
-            # Create QImage without copying if possible
+            # Wrap the slot, then detach from it
             qimage = QImage(frame.data.data, width, height, 
-                           bytes_per_line, QImage.Format.Format_RGB32)
+                           bytes_per_line, QImage.Format.Format_RGB32).copy()
                            
             # Convert to RGB if needed
             if qimage.format() != QImage.Format.Format_RGB32:
@@ -0,0 +1,82 @@
+# ndi_app/ndi_core/capture_timing.py
+"""NDI 수신 루프 타이밍 도우미 - 수신기의 FPS 측정과 recv_capture 타임아웃
+
+NDIlib/Qt 의존성이 없다. returnfeed_unified의 capture_scheduler.py에 같은 구현의 복사본이 있다.
+"""
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class FPSCounter:
+    """최근 프레임 도착 시각으로 소스 FPS / 프레임 간격 측정"""
+
+    def __init__(self, window_size: int = 60, clock: Callable[[], float] = time.perf_counter):
+        self.window_size = window_size
+        self.clock = clock
+        self.frame_times = deque(maxlen=window_size)
+
+    def add_frame(self, now: Optional[float] = None) -> None:
+        self.frame_times.append(self.clock() if now is None else now)
+
+    def get_fps(self) -> float:
+        if len(self.frame_times) < 2:
+            return 0.0
+        time_span = self.frame_times[-1] - self.frame_times[0]
+        if time_span > 0:
+            return (len(self.frame_times) - 1) / time_span
+        return 0.0
+
+    def frame_interval(self) -> Optional[float]:
+        """평균 프레임 간격 (초) - 측정 전이면 None"""
+        fps = self.get_fps()
+        return 1.0 / fps if fps > 0 else None
+
+    def reset(self) -> None:
+        self.frame_times.clear()
+
+
+class AdaptiveTimeout:
+    """recv_capture 타임아웃 (ms) - 측정한 프레임 간격과 연속 미수신 기록으로 조정
+
+    기본값은 프레임 간격의 1.5배라서 프레임이 제때 오면 한 번의 대기로 받는다.
+    recv_capture는 프레임이 도착하는 즉시 반환하므로 타임아웃이 길어도 지연은 늘지 않는다.
+    연속으로 놓치면 (소스 정지/끊김) 대기를 늘려 빈 깨어남을 줄이고, 다시 받으면 기본값으로 복귀한다.
+    """
+
+    def __init__(self, base_timeout: int = 25, min_timeout: int = 5, max_timeout: int = 100,
+                 interval_factor: float = 1.5):
+        self.default_timeout = base_timeout
+        self.base_timeout = base_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.interval_factor = interval_factor
+        self.current_timeout = base_timeout
+        self.miss_count = 0
+
+    def get_timeout(self) -> int:
+        return self.current_timeout
+
+    def set_frame_interval(self, interval: Optional[float]) -> None:
+        """측정한 프레임 간격(초)으로 기본 타임아웃 갱신"""
+        if interval is None:
+            return
+        base = int(round(interval * 1000.0 * self.interval_factor))
+        self.base_timeout = max(self.min_timeout, min(self.max_timeout, base))
+
+    def on_frame_received(self) -> None:
+        self.miss_count = 0
+        if self.current_timeout > self.base_timeout:
+            self.current_timeout = max(self.base_timeout, self.current_timeout - 5)
+        else:
+            self.current_timeout = self.base_timeout
+
+    def on_frame_missed(self) -> None:
+        self.miss_count += 1
+        if self.miss_count > 3:
+            self.current_timeout = min(self.max_timeout, self.current_timeout + 10)
+
+    def reset(self) -> None:
+        self.base_timeout = self.default_timeout
+        self.current_timeout = self.default_timeout
+        self.miss_count = 0
@@ -12,6 +12,8 @@ import numpy as np
 from typing import Optional, Callable, Dict, Any
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
+from .frame_converters import RGB32FrameConverter
+
 try:
     import cyndilib
     from cyndilib.receiver import Receiver
@@ -36,7 +38,7 @@ class CyndiNDIReceiver(QObject):
     """
     
     # PyQt 시그널
-    frame_received = pyqtSignal(np.ndarray, int, int, int)  # frame_data, width, height, fourcc
+    frame_received = pyqtSignal(np.ndarray, int, int, int)  # frame_data (RGB32 BGRX), width, height, fourcc
     connection_status_changed = pyqtSignal(bool)
     error_occurred = pyqtSignal(str)
     info_message = pyqtSignal(str)
@@ -61,6 +63,8 @@ class CyndiNDIReceiver(QObject):
         
         # 프레임 처리를 위한 큐와 스레드 - 버퍼 크기 증가로 안정성 향상
         self.frame_queue = queue.Queue(maxsize=10)  # 최대 10프레임 버퍼로 증가
+        # 재사용 RGB32 출력 버퍼 - 큐 + 처리 중 + 전송 중인 프레임 수만큼
+        self.frame_converter = RGB32FrameConverter(max_buffers=self.frame_queue.maxsize + 4)
         self.processing_thread = None
         self.stop_event = threading.Event()
         
@@ -233,8 +237,8 @@ class CyndiNDIReceiver(QObject):
                 frame_data = self._convert_frame_to_numpy(video_frame)
                 
                 if frame_data is not None:
-                    # 프레임 데이터와 메타데이터를 함께 저장
-                    width, height = video_frame.get_resolution()
+                    # 프레임 데이터와 메타데이터를 함께 저장 (홀수 폭은 변환기가 짝수로 맞춤)
+                    height, width = frame_data.shape[:2]
                     fourcc = video_frame.get_fourcc()
                     fourcc_int = int(fourcc) if hasattr(fourcc, '__int__') else 0
                     
@@ -256,7 +260,11 @@ class CyndiNDIReceiver(QObject):
             self.error_occurred.emit(f"프레임 수신 오류: {str(e)}")
             
     def _convert_frame_to_numpy(self, video_frame) -> Optional[np.ndarray]:
-        """cyndilib VideoFrame을 numpy 배열로 변환 - 성능 최적화 및 호환성 개선"""
+        """cyndilib VideoFrame을 QImage.Format_RGB32로 바로 감쌀 수 있는 재사용 버퍼로 변환
+        
+        FourCC별 변환기(frame_converters.CONVERTERS)가 출력 버퍼에 직접 쓰므로
+        프레임마다 새 배열을 만들지 않고 Qt 쪽 색 변환도 필요 없다.
+        """
         try:
             # 프레임 해상도 및 포맷 정보 가져오기
             width, height = video_frame.get_resolution()
@@ -265,120 +273,15 @@ class CyndiNDIReceiver(QObject):
             if width <= 0 or height <= 0:
                 return None
                 
-            # 프레임 데이터를 numpy 배열로 변환
             # cyndilib의 VideoFrame은 buffer protocol을 지원
             frame_data = np.frombuffer(video_frame, dtype=np.uint8)
-            
-            # OpenCV import를 한 번만 수행
-            import cv2
-            
-            # FourCC에 따른 형태 변환 - NDI SDK 모범 사례 적용
             fourcc_name = fourcc.name if hasattr(fourcc, 'name') else str(fourcc)
+            stride = video_frame.get_line_stride() if hasattr(video_frame, 'get_line_stride') else 0
             
-            if fourcc_name in ['UYVY', 'YUV2', 'UYVP']:
-                # YUV 422 포맷 - NDI의 기본 고성능 포맷
-                try:
-                    # UYVY는 width가 2의 배수여야 함
-                    if width % 2 != 0:
-                        width = width - 1
-                    
-                    frame_data = frame_data[:height * width * 2]  # UYVY는 픽셀당 2바이트
-                    uyvy_frame = frame_data.reshape((height, width, 2))
-                    bgr_frame = cv2.cvtColor(uyvy_frame, cv2.COLOR_YUV2BGR_UYVY)
-                    return bgr_frame
-                except Exception as e:
-                    print(f"[CyndiReceiver] UYVY 변환 오류: {e}")
-                    return None
-                
-            elif fourcc_name in ['BGRA', 'BGRX']:
-                # BGRA/BGRX 포맷 - 알파 채널 포함
-                try:
-                    channels = 4
-                    expected_size = height * width * channels
-                    if len(frame_data) >= expected_size:
-                        bgra_frame = frame_data[:expected_size].reshape((height, width, channels))
-                        # BGRA를 BGR로 변환 (알파 채널 제거)
-                        bgr_frame = cv2.cvtColor(bgra_frame, cv2.COLOR_BGRA2BGR)
-                        return bgr_frame
-                except Exception as e:
-                    print(f"[CyndiReceiver] BGRA 변환 오류: {e}")
-                    return None
-                    
-            elif fourcc_name in ['RGBA', 'RGBX']:
-                # RGBA/RGBX 포맷
-                try:
-                    channels = 4
-                    expected_size = height * width * channels
-                    if len(frame_data) >= expected_size:
-                        rgba_frame = frame_data[:expected_size].reshape((height, width, channels))
-                        # RGBA를 BGR로 변환
-                        bgr_frame = cv2.cvtColor(rgba_frame, cv2.COLOR_RGBA2BGR)
-                        return bgr_frame
-                except Exception as e:
-                    print(f"[CyndiReceiver] RGBA 변환 오류: {e}")
-                    return None
-                    
-            elif fourcc_name in ['P216', 'PA16']:
-                # 16비트 고정밀도 포맷 - NDI의 고품질 포맷
-                try:
-                    # 16비트 데이터를 8비트로 변환
-                    frame_16bit = np.frombuffer(video_frame, dtype=np.uint16)
-                    frame_8bit = (frame_16bit >> 8).astype(np.uint8)  # 상위 8비트 사용
-                    
-                    if fourcc_name == 'P216':
-                        # Y + UV 플레인
-                        y_size = width * height
-                        uv_size = y_size // 2
-                        
-                        if len(frame_8bit) >= y_size + uv_size:
-                            # NV12 형태로 재구성 후 BGR 변환
-                            yuv_frame = np.zeros((height * 3 // 2, width), dtype=np.uint8)
-                            yuv_frame[:height, :] = frame_8bit[:y_size].reshape((height, width))
-                            uv_data = frame_8bit[y_size:y_size + uv_size].reshape((height // 2, width))
-                            yuv_frame[height:, :] = uv_data
-                            
-                            bgr_frame = cv2.cvtColor(yuv_frame, cv2.COLOR_YUV2BGR_NV12)
-                            return bgr_frame
-                except Exception as e:
-                    print(f"[CyndiReceiver] P216/PA16 변환 오류: {e}")
-                    return None
-                    
-            elif fourcc_name == 'NV12':
-                # NV12 포맷 (Y + UV) - 효율적인 4:2:0 포맷
-                try:
-                    y_size = width * height
-                    uv_size = y_size // 2
-                    
-                    if len(frame_data) >= y_size + uv_size:
-                        yuv_frame = frame_data[:y_size + uv_size]
-                        yuv_reshaped = yuv_frame.reshape((height * 3 // 2, width))
-                        bgr_frame = cv2.cvtColor(yuv_reshaped, cv2.COLOR_YUV2BGR_NV12)
-                        return bgr_frame
-                except Exception as e:
-                    print(f"[CyndiReceiver] NV12 변환 오류: {e}")
-                    return None
-                    
-            else:
-                # 알려지지 않은 포맷 - 기본 RGB/BGR로 시도
-                try:
-                    total_pixels = width * height
-                    channels = len(frame_data) // total_pixels
-                    
-                    if channels == 3:
-                        # RGB 포맷으로 가정
-                        rgb_frame = frame_data[:total_pixels * 3].reshape((height, width, 3))
-                        bgr_frame = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2BGR)
-                        return bgr_frame
-                    elif channels == 4:
-                        # RGBA 포맷으로 가정
-                        rgba_frame = frame_data[:total_pixels * 4].reshape((height, width, 4))
-                        bgr_frame = cv2.cvtColor(rgba_frame, cv2.COLOR_RGBA2BGR)
-                        return bgr_frame
-                except Exception as e:
-                    print(f"[CyndiReceiver] 기본 포맷 변환 오류: {e}")
-                    
-            print(f"[CyndiReceiver] 지원되지 않는 포맷: {fourcc_name}")
-            return None
+            rgb32_frame = self.frame_converter.convert(frame_data, width, height, fourcc_name, stride)
+            if rgb32_frame is None and not self.frame_converter.supports(fourcc_name):
+                print(f"[CyndiReceiver] 지원되지 않는 포맷: {fourcc_name}")
+            return rgb32_frame
             
         except Exception as e:
             print(f"[CyndiReceiver] 프레임 변환 오류: {e}")
@@ -0,0 +1,232 @@
+# ndi_app/ndi_core/frame_converters.py
+import threading
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# 변환기 시그니처: (src 바이트, width, height, stride, dst RGB32 버퍼, scratch 캐시) -> None
+# stride는 (첫 플레인의) 행 바이트 수 - 0이 아닌 값으로 전달됨
+Converter = Callable[[np.ndarray, int, int, int, np.ndarray, Dict], None]
+
+CONVERTERS: Dict[str, Converter] = {}
+
+
+def register_converter(*fourccs: str, bytes_per_pixel: int):
+    """FourCC 이름으로 변환기 등록 - 같은 이름이 있으면 덮어씀
+
+    bytes_per_pixel은 첫 플레인 기준 (stride를 모를 때 width * bytes_per_pixel로 가정).
+    """
+    def decorator(func: Converter) -> Converter:
+        func.bytes_per_pixel = bytes_per_pixel
+        for fourcc in fourccs:
+            CONVERTERS[fourcc] = func
+        return func
+    return decorator
+
+
+def get_converter(fourcc_name: str) -> Optional[Converter]:
+    return CONVERTERS.get(fourcc_name)
+
+
+def _scratch_array(scratch: Dict, name: str, shape: Tuple[int, ...], dtype) -> np.ndarray:
+    """변환기별 중간 버퍼 - 해상도가 바뀔 때만 새로 할당"""
+    array = scratch.get(name)
+    if array is None or array.shape != shape or array.dtype != dtype:
+        array = np.empty(shape, dtype=dtype)
+        scratch[name] = array
+    return array
+
+
+def _rows(src: np.ndarray, height: int, row_bytes: int, stride: int, offset: int = 0) -> np.ndarray:
+    """(height, row_bytes) 바이트 뷰 - stride 패딩은 건너뜀"""
+    return src[offset:offset + height * stride].reshape(height, stride)[:, :row_bytes]
+
+
+def _yuv_to_rgb32(y: np.ndarray, u: np.ndarray, v: np.ndarray, dst: np.ndarray, scratch: Dict, sub_y: int):
+    """BT.601 limited range YUV -> BGRX (cv2 COLOR_YUV2BGR_*와 같은 계수, 8비트 고정소수점)
+
+    u/v는 가로 절반 해상도, sub_y=2면 세로도 절반(4:2:0). 모든 중간값은 scratch의
+    int32 버퍼에 out=으로 계산해 프레임마다 할당하지 않는다.
+    """
+    height, width = y.shape
+    luma = _scratch_array(scratch, 'yuv_luma', (height, width), np.int32)
+    channel = _scratch_array(scratch, 'yuv_channel', (height, width), np.int32)
+    chroma_shape = u.shape
+    cu = _scratch_array(scratch, 'yuv_u', chroma_shape, np.int32)
+    cv = _scratch_array(scratch, 'yuv_v', chroma_shape, np.int32)
+    term = _scratch_array(scratch, 'yuv_term', chroma_shape, np.int32)
+    term_tmp = _scratch_array(scratch, 'yuv_term_tmp', chroma_shape, np.int32)
+
+    np.subtract(y, 16, out=luma, dtype=np.int32)
+    np.multiply(luma, 298, out=luma)
+    np.add(luma, 128, out=luma)  # >> 8 반올림
+    np.subtract(u, 128, out=cu, dtype=np.int32)
+    np.subtract(v, 128, out=cv, dtype=np.int32)
+
+    def write(index):
+        for dy in range(sub_y):
+            for dx in range(2):
+                np.add(luma[dy::sub_y, dx::2], term, out=channel[dy::sub_y, dx::2])
+        np.right_shift(channel, 8, out=channel)
+        np.clip(channel, 0, 255, out=channel)
+        np.copyto(dst[..., index], channel, casting='unsafe')
+
+    np.multiply(cu, 516, out=term)  # B
+    write(0)
+    np.multiply(cu, -100, out=term)  # G
+    np.multiply(cv, 208, out=term_tmp)
+    np.subtract(term, term_tmp, out=term)
+    write(1)
+    np.multiply(cv, 409, out=term)  # R
+    write(2)
+    dst[..., 3] = 255
+
+
+@register_converter('BGRA', 'BGRX', bytes_per_pixel=4)
+def convert_bgra(src, width, height, stride, dst, scratch):
+    """RGB32와 메모리 배치가 같음 - 복사만"""
+    np.copyto(dst, _rows(src, height, width * 4, stride).reshape(height, width, 4))
+
+
+@register_converter('RGBA', 'RGBX', bytes_per_pixel=4)
+def convert_rgba(src, width, height, stride, dst, scratch):
+    rgba = _rows(src, height, width * 4, stride).reshape(height, width, 4)
+    if cv2 is not None:
+        cv2.cvtColor(rgba, cv2.COLOR_RGBA2BGRA, dst=dst)
+        return
+    np.copyto(dst[..., 0], rgba[..., 2])
+    np.copyto(dst[..., 1], rgba[..., 1])
+    np.copyto(dst[..., 2], rgba[..., 0])
+    np.copyto(dst[..., 3], rgba[..., 3])
+
+
+@register_converter('RGB', bytes_per_pixel=3)
+def convert_rgb(src, width, height, stride, dst, scratch):
+    """FourCC를 모르는 3채널 프레임 (RGB로 가정)"""
+    rgb = _rows(src, height, width * 3, stride).reshape(height, width, 3)
+    if cv2 is not None:
+        cv2.cvtColor(rgb, cv2.COLOR_RGB2BGRA, dst=dst)
+        return
+    np.copyto(dst[..., :3], rgb[..., ::-1])
+    dst[..., 3] = 255
+
+
+def _uyvy_to_rgb32(uyvy: np.ndarray, dst: np.ndarray, scratch: Dict):
+    if cv2 is not None:
+        cv2.cvtColor(uyvy, cv2.COLOR_YUV2BGRA_UYVY, dst=dst)
+        return
+    _yuv_to_rgb32(uyvy[..., 1], uyvy[:, 0::2, 0], uyvy[:, 1::2, 0], dst, scratch, 1)
+
+
+@register_converter('UYVY', 'UYVA', bytes_per_pixel=2)
+def convert_uyvy(src, width, height, stride, dst, scratch):
+    """4:2:2 패킹 (U Y0 V Y1) - UYVA는 뒤따르는 알파 플레인을 무시"""
+    _uyvy_to_rgb32(_rows(src, height, width * 2, stride).reshape(height, width, 2), dst, scratch)
+
+
+@register_converter('P216', 'PA16', bytes_per_pixel=2)
+def convert_p216(src, width, height, stride, dst, scratch):
+    """16비트 4:2:2 (Y 플레인 + UV 인터리브 플레인) - 상위 8비트를 UYVY 중간 버퍼에 모아 변환
+
+    UV 플레인은 Y와 같은 높이이고 U0 V0 U1 V1 순서라 UYVY의 크로마 바이트 위치와 일치한다.
+    PA16의 알파 플레인은 무시.
+    """
+    y16 = _rows(src, height, width * 2, stride).view(np.uint16)
+    uv16 = _rows(src, height, width * 2, stride, offset=height * stride).view(np.uint16)
+    uyvy = _scratch_array(scratch, 'p216_uyvy', (height, width, 2), np.uint8)
+    np.right_shift(uv16, 8, out=uyvy[..., 0], casting='unsafe')
+    np.right_shift(y16, 8, out=uyvy[..., 1], casting='unsafe')
+    _uyvy_to_rgb32(uyvy, dst, scratch)
+
+
+@register_converter('NV12', bytes_per_pixel=1)
+def convert_nv12(src, width, height, stride, dst, scratch):
+    """4:2:0 (Y 플레인 + 절반 높이 UV 인터리브 플레인)"""
+    if cv2 is not None and stride == width:
+        yuv = src[:height * width * 3 // 2].reshape(height * 3 // 2, width)
+        cv2.cvtColor(yuv, cv2.COLOR_YUV2BGRA_NV12, dst=dst)
+        return
+    y = _rows(src, height, width, stride)
+    uv = _rows(src, height // 2, width, stride, offset=height * stride)
+    _yuv_to_rgb32(y, uv[:, 0::2], uv[:, 1::2], dst, scratch, 2)
+
+
+class RGB32FrameConverter:
+    """FourCC별 변환기로 프레임을 재사용 RGB32 버퍼에 씀
+
+    결과는 (height, width, 4) uint8 BGRX - 메모리상 QImage.Format_RGB32와 같아
+    QImage(buffer.data, width, height, buffer.strides[0], Format_RGB32)로 변환 없이 감쌀 수 있다.
+    버퍼는 아무도 참조하지 않게 된 뒤(큐/시그널/뷰가 모두 놓은 뒤)에만 재사용하고,
+    전부 사용 중이면 max_buffers까지 늘린 다음 프레임을 버린다.
+    반환 여부는 슬롯마다 빌려준 배열에 건 weakref.finalize로 판단한다
+    (returnfeed_unified의 frame_pool.FrameBufferPool과 같은 방식).
+    """
+
+    def __init__(self, max_buffers: int = 8):
+        self.max_buffers = max_buffers
+        self._buffers: List[bytearray] = []  # 슬롯별 저장소
+        self._free: List[int] = []  # 반환된 슬롯 인덱스
+        self._lock = threading.Lock()  # 반환은 마지막 참조를 놓은 스레드(GUI 등)에서 일어남
+        self._scratch: Dict[str, np.ndarray] = {}
+        self.dropped_frames = 0
+
+    def convert(self, src: np.ndarray, width: int, height: int, fourcc_name: str,
+                stride: int = 0) -> Optional[np.ndarray]:
+        """src(1차원 uint8)를 변환한 RGB32 버퍼 - 지원하지 않는 포맷이거나 버퍼가 없으면 None
+
+        홀수 폭은 4:2:x 크로마 쌍 단위로 마지막 열을 버린다 (결과 shape으로 확인).
+        """
+        converter = get_converter(fourcc_name) or self._guess_converter(src, width, height)
+        if converter is None:
+            return None
+        stride = stride or width * converter.bytes_per_pixel
+        width -= width % 2
+        dst = self._acquire(width, height)
+        if dst is None:
+            self.dropped_frames += 1
+            return None
+        converter(src, width, height, stride, dst, self._scratch)
+        return dst
+
+    @staticmethod
+    def supports(fourcc_name: str) -> bool:
+        return fourcc_name in CONVERTERS
+
+    @staticmethod
+    def _guess_converter(src: np.ndarray, width: int, height: int) -> Optional[Converter]:
+        """FourCC를 모를 때 - 픽셀당 바이트 수로 RGB / RGBA 추정"""
+        channels = len(src) // max(1, width * height)
+        return {3: convert_rgb, 4: convert_rgba}.get(channels)
+
+    def _acquire(self, width: int, height: int) -> Optional[np.ndarray]:
+        """빈 슬롯을 빌려줌 - 모두 사용 중이고 max_buffers에 도달했으면 None"""
+        size = height * width * 4
+        with self._lock:
+            if self._free:
+                index = self._free.pop()
+                if len(self._buffers[index]) != size:
+                    self._buffers[index] = bytearray(size)
+            elif len(self._buffers) < self.max_buffers:
+                self._buffers.append(bytearray(size))
+                index = len(self._buffers) - 1
+            else:
+                return None
+        # bytearray 위의 1차원 배열이 소유자 - 반환하는 배열, 그 뷰, QImage가 감싼 버퍼 모두
+        # 이 배열을 base로 붙잡으므로 마지막 참조가 사라질 때 슬롯이 반환된다
+        lease = np.frombuffer(self._buffers[index], dtype=np.uint8)
+        weakref.finalize(lease, self._release, index)
+        return lease.reshape(height, width, 4)
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._free.append(index)
+
+    @property
+    def allocated_buffers(self) -> int:
+        return len(self._buffers)
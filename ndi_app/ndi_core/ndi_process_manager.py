@@ -7,6 +7,8 @@ import NDIlib as ndi
 import os
 import sys
 
+from .shared_frame_ring import SharedFrameRing
+
 class NDIProcessManager(QObject):
     """멀티프로세싱을 사용하여 NDI 작업을 별도 프로세스에서 처리하는 매니저"""
     frame_received = pyqtSignal(np.ndarray)
@@ -28,9 +30,14 @@ class NDIProcessManager(QObject):
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._check_queues)
         
-        # 프레임 버퍼링을 위한 설정
+        # 프레임 버퍼링을 위한 설정 (큐에는 슬롯 인덱스만 전달됨)
         self.max_frame_buffer = 5  # 최대 5프레임 버퍼
         
+        # 공유 메모리 프레임 링 (워커가 생성, GUI는 연결만)
+        self.frame_ring = None
+        self.frame_ring_generation = 0
+        self._retired_rings = []
+        
         # 현재 소스 정보
         self._current_source = None
         
@@ -86,6 +93,7 @@ class NDIProcessManager(QObject):
                     
             self.update_timer.stop()
             self.is_running = False
+            self._close_frame_rings()
             
             self.connection_status_changed.emit(False)
             self.info_message.emit("NDI 프로세스가 중지되었습니다.")
@@ -178,23 +186,60 @@ class NDIProcessManager(QObject):
             
     def _check_queues(self):
         """큐에서 데이터 확인 및 처리"""
-        # 프레임 큐 확인
+        # 상태 큐 확인 (프레임 링 공지를 프레임 인덱스보다 먼저 처리)
         try:
-            while not self.frame_queue.empty():
-                frame_data = self.frame_queue.get_nowait()
-                if frame_data is not None:
-                    self.frame_received.emit(frame_data)
+            while not self.status_queue.empty():
+                status_data = self.status_queue.get_nowait()
+                self._handle_status_message(status_data)
         except:
             pass
             
-        # 상태 큐 확인
+        # 프레임 큐 확인 - (generation, slot, seq) 인덱스 중 최신 것만 사용
+        latest = None
         try:
-            while not self.status_queue.empty():
-                status_data = self.status_queue.get_nowait()
-                self._handle_status_message(status_data)
+            while not self.frame_queue.empty():
+                latest = self.frame_queue.get_nowait()
         except:
             pass
             
+        if latest is not None and self.frame_ring is not None:
+            generation, slot, seq = latest
+            if generation == self.frame_ring_generation:
+                # zero-copy 뷰 - 뷰가 살아있는 동안 워커는 이 슬롯을 덮어쓰지 않음
+                frame_view = self.frame_ring.view(slot, seq)
+                if frame_view is not None:
+                    self.frame_received.emit(frame_view)
+                    
+        if self._retired_rings:
+            self._retired_rings = [ring for ring in self._retired_rings if not ring.close()]
+            
+    def _attach_frame_ring(self, name, generation):
+        """워커가 생성한 공유 메모리 프레임 링에 연결"""
+        try:
+            ring = SharedFrameRing.attach(name)
+        except (FileNotFoundError, ValueError) as e:
+            self.error_occurred.emit(f"프레임 링 연결 실패: {str(e)}")
+            return
+            
+        if self.frame_ring is not None and not self.frame_ring.close():
+            # 아직 GUI가 참조 중인 프레임 뷰가 있으면 나중에 닫음
+            self._retired_rings.append(self.frame_ring)
+        self.frame_ring = ring
+        self.frame_ring_generation = generation
+        
+        # 워커는 이 응답을 받을 때까지 이전 링을 열어 둠 (Windows는 마지막 핸들이 닫히면 세그먼트가 사라짐)
+        try:
+            self.command_queue.put({'command': 'frame_ring_attached', 'generation': generation})
+        except Exception as e:
+            self.error_occurred.emit(f"프레임 링 응답 실패: {str(e)}")
+        
+    def _close_frame_rings(self):
+        """프레임 링 연결 해제"""
+        if self.frame_ring is not None:
+            self._retired_rings.append(self.frame_ring)
+            self.frame_ring = None
+        self._retired_rings = [ring for ring in self._retired_rings if not ring.close()]
+            
     def _handle_status_message(self, status_data):
         """상태 메시지 처리"""
         if not isinstance(status_data, dict):
@@ -216,6 +261,8 @@ class NDIProcessManager(QObject):
         elif msg_type == 'fps_update':
             fps = status_data.get('fps', 0.0)
             self.fps_updated.emit(fps)
+        elif msg_type == 'frame_ring':
+            self._attach_frame_ring(status_data.get('name'), status_data.get('generation', 0))
 
 
 class NDIWorkerProcess(mp.Process):
@@ -235,6 +282,12 @@ class NDIWorkerProcess(mp.Process):
         self.bandwidth_mode = ndi.RECV_BANDWIDTH_HIGHEST
         self.frame_count = 0
         
+        # 공유 메모리 프레임 링 (프로세스 내부에서 생성)
+        self.frame_ring = None
+        self.frame_ring_generation = 0
+        self.frame_ring_slots = 4
+        self.retired_frame_rings = []  # (generation, ring) - GUI가 새 링 연결을 알릴 때까지 유지
+        
         # FPS 카운터
         self.fps_frame_count = 0
         self.fps_start_time = time.time()
@@ -292,6 +345,9 @@ class NDIWorkerProcess(mp.Process):
                 elif command['command'] == 'disconnect':
                     self._disconnect_source()
                     
+                elif command['command'] == 'frame_ring_attached':
+                    self._release_retired_rings(command['generation'])
+                    
         except queue.Empty:
             pass
         except Exception as e:
@@ -405,21 +461,26 @@ class NDIWorkerProcess(mp.Process):
                         self.fps_start_time = current_time
                         self.last_fps_update = current_time
                     
-                    # 프레임 데이터 복사 (프로세스 간 전송을 위해)
-                    if not v_frame.data.flags['C_CONTIGUOUS']:
-                        frame_data = np.ascontiguousarray(v_frame.data.copy())
-                    else:
-                        frame_data = v_frame.data.copy()
+                    # 공유 메모리 링으로 한 번만 복사 (pickle 없음)
+                    if self.frame_ring is None or not self.frame_ring.fits(v_frame.data.nbytes):
+                        self._create_frame_ring(v_frame.data.nbytes)
+                    written = self.frame_ring.write(
+                        v_frame.data,
+                        getattr(v_frame, 'FourCC', 0),
+                        getattr(v_frame, 'timestamp', 0)
+                    )
                         
-                    # 프레임 큐가 가득 찬 경우 오래된 프레임 제거
-                    try:
-                        self.frame_queue.put_nowait(frame_data)
-                    except queue.Full:
+                    # 슬롯 인덱스만 전달 - 큐가 가득 찬 경우 오래된 인덱스 제거
+                    if written is not None:
+                        frame_index = (self.frame_ring_generation,) + written
                         try:
-                            self.frame_queue.get_nowait()  # 오래된 프레임 제거
-                            self.frame_queue.put_nowait(frame_data)  # 새 프레임 추가
-                        except:
-                            pass
+                            self.frame_queue.put_nowait(frame_index)
+                        except queue.Full:
+                            try:
+                                self.frame_queue.get_nowait()  # 오래된 프레임 제거
+                                self.frame_queue.put_nowait(frame_index)  # 새 프레임 추가
+                            except:
+                                pass
                             
                 # 프레임 해제
                 ndi.recv_free_video_v2(self.ndi_recv, v_frame)
@@ -433,6 +494,32 @@ class NDIWorkerProcess(mp.Process):
         except Exception as e:
             self._send_status('error', f'프레임 캡처 오류: {str(e)}')
             
+    def _create_frame_ring(self, frame_bytes):
+        """프레임 크기에 맞는 공유 메모리 링 (재)생성 후 GUI에 공지"""
+        start_seq = 0
+        if self.frame_ring is not None:
+            start_seq = self.frame_ring.last_seq
+            # GUI가 새 링에 연결했다고 알릴 때까지 닫지 않음 - 먼저 닫으면 Windows에서는
+            # 마지막 핸들과 함께 세그먼트가 사라져 GUI의 연결이 실패할 수 있음
+            self.retired_frame_rings.append((self.frame_ring_generation, self.frame_ring))
+            
+        self.frame_ring = SharedFrameRing.create(self.frame_ring_slots, frame_bytes, start_seq)
+        self.frame_ring_generation += 1
+        self._send_status('frame_ring', '', {
+            'name': self.frame_ring.name,
+            'generation': self.frame_ring_generation
+        })
+            
+    def _release_retired_rings(self, attached_generation):
+        """GUI가 attached_generation 링에 연결함 - 그 이전 세대 링 닫기"""
+        remaining = []
+        for generation, ring in self.retired_frame_rings:
+            if generation < attached_generation:
+                ring.close()
+            else:
+                remaining.append((generation, ring))
+        self.retired_frame_rings = remaining
+            
     def _find_sources(self):
         """NDI 소스 검색"""
         try:
@@ -481,6 +568,13 @@ class NDIWorkerProcess(mp.Process):
                 ndi.find_destroy(self.ndi_find)
                 self.ndi_find = None
                 
+            if self.frame_ring:
+                self.frame_ring.close()
+                self.frame_ring = None
+            for _, ring in self.retired_frame_rings:
+                ring.close()
+            self.retired_frame_rings = []
+                
             ndi.destroy()
             self._send_status('info', 'NDI 워커 프로세스 정리 완료')
             
@@ -6,6 +6,8 @@ import queue
 from dataclasses import dataclass
 from typing import Optional
 
+from .capture_timing import AdaptiveTimeout, FPSCounter
+
 @dataclass
 class FrameData:
     frame_type: int
@@ -13,48 +15,6 @@ class FrameData:
     audio_frame: any = None
     timestamp: float = 0.0
 
-class AdaptiveTimeout:
-    def __init__(self, base_timeout=25):
-        self.base_timeout = base_timeout
-        self.current_timeout = base_timeout
-        self.miss_count = 0
-        
-    def get_timeout(self):
-        return self.current_timeout
-        
-    def on_frame_received(self):
-        self.miss_count = 0
-        if self.current_timeout > self.base_timeout:
-            self.current_timeout = max(self.base_timeout, 
-                                     self.current_timeout - 5)
-    
-    def on_frame_missed(self):
-        self.miss_count += 1
-        if self.miss_count > 3:
-            self.current_timeout = min(100, self.current_timeout + 10)
-
-class FPSCounter:
-    def __init__(self, window_size=60):
-        self.window_size = window_size
-        self.frame_times = []
-        
-    def add_frame(self):
-        current_time = time.time()
-        self.frame_times.append(current_time)
-        
-        # 윈도우 크기 유지
-        if len(self.frame_times) > self.window_size:
-            self.frame_times.pop(0)
-            
-    def get_fps(self):
-        if len(self.frame_times) < 2:
-            return 0.0
-            
-        time_span = self.frame_times[-1] - self.frame_times[0]
-        if time_span > 0:
-            return (len(self.frame_times) - 1) / time_span
-        return 0.0
-
 class NDIReceiver(QThread):
     frame_received = pyqtSignal(np.ndarray)
     connection_status_changed = pyqtSignal(bool)
@@ -0,0 +1,187 @@
+# ndi_app/ndi_core/shared_frame_ring.py
+import weakref
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SharedFrameRing:
+    """multiprocessing.shared_memory 기반 프레임 링 버퍼
+
+    워커 프로세스가 프레임을 슬롯에 직접 복사하고 (slot, seq)만 큐로 전달한다.
+    GUI 프로세스는 같은 공유 메모리에 붙어 슬롯을 zero-copy NumPy 뷰로 읽는다.
+
+    메모리 배치: [제어 블록 (int64)] [슬롯 0] [슬롯 1] ...
+      헤더: magic, num_slots, slot_bytes, write_seq
+      슬롯별: seq, width, height, channels, stride, fourcc, timestamp, hold
+    """
+
+    MAGIC = 0x4E444952  # 'NDIR'
+    HEADER_FIELDS = 4
+    SLOT_FIELDS = 8
+    ALIGNMENT = 4096
+
+    # 슬롯 필드 인덱스
+    F_SEQ = 0
+    F_WIDTH = 1
+    F_HEIGHT = 2
+    F_CHANNELS = 3
+    F_STRIDE = 4
+    F_FOURCC = 5
+    F_TIMESTAMP = 6
+    F_HOLD = 7
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.name = shm.name
+        self.owner = owner
+
+        header = np.ndarray((self.HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        self.num_slots = int(header[1])
+        self.slot_bytes = int(header[2])
+        self._header = header
+        self._ctrl = np.ndarray(
+            (self.num_slots, self.SLOT_FIELDS), dtype=np.int64,
+            buffer=shm.buf, offset=self.HEADER_FIELDS * 8
+        )
+        self._data_offset = self._control_bytes(self.num_slots)
+        self._next_slot = 0
+        self._live_views = 0  # NumPy 뷰는 버퍼 export를 유지하지 않으므로 직접 집계
+
+    @classmethod
+    def _control_bytes(cls, num_slots: int) -> int:
+        size = (cls.HEADER_FIELDS + num_slots * cls.SLOT_FIELDS) * 8
+        return (size + cls.ALIGNMENT - 1) // cls.ALIGNMENT * cls.ALIGNMENT
+
+    @classmethod
+    def create(cls, num_slots: int, slot_bytes: int, start_seq: int = 0) -> "SharedFrameRing":
+        """링 생성 (워커 프로세스 측) - start_seq로 이전 링과 seq가 겹치지 않게 함"""
+        slot_bytes = (slot_bytes + cls.ALIGNMENT - 1) // cls.ALIGNMENT * cls.ALIGNMENT
+        total = cls._control_bytes(num_slots) + num_slots * slot_bytes
+        shm = shared_memory.SharedMemory(create=True, size=total)
+        header = np.ndarray((cls.HEADER_FIELDS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = (cls.MAGIC, num_slots, slot_bytes, start_seq)
+        ctrl = np.ndarray((num_slots, cls.SLOT_FIELDS), dtype=np.int64,
+                          buffer=shm.buf, offset=cls.HEADER_FIELDS * 8)
+        ctrl[:] = 0
+        del header, ctrl
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """기존 링에 연결 (GUI 프로세스 측)"""
+        shm = shared_memory.SharedMemory(name=name)
+        magic = int(np.ndarray((1,), dtype=np.int64, buffer=shm.buf)[0])
+        if magic != cls.MAGIC:
+            shm.close()
+            raise ValueError(f"Invalid frame ring: {name}")
+        return cls(shm, owner=False)
+
+    def fits(self, nbytes: int) -> bool:
+        return nbytes <= self.slot_bytes
+
+    @property
+    def last_seq(self) -> int:
+        return int(self._header[3])
+
+    def write(self, frame: np.ndarray, fourcc: int = 0, timestamp: int = 0) -> Optional[Tuple[int, int]]:
+        """프레임을 빈 슬롯에 복사 - (slot, seq) 반환, 모든 슬롯이 사용 중이면 None"""
+        if frame.nbytes > self.slot_bytes:
+            return None
+
+        slot = self._acquire_slot()
+        if slot is None:
+            return None
+
+        ctrl = self._ctrl[slot]  # _acquire_slot이 이미 쓰기 중(-1)으로 표시함
+        dest = np.ndarray(frame.shape, dtype=frame.dtype, buffer=self.shm.buf,
+                          offset=self._data_offset + slot * self.slot_bytes)
+        np.copyto(dest, frame)
+
+        height = frame.shape[0]
+        width = frame.shape[1] if frame.ndim > 1 else 1
+        channels = frame.shape[2] if frame.ndim > 2 else 1
+        ctrl[self.F_WIDTH] = width
+        ctrl[self.F_HEIGHT] = height
+        ctrl[self.F_CHANNELS] = channels
+        ctrl[self.F_STRIDE] = dest.strides[0]
+        ctrl[self.F_FOURCC] = fourcc
+        ctrl[self.F_TIMESTAMP] = timestamp
+
+        seq = int(self._header[3]) + 1
+        ctrl[self.F_SEQ] = seq  # 쓰기 완료 후 게시
+        self._header[3] = seq
+        return slot, seq
+
+    def _acquire_slot(self) -> Optional[int]:
+        """라운드 로빈으로 GUI가 붙잡고 있지 않은 슬롯을 골라 쓰기 중(seq = -1)으로 표시
+
+        GUI는 hold를 건 뒤 seq를 다시 확인하므로, 워커는 반대로 seq를 먼저 무효화한 뒤 hold를 확인한다.
+        hold 확인 후에 무효화하면 GUI가 두 단계 사이를 지나 덮어쓰는 중인 슬롯을 뷰로 감쌀 수 있다.
+        """
+        for _ in range(self.num_slots):
+            slot = self._next_slot
+            self._next_slot = (self._next_slot + 1) % self.num_slots
+            ctrl = self._ctrl[slot]
+            previous_seq = int(ctrl[self.F_SEQ])
+            ctrl[self.F_SEQ] = -1
+            if ctrl[self.F_HOLD] == 0:
+                return slot
+            ctrl[self.F_SEQ] = previous_seq  # GUI가 붙잡은 슬롯 - 손대지 않고 되돌림
+        return None
+
+    def view(self, slot: int, seq: int) -> Optional[np.ndarray]:
+        """슬롯의 zero-copy 뷰 반환 - 이미 덮어써진 프레임이면 None
+
+        뷰가 살아있는 동안 슬롯은 hold 상태로 표시되어 워커가 덮어쓰지 않는다.
+        """
+        if not 0 <= slot < self.num_slots:
+            return None
+        ctrl = self._ctrl[slot]
+        ctrl[self.F_HOLD] = seq
+        if ctrl[self.F_SEQ] != seq:
+            ctrl[self.F_HOLD] = 0
+            return None
+
+        height = int(ctrl[self.F_HEIGHT])
+        width = int(ctrl[self.F_WIDTH])
+        channels = int(ctrl[self.F_CHANNELS])
+        stride = int(ctrl[self.F_STRIDE])
+        offset = self._data_offset + slot * self.slot_bytes
+        if channels > 1:
+            frame = np.ndarray((height, width, channels), dtype=np.uint8, buffer=self.shm.buf,
+                               offset=offset, strides=(stride, channels, 1))
+        else:
+            frame = np.ndarray((height, width), dtype=np.uint8, buffer=self.shm.buf,
+                               offset=offset, strides=(stride, 1))
+        self._live_views += 1
+        weakref.finalize(frame, self._release, slot, seq)
+        return frame
+
+    def _release(self, slot: int, seq: int) -> None:
+        self._live_views -= 1
+        if self._ctrl is not None and self._ctrl[slot, self.F_HOLD] == seq:
+            self._ctrl[slot, self.F_HOLD] = 0
+
+    def fourcc(self, slot: int) -> int:
+        return int(self._ctrl[slot, self.F_FOURCC])
+
+    def close(self) -> bool:
+        """매핑 해제 - 아직 GUI 측 뷰가 남아있으면 False (나중에 다시 시도)"""
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+            self.owner = False
+
+        # 살아있는 프레임 뷰가 있으면 매핑을 유지 (해제 시 use-after-free)
+        if self._live_views > 0:
+            return False
+
+        # 제어 블록 뷰도 export된 버퍼이므로 먼저 해제
+        self._header = None
+        self._ctrl = None
+        self.shm.close()
+        return True
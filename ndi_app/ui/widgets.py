@@ -118,9 +118,24 @@ class VideoDisplayWidget(AspectRatioPreviewLabel):
         try:
             # 640x360 해상도 최적화된 고속 프레임 처리
             if frame_data.ndim == 3 and frame_data.shape[2] == 4:
-                # NDI BGRX_BGRA 형식: RGB로 변환 (알파 채널 제거)
-                bgr_frame = frame_data[:, :, :3]
-                rgb_frame = cv2.cvtColor(bgr_frame, cv2.COLOR_BGR2RGB)
+                # NDI BGRX_BGRA 형식: 공유 메모리 뷰를 그대로 감싸 QImage 생성
+                # (RGB32는 메모리상 BGRA 순서이므로 색 변환 불필요)
+                height, width = frame_data.shape[:2]
+                q_image = QImage(
+                    frame_data.data,
+                    width,
+                    height,
+                    frame_data.strides[0],
+                    QImage.Format.Format_RGB32
+                )
+                if (height, width) != (360, 640):
+                    q_image = q_image.scaled(
+                        640, 360,
+                        Qt.AspectRatioMode.IgnoreAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                self._show_qimage(q_image)
+                return
                 
             elif frame_data.ndim == 3 and frame_data.shape[2] == 3:
                 # BGR 형식으로 가정하고 RGB로 변환
@@ -155,22 +170,26 @@ class VideoDisplayWidget(AspectRatioPreviewLabel):
                 QImage.Format.Format_RGB888
             )
             
-            # QPixmap으로 변환 (640x360 고정 해상도)
-            pixmap = QPixmap.fromImage(q_image)
-            
-            if not pixmap.isNull():
-                # 640x360 고정 해상도로 표시
-                self.setPixmap(pixmap)
-                
-                # 활성 비디오 스타일 업데이트
-                self.setStyleSheet("background-color: black; border: 2px solid #00aa00;")
-            
-            # FPS 통계 업데이트
-            self.timer.update_fps_statistics()
+            self._show_qimage(q_image)
                 
         except Exception as e:
             print(f"[VideoDisplayWidget]: 프레임 처리 오류: {e}")
 
+    def _show_qimage(self, q_image):
+        """QImage를 픽스맵으로 표시 (fromImage가 복사하므로 원본 뷰는 바로 해제 가능)"""
+        # QPixmap으로 변환 (640x360 고정 해상도)
+        pixmap = QPixmap.fromImage(q_image)
+        
+        if not pixmap.isNull():
+            # 640x360 고정 해상도로 표시
+            self.setPixmap(pixmap)
+            
+            # 활성 비디오 스타일 업데이트
+            self.setStyleSheet("background-color: black; border: 2px solid #00aa00;")
+        
+        # FPS 통계 업데이트
+        self.timer.update_fps_statistics()
+
     def clear_display(self):
         """디스플레이 초기화 및 기본 이미지 표시"""
         with QMutexLocker(self.frame_mutex):
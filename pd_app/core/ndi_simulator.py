@@ -1,141 +1,472 @@
 # pd_app/core/ndi_simulator.py
 """
 NDI 시뮬레이터 - NDI SDK가 없을 때 사용
+
+설정 가능한 합성 소스: 해상도/fps/픽셀 포맷(BGRA, UYVY, P216)/오디오 채널 수를 고르고,
+테스트 패턴은 한 번만 만들어 두고 recv_capture_v2는 그 뷰를 돌려가며 반환한다 (프레임당
+생성/복사 없음). 프레임은 절대 데드라인(시작 시각 + k x 프레임 간격)에 맞춰 내보내므로
+타이머 오차가 누적되지 않고, 지터/드롭을 흉내 낼 수 있다. paced=False면 기다리지 않고
+바로 반환해 수신 경로의 최대 처리량을 잴 수 있다 (CI에서 4K60 부하 테스트).
 """
 
 import logging
+import os
 import time
 import random
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# NDIlib 상수 (SDK 값과 같음)
+FRAME_TYPE_NONE = 0
+FRAME_TYPE_VIDEO = 1
+FRAME_TYPE_AUDIO = 2
+FRAME_TYPE_METADATA = 3
+FRAME_TYPE_ERROR = 4
+
+RECV_COLOR_FORMAT_BGRX_BGRA = 0
+RECV_COLOR_FORMAT_UYVY_BGRA = 1
+RECV_COLOR_FORMAT_RGBX_RGBA = 2
+RECV_COLOR_FORMAT_UYVY_RGBA = 3
+RECV_COLOR_FORMAT_FASTEST = 100
+RECV_COLOR_FORMAT_BEST = 101
+
+RECV_BANDWIDTH_METADATA_ONLY = -10
+RECV_BANDWIDTH_AUDIO_ONLY = 10
+RECV_BANDWIDTH_LOWEST = 0
+RECV_BANDWIDTH_HIGHEST = 100
+
+FRAME_FORMAT_TYPE_PROGRESSIVE = 1
+
+
+def _fourcc(code: str) -> int:
+    return ord(code[0]) | (ord(code[1]) << 8) | (ord(code[2]) << 16) | (ord(code[3]) << 24)
+
+
+FOURCC_VIDEO_TYPE_BGRA = _fourcc("BGRA")
+FOURCC_VIDEO_TYPE_UYVY = _fourcc("UYVY")
+FOURCC_VIDEO_TYPE_P216 = _fourcc("P216")
+
+PIXEL_FORMATS = {"BGRA": FOURCC_VIDEO_TYPE_BGRA, "UYVY": FOURCC_VIDEO_TYPE_UYVY, "P216": FOURCC_VIDEO_TYPE_P216}
+
+# 75% 컬러바 (BT.709) - (B, G, R) / (Y, Cb, Cr) 8비트
+COLOR_BARS_BGR = [(191, 191, 191), (0, 191, 191), (191, 191, 0), (0, 191, 0),
+                  (191, 0, 191), (0, 0, 191), (191, 0, 0), (0, 0, 0)]
+COLOR_BARS_YUV = [(180, 128, 128), (168, 44, 136), (145, 147, 44), (133, 63, 52),
+                  (63, 193, 204), (51, 109, 212), (28, 212, 120), (16, 128, 128)]
+MOVING_BAR_BGR = (235, 235, 235)
+MOVING_BAR_YUV = (235, 128, 128)
+
+
+@dataclass
+class SimulatorConfig:
+    """합성 소스 설정"""
+    width: int = 1920
+    height: int = 1080
+    fps: float = 60.0
+    pixel_format: str = "BGRA"        # BGRA / UYVY / P216
+    audio_channels: int = 2           # 0이면 오디오 없음
+    audio_sample_rate: int = 48000
+    pattern_frames: int = 4           # 미리 만들어 돌려 쓰는 패턴 수 (4K BGRA 1장 = 33MB)
+    paced: bool = True                # False면 대기 없이 즉시 반환 (최대 처리량 측정)
+    jitter_ms: float = 0.0            # 프레임마다 0~jitter_ms 만큼 늦게 도착
+    drop_rate: float = 0.0            # 프레임이 전송되지 않을 확률 (0~1)
+    spin_ms: float = 1.0              # 데드라인 직전 이 시간은 sleep 대신 바쁜 대기 (OS 타이머 해상도 보정)
+    seed: Optional[int] = None
+    source_names: List[str] = field(default_factory=lambda: [
+        "테스트 카메라 1 (시뮬레이션)",
+        "테스트 카메라 2 (시뮬레이션)",
+        "화면 캡처 (시뮬레이션)",
+    ])
+    source_churn: bool = False        # True면 가끔 새 소스가 나타남 (소스 목록 변경 테스트)
+
+    @property
+    def frame_rate(self) -> Tuple[int, int]:
+        """fps -> (frame_rate_N, frame_rate_D) - 59.94는 60000/1001"""
+        ntsc = round(self.fps * 1.001)
+        if abs(self.fps - ntsc / 1.001) < 0.005 and abs(self.fps - ntsc) > 0.005:
+            return ntsc * 1000, 1001
+        rate = Fraction(self.fps).limit_denominator(1000)
+        return rate.numerator, rate.denominator
+
+    @classmethod
+    def from_env(cls) -> "SimulatorConfig":
+        """NDI_SIM_RESOLUTION=3840x2160, NDI_SIM_FPS, NDI_SIM_FORMAT, NDI_SIM_AUDIO_CHANNELS,
+        NDI_SIM_JITTER_MS, NDI_SIM_DROP_RATE, NDI_SIM_PACED=0"""
+        config = cls()
+        resolution = os.environ.get("NDI_SIM_RESOLUTION")
+        if resolution:
+            width, height = resolution.lower().split("x")
+            config.width, config.height = int(width), int(height)
+        config.fps = float(os.environ.get("NDI_SIM_FPS", config.fps))
+        config.pixel_format = os.environ.get("NDI_SIM_FORMAT", config.pixel_format).upper()
+        config.audio_channels = int(os.environ.get("NDI_SIM_AUDIO_CHANNELS", config.audio_channels))
+        config.jitter_ms = float(os.environ.get("NDI_SIM_JITTER_MS", config.jitter_ms))
+        config.drop_rate = float(os.environ.get("NDI_SIM_DROP_RATE", config.drop_rate))
+        config.paced = os.environ.get("NDI_SIM_PACED", "1") != "0"
+        return config
+
+
 @dataclass
 class SimulatedNDISource:
     """시뮬레이션된 NDI 소스"""
     ndi_name: bytes
     ip_address: str = "127.0.0.1"
-    
+
     def __init__(self, name: str, ip_address: str = "127.0.0.1"):
         self.ndi_name = name.encode('utf-8') if isinstance(name, str) else name
         self.ip_address = ip_address
-    
+        self.url_address = f"{ip_address}:5961"
+
     def __str__(self):
         return self.ndi_name.decode('utf-8') if isinstance(self.ndi_name, bytes) else str(self.ndi_name)
 
-class NDISimulator:
-    """NDI 기능 시뮬레이터"""
-    
+
+class SimulatedVideoFrame:
+    """NDIlib.VideoFrameV2 흉내 - data는 미리 만든 패턴의 읽기 전용 뷰"""
+    __slots__ = ('type', 'xres', 'yres', 'FourCC', 'frame_rate_N', 'frame_rate_D', 'picture_aspect_ratio',
+                 'frame_format_type', 'timecode', 'timestamp', 'line_stride_in_bytes', 'data', 'metadata')
+
+    def __init__(self):
+        self.type = FRAME_TYPE_VIDEO
+        self.metadata = None
+
+
+class SimulatedAudioFrame:
+    """NDIlib.AudioFrameV2 흉내 - data는 (channels, samples) float32 플래너 뷰"""
+    __slots__ = ('type', 'sample_rate', 'no_channels', 'no_samples', 'timecode', 'timestamp',
+                 'channel_stride_in_bytes', 'data', 'metadata')
+
     def __init__(self):
+        self.type = FRAME_TYPE_AUDIO
+        self.metadata = None
+
+
+class SimulatedReceiver:
+    """수신기별 타임라인 - 절대 데드라인으로 프레임 번호를 진행"""
+
+    def __init__(self, settings=None):
+        self.settings = settings
+        self.source = None
+        self.start_time: Optional[float] = None
+        self.frame_index = -1          # 다음에 보낼 비디오 프레임 번호
+        self.due_time = 0.0            # 다음 비디오 프레임 도착 시각
+        self.pending_audio = None      # 직전 비디오 프레임에 딸린 오디오 블록
+        self.audio_position = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self.audio_frames = 0
+        self.max_late_ms = 0.0
+
+
+class NDISimulator:
+    """NDI 기능 시뮬레이터 - 설정 가능한 합성 소스"""
+
+    def __init__(self, config: Optional[SimulatorConfig] = None,
+                 clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep):
         self.initialized = False
         self.sources = []
         self.finder = None
         self.receiver = None
+        self.clock = clock
+        self.sleep = sleep
+        self.config = config or SimulatorConfig()
+        self._patterns: Optional[np.ndarray] = None
+        self._audio: Optional[np.ndarray] = None
+        self._rng = random.Random(self.config.seed)
         logger.info("NDI 시뮬레이터 모드 활성화")
-        
+
+    def configure(self, config: Optional[SimulatorConfig] = None, **changes):
+        """설정 변경 - 패턴은 다음 수신 때 다시 만듦"""
+        config = config or self.config
+        for key, value in changes.items():
+            if not hasattr(config, key):
+                raise AttributeError(f"Unknown simulator setting: {key}")
+            setattr(config, key, value)
+        if config.pixel_format.upper() not in PIXEL_FORMATS:
+            raise ValueError(f"Unsupported pixel format: {config.pixel_format}")
+        config.pixel_format = config.pixel_format.upper()
+        self.config = config
+        self._patterns = None
+        self._audio = None
+        self._rng = random.Random(config.seed)
+        return config
+
     def initialize(self):
         """NDI 초기화 시뮬레이션"""
         self.initialized = True
         logger.info("NDI 시뮬레이터 초기화 완료")
         return True
-        
+
     def destroy(self):
         """NDI 종료 시뮬레이션"""
         self.initialized = False
         logger.info("NDI 시뮬레이터 종료")
-        
-    def find_create_v2(self):
+
+    def find_create_v2(self, *args):
         """Finder 생성 시뮬레이션"""
         self.finder = "SimulatedFinder"
         # 테스트용 가상 소스 추가
-        self.sources = [
-            SimulatedNDISource("테스트 카메라 1 (시뮬레이션)"),
-            SimulatedNDISource("테스트 카메라 2 (시뮬레이션)"),
-            SimulatedNDISource("화면 캡처 (시뮬레이션)")
-        ]
+        self.sources = [SimulatedNDISource(name) for name in self.config.source_names]
         return self.finder
-        
+
     def find_wait_for_sources(self, finder, timeout):
         """소스 대기 시뮬레이션"""
         time.sleep(min(timeout / 1000, 0.1))  # 짧은 대기
         return True
-        
+
     def find_get_current_sources(self, finder):
         """현재 소스 목록 반환"""
         # 가끔 소스 목록 변경 시뮬레이션
-        if random.random() > 0.9:
-            new_source = SimulatedNDISource(f"새 소스 {random.randint(1, 100)} (시뮬레이션)")
+        if self.config.source_churn and self._rng.random() > 0.9:
+            new_source = SimulatedNDISource(f"새 소스 {self._rng.randint(1, 100)} (시뮬레이션)")
             self.sources.append(new_source)
             logger.info(f"시뮬레이션: 새 NDI 소스 발견 - {new_source.ndi_name}")
-        
+
         # list 형태로 반환 (ndi_manager.py와 호환성을 위해)
         return self.sources if self.sources else []
-        
+
     def find_destroy(self, finder):
         """Finder 제거 시뮬레이션"""
         self.finder = None
         logger.info("NDI Finder 시뮬레이션 종료")
-        
-    def recv_create_v3(self, recv_create):
+
+    def recv_create_v3(self, recv_create=None):
         """Receiver 생성 시뮬레이션"""
-        self.receiver = "SimulatedReceiver"
+        self.receiver = SimulatedReceiver(recv_create)
         return self.receiver
-        
+
     def recv_connect(self, receiver, source):
-        """소스 연결 시뮬레이션"""
-        logger.info(f"시뮬레이션: {source.ndi_name}에 연결")
+        """소스 연결 시뮬레이션 - 연결 시각부터 타임라인 시작"""
+        logger.info(f"시뮬레이션: {getattr(source, 'ndi_name', source)}에 연결")
+        self._ensure_patterns()
+        receiver.source = source
+        receiver.start_time = self.clock()
+        receiver.frame_index = -1
+        receiver.pending_audio = None
+        self._schedule_next(receiver)
         return True
-        
+
     def recv_capture_v2(self, receiver, timeout):
-        """프레임 캡처 시뮬레이션"""
-        # 가상 프레임 데이터
-        class VideoFrame:
-            def __init__(self):
-                self.type = 1  # FRAME_TYPE_VIDEO
-                self.width = 1920
-                self.height = 1080
-                self.data = self._generate_test_pattern()
-                
-            def _generate_test_pattern(self):
-                """테스트 패턴 생성"""
-                import numpy as np
-                # 간단한 그라데이션 패턴
-                pattern = np.zeros((1080, 1920, 4), dtype=np.uint8)
-                for y in range(1080):
-                    pattern[y, :, 0] = int(255 * y / 1080)  # R
-                    pattern[y, :, 1] = 128  # G
-                    pattern[y, :, 2] = int(255 * (1 - y / 1080))  # B
-                    pattern[y, :, 3] = 255  # A
-                return pattern
-                
-        time.sleep(0.033)  # 30fps 시뮬레이션
-        return VideoFrame()
-        
+        """프레임 캡처 시뮬레이션 - (frame_type, video, audio, metadata)
+
+        비디오 프레임 데드라인이 timeout 안에 오면 그때까지 기다려 반환하고, 아니면
+        timeout만큼 기다린 뒤 FRAME_TYPE_NONE. 비디오 직후 호출에는 그 프레임 구간의
+        오디오 블록을 바로 반환한다.
+        """
+        if receiver is None or receiver.start_time is None:
+            self.sleep(timeout / 1000.0)
+            return FRAME_TYPE_NONE, None, None, None
+
+        if receiver.pending_audio is not None:
+            audio, receiver.pending_audio = receiver.pending_audio, None
+            receiver.audio_frames += 1
+            return FRAME_TYPE_AUDIO, None, audio, None
+
+        if self.config.paced:
+            remaining = receiver.due_time - self.clock()
+            if remaining * 1000.0 > timeout:
+                self.sleep(timeout / 1000.0)
+                return FRAME_TYPE_NONE, None, None, None
+            self._wait_until(receiver.due_time)
+            late_ms = (self.clock() - receiver.due_time) * 1000.0
+            receiver.max_late_ms = max(receiver.max_late_ms, late_ms)
+
+        video = self._make_video_frame(receiver.frame_index)
+        if self.config.audio_channels > 0:
+            receiver.pending_audio = self._make_audio_frame(receiver, receiver.frame_index)
+        receiver.frames_delivered += 1
+        self._schedule_next(receiver)
+        return FRAME_TYPE_VIDEO, video, None, None
+
     def recv_free_video_v2(self, receiver, video_frame):
-        """비디오 프레임 해제 시뮬레이션"""
+        """비디오 프레임 해제 시뮬레이션 - 패턴 뷰라 할 일 없음"""
+        pass
+
+    def recv_free_audio_v2(self, receiver, audio_frame):
+        """오디오 프레임 해제 시뮬레이션"""
+        pass
+
+    def recv_free_metadata(self, receiver, metadata_frame):
+        """메타데이터 프레임 해제 시뮬레이션"""
         pass
-        
+
     def recv_destroy(self, receiver):
         """Receiver 제거 시뮬레이션"""
-        self.receiver = None
+        if receiver is not None and not isinstance(receiver, str):
+            receiver.start_time = None
+        if receiver is self.receiver:
+            self.receiver = None
         logger.info("NDI Receiver 시뮬레이션 종료")
 
-# 상수 정의
-FRAME_TYPE_VIDEO = 1
-RECV_COLOR_FORMAT_RGBX_RGBA = 3
+    def get_stats(self, receiver=None) -> Dict:
+        """수신기 통계 (전달/드롭/오디오 프레임 수, 최대 지연)"""
+        receiver = receiver or self.receiver
+        if receiver is None:
+            return {}
+        elapsed = self.clock() - receiver.start_time if receiver.start_time is not None else 0.0
+        return {
+            'frames_delivered': receiver.frames_delivered,
+            'frames_dropped': receiver.frames_dropped,
+            'audio_frames': receiver.audio_frames,
+            'max_late_ms': receiver.max_late_ms,
+            'delivered_fps': receiver.frames_delivered / elapsed if elapsed > 0 else 0.0,
+        }
+
+    # --- 타임라인 ---
+    def _schedule_next(self, receiver):
+        """다음 비디오 프레임 번호와 도착 시각 - 드롭은 번호만 건너뛰고 타임스탬프에 반영"""
+        config = self.config
+        receiver.frame_index += 1
+        while config.drop_rate > 0 and self._rng.random() < config.drop_rate:
+            receiver.frame_index += 1
+            receiver.frames_dropped += 1
+        numerator, denominator = config.frame_rate
+        due = receiver.start_time + receiver.frame_index * denominator / numerator
+        if config.jitter_ms > 0:
+            due += self._rng.uniform(0.0, config.jitter_ms / 1000.0)
+        receiver.due_time = due
+
+    def _wait_until(self, deadline: float):
+        """deadline까지 대기 - 대부분 sleep, 마지막 spin_ms는 바쁜 대기"""
+        spin = self.config.spin_ms / 1000.0
+        remaining = deadline - self.clock()
+        if remaining > spin:
+            self.sleep(remaining - spin)
+        while self.clock() < deadline:
+            pass
+
+    def _timestamp(self, frame_index: int) -> int:
+        """프레임 번호 -> 100ns 단위 타임스탬프"""
+        numerator, denominator = self.config.frame_rate
+        return frame_index * 10_000_000 * denominator // numerator
+
+    # --- 프레임 ---
+    def _make_video_frame(self, frame_index: int) -> SimulatedVideoFrame:
+        config = self.config
+        numerator, denominator = config.frame_rate
+        frame = SimulatedVideoFrame()
+        frame.xres = config.width
+        frame.yres = config.height
+        frame.FourCC = PIXEL_FORMATS[config.pixel_format]
+        frame.frame_rate_N = numerator
+        frame.frame_rate_D = denominator
+        frame.picture_aspect_ratio = config.width / config.height
+        frame.frame_format_type = FRAME_FORMAT_TYPE_PROGRESSIVE
+        frame.timestamp = frame.timecode = self._timestamp(frame_index)
+        frame.data = self._patterns[frame_index % len(self._patterns)]
+        frame.line_stride_in_bytes = frame.data.strides[0]
+        return frame
+
+    def _make_audio_frame(self, receiver, frame_index: int) -> SimulatedAudioFrame:
+        """비디오 프레임 구간의 오디오 (59.94p면 800/801 샘플 교대) - 1초 톤 버퍼의 뷰"""
+        config = self.config
+        numerator, denominator = config.frame_rate
+        start = frame_index * config.audio_sample_rate * denominator // numerator
+        end = (frame_index + 1) * config.audio_sample_rate * denominator // numerator
+        samples = end - start
+        position = start % config.audio_sample_rate
+        frame = SimulatedAudioFrame()
+        frame.sample_rate = config.audio_sample_rate
+        frame.no_channels = config.audio_channels
+        frame.no_samples = samples
+        frame.timestamp = frame.timecode = self._timestamp(frame_index)
+        frame.data = self._audio[:, position:position + samples]
+        frame.channel_stride_in_bytes = frame.data.strides[0]
+        return frame
+
+    def _ensure_patterns(self):
+        """패턴/오디오 버퍼를 한 번만 생성"""
+        if self._patterns is None:
+            started = time.perf_counter()
+            self._patterns = make_test_patterns(self.config)
+            logger.info(f"시뮬레이터 패턴 생성: {self.config.pixel_format} {self.config.width}x{self.config.height} "
+                        f"x{len(self._patterns)} ({self._patterns.nbytes / 1e6:.0f} MB, "
+                        f"{(time.perf_counter() - started) * 1000:.0f} ms)")
+        if self._audio is None and self.config.audio_channels > 0:
+            self._audio = make_test_tone(self.config)
+
+
+def make_test_patterns(config: SimulatorConfig) -> np.ndarray:
+    """컬러바 + 프레임마다 이동하는 흰 막대 - (pattern_frames, ...) 읽기 전용 배열
+
+    BGRA: (h, w, 4) uint8, UYVY: (h, w, 2) uint8 (U Y V Y), P216: (2h, w) uint16
+    (16비트 Y 평면 다음에 Cb/Cr 교차 평면 - 4:2:2 반평면).
+    """
+    width, height = config.width, config.height
+    count = max(1, config.pattern_frames)
+    bar_index = (np.arange(width) * len(COLOR_BARS_BGR)) // width
+    bar_width = max(2, width // 32) & ~1  # 크로마 쌍 경계에 맞춤
+
+    if config.pixel_format == "BGRA":
+        row = np.empty((width, 4), dtype=np.uint8)
+        row[:, :3] = np.array(COLOR_BARS_BGR, dtype=np.uint8)[bar_index]
+        row[:, 3] = 255
+        patterns = np.empty((count, height, width, 4), dtype=np.uint8)
+        patterns[:] = row
+        for i in range(count):
+            x = (i * (width - bar_width) // count) & ~1
+            patterns[i, :, x:x + bar_width, :3] = MOVING_BAR_BGR
+    else:
+        yuv = np.array(COLOR_BARS_YUV, dtype=np.uint16)[bar_index]  # (w, 3)
+        luma = yuv[:, 0]
+        chroma = np.empty(width, dtype=np.uint16)
+        chroma[0::2] = yuv[0::2, 1]  # Cb (짝수 픽셀 기준)
+        chroma[1::2] = yuv[0::2, 2]  # Cr
+        if config.pixel_format == "UYVY":
+            patterns = np.empty((count, height, width, 2), dtype=np.uint8)
+            patterns[:, :, :, 0] = chroma.astype(np.uint8)
+            patterns[:, :, :, 1] = luma.astype(np.uint8)
+            for i in range(count):
+                x = (i * (width - bar_width) // count) & ~1
+                patterns[i, :, x:x + bar_width, 0] = 128
+                patterns[i, :, x:x + bar_width, 1] = MOVING_BAR_YUV[0]
+        else:  # P216
+            patterns = np.empty((count, height * 2, width), dtype=np.uint16)
+            patterns[:, :height] = luma << 8
+            patterns[:, height:] = chroma << 8
+            for i in range(count):
+                x = (i * (width - bar_width) // count) & ~1
+                patterns[i, :height, x:x + bar_width] = MOVING_BAR_YUV[0] << 8
+                patterns[i, height:, x:x + bar_width] = 128 << 8
+    patterns.flags.writeable = False
+    return patterns
+
+
+def make_test_tone(config: SimulatorConfig, frequency: float = 1000.0, level_db: float = -20.0) -> np.ndarray:
+    """채널별 1kHz 톤 1초 + 한 블록 여유 - 어느 위치에서 잘라도 연속 (정수 Hz라 1초 주기)"""
+    numerator, denominator = config.frame_rate
+    max_block = config.audio_sample_rate * denominator // numerator + 1
+    t = np.arange(config.audio_sample_rate + max_block) / config.audio_sample_rate
+    amplitude = 10 ** (level_db / 20.0)
+    tone = np.empty((config.audio_channels, t.size), dtype=np.float32)
+    for channel in range(config.audio_channels):
+        tone[channel] = amplitude * np.sin(2 * np.pi * frequency * t + channel * np.pi / 8)
+    tone.flags.writeable = False
+    return tone
+
 
 class RecvCreateV3:
     """Receiver 생성 설정"""
-    def __init__(self):
-        self.color_format = RECV_COLOR_FORMAT_RGBX_RGBA
+    def __init__(self, source_to_connect_to=None, color_format=RECV_COLOR_FORMAT_BGRX_BGRA,
+                 bandwidth=RECV_BANDWIDTH_HIGHEST, allow_video_fields=True):
+        self.source_to_connect_to = source_to_connect_to
+        self.color_format = color_format
+        self.bandwidth = bandwidth
+        self.allow_video_fields = allow_video_fields
 
-# 글로벌 시뮬레이터 인스턴스
-_simulator = NDISimulator()
+# 글로벌 시뮬레이터 인스턴스 (NDI_SIM_* 환경 변수로 설정)
+_simulator = NDISimulator(SimulatorConfig.from_env())
 
 # NDIlib 호환 API
 initialize = _simulator.initialize
 destroy = _simulator.destroy
+configure = _simulator.configure
+get_stats = _simulator.get_stats
 find_create_v2 = _simulator.find_create_v2
 find_wait_for_sources = _simulator.find_wait_for_sources
 find_get_current_sources = _simulator.find_get_current_sources
@@ -144,4 +475,6 @@ recv_create_v3 = _simulator.recv_create_v3
 recv_connect = _simulator.recv_connect
 recv_capture_v2 = _simulator.recv_capture_v2
 recv_free_video_v2 = _simulator.recv_free_video_v2
-recv_destroy = _simulator.recv_destroy
\ No newline at end of file
+recv_free_audio_v2 = _simulator.recv_free_audio_v2
+recv_free_metadata = _simulator.recv_free_metadata
+recv_destroy = _simulator.recv_destroy
@@ -3,5 +3,7 @@ from .ndi_module import NDIModule
 from .ndi_manager import NDIManager
 from .ndi_widget import NDIWidget
 from .ndi_receiver import NDIReceiver
+from .multiview import MultiviewEngine
+from .multiview_widget import MultiviewWidget
 
-__all__ = ['NDIModule', 'NDIManager', 'NDIWidget', 'NDIReceiver']
\ No newline at end of file
+__all__ = ['NDIModule', 'NDIManager', 'NDIWidget', 'NDIReceiver', 'MultiviewEngine', 'MultiviewWidget']
\ No newline at end of file
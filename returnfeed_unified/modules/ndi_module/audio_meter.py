@@ -0,0 +1,165 @@
+# audio_meter.py
+from typing import Optional
+
+import numpy as np
+
+
+# ITU-R BS.1770-4 Annex 2 - 4배 오버샘플링 폴리페이즈 FIR (위상별 12탭)
+TRUE_PEAK_PHASES = np.array([
+    [0.0017089843750, 0.0109863281250, -0.0196533203125, 0.0332031250000,
+     -0.0594482421875, 0.1373291015625, 0.9721679687500, -0.1022949218750,
+     0.0476074218750, -0.0266113281250, 0.0148925781250, -0.0083007812500],
+    [-0.0291748046875, 0.0292968750000, -0.0517578125000, 0.0891113281250,
+     -0.1665039062500, 0.4650878906250, 0.7797851562500, -0.2003173828125,
+     0.1015625000000, -0.0582275390625, 0.0330810546875, -0.0189208984375],
+    [-0.0189208984375, 0.0330810546875, -0.0582275390625, 0.1015625000000,
+     -0.2003173828125, 0.7797851562500, 0.4650878906250, -0.1665039062500,
+     0.0891113281250, -0.0517578125000, 0.0292968750000, -0.0291748046875],
+    [-0.0083007812500, 0.0148925781250, -0.0266113281250, 0.0476074218750,
+     -0.1022949218750, 0.9721679687500, 0.1373291015625, -0.0594482421875,
+     0.0332031250000, -0.0196533203125, 0.0109863281250, 0.0017089843750],
+], dtype=np.float32)
+
+FLOOR_DB = -100.0
+
+# 게시 배열 열 인덱스 - levels[channel, COLUMN]
+VU = 0          # RMS, VU 탄도 (dBFS)
+PPM = 1         # 트루 피크, PPM 탄도 (dBTP)
+TRUE_PEAK = 2   # 게시 구간 내 최대 트루 피크 (dBTP)
+PEAK_HOLD = 3   # 피크 홀드 (dBTP)
+COLUMNS = 4
+
+
+class AudioMeter:
+    """다채널 오디오 미터 - 채널별 RMS / 트루 피크 / PPM·VU 탄도 / 피크 홀드
+
+    NDI 오디오 프레임(float32 planar, (channels, samples))마다 process()를 호출하면
+    오디오 클럭 기준으로 publish_interval마다 (channels, 4) float32 배열을 반환한다.
+    제곱합은 einsum으로, 오버샘플링 FIR은 미리 할당한 버퍼로 matmul 계산하여
+    프레임 크기 임시 배열을 만들지 않는다.
+    """
+
+    VU_TIME_CONSTANT = 0.065     # 300ms에 99% 도달 (IEC 60268-17)
+    PPM_FALL_DB_PER_SEC = 20.0 / 1.7  # IEC 60268-10 Type I: 1.7초에 20dB 하강
+    TAPS = TRUE_PEAK_PHASES.shape[1]
+
+    def __init__(self, publish_interval: float = 0.05, peak_hold_time: float = 1.5):
+        self.publish_interval = publish_interval
+        self.peak_hold_time = peak_hold_time
+
+        # (samples, 4) 형태로 뒤집어 둔 필터 - window @ filter = 4개 위상 출력
+        self._filter = np.ascontiguousarray(TRUE_PEAK_PHASES[:, ::-1].T)
+        self._channels = 0
+        self._history = None   # (channels, TAPS-1 + samples) 이전 프레임 꼬리 포함
+        self._oversampled = None  # (channels, samples, 4)
+        self._sum_squares = None
+        self._block_peak = None
+
+        self._vu_power = None
+        self._ppm_db = None
+        self._interval_peak = None
+        self._hold_db = None
+        self._hold_left = None
+        self._elapsed = 0.0
+        self._levels = None
+
+        # 통계
+        self.frames_processed = 0
+        self.publishes = 0
+
+    def _allocate(self, channels: int, samples: int) -> None:
+        """채널 수가 바뀌면 상태를 새로 만들고, 프레임이 길어지면 작업 버퍼만 늘림"""
+        if channels != self._channels:
+            self._channels = channels
+            self._history = np.zeros((channels, self.TAPS - 1 + samples), dtype=np.float32)
+            self._oversampled = np.empty((channels, samples, 4), dtype=np.float32)
+            self._sum_squares = np.empty(channels, dtype=np.float32)
+            self._block_peak = np.empty(channels, dtype=np.float32)
+            self._vu_power = np.zeros(channels, dtype=np.float64)
+            self._ppm_db = np.full(channels, FLOOR_DB)
+            self._interval_peak = np.zeros(channels, dtype=np.float32)
+            self._hold_db = np.full(channels, FLOOR_DB)
+            self._hold_left = np.zeros(channels)
+            self._levels = np.full((channels, COLUMNS), FLOOR_DB, dtype=np.float32)
+        elif self._history.shape[1] < self.TAPS - 1 + samples:
+            grown = np.zeros((channels, self.TAPS - 1 + samples), dtype=np.float32)
+            grown[:, :self.TAPS - 1] = self._history[:, :self.TAPS - 1]
+            self._history = grown
+            self._oversampled = np.empty((channels, samples, 4), dtype=np.float32)
+
+    def process(self, data: np.ndarray, sample_rate: int = 48000) -> Optional[np.ndarray]:
+        """오디오 프레임 한 개 처리 - 게시 시점이면 (channels, 4) 레벨 배열 반환"""
+        if data.ndim == 1:
+            data = data[None, :]
+        channels, samples = data.shape
+        if channels == 0 or samples == 0:
+            return None
+        self._allocate(channels, samples)
+        dt = samples / float(sample_rate or 48000)
+
+        # 채널별 제곱합 (임시 배열 없음)
+        np.einsum('ij,ij->i', data, data, out=self._sum_squares)
+        block_power = self._sum_squares / samples
+
+        # 트루 피크: 이전 프레임 꼬리 + 현재 프레임을 슬라이딩 윈도우로 보고 4위상 FIR
+        keep = self.TAPS - 1
+        history = self._history[:, :keep + samples]
+        history[:, keep:] = data
+        windows = np.lib.stride_tricks.sliding_window_view(history, self.TAPS, axis=1)
+        oversampled = self._oversampled[:, :samples]
+        np.matmul(windows, self._filter, out=oversampled)
+        np.abs(oversampled, out=oversampled)
+        np.max(oversampled, axis=(1, 2), out=self._block_peak)
+        history[:, :keep] = history[:, samples:samples + keep]
+
+        self._apply_ballistics(block_power, self._block_peak, dt)
+        self.frames_processed += 1
+
+        self._elapsed += dt
+        if self._elapsed < self.publish_interval:
+            return None
+        self._elapsed %= self.publish_interval
+        return self._publish()
+
+    def _apply_ballistics(self, block_power: np.ndarray, block_peak: np.ndarray, dt: float) -> None:
+        # VU: RMS 전력의 1차 지수 평활
+        alpha = 1.0 - np.exp(-dt / self.VU_TIME_CONSTANT)
+        self._vu_power += alpha * (block_power - self._vu_power)
+
+        # PPM: 즉시 상승, 고정 dB/s 하강
+        peak_db = self.to_db(block_peak)
+        fall = self.PPM_FALL_DB_PER_SEC * dt
+        np.maximum(peak_db, self._ppm_db - fall, out=self._ppm_db)
+
+        # 피크 홀드: hold_time 동안 유지 후 PPM 속도로 하강
+        np.maximum(self._interval_peak, block_peak, out=self._interval_peak)
+        rising = peak_db >= self._hold_db
+        self._hold_left = np.where(rising, self.peak_hold_time, self._hold_left - dt)
+        released = np.maximum(peak_db, self._hold_db - fall)
+        self._hold_db = np.where(rising, peak_db, np.where(self._hold_left > 0, self._hold_db, released))
+
+    def _publish(self) -> np.ndarray:
+        levels = self._levels
+        levels[:, VU] = self.to_db(np.sqrt(self._vu_power))
+        levels[:, PPM] = self._ppm_db
+        levels[:, TRUE_PEAK] = self.to_db(self._interval_peak)
+        levels[:, PEAK_HOLD] = self._hold_db
+        self._interval_peak.fill(0.0)
+        self.publishes += 1
+        return levels.copy()  # GUI로 넘기는 작은 스냅샷 (채널 x 4)
+
+    @staticmethod
+    def to_db(linear: np.ndarray) -> np.ndarray:
+        return np.maximum(20.0 * np.log10(np.maximum(linear, 1e-10)), FLOOR_DB)
+
+    def overall_level(self, floor: float = -60.0) -> float:
+        """기존 단일 레벨 표시용 - 가장 큰 채널의 VU 레벨 (dBFS)"""
+        if self._levels is None:
+            return floor
+        return float(max(floor, min(0.0, self._levels[:, VU].max())))
+
+    def reset(self) -> None:
+        """소스 변경 시 상태 초기화"""
+        self._channels = 0
+        self._levels = None
+        self._elapsed = 0.0
@@ -0,0 +1,148 @@
+# capture_scheduler.py
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+# FPSCounter / AdaptiveTimeout는 ndi_app/ndi_core/capture_timing.py와 같은 구현이다.
+# returnfeed_unified는 독립 실행 앱이라 ndi_app을 import 경로에 올리지 않고 복사본을 둔다 - 고칠 때 함께 고칠 것.
+
+
+class FPSCounter:
+    """최근 프레임 도착 시각으로 소스 FPS / 프레임 간격 측정"""
+
+    def __init__(self, window_size: int = 60, clock: Callable[[], float] = time.perf_counter):
+        self.window_size = window_size
+        self.clock = clock
+        self.frame_times = deque(maxlen=window_size)
+
+    def add_frame(self, now: Optional[float] = None) -> None:
+        self.frame_times.append(self.clock() if now is None else now)
+
+    def get_fps(self) -> float:
+        if len(self.frame_times) < 2:
+            return 0.0
+        time_span = self.frame_times[-1] - self.frame_times[0]
+        if time_span > 0:
+            return (len(self.frame_times) - 1) / time_span
+        return 0.0
+
+    def frame_interval(self) -> Optional[float]:
+        """평균 프레임 간격 (초) - 측정 전이면 None"""
+        fps = self.get_fps()
+        return 1.0 / fps if fps > 0 else None
+
+    def reset(self) -> None:
+        self.frame_times.clear()
+
+
+class AdaptiveTimeout:
+    """recv_capture 타임아웃 (ms) - 측정한 프레임 간격과 연속 미수신 기록으로 조정
+
+    기본값은 프레임 간격의 1.5배라서 프레임이 제때 오면 한 번의 대기로 받는다.
+    recv_capture는 프레임이 도착하는 즉시 반환하므로 타임아웃이 길어도 지연은 늘지 않는다.
+    연속으로 놓치면 (소스 정지/끊김) 대기를 늘려 빈 깨어남을 줄이고, 다시 받으면 기본값으로 복귀한다.
+    """
+
+    def __init__(self, base_timeout: int = 25, min_timeout: int = 5, max_timeout: int = 100,
+                 interval_factor: float = 1.5):
+        self.default_timeout = base_timeout
+        self.base_timeout = base_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.interval_factor = interval_factor
+        self.current_timeout = base_timeout
+        self.miss_count = 0
+
+    def get_timeout(self) -> int:
+        return self.current_timeout
+
+    def set_frame_interval(self, interval: Optional[float]) -> None:
+        """측정한 프레임 간격(초)으로 기본 타임아웃 갱신"""
+        if interval is None:
+            return
+        base = int(round(interval * 1000.0 * self.interval_factor))
+        self.base_timeout = max(self.min_timeout, min(self.max_timeout, base))
+
+    def on_frame_received(self) -> None:
+        self.miss_count = 0
+        if self.current_timeout > self.base_timeout:
+            self.current_timeout = max(self.base_timeout, self.current_timeout - 5)
+        else:
+            self.current_timeout = self.base_timeout
+
+    def on_frame_missed(self) -> None:
+        self.miss_count += 1
+        if self.miss_count > 3:
+            self.current_timeout = min(self.max_timeout, self.current_timeout + 10)
+
+    def reset(self) -> None:
+        self.base_timeout = self.default_timeout
+        self.current_timeout = self.default_timeout
+        self.miss_count = 0
+
+
+class CaptureScheduler:
+    """NDI 수신 루프의 캡처 스케줄러 - 다음 recv_capture 타임아웃 결정 + 깨어남 통계
+
+    수신 루프는 next_timeout_ms()로 대기하고, 결과에 따라 on_video_frame() /
+    on_other_frame() / on_timeout()을 호출한다. 30p 소스면 비디오 대기는 프레임당 한 번 깨어난다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, stats_window: float = 1.0):
+        self.clock = clock
+        self.stats_window = stats_window
+        self.fps_counter = FPSCounter(window_size=30, clock=clock)
+        self.adaptive_timeout = AdaptiveTimeout()
+        self.reset()
+
+    def next_timeout_ms(self) -> int:
+        return self.adaptive_timeout.get_timeout()
+
+    def on_video_frame(self) -> None:
+        now = self._wakeup()
+        self.fps_counter.add_frame(now)
+        self.adaptive_timeout.set_frame_interval(self.fps_counter.frame_interval())
+        self.adaptive_timeout.on_frame_received()
+        self.video_frames += 1
+
+    def on_other_frame(self) -> None:
+        """오디오/메타데이터 - 깨어남으로만 집계 (비디오 미수신 기록은 유지)"""
+        self._wakeup()
+
+    def on_timeout(self) -> None:
+        self._wakeup()
+        self.adaptive_timeout.on_frame_missed()
+        self.timeouts += 1
+
+    def _wakeup(self) -> float:
+        now = self.clock()
+        self.wakeups += 1
+        self._window_wakeups += 1
+        elapsed = now - self._window_start
+        if elapsed >= self.stats_window:
+            self.wakeups_per_sec = self._window_wakeups / elapsed
+            self._window_wakeups = 0
+            self._window_start = now
+        return now
+
+    def reset(self) -> None:
+        """소스 변경 시 측정 초기화"""
+        self.fps_counter.reset()
+        self.adaptive_timeout.reset()
+        self.wakeups = 0
+        self.video_frames = 0
+        self.timeouts = 0
+        self.wakeups_per_sec = 0.0
+        self._window_wakeups = 0
+        self._window_start = self.clock()
+
+    def get_stats(self) -> Dict:
+        """스케줄러 통계 - wakeups_per_sec는 최근 stats_window 초 기준"""
+        return {
+            'wakeups_per_sec': round(self.wakeups_per_sec, 1),
+            'source_fps': round(self.fps_counter.get_fps(), 2),
+            'timeout_ms': self.adaptive_timeout.get_timeout(),
+            'wakeups': self.wakeups,
+            'video_frames': self.video_frames,
+            'timeouts': self.timeouts,
+        }
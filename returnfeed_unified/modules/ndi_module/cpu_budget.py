@@ -0,0 +1,88 @@
+# cpu_budget.py
+import os
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class CpuBudget:
+    """전역 CPU 예산 - 사용률이 예산을 넘으면 멀티뷰 타일 fps 상한을 한 단계씩 낮춤
+
+    psutil이 있으면 시스템 전체 사용률, 없으면 이 프로세스의 CPU 시간 / (경과 시간 x 코어 수)를 쓴다.
+    올릴 때는 예산의 recover_ratio 아래에서 hold_samples번 연속 머물러야 하므로 경계에서 출렁이지 않는다.
+    """
+
+    FPS_STEPS = (30, 25, 15, 10, 5)
+
+    def __init__(self, budget: float = 0.75, recover_ratio: float = 0.7, hold_samples: int = 3,
+                 fps_steps: Sequence[int] = FPS_STEPS,
+                 usage_source: Optional[Callable[[], float]] = None):
+        self.budget = budget
+        self.recover_ratio = recover_ratio
+        self.hold_samples = hold_samples
+        self.fps_steps = tuple(fps_steps)
+        self.level = 0  # fps_steps 인덱스
+        self.usage = 0.0
+        self._calm_samples = 0
+
+        if usage_source is not None:
+            self._usage_source = usage_source
+        elif PSUTIL_AVAILABLE:
+            psutil.cpu_percent(None)  # 첫 호출은 기준점만 설정
+            self._usage_source = lambda: psutil.cpu_percent(None) / 100.0
+        else:
+            self._cpu_count = os.cpu_count() or 1
+            self._last_wall = time.perf_counter()
+            self._last_cpu = time.process_time()
+            self._usage_source = self._process_usage
+
+        # 통계
+        self.step_downs = 0
+        self.step_ups = 0
+
+    def _process_usage(self) -> float:
+        wall, cpu = time.perf_counter(), time.process_time()
+        elapsed = wall - self._last_wall
+        usage = (cpu - self._last_cpu) / (elapsed * self._cpu_count) if elapsed > 0 else 0.0
+        self._last_wall, self._last_cpu = wall, cpu
+        return usage
+
+    @property
+    def fps(self) -> int:
+        return self.fps_steps[self.level]
+
+    def update(self) -> int:
+        """사용률 한 번 측정 후 타일 fps 상한 반환 (주기적으로 호출)"""
+        self.usage = self._usage_source()
+        if self.usage > self.budget:
+            self._calm_samples = 0
+            if self.level < len(self.fps_steps) - 1:
+                self.level += 1
+                self.step_downs += 1
+        elif self.usage < self.budget * self.recover_ratio:
+            self._calm_samples += 1
+            if self._calm_samples >= self.hold_samples and self.level > 0:
+                self.level -= 1
+                self.step_ups += 1
+                self._calm_samples = 0
+        else:
+            self._calm_samples = 0
+        return self.fps
+
+    def reset(self) -> None:
+        self.level = 0
+        self._calm_samples = 0
+
+    def get_stats(self) -> Dict:
+        return {
+            'usage': round(self.usage, 3),
+            'budget': self.budget,
+            'tile_fps': self.fps,
+            'step_downs': self.step_downs,
+            'step_ups': self.step_ups,
+        }
@@ -0,0 +1,68 @@
+# frame_mailbox.py
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+class FrameMailbox:
+    """단일 슬롯 latest-wins 프레임 메일박스
+
+    수신 스레드는 publish()로 최신 프레임을 덮어쓰고, GUI는 화면 갱신 시점에
+    fetch()로 가져간다. 큐가 없으므로 GUI가 멈춰도 메모리는 한 프레임으로
+    제한되고 지연도 한 프레임을 넘지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frame: Optional[Any] = None
+        self._frame_id = 0  # 단조 증가 프레임 ID
+        self._consumed = True
+
+        # 통계
+        self.published = 0
+        self.delivered = 0
+        self.overwritten = 0  # 한 번도 읽히지 않고 덮어써진 프레임
+
+    def publish(self, frame: Any) -> bool:
+        """최신 프레임 게시 - 직전 프레임이 이미 읽혔으면 True (알림 필요)"""
+        with self._lock:
+            was_consumed = self._consumed
+            if not was_consumed:
+                self.overwritten += 1
+            self._frame_id += 1
+            self._frame = frame
+            self._consumed = False
+            self.published += 1
+        return was_consumed
+
+    def fetch(self, last_id: int = 0) -> Tuple[int, Optional[Any]]:
+        """last_id 이후의 새 프레임이 있으면 (frame_id, frame), 없으면 (last_id, None)
+
+        읽기는 비파괴적이므로 여러 소비자가 각자의 last_id로 가져갈 수 있다.
+        """
+        with self._lock:
+            if self._frame is None or self._frame_id <= last_id:
+                return last_id, None
+            if not self._consumed:
+                self._consumed = True
+                self.delivered += 1
+            return self._frame_id, self._frame
+
+    def clear(self) -> None:
+        """보관 중인 프레임 제거 (ID는 유지)"""
+        with self._lock:
+            self._frame = None
+            self._consumed = True
+
+    @property
+    def latest_id(self) -> int:
+        return self._frame_id
+
+    def get_stats(self) -> Dict[str, int]:
+        """게시/전달/덮어쓰기 통계"""
+        with self._lock:
+            return {
+                'frame_id': self._frame_id,
+                'published': self.published,
+                'delivered': self.delivered,
+                'overwritten': self.overwritten,
+            }
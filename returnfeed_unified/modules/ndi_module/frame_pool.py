@@ -0,0 +1,95 @@
+# frame_pool.py
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class FrameBufferPool:
+    """NDI 비디오 프레임용 사전 할당 버퍼 풀
+
+    수신 스레드는 acquire()로 슬롯을 받아 np.copyto로 프레임을 복사하고,
+    슬롯은 해당 QImage가 GUI 스레드에서 그려진 뒤 버려질 때 풀로 돌아온다.
+    슬롯은 해상도(xres/yres) 또는 스트라이드가 바뀔 때만 재할당된다.
+    """
+
+    def __init__(self, num_slots: int = 6):
+        self.num_slots = max(1, int(num_slots))
+        self._lock = threading.Lock()
+        self._layout: Optional[Tuple[Any, ...]] = None  # (shape, dtype, stride)
+        self._generation = 0
+        self._slots = []
+        self._free = []
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.reallocations = 0
+        self.in_flight = 0
+
+    def acquire(self, shape, dtype, stride: int = 0) -> Tuple[Optional[Tuple[int, int]], np.ndarray]:
+        """빈 슬롯 획득 - (token, buffer) 반환
+
+        풀이 고갈되면 임시 버퍼를 할당하고 token은 None이 된다 (miss로 집계).
+        """
+        layout = (tuple(shape), np.dtype(dtype), int(stride or 0))
+        with self._lock:
+            if layout != self._layout:
+                self._reallocate(layout)
+            if self._free:
+                index = self._free.pop()
+                self.hits += 1
+                self.in_flight += 1
+                return (self._generation, index), self._slots[index]
+            self.misses += 1
+        return None, np.empty(shape, dtype=dtype)
+
+    def release(self, token: Optional[Tuple[int, int]]) -> None:
+        """슬롯을 풀에 반환 - 이전 해상도 세대의 토큰은 무시"""
+        if token is None:
+            return
+        generation, index = token
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._free.append(index)
+            self.in_flight -= 1
+
+    def bind(self, owner, token: Optional[Tuple[int, int]]) -> None:
+        """owner(QImage)가 가비지 컬렉션될 때 슬롯이 반환되도록 연결
+
+        GUI 위젯은 새 프레임을 그리기 전까지 현재 QImage를 붙잡고 있으므로,
+        슬롯은 그려진(또는 그려지기 전에 대체된) 뒤에만 재사용된다.
+        """
+        if token is None:
+            return
+        weakref.finalize(owner, self.release, token)
+
+    def _reallocate(self, layout: Tuple[Any, ...]) -> None:
+        """해상도/스트라이드 변경 시 슬롯 재할당 (lock 보유 상태에서 호출)"""
+        shape, dtype, _stride = layout
+        self._layout = layout
+        self._generation += 1
+        # 이전 슬롯은 아직 살아있는 QImage가 참조를 유지하므로 안전하게 버릴 수 있음
+        self._slots = [np.empty(shape, dtype=dtype) for _ in range(self.num_slots)]
+        self._free = list(range(self.num_slots))
+        self.in_flight = 0
+        self.reallocations += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """풀 통계 반환"""
+        with self._lock:
+            return {
+                'slots': self.num_slots,
+                'hits': self.hits,
+                'misses': self.misses,
+                'in_flight': self.in_flight,
+                'reallocations': self.reallocations,
+            }
+
+    def reset_stats(self) -> None:
+        """hit/miss 카운터 리셋"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,196 @@
+# frame_scaler.py
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+_CURRENT_PLAN = object()  # scale()의 plan 기본값 - 호출 시점의 목표 크기로 계획
+
+
+class FrameScaler:
+    """표시 해상도로의 워커 스레드 다운스케일러
+
+    GUI 위젯이 자신의 디바이스 픽셀 크기를 set_target_size()로 알려주면
+    수신 스레드가 QImage 생성 전에 프레임을 그 크기로 줄인다. GUI 스레드는
+    스케일링 없이 1:1로 그리기만 한다.
+
+    1단계: 정수 배율 박스 필터 (행 단위 누적 후 열 단위 누적, uint16/uint32 정수 연산)
+    2단계: 남은 비정수 배율은 캐시된 인덱스 배열로 최근접 샘플링
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._target: Optional[Tuple[int, int]] = None  # (width, height) 디바이스 픽셀 - 실제 축소 목표
+        self._display_size: Optional[Tuple[int, int]] = None  # GUI가 알려준 표시 영역
+        self._size_limit: Optional[Tuple[int, int]] = None  # 표시 영역과 관계없는 출력 상한 (스로틀 프리뷰)
+
+        # (입력 shape, 목표) 별 캐시 - 해상도나 창 크기가 바뀔 때만 재계산
+        self._plan_key = None
+        self._plan: Optional[Dict] = None
+
+        # 통계
+        self.scaled_frames = 0
+        self.passthrough_frames = 0
+
+    def set_target_size(self, width: int, height: int) -> None:
+        """표시 영역 크기 설정 (GUI 스레드) - 0 이하이면 스케일링 비활성화"""
+        with self._lock:
+            self._display_size = (int(width), int(height)) if width > 0 and height > 0 else None
+            self._update_target()
+
+    def set_size_limit(self, width: int, height: int) -> None:
+        """출력 크기 상한 - 표시 영역이 더 커도 이 크기 안으로 축소 (0 이하이면 해제)"""
+        with self._lock:
+            self._size_limit = (int(width), int(height)) if width > 0 and height > 0 else None
+            self._update_target()
+
+    def _update_target(self) -> None:
+        display, limit = self._display_size, self._size_limit
+        if display is None or limit is None:
+            self._target = display or limit
+        else:
+            self._target = (min(display[0], limit[0]), min(display[1], limit[1]))
+
+    @property
+    def target_size(self) -> Optional[Tuple[int, int]]:
+        return self._target
+
+    def fit_size(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """원본 비율을 유지하며 목표 영역에 맞춘 (width, height) - 축소가 필요 없으면 None"""
+        return self._fit(self._target, width, height)
+
+    @staticmethod
+    def _fit(target: Optional[Tuple[int, int]], width: int, height: int) -> Optional[Tuple[int, int]]:
+        if target is None or width <= 0 or height <= 0:
+            return None
+        scale = min(target[0] / width, target[1] / height)
+        if scale >= 1.0:
+            return None  # 확대는 GUI에 맡김 - 원본 그대로 전달
+        return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+    def plan(self, shape: Tuple[int, ...]) -> Optional[Dict]:
+        """지금 목표 크기 기준 스케일링 계획 (스케일링이 필요 없으면 None)
+
+        GUI 스레드가 그 사이에 목표를 바꿔도 같은 프레임의 버퍼 크기와 scale()이 어긋나지 않도록
+        수신 스레드는 프레임마다 한 번 받아서 plan['out_shape']와 scale(..., plan)에 함께 쓴다.
+        """
+        return self._get_plan(shape)
+
+    def output_shape(self, shape: Tuple[int, ...]) -> Optional[Tuple[int, ...]]:
+        """입력 (H, W, C) 프레임의 출력 shape - 스케일링이 필요 없으면 None"""
+        plan = self._get_plan(shape)
+        return plan['out_shape'] if plan else None
+
+    def scale(self, src: np.ndarray, out: np.ndarray, plan: Optional[Dict] = _CURRENT_PLAN) -> np.ndarray:
+        """src를 out 버퍼로 축소 - plan을 주지 않으면 지금 목표 크기의 계획 (output_shape() 크기)"""
+        if plan is _CURRENT_PLAN:
+            plan = self._get_plan(src.shape)
+        if plan is None:
+            np.copyto(out, src)
+            self.passthrough_frames += 1
+            return out
+
+        rows, cols = plan['rows'], plan['cols']
+        if plan['factor'] > 1:
+            # 정수 배율로 끝나면 박스 필터 결과를 out에 바로 기록
+            reduced = self._box_reduce(src, plan, out if rows is None else plan['reduced'])
+        else:
+            reduced = src
+
+        if rows is not None:
+            # 최근접 샘플링 - 인덱스는 캐시되어 있으므로 프레임당 take 두 번
+            np.take(np.take(reduced, rows, axis=0), cols, axis=1, out=out)
+
+        self.scaled_frames += 1
+        return out
+
+    def _get_plan(self, shape: Tuple[int, ...]) -> Optional[Dict]:
+        target = self._target
+        if target is None or len(shape) != 3 or shape[2] not in (3, 4):
+            return None  # 패킹된 YUV(2채널)는 픽셀 쌍 단위라 박스 필터 대상이 아님
+
+        key = (tuple(shape), target)
+        if key == self._plan_key:
+            return self._plan
+
+        # 키와 같은 target 스냅샷으로 계획 - 계산 중에 목표가 바뀌면 다음 프레임에서 다시 계획
+        plan = self._build_plan(shape, self._fit(target, shape[1], shape[0]))
+        with self._lock:
+            self._plan = plan
+            self._plan_key = key
+        return plan
+
+    @staticmethod
+    def _build_plan(shape: Tuple[int, ...], fit: Optional[Tuple[int, int]]) -> Optional[Dict]:
+        if fit is None:
+            return None
+        height, width, channels = shape
+        out_w, out_h = fit
+
+        # 출력보다 작아지지 않는 최대 정수 배율
+        factor = max(1, min(width // out_w, height // out_h))
+        reduced_w = width // factor
+        reduced_h = height // factor
+
+        plan = {
+            'out_shape': (out_h, out_w, channels),
+            'factor': factor,
+            'reduced_shape': (reduced_h, reduced_w, channels),
+            'rows': None,
+            'cols': None,
+        }
+
+        if factor > 1:
+            taps = factor * factor
+            acc_dtype = np.uint16 if taps * 255 <= np.iinfo(np.uint16).max else np.uint32
+            plan['acc_rows'] = np.empty((reduced_h, reduced_w * factor, channels), dtype=acc_dtype)
+            plan['acc'] = np.empty((reduced_h, reduced_w, channels), dtype=acc_dtype)
+            plan['shift'] = taps.bit_length() - 1 if taps & (taps - 1) == 0 else None
+            plan['taps'] = taps
+            plan['reduced'] = np.empty((reduced_h, reduced_w, channels), dtype=np.uint8)
+
+        if (reduced_h, reduced_w) != (out_h, out_w):
+            # 픽셀 중심 기준 최근접 인덱스
+            plan['rows'] = ((np.arange(out_h) + 0.5) * reduced_h / out_h).astype(np.intp)
+            plan['cols'] = ((np.arange(out_w) + 0.5) * reduced_w / out_w).astype(np.intp)
+
+        return plan
+
+    @staticmethod
+    def _box_reduce(src: np.ndarray, plan: Dict, dest: np.ndarray) -> np.ndarray:
+        """factor x factor 블록 평균을 dest에 기록 - 반올림 포함 정수 연산"""
+        factor = plan['factor']
+        reduced_h, reduced_w, _ = plan['reduced_shape']
+        acc_rows, acc = plan['acc_rows'], plan['acc']
+        crop = src[:reduced_h * factor, :reduced_w * factor]
+
+        # 세로: 연속된 행끼리 더함 (행 내부는 연속 메모리)
+        np.add(crop[0::factor], crop[1::factor], out=acc_rows, dtype=acc_rows.dtype)
+        for dy in range(2, factor):
+            np.add(acc_rows, crop[dy::factor], out=acc_rows, casting='unsafe')
+
+        # 가로: (W, factor, C) 뷰에서 블록 내 열끼리 더함
+        columns = acc_rows.reshape(reduced_h, reduced_w, factor, -1)
+        np.add(columns[:, :, 0], columns[:, :, 1], out=acc)
+        for dx in range(2, factor):
+            np.add(acc, columns[:, :, dx], out=acc)
+
+        acc += plan['taps'] // 2
+        if plan['shift'] is not None:
+            np.right_shift(acc, plan['shift'], out=acc)
+        else:
+            np.floor_divide(acc, plan['taps'], out=acc)
+        np.copyto(dest, acc, casting='unsafe')
+        return dest
+
+    def get_stats(self) -> Dict:
+        """스케일링 통계"""
+        plan = self._plan
+        return {
+            'target': self._target,
+            'size_limit': self._size_limit,
+            'factor': plan['factor'] if plan else 1,
+            'output': plan['out_shape'][:2] if plan else None,
+            'scaled_frames': self.scaled_frames,
+            'passthrough_frames': self.passthrough_frames,
+        }
@@ -0,0 +1,169 @@
+# glass_latency.py
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import numpy as np
+
+# NDIlib_recv_timestamp_undefined - 송신 측이 타임스탬프를 채우지 않은 프레임
+NDI_TIMESTAMP_UNDEFINED = 0x7FFFFFFFFFFFFFFF
+# 100ns 단위 UNIX 시각으로 볼 수 있는 최솟값 (2001년) - 이보다 작은 timecode는 프레임 카운터 등 임의 값
+MIN_EPOCH_100NS = 10 ** 16
+
+
+def sender_time_100ns(timestamp, timecode) -> Optional[int]:
+    """프레임의 송신 시각 (100ns, UNIX epoch) - timestamp 우선, 없으면 합성된 timecode"""
+    for value in (timestamp, timecode):
+        if value is not None and MIN_EPOCH_100NS <= value < NDI_TIMESTAMP_UNDEFINED:
+            return int(value)
+    return None
+
+
+class ClockOffsetEstimator:
+    """송신/수신 시계 차이 추정 - 도착 시각 - 송신 시각의 슬라이딩 윈도우 최솟값
+
+    한 방향 지연 = 전송 지연 + 시계 차이. 전송 지연의 바닥(큐가 비었을 때)은 거의
+    일정하므로 window_seconds 안의 최솟값이 '시계 차이 + 최소 전송 지연'이 된다.
+    윈도우를 밀면서 최솟값을 다시 잡으므로 시계 드리프트도 따라간다.
+    최솟값이 0~sync_tolerance 사이면 두 시계가 이미 맞춰진 것(같은 PC/PTP/NTP)으로 보고
+    보정하지 않는다.
+    """
+
+    def __init__(self, window_seconds: float = 10.0, sync_tolerance_ms: float = 50.0,
+                 base_transit_ms: float = 1.0):
+        self.window_100ns = int(window_seconds * 1e7)
+        self.sync_tolerance_100ns = int(sync_tolerance_ms * 1e4)
+        self.base_transit_100ns = int(base_transit_ms * 1e4)  # 시계가 안 맞을 때 가정하는 최소 전송 지연
+        self._window: Deque[Tuple[int, int]] = deque()  # (수신 시각, 한 방향 지연) - 지연이 단조 증가하는 후보만 유지
+        self.samples = 0
+
+    def reset(self):
+        self._window.clear()
+        self.samples = 0
+
+    def add(self, sender_100ns: int, received_100ns: int):
+        delay = received_100ns - sender_100ns
+        window = self._window
+        while window and window[-1][1] >= delay:
+            window.pop()
+        window.append((received_100ns, delay))
+        while window[0][0] < received_100ns - self.window_100ns:
+            window.popleft()
+        self.samples += 1
+
+    @property
+    def min_delay_100ns(self) -> Optional[int]:
+        window = self._window
+        return window[0][1] if window else None
+
+    @property
+    def synced(self) -> bool:
+        """두 시계가 이미 맞춰져 있는지 (보정 불필요)"""
+        min_delay = self.min_delay_100ns
+        return min_delay is not None and 0 <= min_delay <= self.sync_tolerance_100ns
+
+    @property
+    def offset_100ns(self) -> int:
+        """수신 시계 - 송신 시계 추정치 (맞춰진 시계면 0)"""
+        min_delay = self.min_delay_100ns
+        if min_delay is None or self.synced:
+            return 0
+        return min_delay - self.base_transit_100ns
+
+
+class GlassToGlassEstimator:
+    """송신 -> 화면 표시 지연 (NDI 프레임 timestamp/timecode 기준)
+
+    수신 스레드: on_arrival()로 송신/도착 시각을 시계 차이 추정기에 넣는다.
+    GUI 스레드: 메일박스에서 프레임을 가져올 때 on_pickup(), 그 프레임을 그린 paintEvent
+    끝에서 on_present(). 표시 시각은 도착 벽시계 + (표시 - 도착) perf_counter 차이로
+    구하므로 벽시계 보정이 중간에 일어나도 튀지 않는다.
+    최근 window_frames 개의 지연으로 p50/p95를 refresh_interval마다 다시 계산한다
+    (표시는 GUI가 get_stats()로 읽어 상태 표시줄/오버레이에).
+    """
+
+    def __init__(self, window_frames: int = 300, refresh_interval: float = 0.5,
+                 clock_estimator: Optional[ClockOffsetEstimator] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.clock_estimator = clock_estimator or ClockOffsetEstimator()
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self._latencies: Deque[float] = deque(maxlen=window_frames)  # ms
+        self._pending: Optional[Tuple[int, int, float]] = None  # (송신 100ns, 도착 벽시계 100ns, 도착 perf)
+        self._lock = threading.Lock()  # 시계 차이 추정기 (수신 스레드 기록 / GUI 스레드 조회)
+        self._last_refresh = 0.0
+        self._stats = self._empty_stats()
+        self.presented = 0
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {'p50_ms': None, 'p95_ms': None, 'samples': 0, 'clock_synced': None, 'clock_offset_ms': 0.0}
+
+    def reset(self):
+        with self._lock:
+            self.clock_estimator.reset()
+        self._latencies.clear()
+        self._pending = None
+        self._stats = self._empty_stats()
+
+    def on_arrival(self, timestamp, timecode, received_100ns: int) -> Optional[int]:
+        """수신 스레드 - 프레임 도착. 사용한 송신 시각 (없으면 None)"""
+        sender = sender_time_100ns(timestamp, timecode)
+        if sender is not None:
+            with self._lock:
+                self.clock_estimator.add(sender, received_100ns)
+        return sender
+
+    def on_pickup(self, frame_data):
+        """GUI 스레드 - 메일박스에서 새 프레임을 가져온 직후"""
+        if not isinstance(frame_data, dict):
+            return
+        sender = sender_time_100ns(frame_data.get('timestamp'), frame_data.get('timecode'))
+        received_wall = frame_data.get('received_wall')
+        received_at = frame_data.get('received_at')
+        if sender is None or received_wall is None or received_at is None:
+            return
+        self._pending = (sender, received_wall, received_at)
+
+    def on_present(self, presented_at: Optional[float] = None):
+        """GUI 스레드 - paintEvent 끝. 픽업한 프레임이 있으면 지연 한 개 기록"""
+        pending = self._pending
+        if pending is None:
+            return
+        self._pending = None
+        sender, received_wall, received_at = pending
+        presented_at = self.clock() if presented_at is None else presented_at
+        with self._lock:
+            offset = self.clock_estimator.offset_100ns
+        presented_wall = received_wall + (presented_at - received_at) * 1e7
+        self._latencies.append((presented_wall - sender - offset) / 1e4)
+        self.presented += 1
+        if presented_at - self._last_refresh >= self.refresh_interval:
+            self._last_refresh = presented_at
+            self._refresh()
+
+    def _refresh(self):
+        with self._lock:
+            synced = self.clock_estimator.synced
+            offset = self.clock_estimator.offset_100ns
+        p50, p95 = np.percentile(np.fromiter(self._latencies, dtype=np.float64), (50, 95))
+        self._stats = {
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'samples': len(self._latencies),
+            'clock_synced': synced,
+            'clock_offset_ms': offset / 1e4,
+        }
+
+    def get_stats(self) -> Dict:
+        """{'p50_ms', 'p95_ms', 'samples', 'clock_synced', 'clock_offset_ms'} - 샘플이 없으면 p50/p95는 None"""
+        return dict(self._stats)
+
+
+def format_latency(stats: Optional[Dict]) -> str:
+    """'G2G 42/58 ms' (p50/p95) - 시계를 추정 보정한 값은 '≈' 표시, 측정 전이면 빈 문자열"""
+    if not stats or stats.get('p50_ms') is None:
+        return ""
+    approx = "" if stats.get('clock_synced') else "≈"
+    return f"G2G {approx}{stats['p50_ms']:.0f}/{stats['p95_ms']:.0f} ms"
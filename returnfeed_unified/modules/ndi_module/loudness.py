@@ -0,0 +1,276 @@
+# loudness.py
+import math
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+LUFS_OFFSET = -0.691
+
+# 적분 라우드니스 게이팅용 히스토그램 (0.1 LU 해상도)
+HISTOGRAM_MIN_LUFS = ABSOLUTE_GATE_LUFS
+HISTOGRAM_MAX_LUFS = 10.0
+HISTOGRAM_STEP = 0.1
+
+
+def k_weighting_coefficients(sample_rate: int):
+    """ITU-R BS.1770 K-가중 필터 (고역 쉘프 + 고역 통과) - 표본화 주파수에 맞춘 bilinear 설계
+
+    48 kHz에서 규격 표의 계수와 일치한다. 두 단의 (b, a) biquad 목록을 반환.
+    """
+    # 1단계: 머리 효과를 모델링한 고역 쉘프
+    f0, gain_db, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = math.tan(math.pi * f0 / sample_rate)
+    vh = 10.0 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf_b = np.array([(vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0])
+    shelf_a = np.array([1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0])
+
+    # 2단계: RLB 고역 통과
+    f0, q = 38.13547087602444, 0.5003270373238773
+    k = math.tan(math.pi * f0 / sample_rate)
+    a0 = 1.0 + k / q + k * k
+    highpass_b = np.array([1.0, -2.0, 1.0])
+    highpass_a = np.array([1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0])
+
+    return [(shelf_b, shelf_a), (highpass_b, highpass_a)]
+
+
+class BiquadBlockFilter:
+    """biquad 한 단의 정확한 블록 처리 (스트리밍 상태 유지)
+
+    블록 길이 N에 대해 출력 = (입력 * 임펄스 응답 h[:N]) + (이전 상태의 영입력 응답).
+    컨볼루션은 rfft로, 영입력 응답은 (4, N) 행렬 곱으로 계산하므로 샘플 단위 파이썬 루프가 없다.
+    상태는 Direct Form I (최근 입력 2개, 출력 2개).
+    4차 하나로 합치면 38Hz 부근의 겹친 극점 때문에 영입력 응답 오차가 커지므로
+    규격대로 두 단을 따로 둔다.
+
+    h와 영입력 응답은 블록 길이와 관계없는 무한 수열의 앞부분이므로 가장 긴 블록 길이만큼
+    한 번 계산해 두고 잘라 쓴다 (프레임 싱크 오디오처럼 블록 길이가 매번 달라도 재계산 없음).
+    길이에 따라 달라지는 것은 2의 거듭제곱 FFT 크기별 h 스펙트럼뿐이라 작은 LRU로 충분하다.
+    """
+
+    ORDER = 2
+    FFT_CACHE_SIZE = 8
+    STEP = 8  # 행렬 거듭제곱 한 번에 늘리는 행 수 (제곱을 반복하는 방식은 38Hz 겹친 극점에서 오차가 1e-9까지 커짐)
+
+    def __init__(self, b: np.ndarray, a: np.ndarray):
+        self.b = b
+        self.a = a
+        # 상태 공간 표현 s[n+1] = A s[n] + B x[n], y[n] = c . s[n] + b0 x[n]
+        self._transition = np.array([
+            [0.0, 0.0, 0.0, 0.0],
+            [1.0, 0.0, 0.0, 0.0],
+            [b[1], b[2], -a[1], -a[2]],
+            [0.0, 0.0, 1.0, 0.0],
+        ])
+        self._input = np.array([1.0, 0.0, b[0], 0.0])
+        # n번째 행 = c A^n - 처음 STEP 행은 한 행씩, 이후는 STEP 행 묶음에 A^STEP을 곱해 확장
+        rows = np.empty((self.STEP, 2 * self.ORDER))
+        rows[0] = [b[1], b[2], -a[1], -a[2]]
+        for n in range(1, self.STEP):
+            rows[n] = rows[n - 1] @ self._transition
+        self._rows = rows
+        self._step_power = np.linalg.matrix_power(self._transition, self.STEP)
+        self._h_ffts: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._state: Optional[np.ndarray] = None  # (channels, 4) = x[n-1], x[n-2], y[n-1], y[n-2]
+
+    def _response_rows(self, length: int) -> np.ndarray:
+        """c A^n (n < length) 행렬 - 더 긴 블록이 올 때만 2배 길이로 확장 (STEP 행씩 A^STEP 곱)"""
+        rows = self._rows
+        if len(rows) < length:
+            step = self.STEP
+            size = len(rows)
+            while size < length:
+                size *= 2
+            grown = np.empty((size, rows.shape[1]))
+            grown[:len(rows)] = rows
+            for start in range(len(rows), size, step):
+                np.matmul(grown[start - step:start], self._step_power, out=grown[start:start + step])
+            self._rows = rows = grown
+        return rows
+
+    def _h_fft(self, nfft: int) -> np.ndarray:
+        """FFT 크기별 임펄스 응답 스펙트럼 (h[:nfft // 2] - nfft >= 2N - 1이면 앞 N개 출력에 겹침 없음)"""
+        h_fft = self._h_ffts.get(nfft)
+        if h_fft is not None:
+            self._h_ffts.move_to_end(nfft)
+            return h_fft
+        taps = max(1, nfft // 2)
+        h = np.empty(taps)
+        h[0] = self.b[0]
+        h[1:] = self._response_rows(taps - 1)[:taps - 1] @ self._input  # h[n] = c A^(n-1) B
+        h_fft = np.fft.rfft(h, nfft)
+        self._h_ffts[nfft] = h_fft
+        if len(self._h_ffts) > self.FFT_CACHE_SIZE:
+            self._h_ffts.popitem(last=False)
+        return h_fft
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """(channels, N) 블록 필터링 - 반환 배열은 float64 (channels, N)"""
+        channels, samples = block.shape
+        if self._state is None or self._state.shape[0] != channels:
+            self._state = np.zeros((channels, 2 * self.ORDER))
+        nfft = 1 << (2 * samples - 1).bit_length()
+
+        spectrum = np.fft.rfft(block, nfft, axis=1)
+        spectrum *= self._h_fft(nfft)
+        out = np.fft.irfft(spectrum, nfft, axis=1)[:, :samples]
+        out += self._state @ self._response_rows(samples)[:samples].T  # 영입력 응답 (4, N)
+
+        # 다음 블록을 위한 상태 갱신 (최근 것부터)
+        order = self.ORDER
+        state = self._state
+        if samples >= order:
+            state[:, :order] = block[:, :-order - 1:-1]
+            state[:, order:] = out[:, :-order - 1:-1]
+        else:
+            state[:, :order] = np.concatenate([block[:, ::-1], state[:, :order - samples]], axis=1)
+            state[:, order:] = np.concatenate([out[:, ::-1], state[:, order:2 * order - samples]], axis=1)
+        return out
+
+    def reset(self) -> None:
+        self._state = None
+
+
+class KWeightingFilter:
+    """K-가중 필터 - 두 biquad 단을 블록 단위로 직렬 적용"""
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.stages = [BiquadBlockFilter(b, a) for b, a in k_weighting_coefficients(sample_rate)]
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        out = block
+        for stage in self.stages:
+            out = stage.process(out)
+        return out
+
+    def reset(self) -> None:
+        for stage in self.stages:
+            stage.reset()
+
+
+class LoudnessMeter:
+    """ITU-R BS.1770 / EBU R128 라우드니스 미터 - 순간(400ms), 단기(3s), 적분(게이팅)
+
+    K-가중 에너지를 100ms 단위로 모으고, 400ms 블록(75% 겹침)마다 적분 게이팅용
+    히스토그램에 누적한다. 히스토그램은 빈마다 블록 수와 에너지 합을 보관하므로
+    메모리는 측정 시간과 무관하게 고정이다.
+    """
+
+    STEP_SECONDS = 0.1
+    MOMENTARY_STEPS = 4
+    SHORT_TERM_STEPS = 30
+
+    def __init__(self, channel_weights: Optional[Sequence[float]] = None):
+        self.channel_weights = channel_weights  # None이면 모두 1.0 (LFE/서라운드는 설정으로 지정)
+        self.sample_rate = 0
+        self._filter: Optional[KWeightingFilter] = None
+        self._weights: Optional[np.ndarray] = None
+
+        bins = int(round((HISTOGRAM_MAX_LUFS - HISTOGRAM_MIN_LUFS) / HISTOGRAM_STEP))
+        self._hist_count = np.zeros(bins, dtype=np.int64)
+        self._hist_energy = np.zeros(bins)
+        self.reset()
+
+    def reset(self) -> None:
+        """측정 초기화 (소스 변경 / 사용자 리셋)"""
+        self._step_samples = 0
+        self._step_fill = 0
+        self._step_energy = 0.0
+        self._steps = np.zeros(self.SHORT_TERM_STEPS)  # 최근 100ms 평균 에너지 링
+        self._steps_written = 0
+        self._hist_count[:] = 0
+        self._hist_energy[:] = 0.0
+        self._levels = {'momentary': None, 'short_term': None, 'integrated': None}
+        if self._filter is not None:
+            self._filter.reset()
+
+    def _configure(self, channels: int, sample_rate: int) -> None:
+        if sample_rate != self.sample_rate or self._filter is None:
+            self.sample_rate = sample_rate
+            self._filter = KWeightingFilter(sample_rate)
+            self.reset()
+        self._step_samples = int(round(sample_rate * self.STEP_SECONDS))
+        weights = np.ones(channels)
+        if self.channel_weights is not None:
+            count = min(channels, len(self.channel_weights))
+            weights[:count] = self.channel_weights[:count]
+        self._weights = weights
+
+    def process(self, data: np.ndarray, sample_rate: int = 48000) -> None:
+        """오디오 프레임 (channels, samples) 누적"""
+        if data.ndim == 1:
+            data = data[None, :]
+        channels, samples = data.shape
+        if samples == 0:
+            return
+        if (sample_rate != self.sample_rate or self._weights is None
+                or self._weights.shape[0] != channels):
+            self._configure(channels, sample_rate)
+
+        filtered = self._filter.process(data)
+        # 채널 가중 에너지 (샘플별) - einsum으로 제곱/가중합을 한 번에
+        energy = np.einsum('c,cn,cn->n', self._weights, filtered, filtered)
+
+        position = 0
+        while position < samples:
+            take = min(self._step_samples - self._step_fill, samples - position)
+            self._step_energy += float(energy[position:position + take].sum())
+            self._step_fill += take
+            position += take
+            if self._step_fill == self._step_samples:
+                self._complete_step(self._step_energy / self._step_samples)
+                self._step_energy = 0.0
+                self._step_fill = 0
+
+    def _complete_step(self, mean_energy: float) -> None:
+        self._steps[self._steps_written % self.SHORT_TERM_STEPS] = mean_energy
+        self._steps_written += 1
+
+        if self._steps_written >= self.MOMENTARY_STEPS:
+            block_energy = self._recent_energy(self.MOMENTARY_STEPS)
+            momentary = self.energy_to_lufs(block_energy)
+            self._levels['momentary'] = momentary
+            # 400ms 블록을 절대 게이트 통과 시 히스토그램에 누적
+            if momentary is not None and momentary > ABSOLUTE_GATE_LUFS:
+                index = min(int((momentary - HISTOGRAM_MIN_LUFS) / HISTOGRAM_STEP), len(self._hist_count) - 1)
+                self._hist_count[index] += 1
+                self._hist_energy[index] += block_energy
+            self._levels['integrated'] = self._integrated()
+
+        if self._steps_written >= self.SHORT_TERM_STEPS:
+            self._levels['short_term'] = self.energy_to_lufs(self._recent_energy(self.SHORT_TERM_STEPS))
+
+    def _recent_energy(self, steps: int) -> float:
+        end = self._steps_written
+        indices = np.arange(end - steps, end) % self.SHORT_TERM_STEPS
+        return float(self._steps[indices].mean())
+
+    def _integrated(self) -> Optional[float]:
+        """2단계 게이팅 (절대 -70 LUFS, 상대 -10 LU) - 히스토그램 빈 단위"""
+        total = self._hist_count.sum()
+        if total == 0:
+            return None
+        ungated = self._hist_energy.sum() / total
+        threshold = self.energy_to_lufs(ungated) + RELATIVE_GATE_LU
+        first_bin = max(0, int(math.ceil((threshold - HISTOGRAM_MIN_LUFS) / HISTOGRAM_STEP - 1e-9)))
+        count = self._hist_count[first_bin:].sum()
+        if count == 0:
+            return None
+        return self.energy_to_lufs(self._hist_energy[first_bin:].sum() / count)
+
+    @staticmethod
+    def energy_to_lufs(energy: float) -> Optional[float]:
+        if energy <= 0.0:
+            return None
+        return LUFS_OFFSET + 10.0 * math.log10(energy)
+
+    def get_levels(self) -> Dict[str, Optional[float]]:
+        """{'momentary', 'short_term', 'integrated'} LUFS - 측정 전이면 None"""
+        return dict(self._levels)
@@ -0,0 +1,165 @@
+# multiview.py
+import logging
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from .cpu_budget import CpuBudget
+from .multiview_widget import MultiviewWidget
+from .ndi_receiver import NDIReceiver
+
+
+class MultiviewEngine(QObject):
+    """멀티뷰 엔진 - 저대역폭 수신기 풀 + 단일 합성 위젯 + 전역 CPU 예산
+
+    타일마다 NDIReceiver(프록시 대역폭)를 하나씩 두고, 각 수신기는 타일 크기로 축소한
+    프레임을 자기 메일박스에 게시한다. 합성 타이머가 틱마다 모든 메일박스에서 최신 프레임만
+    가져와 위젯을 한 번만 다시 그리게 한다. CPU 사용률이 예산을 넘으면 모든 타일의 fps 상한을 낮춘다.
+    """
+
+    status_changed = pyqtSignal(str)  # "running" / "stopped"
+
+    def __init__(self, widget: MultiviewWidget, source_lookup: Callable[[str], object],
+                 parent: Optional[QObject] = None, cpu_budget: Optional[CpuBudget] = None):
+        super().__init__(parent)
+        self.logger = logging.getLogger("MultiviewEngine")
+        self.widget = widget
+        self.source_lookup = source_lookup  # 소스 이름 -> NDI 소스 객체 (NDIManager.get_source_object)
+        self.cpu_budget = cpu_budget or CpuBudget()
+
+        self._pool: List[NDIReceiver] = []  # 재사용하는 수신기 (타일 수가 줄어도 유지)
+        self.receivers: List[NDIReceiver] = []  # 현재 타일에 연결된 수신기
+        self._last_frame_ids: List[int] = []
+        self.tile_size = None
+
+        self.compose_timer = QTimer(self)
+        self.compose_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.compose_timer.setInterval(16)  # 60Hz 합성 - 각 타일은 자기 fps로 갱신
+        self.compose_timer.timeout.connect(self._compose)
+
+        self.budget_timer = QTimer(self)
+        self.budget_timer.setInterval(1000)
+        self.budget_timer.timeout.connect(self._apply_budget)
+
+        self.widget.tile_size_changed.connect(self.set_tile_size)
+
+        # 통계
+        self.composed_frames = 0
+        self.tile_updates = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self.compose_timer.isActive()
+
+    def start(self, source_names: List[str], tile_count: Optional[int] = None) -> bool:
+        """소스 목록으로 멀티뷰 시작 (tile_count: 4/9/16)"""
+        self.stop()
+        self.widget.set_sources(source_names, tile_count)
+        self.cpu_budget.reset()
+
+        self.receivers = []
+        for index, name in enumerate(self.widget.source_names):
+            receiver = self._acquire_receiver(index)
+            receiver.set_bandwidth_mode("lowest")
+            receiver.set_max_fps(self.cpu_budget.fps)
+            if self.tile_size:
+                receiver.set_display_size(*self.tile_size)
+            try:
+                if receiver.connect_to_source(name, self.source_lookup(name)):
+                    receiver.start()
+                else:
+                    self.logger.warning(f"Multiview tile {index} failed to connect: {name}")
+            except Exception as e:
+                self.logger.error(f"Multiview tile {index} connection error: {e}")
+            self.receivers.append(receiver)
+        self._last_frame_ids = [0] * len(self.receivers)
+
+        self.compose_timer.start()
+        self.budget_timer.start()
+        self.logger.info(f"Multiview started: {len(self.receivers)} sources in {self.widget.tile_count} tiles")
+        self.status_changed.emit("running")
+        return bool(self.receivers)
+
+    def stop(self):
+        """모든 타일 연결 해제 (수신기 객체는 풀에 남겨 재사용)"""
+        was_running = self.is_running
+        self.compose_timer.stop()
+        self.budget_timer.stop()
+        for receiver in self.receivers:
+            try:
+                if receiver.isRunning():
+                    receiver.disconnect()
+                    receiver.quit()
+                    receiver.wait(1000)
+            except Exception as e:
+                self.logger.warning(f"Multiview receiver stop failed: {e}")
+        self.receivers = []
+        self._last_frame_ids = []
+        for index in range(len(self.widget.tile_images)):
+            self.widget.clear_tile(index)
+        self.widget.update()
+        if was_running:
+            self.status_changed.emit("stopped")
+
+    def _acquire_receiver(self, index: int) -> NDIReceiver:
+        while len(self._pool) <= index:
+            receiver = NDIReceiver(self)
+            receiver.set_audio_metering(False)  # 타일에는 오디오 미터가 없음
+            receiver.error_occurred.connect(
+                lambda message, tile=len(self._pool): self.logger.warning(f"Multiview tile {tile}: {message}")
+            )
+            self._pool.append(receiver)
+        return self._pool[index]
+
+    def _compose(self):
+        """합성 틱 - 새 프레임이 있는 타일만 교체하고 위젯은 한 번만 다시 그림"""
+        if not self.widget.isVisible():
+            return
+        changed = False
+        for index, receiver in enumerate(self.receivers):
+            frame_id, frame_data = receiver.frame_mailbox.fetch(self._last_frame_ids[index])
+            if frame_data is None:
+                continue
+            self._last_frame_ids[index] = frame_id
+            image = frame_data.get('image') if isinstance(frame_data, dict) else frame_data
+            if isinstance(image, QImage):
+                self.widget.update_tile(index, image)
+                self.tile_updates += 1
+                changed = True
+        if changed:
+            self.widget.update()
+            self.composed_frames += 1
+
+    def _apply_budget(self):
+        """전역 CPU 예산 - 포화 시 모든 타일 fps 상한을 낮추고 여유가 생기면 복귀"""
+        previous = self.cpu_budget.fps
+        fps = self.cpu_budget.update()
+        if fps != previous:
+            self.logger.info(f"Multiview tile fps {previous} -> {fps} (CPU {self.cpu_budget.usage:.0%})")
+        for receiver in self.receivers:
+            receiver.set_max_fps(fps)
+
+    def set_tile_size(self, width: int, height: int):
+        """타일 디바이스 픽셀 크기 - 모든 수신기가 이 크기로 축소"""
+        self.tile_size = (width, height)
+        for receiver in self._pool:
+            receiver.set_display_size(width, height)
+
+    def set_tally_states(self, tally_states: Dict[str, str]):
+        self.widget.set_tally_states(tally_states)
+
+    def cleanup(self):
+        self.stop()
+        self._pool = []
+
+    def get_stats(self) -> Dict:
+        """멀티뷰 통계 - 타일별 fps, 상한으로 버린 프레임, CPU 예산"""
+        return {
+            'tiles': len(self.receivers),
+            'tile_fps': [receiver.current_fps for receiver in self.receivers],
+            'frames_capped': sum(receiver.frames_capped for receiver in self.receivers),
+            'composed_frames': self.composed_frames,
+            'tile_updates': self.tile_updates,
+            'cpu_budget': self.cpu_budget.get_stats(),
+        }
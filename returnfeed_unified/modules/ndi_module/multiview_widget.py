@@ -0,0 +1,184 @@
+# multiview_widget.py
+import math
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QSize
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QImage
+
+
+TALLY_COLORS = {
+    "PGM": QColor(255, 55, 55),   # Red
+    "PVW": QColor(0, 255, 55),    # Green
+}
+
+
+def grid_dimensions(count: int) -> Tuple[int, int]:
+    """타일 수 -> (columns, rows) - 4/9/16은 2x2/3x3/4x4"""
+    columns = max(1, math.ceil(math.sqrt(count)))
+    rows = max(1, math.ceil(count / columns))
+    return columns, rows
+
+
+def tile_rects(width: int, height: int, count: int, gap: int = 2) -> List[Tuple[int, int, int, int]]:
+    """위젯 크기 안의 16:9 타일 영역 목록 (x, y, w, h) - 그리드는 중앙 정렬"""
+    columns, rows = grid_dimensions(count)
+    cell_w = (width - gap * (columns - 1)) // columns
+    cell_h = (height - gap * (rows - 1)) // rows
+    tile_w, tile_h = cell_w, cell_w * 9 // 16
+    if tile_h > cell_h:
+        tile_w, tile_h = cell_h * 16 // 9, cell_h
+    grid_w = tile_w * columns + gap * (columns - 1)
+    grid_h = tile_h * rows + gap * (rows - 1)
+    left, top = (width - grid_w) // 2, (height - grid_h) // 2
+    return [(left + (i % columns) * (tile_w + gap), top + (i // columns) * (tile_h + gap), tile_w, tile_h)
+            for i in range(count)]
+
+
+class MultiviewWidget(QWidget):
+    """멀티뷰 합성 위젯 - 모든 타일을 paintEvent 한 번에 그림 (타일별 위젯 없음)
+
+    타일 이미지는 수신기가 이미 타일 크기로 줄여서 보내므로 대부분 1:1 블릿이다.
+    타일마다 소스 이름과 tally 테두리(PGM 빨강 / PVW 초록)를 함께 그린다.
+    """
+
+    # 타일 한 칸의 디바이스 픽셀 크기 (width, height) - 엔진이 모든 수신기에 전달
+    tile_size_changed = pyqtSignal(int, int)
+    # 타일 더블클릭 - 해당 소스를 단일 화면으로 보기
+    tile_activated = pyqtSignal(str)
+    # 별도 창으로 띄운 멀티뷰를 닫음 - 엔진 중지
+    closed = pyqtSignal()
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setMinimumSize(320, 180)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
+        self.tile_count = 4
+        self.source_names: List[str] = []
+        self.tile_images: List[Optional[QImage]] = []
+        self.tally_states: Dict[str, str] = {}
+        self.gap = 2
+        self._rects: List[QRect] = []
+        self._published_tile_size = None
+        self._label_font = QFont("Consolas", 10)
+        self._tally_font = QFont()
+        self._tally_font.setPointSize(10)
+        self._tally_font.setBold(True)
+
+    def sizeHint(self):
+        return QSize(1280, 720)
+
+    def set_sources(self, source_names: List[str], tile_count: Optional[int] = None):
+        """타일 구성 변경 - tile_count는 4/9/16 (기본: 소스 수를 담는 가장 작은 그리드)"""
+        if tile_count is None:
+            tile_count = next((n for n in (4, 9, 16) if n >= len(source_names)), 16)
+        self.tile_count = tile_count
+        self.source_names = list(source_names[:tile_count])
+        self.tile_images = [None] * tile_count
+        self._layout()
+        self.update()
+
+    def update_tile(self, index: int, image: QImage):
+        """타일 이미지 교체 - 다시 그리기는 엔진이 한 틱에 한 번 요청"""
+        if 0 <= index < len(self.tile_images):
+            self.tile_images[index] = image
+
+    def clear_tile(self, index: int):
+        if 0 <= index < len(self.tile_images):
+            self.tile_images[index] = None
+
+    def set_tally_states(self, tally_states: Dict[str, str]):
+        self.tally_states = dict(tally_states)
+        self.update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._layout()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._layout()
+
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        self.closed.emit()
+
+    def _layout(self):
+        """타일 영역 재계산 후 타일 크기 변경 시에만 알림"""
+        self._rects = [QRect(*rect) for rect in tile_rects(self.width(), self.height(), self.tile_count, self.gap)]
+        if not self._rects or not self.isVisible():
+            return
+        dpr = self.devicePixelRatioF()
+        size = (int(round(self._rects[0].width() * dpr)), int(round(self._rects[0].height() * dpr)))
+        if size != self._published_tile_size:
+            self._published_tile_size = size
+            self.tile_size_changed.emit(*size)
+
+    def mouseDoubleClickEvent(self, event):
+        position = event.position().toPoint()
+        for index, rect in enumerate(self._rects):
+            if rect.contains(position) and index < len(self.source_names):
+                self.tile_activated.emit(self.source_names[index])
+                return
+        super().mouseDoubleClickEvent(event)
+
+    def paintEvent(self, event):
+        """모든 타일을 한 번에 합성"""
+        painter = QPainter(self)
+        try:
+            painter.fillRect(self.rect(), Qt.GlobalColor.black)
+            dpr = self.devicePixelRatioF()
+            for index, rect in enumerate(self._rects):
+                image = self.tile_images[index] if index < len(self.tile_images) else None
+                name = self.source_names[index] if index < len(self.source_names) else ""
+                if image is not None and not image.isNull():
+                    self._draw_tile_image(painter, rect, image, dpr)
+                else:
+                    painter.fillRect(rect, QColor(24, 24, 24))
+                    painter.setPen(Qt.GlobalColor.gray)
+                    painter.setFont(self._label_font)
+                    painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, name or "No Source")
+                if name:
+                    self._draw_tile_label(painter, rect, name)
+                    tally = self.tally_states.get(name, "")
+                    if tally in TALLY_COLORS:
+                        self._draw_tile_tally(painter, rect, tally)
+        except Exception as e:
+            print(f"Multiview paint error: {e}")
+        finally:
+            painter.end()
+
+    @staticmethod
+    def _draw_tile_image(painter: QPainter, rect: QRect, image: QImage, dpr: float):
+        image_w, image_h = image.width(), image.height()
+        scale = min(rect.width() * dpr / image_w, rect.height() * dpr / image_h)
+        smooth = abs(scale - 1.0) * max(image_w, image_h) >= 1.5
+        if not smooth:
+            scale = 1.0  # 수신기가 타일 크기로 축소함 - 1:1 블릿
+        draw_w, draw_h = image_w * scale / dpr, image_h * scale / dpr
+        x = rect.x() + round((rect.width() - draw_w) / 2)
+        y = rect.y() + round((rect.height() - draw_h) / 2)
+        painter.fillRect(rect, Qt.GlobalColor.black)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, smooth)
+        painter.drawImage(QRect(x, y, round(draw_w), round(draw_h)), image)
+
+    def _draw_tile_label(self, painter: QPainter, rect: QRect, name: str):
+        label_rect = QRect(rect.x(), rect.bottom() - 22, rect.width(), 22)
+        painter.fillRect(label_rect, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(self._label_font)
+        painter.drawText(label_rect.adjusted(6, 0, -6, 0),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, name)
+
+    def _draw_tile_tally(self, painter: QPainter, rect: QRect, tally: str):
+        color = TALLY_COLORS[tally]
+        painter.setPen(QPen(color, 4))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect.adjusted(2, 2, -2, -2))
+        label_rect = QRect(rect.x() + 8, rect.y() + 8, 44, 20)
+        painter.fillRect(label_rect, color)
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(self._tally_font)
+        painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, tally)
@@ -0,0 +1,165 @@
+# ndi_discovery.py
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+# (name, address, ndi_source_obj)
+SourceEntry = Tuple[str, str, object]
+
+
+class FinderAPI:
+    """NDIlib finder API 형태를 한 번만 확인해 둔 결과
+
+    ndi-python 빌드마다 함수/속성 이름이 달라서 예전에는 스캔할 때마다 소스마다
+    hasattr/getattr를 여러 번 시도했다. 초기화 시 한 번 고르고 이후에는 바로 호출한다.
+    """
+
+    CREATE_NAMES = ('find_create_v2', 'find_create', 'Find_create_v2', 'Find_create')
+    DESTROY_NAMES = ('find_destroy', 'Find_destroy')
+    WAIT_NAMES = ('find_wait_for_sources', 'Find_wait_for_sources')
+    SOURCES_NAMES = ('find_get_current_sources', 'Find_get_current_sources',
+                     'find_get_sources', 'Find_get_sources',
+                     'get_current_sources', 'get_sources')
+    NAME_ATTRS = ('name', 'ndi_name', 'source_name')
+    ADDRESS_ATTRS = ('address', 'url_address', 'ip_address')
+
+    def __init__(self, module):
+        self.module = module
+        self.create = self._pick(self.CREATE_NAMES)
+        self.destroy = self._pick(self.DESTROY_NAMES)
+        self.wait = self._pick(self.WAIT_NAMES)
+        self.get_sources = self._pick(self.SOURCES_NAMES)
+        # 소스 객체 필드 이름은 첫 소스를 볼 때 결정
+        self._name_attr: Optional[str] = None
+        self._address_attr: Optional[str] = None
+        self._fields_resolved = False
+
+    def _pick(self, names) -> Optional[Callable]:
+        for name in names:
+            func = getattr(self.module, name, None) if self.module is not None else None
+            if callable(func):
+                return func
+        return None
+
+    def _resolve_fields(self, source) -> None:
+        self._name_attr = next((attr for attr in self.NAME_ATTRS if getattr(source, attr, None)), None)
+        self._address_attr = next((attr for attr in self.ADDRESS_ATTRS if hasattr(source, attr)), None)
+        self._fields_resolved = True
+
+    def describe(self, source) -> Tuple[str, str]:
+        """소스 객체 -> (name, address)"""
+        if not self._fields_resolved:
+            self._resolve_fields(source)
+        name = getattr(source, self._name_attr, "") if self._name_attr else ""
+        if not name:
+            name = str(source)  # 이름 속성이 없는 빌드 - 문자열 표현 사용
+        address = getattr(source, self._address_attr, "") if self._address_attr else ""
+        return name, address or ""
+
+
+def diff_sources(index: Dict[str, str], current: Dict[str, str]) -> Tuple[List[str], List[str], List[str]]:
+    """이름 -> 주소 색인 비교 - (added, removed, changed) 이름 목록"""
+    added = [name for name in current if name not in index]
+    removed = [name for name in index if name not in current]
+    changed = [name for name in current if name in index and index[name] != current[name]]
+    return added, removed, changed
+
+
+class NDIDiscoveryWorker(QThread):
+    """NDI 소스 검색 스레드 - find_wait_for_sources로 대기하고 변경분만 알림
+
+    소스 목록이 바뀔 때만 깨어나므로 평소에는 CPU를 쓰지 않는다.
+    wait 함수가 없는 빌드는 poll_interval_ms 간격 폴링으로 대신한다.
+    """
+
+    # added: [(name, address, source)], removed: [name], changed: [(name, address, source)]
+    sources_changed = pyqtSignal(list, list, list)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, api: FinderAPI, finder, wait_timeout_ms: int = 1000,
+                 poll_interval_ms: int = 2000, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger("NDIDiscoveryWorker")
+        self.api = api
+        self.finder = finder
+        self.wait_timeout_ms = wait_timeout_ms  # 정지 요청 응답 시간 상한
+        self.poll_interval_ms = poll_interval_ms
+        self.index: Dict[str, str] = {}  # name -> address
+        self._running = False
+        self._refresh_requested = True  # 시작 직후 한 번 현재 목록을 읽음
+
+        # 통계
+        self.wakeups = 0
+        self.updates = 0
+
+    def stop(self):
+        self._running = False
+
+    def request_refresh(self):
+        """다음 대기 후 변경 여부와 상관없이 목록을 다시 읽음"""
+        self._refresh_requested = True
+
+    def run(self):
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    changed = self._wait_for_change()
+                    self.wakeups += 1
+                    if not self._running:
+                        break
+                    if changed or self._refresh_requested:
+                        self._refresh_requested = False
+                        self._update_index()
+                except Exception as e:
+                    self.logger.error(f"Discovery error: {e}")
+                    self.error_occurred.emit(str(e))
+                    self.msleep(self.poll_interval_ms)
+        finally:
+            self._destroy_finder()
+
+    def _destroy_finder(self):
+        """finder는 검색 스레드가 소유 - find_wait_for_sources에서 빠져나온 뒤 이 스레드에서 해제"""
+        if self.finder is not None and self.api.destroy is not None:
+            try:
+                self.api.destroy(self.finder)
+                self.logger.info("NDI finder destroyed")
+            except Exception as e:
+                self.logger.warning(f"Error destroying finder: {e}")
+        self.finder = None
+
+    def _wait_for_change(self) -> bool:
+        if self.api.wait is not None:
+            return bool(self.api.wait(self.finder, self.wait_timeout_ms))
+        # 대기 API 없음 - 짧게 나눠 자면서 정지 요청 확인
+        slept = 0
+        while self._running and slept < self.poll_interval_ms and not self._refresh_requested:
+            self.msleep(50)
+            slept += 50
+        return True
+
+    def _update_index(self):
+        sources_raw = self.api.get_sources(self.finder) if self.api.get_sources else None
+        current: Dict[str, str] = {}
+        objects: Dict[str, object] = {}
+        for source in sources_raw or []:
+            try:
+                name, address = self.api.describe(source)
+            except Exception as e:
+                self.logger.warning(f"Error processing source: {e}")
+                continue
+            if name and name not in current:
+                current[name] = address
+                objects[name] = source
+
+        added, removed, changed = diff_sources(self.index, current)
+        if not (added or removed or changed):
+            return
+        self.index = current
+        self.updates += 1
+        self.sources_changed.emit(
+            [(name, current[name], objects[name]) for name in added],
+            removed,
+            [(name, current[name], objects[name]) for name in changed],
+        )
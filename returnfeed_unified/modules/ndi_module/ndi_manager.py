@@ -5,6 +5,10 @@ from typing import Optional, List, Dict, Any
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 import logging
 
+from .ndi_discovery import FinderAPI, NDIDiscoveryWorker, diff_sources
+from .source_cache import SourceCache
+from .ndi_trace import replay_backend_from_env
+
 # NDI SDK DLL 경로 설정
 NDI_SDK_DLL_PATH = r"C:\Program Files\NDI\NDI 6 SDK\Bin\x64"
 
@@ -24,6 +28,11 @@ except ImportError:
     NDI_AVAILABLE = False
     ndi = None
 
+# 녹화한 캡처 트레이스 재생 (RETURNFEED_NDI_REPLAY) - 트레이스 소스 하나만 검색됨
+if replay_backend_from_env() is not None:
+    ndi = replay_backend_from_env()
+    NDI_AVAILABLE = True
+
 
 class NDISource:
     """NDI 소스 정보"""
@@ -37,21 +46,42 @@ class NDISource:
 
 
 class NDIManager(QObject):
-    """NDI 통신 관리자"""
+    """NDI 통신 관리자
+    
+    소스 검색은 NDIDiscoveryWorker가 find_wait_for_sources로 대기하다가 변경분만 알려준다.
+    관리자는 이름 기준 색인(live_sources)에 변경분을 적용하고, 목록이 실제로 바뀐 경우에만
+    sources_updated를 보낸다 (소스 목록 위젯 재구성 최소화).
+    
+    발견한 소스는 SourceCache에 저장해 두고 시작하자마자 캐시 목록을 내보낸다.
+    검색이 안정될 때까지(DISCOVERY_SETTLE_MS)는 라이브 + 캐시 목록을 합쳐 보여주고,
+    이후에는 라이브 목록만 내보내며 캐시의 오래된 항목을 정리한다.
+    """
+    
+    # mDNS 검색이 대부분의 소스를 찾는 데 걸리는 시간
+    DISCOVERY_SETTLE_MS = 5000
     
     # 시그널
     sources_updated = pyqtSignal(list)  # List[NDISource]
     status_changed = pyqtSignal(str, str)  # status, message
     error_occurred = pyqtSignal(str)  # error message
     
-    def __init__(self, parent: Optional[QObject] = None):
+    def __init__(self, parent: Optional[QObject] = None, source_cache: Optional[SourceCache] = None):
         super().__init__(parent)
         self.logger = logging.getLogger("NDIManager")
         self.is_initialized = False
         self.finder = None
-        self.sources = []
-        self.scan_timer = QTimer(self)
-        self.scan_timer.timeout.connect(self._scan_sources)
+        self.finder_api: Optional[FinderAPI] = None
+        self.discovery_worker: Optional[NDIDiscoveryWorker] = None
+        self.live_sources: Dict[str, NDISource] = {}  # 이름 -> 라이브 소스 (발견 순서 유지)
+        self.sources = []  # 내보낸 목록 (라이브 + 검색 안정 전 캐시)
+        
+        # 소스 캐시 - 라이브 검색 전에도 마지막 소스에 주소로 바로 연결
+        self.source_cache = source_cache or SourceCache()
+        self.cached_sources: List[NDISource] = []
+        self.discovery_settled = False
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.timeout.connect(self._on_discovery_settled)
         
     def initialize(self) -> bool:
         """NDI 라이브러리 초기화"""
@@ -73,8 +103,10 @@ class NDIManager(QObject):
                 return False
                 
             self.is_initialized = True
+            self.finder_api = FinderAPI(ndi)  # API 형태는 여기서 한 번만 확인
             self.logger.info("NDI library initialized successfully")
             self.status_changed.emit("initialized", "NDI 초기화 성공")
+            self.load_cached_sources()
             return True
             
         except Exception as e:
@@ -89,141 +121,108 @@ class NDIManager(QObject):
             self.logger.error("NDI not initialized")
             return False
             
-        try:
-            # NDI Finder 생성 - 다양한 함수명 시도
-            finder_functions = ['find_create_v2', 'find_create', 'Find_create_v2', 'Find_create']
-            
-            for func_name in finder_functions:
-                if hasattr(ndi, func_name):
-                    try:
-                        func = getattr(ndi, func_name)
-                        self.finder = func()
-                        if self.finder:
-                            self.logger.info(f"NDI finder created using {func_name}")
-                            break
-                    except Exception as e:
-                        self.logger.warning(f"Failed to create finder with {func_name}: {e}")
-                        continue
+        if self.discovery_worker is not None and self.discovery_worker.isRunning():
+            return True
             
+        try:
+            api = self.finder_api
+            if api is None or api.create is None or api.get_sources is None:
+                self.logger.error("NDI finder API not available")
+                return False
+                
+            self.finder = api.create()
             if not self.finder:
-                self.logger.error("Failed to create NDI finder with any available function")
+                self.logger.error("Failed to create NDI finder")
                 return False
+            if api.wait is None:
+                self.logger.warning("find_wait_for_sources not available - falling back to polling")
                 
-            # 주기적 스캔 시작 (2초마다)
-            self.scan_timer.start(2000)
+            # 검색 스레드 시작 - 소스 목록이 바뀔 때만 깨어남
+            self.discovery_worker = NDIDiscoveryWorker(api, self.finder, parent=self)
+            self.discovery_worker.sources_changed.connect(self._on_sources_changed)
+            self.discovery_worker.error_occurred.connect(
+                lambda message: self.logger.warning(f"Discovery worker: {message}")
+            )
+            self.live_sources = {}
+            self.discovery_settled = False
+            self.settle_timer.start(self.DISCOVERY_SETTLE_MS)
+            self.discovery_worker.start()
             self.status_changed.emit("discovering", "NDI 소스 검색 중...")
-            
-            # 초기 스캔
-            self._scan_sources()
-            
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to start discovery: {e}")
             return False
             
-    def stop_discovery(self) -> None:
-        """NDI 소스 검색 중지"""
-        self.scan_timer.stop()
+    def stop_discovery(self) -> bool:
+        """NDI 소스 검색 중지 - 검색 스레드가 제때 끝났으면 True
+        
+        finder는 검색 스레드가 끝나면서 직접 해제한다. 대기 시간 안에 끝나지 않아도
+        find_wait_for_sources 중인 finder를 여기서 해제하지 않는다.
+        """
+        self.settle_timer.stop()
         
-        if self.finder:
+        stopped = True
+        if self.discovery_worker is not None:
+            self.discovery_worker.stop()
+            if not self.discovery_worker.wait(3000):
+                stopped = False
+                self.logger.warning("Discovery worker did not stop in time - it will destroy the finder on exit")
+            self.discovery_worker = None
+        elif self.finder:
+            # 검색 스레드 없이 만들어진 finder만 여기서 해제
             try:
-                # 다양한 함수명 시도
-                destroy_functions = ['find_destroy', 'Find_destroy']
-                for func_name in destroy_functions:
-                    if hasattr(ndi, func_name):
-                        try:
-                            func = getattr(ndi, func_name)
-                            func(self.finder)
-                            self.logger.info(f"NDI finder destroyed using {func_name}")
-                            break
-                        except Exception as e:
-                            self.logger.warning(f"Failed to destroy finder with {func_name}: {e}")
-                            continue
+                if self.finder_api and self.finder_api.destroy:
+                    self.finder_api.destroy(self.finder)
             except Exception as e:
                 self.logger.warning(f"Error destroying finder: {e}")
-            finally:
-                self.finder = None
+        self.finder = None
             
+        self.source_cache.record_seen([(s.name, s.address) for s in self.live_sources.values()])
+        self.source_cache.save()
+        
         self.status_changed.emit("stopped", "NDI 검색 중지됨")
+        return stopped
         
-    def _scan_sources(self):
-        """NDI 소스 스캔"""
-        if not self.finder:
-            return
-            
-        try:
-            # NDI 소스 찾기 - 다양한 함수명 시도
-            source_functions = [
-                'find_get_current_sources', 'Find_get_current_sources',
-                'find_get_sources', 'Find_get_sources',
-                'get_current_sources', 'get_sources'
-            ]
-            
-            sources_raw = None
-            for func_name in source_functions:
-                if hasattr(ndi, func_name):
-                    try:
-                        func = getattr(ndi, func_name)
-                        sources_raw = func(self.finder)
-                        if sources_raw is not None:
-                            self.logger.debug(f"Got sources using {func_name}")
-                            break
-                    except Exception as e:
-                        self.logger.warning(f"Failed to get sources with {func_name}: {e}")
-                        continue
+    def _on_sources_changed(self, added: list, removed: list, changed: list):
+        """검색 스레드의 변경분을 색인에 적용"""
+        for name in removed:
+            self.live_sources.pop(name, None)
+        for name, address, source in added + changed:
+            self.live_sources[name] = NDISource(name, address, ndi_source_obj=source)
+        if added or changed:
+            self.source_cache.record_seen([(name, address) for name, address, _ in added + changed])
+            self.source_cache.save()
+        self.logger.info(f"NDI sources: +{len(added)} -{len(removed)} ~{len(changed)} "
+                         f"({len(self.live_sources)} live)")
+        self._publish_sources()
+        
+    def _publish_sources(self, force: bool = False):
+        """라이브 색인(+검색 안정 전 캐시)으로 목록을 만들고 바뀐 경우에만 알림"""
+        published = list(self.live_sources.values())
+        if not self.discovery_settled:
+            published += [s for s in self.cached_sources if s.name not in self.live_sources]
             
-            # 소스 리스트 업데이트
-            new_sources = []
-            if sources_raw:
-                for source in sources_raw:
-                    try:
-                        # 소스 정보 추출 - 다양한 속성명 시도
-                        name = ""
-                        address = ""
-                        
-                        # 이름 추출
-                        name_attrs = ['name', 'ndi_name', 'source_name']
-                        for attr in name_attrs:
-                            if hasattr(source, attr):
-                                name = getattr(source, attr)
-                                if name:
-                                    break
-                        
-                        # 주소 추출
-                        addr_attrs = ['address', 'url_address', 'ip_address']
-                        for attr in addr_attrs:
-                            if hasattr(source, attr):
-                                address = getattr(source, attr)
-                                break
-                        
-                        # 문자열로 변환된 경우 처리
-                        if not name and hasattr(source, '__str__'):
-                            name = str(source)
-                        
-                        if name:
-                            new_sources.append(NDISource(name, address, ndi_source_obj=source))
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Error processing source: {e}")
-                        continue
-                        
-            # 변경사항이 있으면 시그널 발송
-            if len(new_sources) != len(self.sources) or any(
-                ns.name != os.name for ns, os in zip(new_sources, self.sources)
-            ):
-                self.sources = new_sources
-                self.sources_updated.emit([s.to_dict() for s in self.sources])
-                self.logger.info(f"Found {len(self.sources)} NDI sources")
-                
-        except Exception as e:
-            self.logger.error(f"Error scanning sources: {e}")
+        previous = {s.name: s.address for s in self.sources}
+        current = {s.name: s.address for s in published}
+        self.sources = published
+        if force or any(diff_sources(previous, current)):
+            self.sources_updated.emit([s.to_dict() for s in self.sources])
             
+    def refresh_sources(self):
+        """수동 새로고침 - 현재 목록을 다시 보내고 검색 스레드가 목록을 다시 읽게 함"""
+        if self.discovery_worker is not None:
+            self.discovery_worker.request_refresh()
+        self._publish_sources(force=True)
+        
     def cleanup(self) -> None:
         """리소스 정리"""
-        self.stop_discovery()
+        stopped = self.stop_discovery()
         
-        if self.is_initialized and NDI_AVAILABLE:
+        if self.is_initialized and NDI_AVAILABLE and not stopped:
+            # 검색 스레드가 아직 SDK 호출 중 - 라이브러리를 내리지 않음 (프로세스 종료 시 정리)
+            self.logger.warning("Skipping NDI deinitialization while discovery is still running")
+        elif self.is_initialized and NDI_AVAILABLE:
             try:
                 ndi.destroy()
                 self.logger.info("NDI library deinitialized")
@@ -241,8 +240,57 @@ class NDIManager(QObject):
         return [s.name for s in self.sources]
     
     def get_source_object(self, source_name: str):
-        """이름으로 NDI 소스 객체 찾기"""
+        """이름으로 NDI 소스 객체 찾기 - 목록에 없으면 캐시 주소로 만든 객체"""
         for source in self.sources:
             if source.name == source_name:
                 return source.ndi_source_obj
-        return None
\ No newline at end of file
+        if source_name in self.source_cache.entries:
+            return self._make_source_object(source_name, self.source_cache.get_address(source_name))
+        return None
+        
+    def load_cached_sources(self) -> List[Dict[str, str]]:
+        """디스크 캐시의 소스 목록을 바로 내보냄 (mDNS 검색을 기다리지 않음)"""
+        self.source_cache.load()
+        self.cached_sources = [
+            NDISource(entry['name'], entry['address'],
+                      ndi_source_obj=self._make_source_object(entry['name'], entry['address']))
+            for entry in self.source_cache.get_sources()
+        ]
+        if self.cached_sources:
+            self._publish_sources()
+            self.logger.info(f"Loaded {len(self.cached_sources)} cached NDI sources")
+        return [s.to_dict() for s in self.cached_sources]
+        
+    def _make_source_object(self, name: str, address: str = ""):
+        """이름 + URL 주소로 NDI 소스 객체 생성 - 주소가 있으면 검색 없이 바로 연결"""
+        if not NDI_AVAILABLE or not hasattr(ndi, 'Source'):
+            return None
+        try:
+            source = ndi.Source()
+            source.ndi_name = name
+            if address:
+                source.url_address = address
+            return source
+        except Exception as e:
+            self.logger.warning(f"Failed to build source object for {name}: {e}")
+            return None
+            
+    def _on_discovery_settled(self):
+        """검색 안정 - 캐시 정리 후 라이브 목록만 내보냄"""
+        self.discovery_settled = True
+        self.source_cache.record_seen([(s.name, s.address) for s in self.live_sources.values()])
+        removed = self.source_cache.reconcile(self.live_sources.keys())
+        if removed:
+            self.logger.info(f"Removed stale cached NDI sources: {removed}")
+        self.source_cache.save()
+        self._publish_sources()
+        
+    def mark_source_used(self, source_name: str) -> None:
+        """연결에 성공한 소스를 마지막 사용 소스로 저장"""
+        address = next((s.address for s in self.sources if s.name == source_name), "")
+        self.source_cache.mark_used(source_name, address)
+        self.source_cache.save()
+        
+    def get_last_used_source(self) -> Optional[str]:
+        """마지막으로 연결했던 소스 이름"""
+        return self.source_cache.last_used
\ No newline at end of file
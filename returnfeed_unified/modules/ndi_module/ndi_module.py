@@ -1,11 +1,13 @@
 # ndi_module.py
 from typing import Dict, Any, Optional
 from PyQt6.QtWidgets import QWidget, QMessageBox
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, QTimer, Qt
 from modules import BaseModule, ModuleStatus
 from .ndi_manager import NDIManager
 from .ndi_widget import NDIWidget
 from .ndi_receiver import NDIReceiver
+from .multiview import MultiviewEngine
+from .multiview_widget import MultiviewWidget
 
 
 class NDIModule(BaseModule):
@@ -25,16 +27,28 @@ class NDIModule(BaseModule):
             "auto_refresh": True,
             "refresh_interval": 2000,  # milliseconds
             "show_addresses": True,
-            "bandwidth_mode": "highest"  # highest (normal) or lowest (proxy)
+            "bandwidth_mode": "highest",  # highest (normal) or lowest (proxy)
+            "color_format": "bgra",  # bgra (SDK 변환) or uyvy (네이티브 UYVY 수신)
+            "frame_sync": False,  # True: GUI 프레젠테이션 클럭으로 프레임을 가져옴 (NDI framesync)
+            "auto_reconnect": True,  # 시작 시 마지막 소스에 캐시된 주소로 바로 연결
+            # SRT 스트리밍 중 프리뷰: throttled (저fps/저해상도 프록시로 계속 표시) or paused (완전 중지)
+            "streaming_preview": "throttled",
+            "streaming_preview_fps": 5,
+            "streaming_preview_size": (640, 360)
         }
         
         # 프리뷰 상태
         self.preview_paused = False
+        self.preview_throttled = False
         self.current_ndi_source = None
         
         # Tally 상태 추적
         self.tally_states = {}  # {source_name: "PGM"|"PVW"|""}
         
+        # 멀티뷰 (4/9/16 소스 동시 모니터링) - 처음 사용할 때 생성
+        self.multiview = None
+        self.multiview_widget = None
+        
     def _setup_connections(self):
         """시그널/슬롯 연결 설정 - QVideoSink 기반 스레드 안전 버전"""
         # Widget → Module
@@ -43,23 +57,34 @@ class NDIModule(BaseModule):
         self.widget.source_connect_requested.connect(self._on_connect_requested)
         self.widget.source_disconnect_requested.connect(self._on_disconnect_requested)
         self.widget.bandwidth_mode_changed.connect(self._on_bandwidth_mode_changed)
+        self.widget.multiview_toggled.connect(self._on_multiview_toggled)
         
         # Manager → Widget
         self.manager.sources_updated.connect(self.widget.update_sources)
         self.manager.status_changed.connect(self.widget.update_status)
         
         # Receiver → Widget
-        self.receiver.frame_received.connect(self.widget.display_frame)  # 레거시 호환
         self.receiver.status_changed.connect(self._on_receiver_status_changed)
         self.receiver.error_occurred.connect(self._on_receiver_error)
         
         # **🚀 ULTRATHINK 수정**: QPainter 직접 렌더링 연결
-        # QVideoSink 대신 QImage 시그널을 직접 연결
-        video_display = getattr(self.widget, 'video_display', None)
-        if video_display and hasattr(video_display, 'updateFrame'):
-            # NDI receiver의 frame_received 시그널을 VideoDisplayWidget의 updateFrame에 직접 연결
-            self.receiver.frame_received.connect(video_display.updateFrame)
-            self.logger.info("🚀 QPainter direct rendering connected - QVideoSink 블랙박스 우회 완료")
+        # 프레임마다 시그널을 보내지 않고, 메일박스에서 최신 프레임만 가져감
+        self._last_frame_id = 0
+        # 프레임을 표시하는 쪽만 픽업/표시 단계를 기록 - 다른 창이 표시하면 set_preview_owner(False)
+        self.preview_owner = True
+        self.receiver.frame_ready.connect(self._on_frame_ready)
+        # 표시 크기 협상 - 수신 스레드가 위젯 크기로 미리 축소
+        self.widget.video_display.display_size_changed.connect(self.receiver.set_display_size)
+        # 단계별 지연 - 픽업/paint 단계는 GUI 스레드에서 같은 히스토그램 묶음에 기록
+        self.widget.video_display.stage_timings = self.receiver.stage_timings
+        self.widget.video_display.latency_estimator = self.receiver.latency_estimator
+        
+        # 프레임 싱크 모드의 프레젠테이션 클럭 - 위젯이 보일 때만 수신 스레드에 프레임 요청
+        self.present_timer = QTimer(self)
+        self.present_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.present_timer.setInterval(16)  # 60fps
+        self.present_timer.timeout.connect(self._on_present_tick)
+        self.logger.info("🚀 QPainter direct rendering connected - latest-frame mailbox")
         
         # Manager → Module
         self.manager.error_occurred.connect(self._on_manager_error)
@@ -77,6 +102,8 @@ class NDIModule(BaseModule):
                 # Apply saved bandwidth mode
                 saved_mode = self.settings.get("bandwidth_mode", "highest")
                 self.receiver.set_bandwidth_mode(saved_mode)
+                self.receiver.set_color_format(self.settings.get("color_format", "bgra"))
+                self._apply_frame_sync(self.settings.get("frame_sync", False))
                 # Update UI to reflect saved mode
                 if saved_mode == "lowest":
                     self.widget.bandwidth_combo.setCurrentIndex(1)
@@ -103,6 +130,7 @@ class NDIModule(BaseModule):
             # NDI 소스 검색 시작
             if self.manager.start_discovery():
                 self.set_status(ModuleStatus.RUNNING, "NDI 소스 검색 중")
+                self._auto_reconnect()
                 return True
             else:
                 self.emit_error("StartError", "NDI 검색 시작 실패")
@@ -118,6 +146,9 @@ class NDIModule(BaseModule):
             self.set_status(ModuleStatus.STOPPING, "NDI 검색 중지 중...")
             
             # NDI 수신기 정지
+            self.present_timer.stop()
+            if self.multiview:
+                self.multiview.stop()
             if self.receiver.isRunning():
                 self.receiver.disconnect()
                 self.receiver.quit()
@@ -141,6 +172,9 @@ class NDIModule(BaseModule):
         """리소스 정리"""
         try:
             # 수신기 정리
+            self.present_timer.stop()
+            if self.multiview:
+                self.multiview.cleanup()
             if self.receiver.isRunning():
                 self.receiver.disconnect()
                 self.receiver.quit()
@@ -171,6 +205,14 @@ class NDIModule(BaseModule):
                 # Manager의 타이머 간격 변경 (현재는 고정값 사용)
                 self.logger.info(f"Refresh interval updated to {settings['refresh_interval']}ms")
             
+            # 수신 색상 포맷 변경 적용
+            if "color_format" in settings:
+                self.receiver.set_color_format(settings["color_format"])
+                
+            # 프레임 싱크 모드 변경 적용
+            if "frame_sync" in settings:
+                self._apply_frame_sync(settings["frame_sync"])
+                
             # Bandwidth mode 변경 적용
             if "bandwidth_mode" in settings:
                 mode = settings["bandwidth_mode"]
@@ -191,8 +233,7 @@ class NDIModule(BaseModule):
         """새로고침 요청 처리"""
         if self.status == ModuleStatus.RUNNING:
             self.logger.info("Manual refresh requested")
-            # Manager의 _scan_sources 메서드를 직접 호출
-            self.manager._scan_sources()
+            self.manager.refresh_sources()
             
     def _on_source_selected(self, source_name: str):
         """NDI 소스 선택 처리"""
@@ -209,6 +250,7 @@ class NDIModule(BaseModule):
             if self.receiver.connect_to_source(source_name, source_object):
                 self.receiver.start()
                 self.widget.update_connection_status(True, source_name)
+                self.manager.mark_source_used(source_name)
                 self.logger.info(f"Successfully connected to: {source_name}")
             else:
                 self.logger.error(f"Failed to connect to: {source_name}")
@@ -216,6 +258,15 @@ class NDIModule(BaseModule):
         except Exception as e:
             self.emit_error("ConnectionError", f"Failed to connect to source: {e}")
             
+    def _auto_reconnect(self):
+        """마지막 사용 소스에 자동 연결 - mDNS 검색 완료를 기다리지 않고 캐시 주소 사용"""
+        if not self.settings.get("auto_reconnect", True) or self.receiver.isRunning():
+            return
+        source_name = self.manager.get_last_used_source()
+        if source_name and source_name in self.manager.get_source_names():
+            self.logger.info(f"Auto-reconnecting to last used source: {source_name}")
+            self._on_connect_requested(source_name)
+            
     def _on_disconnect_requested(self):
         """NDI 소스 연결 해제 요청 처리 - 스레드 안전 버전"""
         try:
@@ -237,6 +288,45 @@ class NDIModule(BaseModule):
         except Exception as e:
             self.emit_error("DisconnectionError", f"Failed to disconnect: {e}")
             
+    def _apply_frame_sync(self, enabled: bool):
+        """프레임 싱크 모드 적용 - 수신 루프 전환 + 프레젠테이션 클럭 시작/정지"""
+        self.receiver.set_frame_sync(enabled)
+        if self.receiver.frame_sync:
+            self.present_timer.start()
+        else:
+            self.present_timer.stop()
+            
+    def _on_present_tick(self):
+        """프레젠테이션 틱 - 위젯이 숨겨져 있으면 요청하지 않음 (수신 스레드도 대기)"""
+        if self.widget.isVisible():
+            self.receiver.request_frame()
+            
+    def set_preview_owner(self, owned: bool):
+        """이 모듈의 위젯이 프레임을 표시하는지 설정
+
+        클래식 모드처럼 다른 창이 같은 메일박스에서 프레임을 가져가 표시하면 False.
+        두 곳에서 on_pickup을 부르면 'mailbox' 단계가 두 번 기록되고 픽업 시각이 덮어써진다.
+        """
+        self.preview_owner = owned
+        video_display = getattr(self.widget, 'video_display', None)
+        if video_display is not None:
+            video_display.stage_timings = self.receiver.stage_timings if owned else None
+            video_display.latency_estimator = self.receiver.latency_estimator if owned else None
+
+    def _on_frame_ready(self):
+        """메일박스의 최신 프레임을 VideoDisplayWidget에 전달"""
+        if not self.preview_owner:
+            return
+        frame_id, frame_data = self.receiver.frame_mailbox.fetch(self._last_frame_id)
+        if frame_data is None:
+            return
+        self._last_frame_id = frame_id
+        self.receiver.stage_timings.on_pickup(frame_data)
+        self.receiver.latency_estimator.on_pickup(frame_data)
+        video_display = getattr(self.widget, 'video_display', None)
+        if video_display is not None:
+            video_display.updateFrame(frame_data)
+            
     def _on_receiver_status_changed(self, status: str):
         """NDI 수신기 상태 변경 처리"""
         if status == "connected":
@@ -269,7 +359,21 @@ class NDIModule(BaseModule):
             self.set_status(ModuleStatus.ERROR, message)
     
     def pause_preview(self, srt_stream_info: dict = None):
-        """NDI 프리뷰 일시정지 (SRT 스트리밍 시작 시)"""
+        """NDI 프리뷰 일시정지 (SRT 스트리밍 시작 시)
+        
+        streaming_preview 설정이 throttled면 수신을 끊지 않고 스로틀 프리뷰로 전환해
+        인코더에 CPU를 넘기면서도 화면 모니터링은 유지한다.
+        """
+        stream_name = srt_stream_info.get('stream_name', '') if srt_stream_info else ''
+        if self.settings.get("streaming_preview", "throttled") == "throttled":
+            fps = self.settings.get("streaming_preview_fps", 5)
+            width, height = self.settings.get("streaming_preview_size", (640, 360))
+            self.logger.info(f"Throttling NDI preview to {fps} fps for SRT streaming")
+            self.receiver.set_preview_throttle(fps, width, height)
+            self.preview_throttled = True
+            if hasattr(self.widget, 'video_display'):
+                self.widget.video_display.set_srt_streaming(True, stream_name, throttled_fps=fps)
+            return
         if self.receiver.is_connected():
             self.logger.info("Pausing NDI preview for SRT streaming")
             # 현재 소스 저장
@@ -281,12 +385,17 @@ class NDIModule(BaseModule):
             
             # 비디오 디스플레이에 SRT 스트리밍 오버레이 표시
             if hasattr(self.widget, 'video_display'):
-                stream_name = srt_stream_info.get('stream_name', '') if srt_stream_info else ''
                 self.widget.video_display.set_srt_streaming(True, stream_name)
     
     def resume_preview(self):
         """NDI 프리뷰 재개 (SRT 스트리밍 종료 시)"""
-        if self.preview_paused and self.current_ndi_source:
+        if self.preview_throttled:
+            # 스로틀 해제 - 켜기 전의 fps 상한/대역폭 모드로 복귀 (필요하면 재연결)
+            self.receiver.set_preview_throttle(0)
+            self.preview_throttled = False
+            if hasattr(self.widget, 'video_display'):
+                self.widget.video_display.set_srt_streaming(False)
+        elif self.preview_paused and self.current_ndi_source:
             self.logger.info("Resuming NDI preview after SRT streaming")
             # SRT 오버레이 제거
             if hasattr(self.widget, 'video_display'):
@@ -301,7 +410,7 @@ class NDIModule(BaseModule):
     
     def update_srt_stats(self, stats: dict):
         """SRT 스트리밍 통계 업데이트"""
-        if self.preview_paused and hasattr(self.widget, 'video_display'):
+        if (self.preview_paused or self.preview_throttled) and hasattr(self.widget, 'video_display'):
             self.widget.video_display.srt_stats = stats
             self.widget.video_display.update()
     
@@ -315,6 +424,58 @@ class NDIModule(BaseModule):
         self.settings["bandwidth_mode"] = mode
         self.receiver.set_bandwidth_mode(mode)
     
+    def get_multiview_widget(self) -> QWidget:
+        """멀티뷰 합성 위젯 (엔진과 함께 처음 요청 시 생성)"""
+        if self.multiview is None:
+            self.multiview_widget = MultiviewWidget()
+            self.multiview = MultiviewEngine(self.multiview_widget, self.manager.get_source_object, self)
+            self.multiview.set_tally_states(self.tally_states)
+            self.multiview_widget.closed.connect(self._on_multiview_closed)
+            self.multiview_widget.tile_activated.connect(self._on_multiview_tile_activated)
+        return self.multiview_widget
+    
+    def start_multiview(self, source_names: list, tile_count: int = None) -> bool:
+        """여러 소스를 프록시 대역폭으로 동시에 수신해 한 위젯에 그리드로 표시"""
+        try:
+            self.get_multiview_widget()
+            return self.multiview.start(source_names, tile_count)
+        except Exception as e:
+            self.emit_error("MultiviewError", f"Failed to start multiview: {e}")
+            return False
+    
+    def stop_multiview(self):
+        """멀티뷰 중지 - 모든 타일 연결 해제"""
+        if self.multiview:
+            self.multiview.stop()
+    
+    def _on_multiview_toggled(self, enabled: bool):
+        """멀티뷰 버튼 - 발견된 소스로 멀티뷰 창을 열거나 닫음"""
+        if not enabled:
+            self.stop_multiview()
+            if self.multiview_widget is not None and self.multiview_widget.isVisible():
+                self.multiview_widget.close()
+            return
+        
+        source_names = self.manager.get_source_names()[:16]
+        if not source_names or not self.start_multiview(source_names):
+            self.widget.multiview_button.setChecked(False)
+            return
+        self.multiview_widget.setWindowTitle(f"NDI Multiview ({len(source_names)} sources)")
+        self.multiview_widget.show()
+        self.multiview_widget.raise_()
+    
+    def _on_multiview_closed(self):
+        """멀티뷰 창을 직접 닫으면 버튼도 해제 (toggled로 엔진 중지)"""
+        self.widget.multiview_button.setChecked(False)
+    
+    def _on_multiview_tile_activated(self, source_name: str):
+        """타일 더블클릭 - 멀티뷰를 닫고 해당 소스를 단일 화면으로 연결"""
+        self.widget.multiview_button.setChecked(False)
+        if self.receiver.isRunning():
+            self._on_disconnect_requested()
+        self.widget.current_source = source_name
+        self._on_connect_requested(source_name)
+    
     def update_tally_states(self, tally_data: dict):
         """Update tally states for all NDI sources
         
@@ -323,6 +484,10 @@ class NDIModule(BaseModule):
         """
         self.tally_states = tally_data.copy()
         
+        # 멀티뷰 타일별 tally 테두리
+        if self.multiview:
+            self.multiview.set_tally_states(self.tally_states)
+        
         # Update current source tally display if connected
         if self.current_ndi_source:
             source_name = self.current_ndi_source[0] if isinstance(self.current_ndi_source, tuple) else self.current_ndi_source
@@ -1,6 +1,7 @@
 # ndi_receiver.py
 import os
 import sys
+import threading
 import time
 from typing import Optional
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, QTimer
@@ -9,6 +10,19 @@ from PyQt6.QtMultimedia import QVideoSink, QVideoFrame
 import logging
 import numpy as np
 
+from .frame_pool import FrameBufferPool
+from .frame_scaler import FrameScaler
+from .yuv_convert import UYVYConverter
+from .audio_meter import AudioMeter
+from .loudness import LoudnessMeter
+from .frame_mailbox import FrameMailbox
+from .capture_scheduler import CaptureScheduler
+from .throughput_meter import ThroughputMeter
+from .stage_timing import PipelineTimings
+from .glass_latency import GlassToGlassEstimator
+from .static_detector import StaticFrameDetector
+from .ndi_trace import NDITraceRecorder, replay_backend_from_env
+
 # NDI SDK DLL 경로 설정
 NDI_SDK_DLL_PATH = r"C:\Program Files\NDI\NDI 6 SDK\Bin\x64"
 
@@ -27,12 +41,22 @@ except ImportError:
     NDI_AVAILABLE = False
     ndi = None
 
+# 녹화한 캡처 트레이스 재생 (RETURNFEED_NDI_REPLAY) - 네트워크 없이 벤치마크/CI용
+if replay_backend_from_env() is not None:
+    ndi = replay_backend_from_env()
+    NDI_AVAILABLE = True
+
 
 class NDIReceiver(QThread):
     """NDI 비디오 수신기 - QVideoSink 기반 스레드 안전 버전"""
     
+    FRAME_SYNC_IDLE_WAIT = 0.1  # 프레젠테이션 틱이 없을 때 running 확인 주기 (초)
+    FRAME_SYNC_AUDIO_RATE = 48000  # 프레임 싱크 오디오 리샘플 레이트
+    FRAME_SYNC_MAX_AUDIO = 0.2  # 틱 사이 최대 오디오 길이 (초) - 틱이 멈췄다 재개될 때 제한
+    
     # 시그널
-    frame_received = pyqtSignal(object)  # 수신된 프레임 - QImage 또는 dict{'image': QImage, 'resolution': str, 'fps': int, 'bitrate': str, 'audio_level': float}
+    frame_ready = pyqtSignal()  # 메일박스에 새 프레임 도착 (이전 프레임이 읽힌 경우에만 발송)
+    audio_levels = pyqtSignal(object)  # np.ndarray (channels, 4) - audio_meter 열: VU, PPM, TRUE_PEAK, PEAK_HOLD
     video_frame_ready = pyqtSignal(QVideoFrame)  # QVideoFrame 시그널 (신버전)
     error_occurred = pyqtSignal(str)  # 에러 메시지
     status_changed = pyqtSignal(str)  # 상태 변경
@@ -46,12 +70,76 @@ class NDIReceiver(QThread):
         self.running = False
         self.current_source = None  # 현재 연결된 소스 정보 저장
         self.bandwidth_mode = "highest"  # "highest" or "lowest" (proxy mode)
+        self.color_format = "bgra"  # "bgra" (SDK 변환) or "uyvy" (네이티브 UYVY 수신 후 직접 변환)
         
         # **핵심 수정**: QVideoSink 연결 지원
         self.video_sink = None
         self.frame_queue_size = 0
         self.max_queue_size = 3  # 메모리 절약을 위해 제한
         
+        # 프레임 버퍼 풀 - 프레임마다 v_frame.data.copy() 할당 제거
+        self.frame_pool = FrameBufferPool(num_slots=6)
+        
+        # 표시 해상도 다운스케일러 - 위젯이 set_display_size()로 목표 크기를 알려줌
+        self.frame_scaler = FrameScaler()
+        
+        # UYVY -> BGRA 변환기 (color_format == "uyvy"일 때 사용, 표시 크기 축소와 결합)
+        self.yuv_converter = UYVYConverter()
+        self.yuv_output_pool = FrameBufferPool(num_slots=3)  # 2채널 프레임 변환 결과용
+        
+        # 채널별 오디오 미터 - 오디오 클럭 기준 50ms마다 audio_levels로 게시
+        self.audio_meter = AudioMeter(publish_interval=0.05)
+        
+        # BS.1770 라우드니스 (순간/단기/적분 LUFS) - 프레임 정보의 'loudness'로 전달
+        self.loudness_meter = LoudnessMeter()
+        # 오디오 계측 on/off - 멀티뷰 타일처럼 미터를 표시하지 않는 수신기는 끔
+        self.audio_metering = True
+        
+        # 표시 fps 상한 (0 = 제한 없음) - 멀티뷰 CPU 예산이 조정, 초과 프레임은 변환 전에 반환
+        self.max_fps = 0
+        self._next_accept_time = 0.0
+        self.frames_capped = 0
+        
+        # 스로틀 프리뷰 (스트리밍 중 저부하 모니터링) - 해제 시 복원할 (max_fps, bandwidth_mode)
+        self.preview_throttle = None
+        # 대역폭 변경 요청 - 수신 스레드가 루프에서 확인하고 수신기를 직접 다시 만듦 (GUI 스레드 대기 없음)
+        self._reconnect_requested = False
+        
+        # 캡처 스케줄러 - 측정한 소스 프레임 간격으로 recv_capture 타임아웃 결정 (폴링 루프용)
+        self.capture_scheduler = CaptureScheduler()
+        
+        # 실측 디코딩 처리량 - 압축 해제된 프레임 바이트 슬라이딩 윈도우 + SDK 드롭/큐 카운터 (1초마다 갱신)
+        self.throughput = ThroughputMeter()
+        self._recv_get_performance = getattr(ndi, 'recv_get_performance', None) if NDI_AVAILABLE else None
+        self._recv_get_queue = getattr(ndi, 'recv_get_queue', None) if NDI_AVAILABLE else None
+        
+        # 캡처 트레이스 녹화 (start_trace_recording) - 수신한 SDK 프레임을 해제 전에 그대로 기록
+        self.trace_recorder = None
+        
+        # 단계별 지연 히스토그램 (capture -> copy -> free -> QImage -> emit -> 픽업 -> paint)
+        # GUI 쪽 단계는 프레임을 픽업/표시하는 위젯이 같은 객체에 기록 (RETURNFEED_STAGE_TIMING=1로 시작 시 활성화)
+        self.stage_timings = PipelineTimings(enabled=os.environ.get("RETURNFEED_STAGE_TIMING") == "1")
+        
+        # 송신 -> 화면 표시 지연 (프레임 timestamp/timecode + 시계 차이 추정) - 표시 쪽이 on_pickup/on_present 호출
+        self.latency_estimator = GlassToGlassEstimator()
+        
+        # 정지 화면 감지 - 격자 샘플 체크섬이 같으면 복사/변환/게시를 생략 (FPS/처리량 집계는 계속)
+        # RETURNFEED_STATIC_SKIP=0으로 끌 수 있음
+        self.static_detector = StaticFrameDetector(enabled=os.environ.get("RETURNFEED_STATIC_SKIP", "1") != "0")
+        
+        # 프레임 싱크 모드 - GUI 프레젠테이션 클럭마다 request_frame()으로 한 장씩 가져옴
+        # SDK가 소스/디스플레이 클럭 차이를 시간축 보정하므로 폴링 루프와 59.94/60 저더가 없음
+        self.frame_sync = False
+        self.framesync = None
+        self.present_event = threading.Event()
+        self.frame_sync_requests = 0
+        self.frame_sync_new_frames = 0
+        self.frame_sync_repeats = 0
+        
+        # 최신 프레임 메일박스 - dict{'image': QImage, 'resolution': str, 'fps': int, 'throughput': str,
+        #                        'audio_level': float, 'loudness': dict}
+        self.frame_mailbox = FrameMailbox()
+        
         # 🚀 ULTRATHINK 디버깅: 상세 모니터링 변수들
         self.debug_enabled = False  # 성능 향상을 위해 기본값 False
         self.frame_count = 0
@@ -69,10 +157,9 @@ class NDIReceiver(QThread):
         self.current_fps = 0.0
         self.fps_calc_start_time = 0
         self.fps_frame_count = 0
-        self.current_bitrate = "0 Mbps"
+        self.current_throughput = self.throughput.throughput_text  # 디코딩 처리량 (네트워크 비트레이트 아님)
         self.current_audio_level = -60.0
-        
-        # 동적 비트레이트 계산을 위한 변수
+        self.current_loudness = self.loudness_meter.get_levels()
         
         # 문서 기반 디버깅: 메모리 사용량 모니터링
         try:
@@ -162,7 +249,7 @@ class NDIReceiver(QThread):
                 # RecvCreateV3 설정 객체 생성
                 recv_create_v3 = ndi.RecvCreateV3()
                 recv_create_v3.source_to_connect_to = source
-                recv_create_v3.color_format = ndi.RECV_COLOR_FORMAT_BGRX_BGRA  # BGRA 포맷 강제
+                recv_create_v3.color_format = self._recv_color_format()
                 
                 # Bandwidth mode 설정
                 if self.bandwidth_mode == "lowest":
@@ -233,7 +320,13 @@ class NDIReceiver(QThread):
         """NDI 소스 연결 해제"""
         # 스레드에 정지 신호만 보내고, 실제 정리는 스레드가 종료될 때 수행
         self.running = False
+        self.present_event.set()  # 프레임 싱크 대기 중인 스레드를 즉시 깨움
         self.current_source = None
+        self.frame_mailbox.clear()
+        self.audio_meter.reset()
+        self.reset_loudness()
+        self.latency_estimator.reset()
+        self.static_detector.reset()
         self.status_changed.emit("disconnected")
     
     def disconnect_source(self):
@@ -259,6 +352,96 @@ class NDIReceiver(QThread):
         """현재 연결 상태 확인"""
         return self.receiver is not None and self.running
     
+    def _recv_color_format(self):
+        """수신 색상 포맷 - UYVY 모드는 알파가 없는 소스를 UYVY 그대로 받음"""
+        if self.color_format == "uyvy" and hasattr(ndi, 'RECV_COLOR_FORMAT_UYVY_BGRA'):
+            self.logger.info("Using native UYVY receive (alpha sources arrive as BGRA)")
+            return ndi.RECV_COLOR_FORMAT_UYVY_BGRA
+        return ndi.RECV_COLOR_FORMAT_BGRX_BGRA  # BGRA 포맷 강제
+    
+    def set_color_format(self, color_format: str):
+        """Set receive color format (bgra/uyvy)"""
+        if color_format not in ["bgra", "uyvy"]:
+            self.logger.warning(f"Invalid color format: {color_format}")
+            return
+        if color_format == self.color_format:
+            return
+        self.color_format = color_format
+        self.logger.info(f"Color format set to: {color_format}")
+        
+        # If currently connected, reconnect with new color format
+        if self.is_connected() and self.current_source:
+            source_name, source_object = self.current_source
+            self.disconnect()
+            self.wait(500)  # Wait for disconnect
+            self.connect_to_source(source_name, source_object)
+            self.start()
+    
+    def set_frame_sync(self, enabled: bool):
+        """Enable/disable frame-sync presentation mode (GUI clock pulls frames)"""
+        enabled = bool(enabled)
+        if enabled == self.frame_sync:
+            return
+        if enabled and not hasattr(ndi, 'framesync_create'):
+            self.logger.warning("Frame sync not supported by this NDI binding")
+            return
+        self.frame_sync = enabled
+        self.logger.info(f"Frame sync mode: {'on' if enabled else 'off'}")
+        
+        # If currently connected, reconnect with new receive loop
+        if self.is_connected() and self.current_source:
+            source_name, source_object = self.current_source
+            self.disconnect()
+            self.wait(500)  # Wait for disconnect
+            self.connect_to_source(source_name, source_object)
+            self.start()
+    
+    def set_audio_metering(self, enabled: bool):
+        """오디오 계측 on/off (꺼지면 미터/라우드니스 처리와 audio_levels 게시를 건너뜀)"""
+        self.audio_metering = bool(enabled)
+    
+    def set_max_fps(self, fps: float):
+        """표시 fps 상한 설정 (0 = 소스 fps 그대로)"""
+        fps = max(0.0, float(fps or 0))
+        if fps != self.max_fps:
+            self.max_fps = fps
+            self._next_accept_time = 0.0
+    
+    def set_preview_throttle(self, fps: float, max_width: int = 640, max_height: int = 360,
+                             proxy_bandwidth: bool = True):
+        """스로틀 프리뷰 - 수신은 유지하되 fps 상한 + 축소 해상도로만 변환/게시 (fps 0 = 해제)
+        
+        proxy_bandwidth면 SDK 최저 대역폭(프록시) 스트림으로 다시 연결해 디코딩 비용도 줄인다
+        (재연결은 수신 스레드가 하므로 호출한 GUI 스레드는 기다리지 않는다).
+        상한을 넘는 프레임은 복사 전에 바로 반환되고, 통과한 프레임은 max_width x max_height
+        안으로 축소된다. 해제하면 켜기 전의 fps 상한과 대역폭 모드로 되돌린다.
+        """
+        if fps and fps > 0:
+            if self.preview_throttle is None:
+                self.preview_throttle = (self.max_fps, self.bandwidth_mode)
+            self.set_max_fps(fps)
+            self.frame_scaler.set_size_limit(max_width, max_height)
+            self.logger.info(f"Preview throttled: {fps:g} fps, max {max_width}x{max_height}"
+                             f"{' (proxy)' if proxy_bandwidth else ''}")
+            if proxy_bandwidth and self.bandwidth_mode != "lowest":
+                self.set_bandwidth_mode("lowest")
+        elif self.preview_throttle is not None:
+            max_fps, bandwidth_mode = self.preview_throttle
+            self.preview_throttle = None
+            self.set_max_fps(max_fps)
+            self.frame_scaler.set_size_limit(0, 0)
+            self.logger.info("Preview throttle released")
+            if bandwidth_mode != self.bandwidth_mode:
+                self.set_bandwidth_mode(bandwidth_mode)
+    
+    def request_frame(self) -> bool:
+        """프레젠테이션 틱 - 프레임 싱크 모드면 수신 스레드를 깨우고 True 반환"""
+        if self.framesync is None:
+            return False
+        self.frame_sync_requests += 1
+        self.present_event.set()
+        return True
+    
     def set_bandwidth_mode(self, mode: str):
         """Set bandwidth mode (highest/lowest)"""
         if mode in ["highest", "lowest"]:
@@ -272,137 +455,34 @@ class NDIReceiver(QThread):
                 self.debug_enabled = False
                 self.memory_monitor_enabled = False
             
-            # If currently connected, reconnect with new bandwidth
+            # If currently connected, the receiver thread reconnects with new bandwidth
             if self.is_connected() and self.current_source:
                 self.logger.info("Reconnecting with new bandwidth mode...")
-                source_name, source_object = self.current_source
-                self.disconnect()
-                self.wait(500)  # Wait for disconnect
-                self.connect_to_source(source_name, source_object)
-                self.start()
+                self._reconnect_requested = True
+                self.present_event.set()  # 프레임 싱크 대기 중인 스레드를 바로 깨움
         else:
             self.logger.warning(f"Invalid bandwidth mode: {mode}")
     
-    def _calculate_dynamic_bitrate(self, width, height, fps, actual_frame_size=None):
-        """동적 비트레이트 계산 - 해상도와 압축률 고려"""
-        # Raw 데이터 비트레이트 계산 (bits per second)
-        # width * height * 4 bytes/pixel * 8 bits/byte * fps
-        raw_bps = width * height * 4 * 8 * fps
-        raw_mbps = raw_bps / 1_000_000
-        
-        # 실제 프레임 크기 기반 계산 (같은 PC 내부 NDI 검증용)
-        if actual_frame_size and fps > 0:
-            actual_bps = actual_frame_size * 8 * fps
-            actual_mbps = actual_bps / 1_000_000
-            
-            # 실제 데이터와 이론 데이터 비교
-            if not hasattr(self, '_frame_size_logged'):
-                mode = "프록시" if self.bandwidth_mode == "lowest" else "일반"
-                self.logger.info(f"[{mode} 모드] 실제 프레임 분석:")
-                self.logger.info(f"  이론 크기: {raw_mbps:.1f} Mbps")
-                self.logger.info(f"  실제 크기: {actual_mbps:.1f} Mbps")
-                self.logger.info(f"  비율: {actual_mbps/raw_mbps:.2f}x")
-                if actual_mbps > raw_mbps * 1.5:
-                    self.logger.info(f"  🚨 같은 PC 내부 NDI는 압축을 건너뛸 수 있습니다!")
-                self._frame_size_logged = True
-            
-            # 실제 데이터 크기가 이론값보다 훨씬 크면 압축 없음으로 판단
-            if actual_mbps > raw_mbps * 0.8:
-                return actual_mbps
-        
-        # 해상도와 모드에 따른 압축률 적용
-        if self.bandwidth_mode == "lowest":
-            # 프록시 모드: H.264/H.265 수준 압축률
-            # 사용자 요청 기준: 640x360 60fps = 30 Mbps 최대
-            if width == 640 and height == 360:
-                if fps >= 60:
-                    # 640x360 60fps: 30 Mbps 목표
-                    compression_ratio = 30.0 / raw_mbps
-                else:
-                    # 30fps: 15 Mbps 목표
-                    compression_ratio = 15.0 / raw_mbps
-            elif width <= 640 and height <= 360:
-                # 다른 소형 해상도
-                compression_ratio = 0.068 if fps >= 60 else 0.034
-            elif width <= 1280 and height <= 720:
-                # HD: H.264 효율적 압축
-                compression_ratio = 0.04 if fps >= 60 else 0.03
-            elif width == 1920 and height == 1080:
-                # Full HD: 사용자 요청 기준
-                if fps >= 60:
-                    # FHD 60fps 프록시: 120 Mbps 최대
-                    compression_ratio = 120.0 / raw_mbps
-                else:
-                    # FHD 30fps 프록시: 100 Mbps
-                    compression_ratio = 100.0 / raw_mbps
-            elif width <= 1920 and height <= 1080:
-                # 다른 Full HD 해상도
-                compression_ratio = 0.06 if fps >= 60 else 0.05
-            else:
-                # 4K 이상: 최고 압축률
-                compression_ratio = 0.015 if fps >= 60 else 0.01
-        else:
-            # 일반 모드: SpeedHQ 압축률 (NDI 문서 기반 정확한 값)
-            # 문서에서 정확한 비트레이트를 역산하여 압축률 계산
-            if width == 1280 and height == 720:
-                # 720p 정확한 값
-                if fps >= 60:
-                    # 720p60: 105.83 Mbps / (1280*720*4*8*60/1e6) = 0.1196
-                    compression_ratio = 105.83 / raw_mbps
-                elif fps >= 50:
-                    # 720p50: 96.94 Mbps
-                    compression_ratio = 96.94 / raw_mbps
-                else:
-                    compression_ratio = 0.11
-            elif width == 1920 and height == 1080:
-                # 1080p 정확한 값 (사용자 요청 기준)
-                if fps >= 60:
-                    # 1080p60: 165.17 Mbps (사용자 지정 최대값)
-                    compression_ratio = 165.17 / raw_mbps
-                elif fps >= 50:
-                    # 1080p50: 125.59 Mbps
-                    compression_ratio = 125.59 / raw_mbps
-                else:
-                    compression_ratio = 0.051
-            elif width == 3840 and height == 2160:
-                # 4K 정확한 값
-                if fps >= 60:
-                    # 4K60: 249.99 Mbps
-                    compression_ratio = 249.99 / raw_mbps
-                elif fps >= 50:
-                    # 4K50: 223.80 Mbps
-                    compression_ratio = 223.80 / raw_mbps
-                else:
-                    compression_ratio = 0.028
-            else:
-                # 다른 해상도는 근사값 사용
-                if width <= 1280 and height <= 720:
-                    compression_ratio = 0.12 if fps >= 60 else 0.11
-                elif width <= 1920 and height <= 1080:
-                    compression_ratio = 0.066 if fps >= 60 else 0.051
-                elif width <= 2560 and height <= 1440:
-                    compression_ratio = 0.055 if fps >= 60 else 0.045
-                elif width <= 3840 and height <= 2160:
-                    compression_ratio = 0.031 if fps >= 60 else 0.028
-                else:
-                    compression_ratio = 0.025
-        
-        # 압축된 비트레이트 계산
-        compressed_mbps = raw_mbps * compression_ratio
-        
-        # 최소값 보장
-        compressed_mbps = max(compressed_mbps, 0.1)
-        
-        # 로그 (처음 한 번만)
-        if not hasattr(self, '_bitrate_calc_logged'):
-            mode = "프록시" if self.bandwidth_mode == "lowest" else "일반"
-            self.logger.info(f"[{mode} 모드] {width}x{height}@{int(fps)}fps")
-            self.logger.info(f"  Raw: {raw_mbps:.1f} Mbps → Compressed: {compressed_mbps:.1f} Mbps (압축률 {compression_ratio*100:.1f}%)")
-            self.logger.info(f"  💡 같은 PC 내부 NDI는 압축을 건너뛸 수 있습니다!")
-            self._bitrate_calc_logged = True
-        
-        return compressed_mbps
-        
+    def _reconnect_receiver(self) -> bool:
+        """수신 스레드 - 현재 소스에 새 설정(대역폭)으로 NDI 수신기를 다시 만듦. 실패하면 False"""
+        self._reconnect_requested = False
+        source = self.current_source
+        if source is None:
+            return False
+        receiver, self.receiver = self.receiver, None
+        if receiver is not None:
+            try:
+                ndi.recv_destroy(receiver)
+            except Exception as e:
+                self.logger.warning(f"Error destroying receiver for reconnect: {e}")
+        self.static_detector.reset()
+        self.capture_scheduler.reset()
+        source_name, source_object = source
+        if not self.connect_to_source(source_name, source_object):
+            return False
+        self.logger.info(f"Receiver reconnected ({self.bandwidth_mode} bandwidth)")
+        return True
+    
     def run(self):
         """비디오 수신 스레드"""
         if not self.receiver:
@@ -424,185 +504,37 @@ class NDIReceiver(QThread):
             self.logger.warning(f"Failed to set thread priority: {e}")
         
         try:
+            self.throughput.reset()
+            if self.frame_sync and self._run_frame_sync():
+                return
+            
+            self.capture_scheduler.reset()
             while self.running:
+                if self._reconnect_requested and not self._reconnect_receiver():
+                    break
                 try:
-                    # 프레임 수신 타임아웃 최적화
-                    # 프록시 모드는 비블로킹으로 최대 성능 확보
-                    if self.bandwidth_mode == "lowest":
-                        # 프록시 모드: 비블로킹으로 가능한 한 빨리 프레임 수신
-                        timeout_ms = 0  # Non-blocking for maximum performance
-                    else:
-                        # 일반 모드: 60fps를 위한 적절한 타임아웃
-                        timeout_ms = 16  # 16.67ms for 60fps
+                    # 프레임 수신 타임아웃: 측정한 소스 프레임 간격 x1.5 (연속 미수신 시 최대 100ms)
+                    # 프레임이 오면 즉시 반환하므로 30p 소스는 프레임당 한 번만 깨어남 (프록시/일반 공통)
+                    timeout_ms = self.capture_scheduler.next_timeout_ms()
                     
                     frame_type, v_frame, a_frame, m_frame = ndi.recv_capture_v2(self.receiver, timeout_ms)
+                    captured_ns = time.perf_counter_ns()
+                    self._tick_throughput()
+                    if self.trace_recorder is not None:
+                        self._record_trace(frame_type, v_frame if frame_type == ndi.FRAME_TYPE_VIDEO else a_frame)
                     
                     # 비디오 프레임 처리
                     if frame_type == ndi.FRAME_TYPE_VIDEO and v_frame is not None:
-                        try:
-                            if v_frame.data is not None and v_frame.data.size > 0:
-                                # **🚀 ULTRATHINK 방탄화**: 문서 기반 완벽한 메모리 관리
-                                try:
-                                    # 🚀 ULTRATHINK 디버깅: NDI 프레임 수신 직후 상태 확인 (디버그 모드에서만)
-                                    # if self.debug_enabled:
-                                    #     self._detailed_frame_analysis(v_frame)
-                                    
-                                    # Extract frame info before copying
-                                    width = getattr(v_frame, 'xres', 0)
-                                    height = getattr(v_frame, 'yres', 0)
-                                    
-                                    # Update resolution if changed
-                                    if width > 0 and height > 0:
-                                        new_resolution = f"{width}x{height}"
-                                        if new_resolution != self.current_resolution:
-                                            self.current_resolution = new_resolution
-                                            self.logger.info(f"Resolution changed to: {self.current_resolution}")
-                                    
-                                    # 프레임 카운터 및 성능 모니터링 (모든 모드에서 필요)
-                                    self.frame_count += 1
-                                    self.fps_frame_count += 1
-                                    
-                                    # FPS 및 비트레이트 계산
-                                    current_time = time.perf_counter()  # 더 정확한 타이머
-                                    
-                                    # Calculate FPS every second
-                                    if self.fps_calc_start_time == 0:
-                                        self.fps_calc_start_time = current_time
-                                    elif current_time - self.fps_calc_start_time >= 1.0:
-                                        elapsed = current_time - self.fps_calc_start_time
-                                        raw_fps = self.fps_frame_count / elapsed
-                                        
-                                        # FPS를 합리적인 범위로 제한 (일반적인 비디오 표준)
-                                        # 60fps 소스는 실제로 59.94fps일 수 있음
-                                        if raw_fps > 60.5:
-                                            self.current_fps = 60.0
-                                        elif raw_fps > 59.5 and raw_fps <= 60.5:
-                                            self.current_fps = 60.0  # 59.94fps를 60fps로 표시
-                                        elif raw_fps > 29.5 and raw_fps <= 30.5:
-                                            self.current_fps = 30.0  # 29.97fps를 30fps로 표시
-                                        else:
-                                            self.current_fps = round(raw_fps, 1)
-                                        
-                                        # FPS 로그 (디버깅용)
-                                        if self.bandwidth_mode == "lowest":
-                                            # 프록시 모드 FPS 항상 로그
-                                            if self.current_fps < 50:
-                                                self.logger.warning(f"프록시 모드 FPS 저하: {self.current_fps:.1f} fps (목표: 60fps)")
-                                            else:
-                                                self.logger.info(f"프록시 모드 FPS: {self.current_fps:.1f} fps")
-                                        elif self.current_fps < 55:  # 일반 모드에서 55fps 미만일 때만
-                                            self.logger.info(f"일반 모드 FPS: {self.current_fps:.1f} fps")
-                                        self.fps_frame_count = 0
-                                        self.fps_calc_start_time = current_time
-                                    
-                                    # 동적 비트레이트 계산 (해상도, FPS, 압축률 기반)
-                                    if hasattr(v_frame, 'xres') and hasattr(v_frame, 'yres') and self.current_fps > 0:
-                                        # 실제 프레임 크기 계산 (line_stride_in_bytes * yres)
-                                        actual_frame_size = None
-                                        if hasattr(v_frame, 'line_stride_in_bytes') and hasattr(v_frame, 'yres'):
-                                            actual_frame_size = v_frame.line_stride_in_bytes * v_frame.yres
-                                        
-                                        dynamic_bitrate = self._calculate_dynamic_bitrate(
-                                            v_frame.xres, 
-                                            v_frame.yres, 
-                                            self.current_fps,
-                                            actual_frame_size
-                                        )
-                                        
-                                        # 포맷팅
-                                        if dynamic_bitrate >= 1000:
-                                            self.current_bitrate = f"{dynamic_bitrate/1000:.1f} Gbps"
-                                        else:
-                                            self.current_bitrate = f"{dynamic_bitrate:.1f} Mbps"
-                                    else:
-                                        self.current_bitrate = "계산 중..."
-                                    
-                                    # 프레임 데이터 복사 (프록시 모드 최적화)
-                                    # 프록시 모드는 작은 프레임이므로 단순 복사가 더 빠름
-                                    if self.bandwidth_mode == "lowest":
-                                        # 프록시 모드: 즉시 복사 (작은 프레임이므로 오버헤드 적음)
-                                        frame_data_copy = v_frame.data.copy()
-                                    else:
-                                        # 일반 모드: 안전한 깊은 복사
-                                        frame_data_copy = v_frame.data.copy()
-                                    
-                                    # 2. 복사 직후 NDI 프레임 즉시 해제 (Use-After-Free 방지)
-                                    ndi.recv_free_video_v2(self.receiver, v_frame)
-                                    v_frame = None  # 명시적으로 None 설정하여 실수 방지
-                                    
-                                    # 🚀 ULTRATHINK 디버깅: 메모리 모니터링 (디버그 모드에서만)
-                                    # if self.debug_enabled:
-                                    #     self._monitor_performance()
-                                    
-                                    # 프레임 타이밍 기록 (항상 필요 - FPS 계산용)
-                                    self.last_frame_time = current_time
-                                    
-                                    # 디버그 분석은 분리된 메서드에서만
-                                    if self.debug_enabled:
-                                        self._debug_frame_timing(current_time)
-                                    
-                                    # 복사된 데이터로 안전한 프레임 처리
-                                    try:
-                                        # 프록시 모드는 더 빠른 처리
-                                        if self.bandwidth_mode == "lowest":
-                                            image = self._create_qimage_fast(frame_data_copy)
-                                        else:
-                                            image = self._create_qimage_bulletproof(frame_data_copy)
-                                        if image:
-                                            # Emit frame data as dict with technical info
-                                            frame_dict = {
-                                                'image': image,
-                                                'resolution': self.current_resolution,
-                                                'fps': int(round(self.current_fps)),
-                                                'bitrate': self.current_bitrate,
-                                                'audio_level': self.current_audio_level
-                                            }
-                                            self.frame_received.emit(frame_dict)
-                                            self.frame_queue_size = 1  # 간단한 카운터 유지
-                                                    
-                                    except Exception as qvf_error:
-                                        if self.debug_enabled:
-                                            self.logger.warning(f"Frame processing failed: {qvf_error}")
-                                        
-                                except Exception as copy_error:
-                                    self.logger.error(f"Frame copy error: {copy_error}")
-                                    # NDI 프레임이 아직 해제되지 않았다면 해제
-                                    if v_frame is not None and self.receiver is not None:
-                                        try:
-                                            ndi.recv_free_video_v2(self.receiver, v_frame)
-                                        except Exception as free_error:
-                                            self.logger.warning(f"Emergency frame free failed: {free_error}")
-                            
-                        except Exception as e:
-                            self.logger.error(f"Frame processing error: {e}")
-                            # 에러 발생 시에도 NDI 프레임 해제 확인
-                            if v_frame is not None and self.receiver is not None:
-                                try:
-                                    ndi.recv_free_video_v2(self.receiver, v_frame)
-                                except Exception as free_error:
-                                    self.logger.warning(f"Error cleanup frame free failed: {free_error}")
+                        self.capture_scheduler.on_video_frame()
+                        self._process_video_frame(v_frame, self._free_recv_video, captured_ns)
                     
                     elif frame_type == ndi.FRAME_TYPE_AUDIO and a_frame is not None:
+                        self.capture_scheduler.on_other_frame()
                         try:
                             # 오디오 프레임은 별도 처리 (NDI 표준 비트레이트 사용)
                             
                             # Calculate audio level from audio frame
-                            if hasattr(a_frame, 'data') and a_frame.data is not None:
-                                try:
-                                    audio_data = a_frame.data
-                                    if audio_data.size > 0:
-                                        # Calculate RMS (Root Mean Square) for audio level
-                                        rms = np.sqrt(np.mean(audio_data**2))
-                                        # Convert to dB (with protection against log(0))
-                                        if rms > 0:
-                                            db = 20 * np.log10(rms)
-                                            # Clamp to reasonable range
-                                            self.current_audio_level = max(-60.0, min(0.0, db))
-                                        else:
-                                            self.current_audio_level = -60.0
-                                except Exception as audio_e:
-                                    # Keep previous audio level on error
-                                    pass
+                            self._meter_audio_frame(a_frame)
                         finally:
                             # 오디오 프레임 메모리 해제 - 안전한 해제
                             if a_frame is not None and self.receiver is not None:
@@ -612,6 +544,7 @@ class NDIReceiver(QThread):
                                     self.logger.warning(f"Failed to free audio frame: {free_error}")
                     
                     elif frame_type == ndi.FRAME_TYPE_METADATA and m_frame is not None:
+                        self.capture_scheduler.on_other_frame()
                         try:
                             # 메타데이터 프레임은 별도 처리 (NDI 표준 비트레이트 사용)
                             pass
@@ -624,19 +557,15 @@ class NDIReceiver(QThread):
                                     self.logger.warning(f"Failed to free metadata frame: {free_error}")
                     
                     elif frame_type == ndi.FRAME_TYPE_ERROR:
+                        self.capture_scheduler.on_other_frame()
                         self.logger.error("NDI FRAME_TYPE_ERROR received. Attempting recovery...")
                         self.error_occurred.emit("NDI source reported an error")
                         # 즉시 재시도 (프록시 모드 성능 향상)
                         continue
                     
                     elif frame_type == ndi.FRAME_TYPE_NONE:
-                        # 타임아웃 - 프록시 모드에서는 더 자주 발생
-                        if self.bandwidth_mode == "lowest":
-                            # 프록시 모드: 적절한 대기로 CPU 사용률 감소
-                            self.msleep(8)  # 8ms 대기 (약 120fps 루프)
-                        else:
-                            # 일반 모드: 즉시 재시도
-                            pass
+                        # 타임아웃 - 미수신 기록으로 다음 대기 시간 조정 (별도 sleep 없음)
+                        self.capture_scheduler.on_timeout()
                         continue
                             
                 except Exception as e:
@@ -663,6 +592,358 @@ class NDIReceiver(QThread):
             self.running = False
             self.logger.info("NDI receiver thread stopped")
         
+    def _process_video_frame(self, v_frame, free_video, captured_ns: Optional[int] = None):
+        """비디오 프레임 한 장 처리 - 풀 슬롯으로 복사/변환 후 메일박스에 게시
+        
+        free_video(v_frame)는 복사 직후 SDK 프레임을 반환한다 (recv_capture_v2 / framesync 공용).
+        captured_ns는 SDK가 프레임을 넘겨준 시각 (단계별 지연 기록 시작점, 없으면 지금).
+        """
+        timings = self.stage_timings if self.stage_timings.enabled else None
+        if timings is not None and captured_ns is None:
+            captured_ns = time.perf_counter_ns()
+        if self.max_fps > 0 and not self._accept_capped_frame():
+            # fps 상한 초과 - 복사/변환 없이 바로 반환
+            free_video(v_frame)
+            self.frames_capped += 1
+            return
+        try:
+            if v_frame.data is not None and v_frame.data.size > 0:
+                # **🚀 ULTRATHINK 방탄화**: 문서 기반 완벽한 메모리 관리
+                buffer_token = None
+                try:
+                    # 🚀 ULTRATHINK 디버깅: NDI 프레임 수신 직후 상태 확인 (디버그 모드에서만)
+                    # if self.debug_enabled:
+                    #     self._detailed_frame_analysis(v_frame)
+                    
+                    # Extract frame info before copying
+                    width = getattr(v_frame, 'xres', 0)
+                    height = getattr(v_frame, 'yres', 0)
+                    source_timestamp = getattr(v_frame, 'timestamp', None)  # 100ns 단위 소스 타임스탬프
+                    source_timecode = getattr(v_frame, 'timecode', None)
+                    received_wall = time.time_ns() // 100  # 송신 타임스탬프와 같은 100ns UNIX 시각
+                    self.latency_estimator.on_arrival(source_timestamp, source_timecode, received_wall)
+                    
+                    # Update resolution if changed
+                    if width > 0 and height > 0:
+                        new_resolution = f"{width}x{height}"
+                        if new_resolution != self.current_resolution:
+                            self.current_resolution = new_resolution
+                            self.logger.info(f"Resolution changed to: {self.current_resolution}")
+                    
+                    # 프레임 카운터 및 성능 모니터링 (모든 모드에서 필요)
+                    self.frame_count += 1
+                    self.fps_frame_count += 1
+                    
+                    # FPS 및 비트레이트 계산
+                    current_time = time.perf_counter()  # 더 정확한 타이머
+                    
+                    # Calculate FPS every second
+                    if self.fps_calc_start_time == 0:
+                        self.fps_calc_start_time = current_time
+                    elif current_time - self.fps_calc_start_time >= 1.0:
+                        elapsed = current_time - self.fps_calc_start_time
+                        raw_fps = self.fps_frame_count / elapsed
+                        
+                        # FPS를 합리적인 범위로 제한 (일반적인 비디오 표준)
+                        # 60fps 소스는 실제로 59.94fps일 수 있음
+                        if raw_fps > 60.5:
+                            self.current_fps = 60.0
+                        elif raw_fps > 59.5 and raw_fps <= 60.5:
+                            self.current_fps = 60.0  # 59.94fps를 60fps로 표시
+                        elif raw_fps > 29.5 and raw_fps <= 30.5:
+                            self.current_fps = 30.0  # 29.97fps를 30fps로 표시
+                        else:
+                            self.current_fps = round(raw_fps, 1)
+                        
+                        # FPS 로그 (디버깅용)
+                        if self.bandwidth_mode == "lowest":
+                            # 프록시 모드 FPS 항상 로그
+                            if self.current_fps < 50:
+                                self.logger.warning(f"프록시 모드 FPS 저하: {self.current_fps:.1f} fps (목표: 60fps)")
+                            else:
+                                self.logger.info(f"프록시 모드 FPS: {self.current_fps:.1f} fps "
+                                                 f"(wakeups: {self.capture_scheduler.wakeups_per_sec:.0f}/s)")
+                        elif self.current_fps < 55:  # 일반 모드에서 55fps 미만일 때만
+                            self.logger.info(f"일반 모드 FPS: {self.current_fps:.1f} fps")
+                        self.fps_frame_count = 0
+                        self.fps_calc_start_time = current_time
+                    
+                    # 처리량 집계 - SDK가 넘겨준 프레임 바이트만 더함 (계산/포맷은 1초마다 tick)
+                    self.throughput.add_video(v_frame.data.nbytes)
+                    
+                    # 정지 화면이면 이전에 게시한 프레임이 그대로 유효 - 복사/변환/게시 없이 반환
+                    if self.static_detector.enabled and self.static_detector.check(v_frame.data, current_time):
+                        free_video(v_frame)
+                        v_frame = None
+                        self.last_frame_time = current_time
+                        return
+                    
+                    # 프레임 데이터를 풀 슬롯으로 복사 (해상도/스트라이드 변경 시에만 재할당)
+                    src_data = v_frame.data
+                    # 목표 크기는 GUI 스레드가 언제든 바꿀 수 있으므로 이 프레임의 계획을 한 번만 잡아서 사용
+                    scale_plan = self.frame_scaler.plan(src_data.shape)
+                    if src_data.ndim == 3 and src_data.shape[2] == 2 and width > 0 and height > 0:
+                        # 네이티브 UYVY: 표시 크기로 줄이면서 BGRA 풀 슬롯에 직접 변환
+                        out_w, out_h = self.frame_scaler.fit_size(width, height) or (width, height)
+                        buffer_token, frame_data_copy = self.frame_pool.acquire(
+                            (out_h, out_w, 4), np.uint8, out_w * 4
+                        )
+                        self.yuv_converter.convert(src_data, frame_data_copy)
+                    elif scale_plan is not None:
+                        # 표시 크기로 축소하면서 NDI 버퍼에서 바로 복사 (전체 해상도 복사 생략)
+                        scaled_shape = scale_plan['out_shape']
+                        buffer_token, frame_data_copy = self.frame_pool.acquire(
+                            scaled_shape, src_data.dtype, scaled_shape[1] * scaled_shape[2]
+                        )
+                        self.frame_scaler.scale(src_data, frame_data_copy, scale_plan)
+                    else:
+                        buffer_token, frame_data_copy = self.frame_pool.acquire(
+                            src_data.shape,
+                            src_data.dtype,
+                            getattr(v_frame, 'line_stride_in_bytes', 0)
+                        )
+                        np.copyto(frame_data_copy, src_data)
+                    src_data = None
+                    if timings is not None:
+                        copied_ns = time.perf_counter_ns()
+                    
+                    # 2. 복사 직후 NDI 프레임 즉시 해제 (Use-After-Free 방지)
+                    free_video(v_frame)
+                    v_frame = None  # 명시적으로 None 설정하여 실수 방지
+                    if timings is not None:
+                        freed_ns = time.perf_counter_ns()
+                    
+                    # 단계별 지연/풀/메일박스 요약 로그 (디버그 모드에서만, debug_interval마다)
+                    if self.debug_enabled:
+                        self._monitor_performance()
+                    
+                    # 프레임 타이밍 기록 (항상 필요 - FPS 계산용)
+                    self.last_frame_time = current_time
+                    
+                    # 디버그 분석은 분리된 메서드에서만
+                    if self.debug_enabled:
+                        self._debug_frame_timing(current_time)
+                    
+                    # 복사된 데이터로 안전한 프레임 처리
+                    try:
+                        # 프록시 모드는 더 빠른 처리
+                        if self.bandwidth_mode == "lowest":
+                            image = self._create_qimage_fast(frame_data_copy)
+                        else:
+                            image = self._create_qimage_bulletproof(frame_data_copy)
+                        self._attach_frame_buffer(image, buffer_token, frame_data_copy)
+                        buffer_token = None
+                        if timings is not None:
+                            built_ns = time.perf_counter_ns()
+                        if image:
+                            # Emit frame data as dict with technical info
+                            frame_dict = {
+                                'image': image,
+                                'resolution': self.current_resolution,
+                                'fps': int(round(self.current_fps)),
+                                'throughput': self.current_throughput,
+                                'dropped_frames': self.throughput.dropped_video_frames,
+                                'timestamp': source_timestamp,
+                                'timecode': source_timecode,
+                                'received_at': current_time,
+                                'received_wall': received_wall,
+                                'audio_level': self.current_audio_level,
+                                'loudness': self.current_loudness
+                            }
+                            if timings is not None:
+                                frame_dict['timing'] = (captured_ns, time.perf_counter_ns())  # (캡처, 게시)
+                            # 최신 프레임만 보관 - 읽히지 않은 이전 프레임은 덮어씀
+                            if self.frame_mailbox.publish(frame_dict):
+                                self.frame_ready.emit()
+                            self.frame_queue_size = 1  # 간단한 카운터 유지
+                            if timings is not None:
+                                timings.record_receiver(captured_ns, copied_ns, freed_ns, built_ns,
+                                                        time.perf_counter_ns())
+                                    
+                    except Exception as qvf_error:
+                        # QImage에 연결되지 못한 슬롯은 즉시 반환
+                        self.frame_pool.release(buffer_token)
+                        if self.debug_enabled:
+                            self.logger.warning(f"Frame processing failed: {qvf_error}")
+                        
+                except Exception as copy_error:
+                    self.logger.error(f"Frame copy error: {copy_error}")
+                    self.frame_pool.release(buffer_token)
+                    # NDI 프레임이 아직 해제되지 않았다면 해제
+                    if v_frame is not None and self.receiver is not None:
+                        try:
+                            free_video(v_frame)
+                        except Exception as free_error:
+                            self.logger.warning(f"Emergency frame free failed: {free_error}")
+            
+        except Exception as e:
+            self.logger.error(f"Frame processing error: {e}")
+            # 에러 발생 시에도 NDI 프레임 해제 확인
+            if v_frame is not None and self.receiver is not None:
+                try:
+                    free_video(v_frame)
+                except Exception as free_error:
+                    self.logger.warning(f"Error cleanup frame free failed: {free_error}")
+    
+    def _meter_audio_frame(self, a_frame):
+        """오디오 프레임 계측 - 채널별 미터 + 라우드니스"""
+        if not self.audio_metering:
+            return
+        if hasattr(a_frame, 'data') and a_frame.data is not None:
+            try:
+                audio_data = a_frame.data
+                if audio_data.size > 0:
+                    self.throughput.add_audio(audio_data.nbytes)
+                    # 채널별 RMS/트루 피크 + 탄도 (float32 planar: channels x samples)
+                    levels = self.audio_meter.process(
+                        audio_data, getattr(a_frame, 'sample_rate', 48000)
+                    )
+                    if levels is not None:
+                        self.current_audio_level = self.audio_meter.overall_level()
+                        self.audio_levels.emit(levels)
+                    # K-가중 라우드니스 (100ms 단위로 갱신)
+                    self.loudness_meter.process(
+                        audio_data, getattr(a_frame, 'sample_rate', 48000)
+                    )
+                    self.current_loudness = self.loudness_meter.get_levels()
+            except Exception as audio_e:
+                # Keep previous audio level on error
+                if self.debug_enabled:
+                    self.logger.warning(f"Audio metering failed: {audio_e}")
+    
+    def _accept_capped_frame(self) -> bool:
+        """max_fps 간격 스케줄에 맞는 프레임만 통과 (소스 fps가 상한의 배수가 아니어도 평균 유지)"""
+        now = time.perf_counter()
+        if now < self._next_accept_time:
+            return False
+        interval = 1.0 / self.max_fps
+        # 늦게 도착한 만큼은 다음 간격에서 보상하되, 한 간격 이상 밀리면 현재 시각 기준으로 재설정
+        self._next_accept_time = max(self._next_accept_time + interval, now + interval * 0.5)
+        return True
+    
+    def start_trace_recording(self, path: str, max_bytes: int = 2 << 30) -> bool:
+        """수신 프레임 트레이스 녹화 시작 (재생: RETURNFEED_NDI_REPLAY=path)"""
+        self.stop_trace_recording()
+        try:
+            self.trace_recorder = NDITraceRecorder(path, max_bytes=max_bytes)
+            self.logger.info(f"Trace recording started: {path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to start trace recording: {e}")
+            self.trace_recorder = None
+            return False
+    
+    def stop_trace_recording(self) -> Optional[dict]:
+        """녹화 종료 후 통계 반환 (녹화 중이 아니면 None)"""
+        recorder, self.trace_recorder = self.trace_recorder, None
+        if recorder is None:
+            return None
+        try:
+            recorder.close()
+        except Exception as e:
+            self.logger.error(f"Failed to finalize trace: {e}")
+        return recorder.get_stats()
+    
+    def _record_trace(self, frame_type, frame):
+        recorder = self.trace_recorder
+        if recorder is None or frame is None:
+            return
+        try:
+            recorder.record(frame_type, frame)
+        except Exception as e:
+            self.logger.warning(f"Trace recording failed, stopping: {e}")
+            self.stop_trace_recording()
+    
+    def _free_recv_video(self, v_frame):
+        ndi.recv_free_video_v2(self.receiver, v_frame)
+    
+    def _free_framesync_video(self, v_frame):
+        ndi.framesync_free_video(self.framesync, v_frame)
+    
+    def _run_frame_sync(self) -> bool:
+        """프레임 싱크 수신 루프 - 프레젠테이션 틱마다 비디오 한 장과 그 사이의 오디오를 가져옴
+        
+        framesync를 만들지 못하면 False를 반환하고 호출자는 기존 폴링 루프로 진행한다.
+        """
+        try:
+            self.framesync = ndi.framesync_create(self.receiver)
+        except Exception as e:
+            self.logger.warning(f"Frame sync unavailable, falling back to polling: {e}")
+            self.framesync = None
+        if not self.framesync:
+            self.framesync = None
+            return False
+        
+        self.logger.info("Frame sync receive loop started")
+        self.present_event.clear()
+        last_timestamp = None
+        audio_clock = time.perf_counter()
+        audio_pending = 0.0
+        try:
+            while self.running:
+                # 틱이 없으면 (창 숨김, SRT 송출 중 정지) 깨어나지 않음 - 폴링/msleep 없음
+                ticked = self.present_event.wait(self.FRAME_SYNC_IDLE_WAIT)
+                if self._reconnect_requested:
+                    # framesync는 수신기에 묶여 있으므로 함께 다시 만듦
+                    ndi.framesync_destroy(self.framesync)
+                    self.framesync = None
+                    if not self._reconnect_receiver():
+                        break
+                    self.framesync = ndi.framesync_create(self.receiver)
+                    last_timestamp = None
+                if not ticked:
+                    continue
+                self.present_event.clear()
+                if not self.running:
+                    break
+                self._tick_throughput()
+                
+                try:
+                    v_frame = ndi.framesync_capture_video(self.framesync, ndi.FRAME_FORMAT_TYPE_PROGRESSIVE)
+                    timestamp = getattr(v_frame, 'timestamp', None)
+                    if (v_frame.data is None or v_frame.data.size == 0
+                            or (timestamp is not None and timestamp == last_timestamp)):
+                        # 첫 프레임 전이거나 SDK가 이전 프레임을 반복 - 변환 없이 반환 (화면은 그대로)
+                        self._free_framesync_video(v_frame)
+                        self.frame_sync_repeats += 1
+                    else:
+                        last_timestamp = timestamp
+                        self.frame_sync_new_frames += 1
+                        if self.trace_recorder is not None:
+                            self._record_trace(ndi.FRAME_TYPE_VIDEO, v_frame)
+                        self._process_video_frame(v_frame, self._free_framesync_video)
+                except Exception as e:
+                    self.logger.error(f"Frame sync video capture error: {e}")
+                
+                # 지난 틱 이후 경과한 만큼의 오디오 (SDK가 48kHz로 리샘플)
+                now = time.perf_counter()
+                audio_pending += (now - audio_clock) * self.FRAME_SYNC_AUDIO_RATE
+                audio_clock = now
+                audio_pending = min(audio_pending, self.FRAME_SYNC_MAX_AUDIO * self.FRAME_SYNC_AUDIO_RATE)
+                samples = int(audio_pending)
+                if samples <= 0 or not self.audio_metering:
+                    continue
+                audio_pending -= samples
+                try:
+                    a_frame = ndi.framesync_capture_audio(self.framesync, self.FRAME_SYNC_AUDIO_RATE, 0, samples)
+                    try:
+                        if self.trace_recorder is not None:
+                            self._record_trace(ndi.FRAME_TYPE_AUDIO, a_frame)
+                        self._meter_audio_frame(a_frame)
+                    finally:
+                        ndi.framesync_free_audio(self.framesync, a_frame)
+                except Exception as e:
+                    self.logger.error(f"Frame sync audio capture error: {e}")
+        finally:
+            try:
+                if self.framesync is not None:
+                    ndi.framesync_destroy(self.framesync)
+            except Exception as e:
+                self.logger.warning(f"Failed to destroy frame sync: {e}")
+            self.framesync = None
+            self.logger.info("Frame sync receive loop stopped")
+        return True
+    
     def _convert_frame_to_qimage_safe(self, video_frame, frame_data_copy) -> Optional[QImage]:
         """안전한 프레임 변환 - 복사된 데이터 사용"""
         try:
@@ -1003,6 +1284,115 @@ class NDIReceiver(QThread):
             self.logger.error(f"QVideoFrame conversion error: {e}")
             return None
     
+    def _attach_frame_buffer(self, image: Optional[QImage], buffer_token, frame_data_copy):
+        """풀 슬롯을 QImage 수명에 연결 - QImage가 슬롯 메모리를 직접 참조할 때만"""
+        if buffer_token is None:
+            return
+        # BGRA/RGB 경로는 슬롯 메모리를 그대로 감싸고, YUV 경로는 별도 버퍼로 변환됨
+        if image is not None and not image.isNull() and frame_data_copy.ndim == 3 and frame_data_copy.shape[2] in (3, 4):
+            self.frame_pool.bind(image, buffer_token)
+        else:
+            self.frame_pool.release(buffer_token)
+    
+    def set_display_size(self, width: int, height: int):
+        """표시 영역의 디바이스 픽셀 크기 설정 - GUI 스레드에서 호출"""
+        self.frame_scaler.set_target_size(width, height)
+        self.logger.debug(f"Display size negotiated: {width}x{height}")
+    
+    def get_yuv_stats(self) -> dict:
+        """UYVY 변환 통계"""
+        return self.yuv_converter.get_stats()
+    
+    def reset_loudness(self):
+        """적분 라우드니스 측정 초기화"""
+        self.loudness_meter.reset()
+        self.current_loudness = self.loudness_meter.get_levels()
+    
+    def get_capture_stats(self) -> dict:
+        """캡처 루프 통계 (wakeups_per_sec/source_fps/timeout_ms/timeouts)"""
+        return self.capture_scheduler.get_stats()
+    
+    def _tick_throughput(self):
+        """처리량 윈도우 갱신 + SDK 성능/큐 카운터 조회 - 1초에 한 번만 실제 작업"""
+        if not self.throughput.tick():
+            return
+        self.current_throughput = self.throughput.throughput_text
+        if self.receiver is None:
+            return
+        try:
+            if self._recv_get_performance is not None:
+                total, dropped = self._recv_get_performance(self.receiver)
+                queue = self._recv_get_queue(self.receiver) if self._recv_get_queue is not None else None
+                self.throughput.set_sdk_counters(
+                    total_video=getattr(total, 'video_frames', 0),
+                    dropped_video=getattr(dropped, 'video_frames', 0),
+                    dropped_audio=getattr(dropped, 'audio_frames', 0),
+                    queued_video=getattr(queue, 'video_frames', 0) if queue is not None else 0,
+                )
+        except Exception as e:
+            self.logger.debug(f"SDK performance query failed: {e}")
+    
+    def get_technical_info(self) -> dict:
+        """표시용 기술 정보 - GUI 타이머가 주기적으로 읽음 (정지 화면이라 프레임이 게시되지 않아도 갱신)"""
+        return {
+            'resolution': self.current_resolution,
+            'fps': int(round(self.current_fps)),
+            'throughput': self.current_throughput,
+            'dropped_frames': self.throughput.dropped_video_frames,
+            'audio_level': self.current_audio_level,
+            'loudness': self.current_loudness,
+        }
+    
+    def get_throughput_stats(self) -> dict:
+        """실측 처리량 (슬라이딩 윈도우) + SDK 드롭/큐 카운터"""
+        return self.throughput.get_stats()
+    
+    def set_stage_timing(self, enabled: bool):
+        """단계별 지연 기록 켜기/끄기 - 켤 때 이전 기록은 초기화"""
+        if enabled and not self.stage_timings.enabled:
+            self.stage_timings.reset()
+        self.stage_timings.enabled = enabled
+    
+    def get_latency_stats(self) -> dict:
+        """송신 -> 표시 지연 p50/p95 (ms) + 시계 차이 추정 상태"""
+        return self.latency_estimator.get_stats()
+    
+    def set_static_skip(self, enabled: bool):
+        """정지 화면 생략 켜기/끄기 - 끄면 모든 프레임을 다시 변환/게시"""
+        if enabled != self.static_detector.enabled:
+            self.static_detector.reset()
+        self.static_detector.enabled = enabled
+    
+    def get_static_stats(self) -> dict:
+        """정지 화면 생략 통계 (checked/skipped/skip_ratio, static = 지금 정지 중)"""
+        return self.static_detector.get_stats()
+    
+    def get_stage_timings(self) -> dict:
+        """단계별 지연 백분위 {stage: {'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}}"""
+        return self.stage_timings.get_stats()
+    
+    def get_frame_sync_stats(self) -> dict:
+        """프레임 싱크 통계 (requests/new_frames/repeats)"""
+        return {
+            'enabled': self.frame_sync,
+            'active': self.framesync is not None,
+            'requests': self.frame_sync_requests,
+            'new_frames': self.frame_sync_new_frames,
+            'repeats': self.frame_sync_repeats,
+        }
+    
+    def get_scaler_stats(self) -> dict:
+        """표시 해상도 스케일링 통계"""
+        return self.frame_scaler.get_stats()
+    
+    def get_mailbox_stats(self) -> dict:
+        """프레임 메일박스 통계 (published/delivered/overwritten)"""
+        return self.frame_mailbox.get_stats()
+    
+    def get_frame_pool_stats(self) -> dict:
+        """프레임 버퍼 풀 통계 (hits/misses/in_flight/reallocations)"""
+        return self.frame_pool.get_stats()
+    
     def _reset_frame_queue_counter(self):
         """프레임 큐 카운터 리셋 - 메인 스레드에서 실행"""
         self.frame_queue_size = 0
@@ -1112,12 +1502,34 @@ class NDIReceiver(QThread):
                 if not qimage.isNull():
                     return qimage
                     
+            elif channels == 2:
+                # YUV 422 (UYVY) - 컬러 변환
+                return self._create_qimage_from_uyvy(frame_data_copy)
+                    
             return None
             
         except Exception as e:
             self.logger.debug(f"Fast QImage creation failed: {e}")
             return None
     
+    def _create_qimage_from_uyvy(self, frame_data_copy) -> Optional[QImage]:
+        """UYVY 4:2:2 프레임을 BGRA 버퍼로 컬러 변환해 QImage 생성
+        
+        표시 크기가 협상되어 있으면 변환과 축소를 한 번에 수행한다. 변환 결과는
+        별도 풀 슬롯에 기록되고 QImage 수명에 연결되므로 프레임마다 새 버퍼를
+        할당하지 않는다.
+        """
+        height, width = frame_data_copy.shape[:2]
+        width, height = self.frame_scaler.fit_size(width, height) or (width, height)
+        token, bgra = self.yuv_output_pool.acquire((height, width, 4), np.uint8, width * 4)
+        self.yuv_converter.convert(frame_data_copy, bgra)
+        qimage = QImage(bgra.data, width, height, width * 4, QImage.Format.Format_ARGB32)
+        if qimage.isNull():
+            self.yuv_output_pool.release(token)
+            return None
+        self.yuv_output_pool.bind(qimage, token)
+        return qimage
+    
     def _create_qimage_bulletproof(self, frame_data_copy) -> Optional[QImage]:
         """🚀 ULTRATHINK 방탄화: 문서 기반 완벽한 QImage 생성"""
         try:
@@ -1150,26 +1562,11 @@ class NDIReceiver(QThread):
                     self.logger.warning(f"BGRA to QImage conversion failed: {e}")
                     
             elif channels == 2:
-                # YUV 422 처리 - 개선된 그레이스케일 변환
+                # YUV 422 (UYVY) 처리 - 정수 커널 컬러 변환
                 try:
-                    total_pixels = width * height
-                    # Y 채널만 추출 (더 안전한 방식)
-                    gray_data = frame_data_copy.flatten()[::2][:total_pixels]
-                    
-                    if len(gray_data) >= total_pixels:
-                        gray_image = gray_data.reshape((height, width))
-                        rgb_data = np.stack([gray_image, gray_image, gray_image], axis=-1)
-                        
-                        qimage = QImage(
-                            rgb_data.tobytes(),
-                            width, height,
-                            width * 3,
-                            QImage.Format.Format_RGB888
-                        )
-                        
-                        if not qimage.isNull():
-                            qimage.bits().setsize(rgb_data.nbytes)
-                            return qimage
+                    qimage = self._create_qimage_from_uyvy(frame_data_copy)
+                    if qimage is not None:
+                        return qimage
                             
                 except Exception as yuv_e:
                     self.logger.error(f"YUV to QImage conversion failed: {yuv_e}")
@@ -1258,6 +1655,24 @@ class NDIReceiver(QThread):
                 debug_info = []
                 debug_info.append(f"Frames processed: {self.frame_count}")
                 debug_info.append(f"Queue size: {self.frame_queue_size}/{self.max_queue_size}")
+                mailbox_stats = self.frame_mailbox.get_stats()
+                debug_info.append(f"Mailbox overwritten: {mailbox_stats['overwritten']}/{mailbox_stats['published']}")
+                pool_stats = self.frame_pool.get_stats()
+                debug_info.append(
+                    f"Pool: hit {pool_stats['hits']} / miss {pool_stats['misses']} / "
+                    f"in-flight {pool_stats['in_flight']}/{pool_stats['slots']}"
+                )
+                if self.static_detector.enabled:
+                    debug_info.append(f"Static skip: {self.static_detector.skip_ratio:.0%}")
+                scaler_stats = self.frame_scaler.get_stats()
+                if scaler_stats['output']:
+                    debug_info.append(f"Scaled to: {scaler_stats['output'][1]}x{scaler_stats['output'][0]} (box {scaler_stats['factor']}x)")
+                if self.stage_timings.enabled:
+                    stages = self.stage_timings.get_stats()
+                    debug_info.append("Stages p50/p95 ms: " + ", ".join(
+                        f"{stage} {stats['p50_ms']:.2f}/{stats['p95_ms']:.2f}"
+                        for stage, stats in stages.items() if stats['count']
+                    ))
                 
                 # FPS 계산
                 if self.last_debug_time > 0:
@@ -0,0 +1,408 @@
+# ndi_trace.py
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+# NDIlib_frame_type_e 값과 같음
+FRAME_TYPE_NONE = 0
+FRAME_TYPE_VIDEO = 1
+FRAME_TYPE_AUDIO = 2
+FRAME_TYPE_METADATA = 3
+FRAME_TYPE_ERROR = 4
+
+TRACE_MAGIC = b"RFNDITRC"
+TRACE_VERSION = 1
+# magic, version, frame_count, index_offset, data_end
+TRACE_HEADER = struct.Struct("<8sIxxxxQQQ")
+TRACE_HEADER_SIZE = 64
+# frame_type, ndim, dtype, shape[3], fourcc, xres, yres, stride, frame_rate_N, frame_rate_D,
+# sample_rate, no_channels, no_samples, timestamp, timecode, received_at, payload_offset, payload_size
+RECORD = struct.Struct("<BB6s3IIiiiiiiiiqqdQQ")
+PAYLOAD_ALIGN = 64  # 페이로드를 64바이트 경계에 두어 재생 시 numpy 뷰가 정렬됨
+
+
+def _align(value: int) -> int:
+    return (value + PAYLOAD_ALIGN - 1) // PAYLOAD_ALIGN * PAYLOAD_ALIGN
+
+
+class TraceFrame:
+    """트레이스의 프레임 한 장 - 페이로드는 mmap 위의 읽기 전용 numpy 뷰"""
+
+    __slots__ = ('frame_type', 'data', 'FourCC', 'xres', 'yres', 'line_stride_in_bytes',
+                 'frame_rate_N', 'frame_rate_D', 'sample_rate', 'no_channels', 'no_samples',
+                 'channel_stride_in_bytes', 'timestamp', 'timecode', 'received_at')
+
+
+class NDITraceRecorder:
+    """수신한 비디오/오디오 프레임을 메모리 매핑 컨테이너 파일에 그대로 기록
+
+    레코드마다 원본 페이로드와 FourCC, 스트라이드, 소스 타임스탬프/타임코드, 수신 시각,
+    프레임 종류를 남긴다. 파일은 capacity 단위로 늘려 가며 mmap에 직접 복사하고
+    (프레임마다 write 호출/중간 bytes 객체 없음), close() 때 레코드 인덱스를 끝에 붙인다.
+    max_bytes를 넘으면 기록을 멈춘다 (1080p60 BGRA는 초당 약 500MB).
+    """
+
+    def __init__(self, path: str, max_bytes: int = 2 << 30, initial_capacity: int = 64 << 20,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.logger = logging.getLogger("NDITraceRecorder")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._records: List[bytes] = []
+        self._start_time: Optional[float] = None
+        self.frames_recorded = 0
+        self.frames_dropped = 0
+        self.bytes_recorded = 0
+        self.closed = False
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "w+b")
+        self._capacity = 0
+        self._mm: Optional[mmap.mmap] = None
+        self._resize(max(initial_capacity, TRACE_HEADER_SIZE + PAYLOAD_ALIGN))
+        self._offset = TRACE_HEADER_SIZE
+        self._write_header(0, 0, TRACE_HEADER_SIZE)
+
+    def _resize(self, capacity: int):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.truncate(capacity)
+        self._capacity = capacity
+        self._mm = mmap.mmap(self._file.fileno(), capacity)
+
+    def _write_header(self, frame_count: int, index_offset: int, data_end: int):
+        header = TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, frame_count, index_offset, data_end)
+        self._mm[0:TRACE_HEADER.size] = header
+
+    def record(self, frame_type: int, frame, received_at: Optional[float] = None) -> bool:
+        """SDK 프레임 한 장 기록 (recv_free 전에 호출) - 기록했으면 True"""
+        frame_type = int(frame_type)  # ndi-python은 enum
+        data = getattr(frame, 'data', None)
+        if frame_type not in (FRAME_TYPE_VIDEO, FRAME_TYPE_AUDIO) or data is None or data.size == 0:
+            return False
+        now = self.clock() if received_at is None else received_at
+        with self._lock:
+            if self.closed:
+                return False
+            if self._start_time is None:
+                self._start_time = now
+            payload = np.ascontiguousarray(data)
+            size = payload.nbytes
+            offset = _align(self._offset)
+            if offset + size - TRACE_HEADER_SIZE > self.max_bytes:
+                if self.frames_dropped == 0:
+                    self.logger.warning(f"Trace size limit reached ({self.max_bytes} bytes) - recording stopped")
+                self.frames_dropped += 1
+                return False
+            if offset + size > self._capacity:
+                self._resize(max(self._capacity * 2, _align(offset + size)))
+            target = np.frombuffer(self._mm, dtype=np.uint8, count=size, offset=offset)
+            np.copyto(target, payload.reshape(-1).view(np.uint8))
+            del target  # mmap 크기 변경 전에 뷰를 풀어야 함
+
+            shape = tuple(payload.shape) + (0,) * (3 - payload.ndim)
+            is_video = frame_type == FRAME_TYPE_VIDEO
+            self._records.append(RECORD.pack(
+                frame_type, payload.ndim, payload.dtype.str.encode('ascii'), *shape[:3],
+                int(getattr(frame, 'FourCC', 0) or 0) if is_video else 0,
+                int(getattr(frame, 'xres', 0) or 0), int(getattr(frame, 'yres', 0) or 0),
+                int(getattr(frame, 'line_stride_in_bytes', 0) if is_video
+                    else getattr(frame, 'channel_stride_in_bytes', 0) or 0),
+                int(getattr(frame, 'frame_rate_N', 0) or 0), int(getattr(frame, 'frame_rate_D', 0) or 0),
+                int(getattr(frame, 'sample_rate', 0) or 0), int(getattr(frame, 'no_channels', 0) or 0),
+                int(getattr(frame, 'no_samples', 0) or 0),
+                int(getattr(frame, 'timestamp', 0) or 0), int(getattr(frame, 'timecode', 0) or 0),
+                now - self._start_time, offset, size,
+            ))
+            self._offset = offset + size
+            self.frames_recorded += 1
+            self.bytes_recorded += size
+            return True
+
+    def close(self):
+        """인덱스/헤더를 쓰고 파일을 실제 크기로 자름"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            index_offset = _align(self._offset)
+            index = b"".join(self._records)
+            end = index_offset + len(index)
+            if end > self._capacity:
+                self._resize(end)
+            self._mm[index_offset:end] = index
+            self._write_header(len(self._records), index_offset, self._offset)
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+            self._file.truncate(end)
+            self._file.close()
+            self.logger.info(f"Trace saved: {self.path} ({self.frames_recorded} frames, "
+                             f"{self.bytes_recorded / 1e6:.1f} MB, dropped {self.frames_dropped})")
+
+    def get_stats(self) -> dict:
+        return {
+            'path': self.path,
+            'frames_recorded': self.frames_recorded,
+            'frames_dropped': self.frames_dropped,
+            'bytes_recorded': self.bytes_recorded,
+            'closed': self.closed,
+        }
+
+
+class NDITraceReader:
+    """트레이스 파일을 mmap으로 열고 레코드를 TraceFrame으로 제공 (페이로드 복사 없음)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, frame_count, index_offset, _data_end = TRACE_HEADER.unpack_from(self._mm, 0)
+        if magic != TRACE_MAGIC:
+            self.close()
+            raise ValueError(f"Not an NDI trace file: {path}")
+        if version != TRACE_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported NDI trace version {version}: {path}")
+        if index_offset == 0:
+            self.close()
+            raise ValueError(f"NDI trace was not closed (no index): {path}")
+        self.frames: List[TraceFrame] = [
+            self._make_frame(RECORD.unpack_from(self._mm, index_offset + i * RECORD.size))
+            for i in range(frame_count)
+        ]
+
+    def _make_frame(self, fields) -> TraceFrame:
+        (frame_type, ndim, dtype, shape0, shape1, shape2, fourcc, xres, yres, stride, rate_n, rate_d,
+         sample_rate, channels, samples, timestamp, timecode, received_at, offset, size) = fields
+        dtype = np.dtype(dtype.rstrip(b"\0").decode('ascii'))
+        shape = (shape0, shape1, shape2)[:ndim]
+        frame = TraceFrame()
+        frame.frame_type = frame_type
+        frame.data = np.frombuffer(self._mm, dtype=dtype, count=size // dtype.itemsize, offset=offset).reshape(shape)
+        frame.FourCC = fourcc
+        frame.xres, frame.yres = xres, yres
+        frame.line_stride_in_bytes = stride if frame_type == FRAME_TYPE_VIDEO else 0
+        frame.channel_stride_in_bytes = stride if frame_type == FRAME_TYPE_AUDIO else 0
+        frame.frame_rate_N, frame.frame_rate_D = rate_n, rate_d
+        frame.sample_rate, frame.no_channels, frame.no_samples = sample_rate, channels, samples
+        frame.timestamp, frame.timecode = timestamp, timecode
+        frame.received_at = received_at
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __getitem__(self, index: int) -> TraceFrame:
+        return self.frames[index]
+
+    @property
+    def duration(self) -> float:
+        return self.frames[-1].received_at if self.frames else 0.0
+
+    def count(self, frame_type: int) -> int:
+        return sum(1 for frame in self.frames if frame.frame_type == frame_type)
+
+    def close(self):
+        self.frames = []
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # 재생 중인 프레임 뷰가 남아 있으면 GC가 정리
+        self._file.close()
+
+
+class _ReplaySource:
+    """NDIlib.Source 흉내"""
+
+    def __init__(self, ndi_name: str = "", url_address: str = ""):
+        self.ndi_name = ndi_name
+        self.url_address = url_address
+
+
+class _RecvCreateV3:
+    """NDIlib.RecvCreateV3 흉내 - 설정값은 기록만 함 (재생은 녹화된 포맷 그대로)"""
+
+    def __init__(self, source_to_connect_to=None, color_format=0, bandwidth=100, allow_video_fields=True):
+        self.source_to_connect_to = source_to_connect_to
+        self.color_format = color_format
+        self.bandwidth = bandwidth
+        self.allow_video_fields = allow_video_fields
+
+
+class _ReplayReceiver:
+    def __init__(self, settings):
+        self.settings = settings
+        self.position = 0
+        self.loop_index = 0
+        self.start_time: Optional[float] = None
+        self.connected = False
+
+
+class NDIReplayBackend:
+    """NDIlib 대신 쓰는 재생 백엔드 - 녹화한 트레이스를 recv_capture_v2로 다시 공급
+
+    NDISimulator(pd_app/core/ndi_simulator.py)처럼 NDIReceiver/NDIManager가 쓰는 NDIlib 함수와
+    상수를 같은 이름으로 제공한다. 트레이스 이름의 소스 하나가 검색되고, 연결하면 녹화 당시의
+    수신 간격대로 (speed배 빠르게, speed=0이면 대기 없이) 프레임을 돌려준다. 녹화된 포맷
+    (BGRA/UYVY)을 그대로 재생하므로 수신 색상 포맷 설정은 무시된다. loop=True면 끝에서
+    처음으로 돌아가며, 소스 타임스탬프는 계속 증가하도록 보정한다.
+    """
+
+    FRAME_TYPE_NONE = FRAME_TYPE_NONE
+    FRAME_TYPE_VIDEO = FRAME_TYPE_VIDEO
+    FRAME_TYPE_AUDIO = FRAME_TYPE_AUDIO
+    FRAME_TYPE_METADATA = FRAME_TYPE_METADATA
+    FRAME_TYPE_ERROR = FRAME_TYPE_ERROR
+    RECV_COLOR_FORMAT_BGRX_BGRA = 0
+    RECV_COLOR_FORMAT_UYVY_BGRA = 1
+    RECV_COLOR_FORMAT_RGBX_RGBA = 2
+    RECV_COLOR_FORMAT_UYVY_RGBA = 3
+    RECV_BANDWIDTH_LOWEST = 0
+    RECV_BANDWIDTH_HIGHEST = 100
+
+    Source = _ReplaySource
+    RecvCreateV3 = _RecvCreateV3
+
+    def __init__(self, path: str, speed: float = 1.0, loop: bool = True, source_name: Optional[str] = None,
+                 clock: Callable[[], float] = time.perf_counter, sleep: Callable[[float], None] = time.sleep):
+        self.logger = logging.getLogger("NDIReplayBackend")
+        self.reader = NDITraceReader(path)
+        self.speed = max(0.0, float(speed))
+        self.loop = loop
+        self.clock = clock
+        self.sleep = sleep
+        name = source_name or os.path.splitext(os.path.basename(path))[0]
+        self.source = _ReplaySource(f"REPLAY ({name})", f"trace://{os.path.abspath(path)}")
+        self.frames_replayed = 0
+        # 루프마다 더할 길이 - 마지막 프레임 뒤에 한 프레임 간격을 둠
+        video = [frame for frame in self.reader.frames if frame.frame_type == FRAME_TYPE_VIDEO]
+        if len(video) > 1:
+            interval = (video[-1].received_at - video[0].received_at) / (len(video) - 1)
+            timestamp_interval = (video[-1].timestamp - video[0].timestamp) // (len(video) - 1)
+        else:
+            interval, timestamp_interval = 1.0 / 60.0, 166833
+        self.loop_duration = self.reader.duration + interval
+        self.loop_timestamp_span = ((video[-1].timestamp - video[0].timestamp) + timestamp_interval
+                                    if len(video) > 1 else 0)
+        self.logger.info(f"Replay trace {path}: {len(self.reader)} frames, "
+                         f"{self.reader.duration:.2f}s, speed {self.speed:g}x")
+
+    # --- 라이브러리 / 검색 ---
+    def initialize(self) -> bool:
+        return True
+
+    def destroy(self):
+        pass
+
+    def find_create_v2(self, *args):
+        return "replay-finder"
+
+    def find_wait_for_sources(self, finder, timeout_ms: int) -> bool:
+        return False  # 소스 목록은 변하지 않음 - 첫 조회로 충분
+
+    def find_get_current_sources(self, finder):
+        return [self.source]
+
+    def find_destroy(self, finder):
+        pass
+
+    # --- 수신 ---
+    def recv_create_v3(self, settings=None):
+        return _ReplayReceiver(settings)
+
+    def recv_connect(self, receiver, source):
+        receiver.connected = source is not None
+        receiver.position = 0
+        receiver.loop_index = 0
+        receiver.start_time = None
+
+    def recv_destroy(self, receiver):
+        receiver.connected = False
+
+    def recv_free_video_v2(self, receiver, frame):
+        pass
+
+    def recv_free_audio_v2(self, receiver, frame):
+        pass
+
+    def recv_free_metadata(self, receiver, frame):
+        pass
+
+    def recv_capture_v2(self, receiver, timeout_ms: int):
+        """다음 레코드의 재생 시각까지 기다려 (최대 timeout_ms) (type, video, audio, metadata) 반환"""
+        frames = self.reader.frames
+        if not receiver.connected or not frames:
+            self.sleep(timeout_ms / 1000.0)
+            return FRAME_TYPE_NONE, None, None, None
+        if receiver.position >= len(frames):
+            if not self.loop:
+                self.sleep(timeout_ms / 1000.0)
+                return FRAME_TYPE_NONE, None, None, None
+            receiver.position = 0
+            receiver.loop_index += 1
+
+        frame = frames[receiver.position]
+        if self.speed > 0:
+            now = self.clock()
+            if receiver.start_time is None:
+                receiver.start_time = now
+            due = receiver.start_time + (frame.received_at + receiver.loop_index * self.loop_duration) / self.speed
+            wait = due - now
+            if wait * 1000.0 > timeout_ms:
+                self.sleep(timeout_ms / 1000.0)
+                return FRAME_TYPE_NONE, None, None, None
+            if wait > 0:
+                self.sleep(wait)
+
+        receiver.position += 1
+        self.frames_replayed += 1
+        replay = self._replay_frame(frame, receiver.loop_index)
+        if frame.frame_type == FRAME_TYPE_VIDEO:
+            return FRAME_TYPE_VIDEO, replay, None, None
+        return FRAME_TYPE_AUDIO, None, replay, None
+
+    def _replay_frame(self, frame: TraceFrame, loop_index: int) -> TraceFrame:
+        """루프/배속에 맞춰 소스 타임스탬프만 고친 얕은 복사본 (페이로드 공유)"""
+        if loop_index == 0 and self.speed in (0.0, 1.0):
+            return frame
+        replay = TraceFrame()
+        for name in TraceFrame.__slots__:
+            setattr(replay, name, getattr(frame, name))
+        first_timestamp = self.reader.frames[0].timestamp
+        timestamp = frame.timestamp + loop_index * self.loop_timestamp_span
+        if self.speed > 0:
+            timestamp = first_timestamp + int((timestamp - first_timestamp) / self.speed)
+        replay.timestamp = timestamp
+        return replay
+
+    def close(self):
+        self.reader.close()
+
+
+_env_backend: Optional[NDIReplayBackend] = None
+
+
+def replay_backend_from_env() -> Optional[NDIReplayBackend]:
+    """RETURNFEED_NDI_REPLAY=<trace 경로>면 NDIlib 대신 쓸 재생 백엔드 (프로세스당 하나)
+
+    RETURNFEED_NDI_REPLAY_SPEED: 배속 (기본 1, 0 = 대기 없이 최대 속도)
+    RETURNFEED_NDI_REPLAY_LOOP: 0이면 한 번만 재생
+    """
+    global _env_backend
+    path = os.environ.get("RETURNFEED_NDI_REPLAY")
+    if not path:
+        return None
+    if _env_backend is None:
+        speed = float(os.environ.get("RETURNFEED_NDI_REPLAY_SPEED", "1") or 1)
+        loop = os.environ.get("RETURNFEED_NDI_REPLAY_LOOP", "1") != "0"
+        _env_backend = NDIReplayBackend(path, speed=speed, loop=loop)
+    return _env_backend
@@ -2,16 +2,23 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, 
                             QGroupBox, QPushButton, QLabel, QListWidgetItem, QSplitter,
                             QComboBox)
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QRect
-from PyQt6.QtGui import QFont, QPixmap, QImage, QPainter, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QRect, QRectF
+from PyQt6.QtGui import QFont, QPixmap, QImage, QPainter, QColor, QPen
 from PyQt6.QtMultimedia import QVideoSink, QVideoFrame
 from typing import Optional, List, Dict
+import time
 import numpy as np
 
+from .overlay_cache import OverlayLayer, outline_regions
+from .glass_latency import format_latency
+
 
 class VideoDisplayWidget(QWidget):
     """🚀 ULTRATHINK: QPainter 직접 렌더링 기반 비디오 위젯 - 문서 기반 완전 안정화"""
     
+    # 16:9 표시 영역의 디바이스 픽셀 크기 (width, height) - 수신기가 이 크기로 축소
+    display_size_changed = pyqtSignal(int, int)
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         # 위젯 크기는 자유롭게, 이미지만 16:9 비율 유지
@@ -38,6 +45,7 @@ class VideoDisplayWidget(QWidget):
         self.is_srt_streaming = False
         self.srt_stream_name = ""
         self.srt_stats = {}
+        self.srt_preview_fps = 0  # 스로틀 프리뷰 fps (0 = 프리뷰 중지, 전체 오버레이)
         
         # Tally 상태 관리
         self.tally_state = ""  # "PGM", "PVW", or ""
@@ -48,20 +56,64 @@ class VideoDisplayWidget(QWidget):
         
         # 레거시 호환성을 위한 더미 video_sink (기존 코드와의 호환성)
         self.video_sink = None
+        self._published_display_size = None
+        
+        # 단계별 지연 히스토그램 (NDIReceiver.stage_timings) - paintEvent 시간 기록
+        self.stage_timings = None
+        # 송신 -> 표시 지연 (NDIReceiver.latency_estimator) - 프레임을 그린 paintEvent 끝에서 기록
+        self.latency_estimator = None
+        
+        # 오버레이 레이어 캐시 - 크기나 표시 내용이 바뀔 때만 다시 그리고 paintEvent는 블릿만
+        self._no_source_layer = OverlayLayer(self._render_no_source)
+        self._technical_info_layer = OverlayLayer(self._render_technical_info)
+        self._srt_overlay_layer = OverlayLayer(self._render_srt_overlay)
+        self._srt_banner_layer = OverlayLayer(self._render_srt_banner)
+        self._tally_layer = OverlayLayer(self._render_tally_border)
         
     def resizeEvent(self, event):
         """크기 변경 시 위젯은 자유롭게 변경, 이미지만 16:9 유지"""
         super().resizeEvent(event)
-        # 단순히 다시 그리기만 요청
+        self._publish_display_size()
         self.update()
     
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._publish_display_size()
+    
+    def _target_rect(self) -> QRect:
+        """위젯 중앙의 16:9 영역"""
+        widget_width = self.width()
+        widget_height = self.height()
+        target_width = widget_width
+        target_height = int(target_width * 9 / 16)
+        if target_height > widget_height:
+            # 높이가 초과하면 높이 기준으로 재계산
+            target_height = widget_height
+            target_width = int(target_height * 16 / 9)
+        return QRect((widget_width - target_width) // 2, (widget_height - target_height) // 2,
+                     target_width, target_height)
+    
+    def _publish_display_size(self):
+        """16:9 영역의 디바이스 픽셀 크기를 수신기에 알림 - 변경 시에만"""
+        if not self.isVisible():
+            return
+        rect = self._target_rect()
+        dpr = self.devicePixelRatioF()
+        size = (int(round(rect.width() * dpr)), int(round(rect.height() * dpr)))
+        if size != self._published_display_size:
+            self._published_display_size = size
+            self.display_size_changed.emit(*size)
+    
     def sizeHint(self):
         """기본 크기 힌트 - 16:9 비율"""
         return QSize(self.base_width, self.base_height)
     
     def paintEvent(self, event):
         """🚀 ULTRATHINK 핵심: QPainter 직접 렌더링 - 메인 GUI 스레드에서만 실행"""
+        timings = self.stage_timings
+        paint_started = time.perf_counter_ns() if timings is not None and timings.enabled else 0
         painter = QPainter(self)
+        frame_presented = False  # 프레임을 실제로 그린 paint만 지연으로 기록 (안내 문구/빈 화면 제외)
         try:
             # 안티에일리어싱 활성화
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -69,29 +121,17 @@ class VideoDisplayWidget(QWidget):
             
             # 배경 그리기
             painter.fillRect(self.rect(), Qt.GlobalColor.black)
+            dpr = self.devicePixelRatioF()
             
             if self.current_qimage and not self.current_qimage.isNull():
                 # 비디오 프레임이 있을 때 - QImage를 직접 그리기
-                widget_rect = self.rect()
-                widget_width = widget_rect.width()
-                widget_height = widget_rect.height()
-                
                 # 🚀 ULTRATHINK: 16:9 비율을 완벽하게 유지하는 로직
-                # 1단계: 위젯 내에서 16:9 비율의 최대 크기 계산
-                target_width = widget_width
-                target_height = int(target_width * 9 / 16)
-                
-                if target_height > widget_height:
-                    # 높이가 초과하면 높이 기준으로 재계산
-                    target_height = widget_height
-                    target_width = int(target_height * 16 / 9)
-                
-                # 2단계: 16:9 영역을 위젯 중앙에 배치
-                target_x = (widget_width - target_width) // 2
-                target_y = (widget_height - target_height) // 2
+                # 1-2단계: 위젯 중앙에 16:9 비율의 최대 영역 계산
+                black_rect = self._target_rect()
+                target_x, target_y = black_rect.x(), black_rect.y()
+                target_width, target_height = black_rect.width(), black_rect.height()
                 
                 # 3단계: 16:9 비율의 검은색 배경 그리기
-                black_rect = QRect(target_x, target_y, target_width, target_height)
                 painter.fillRect(black_rect, Qt.GlobalColor.black)
                 
                 # 4단계: 원본 이미지를 16:9 영역에 맞춰 그리기
@@ -101,46 +141,60 @@ class VideoDisplayWidget(QWidget):
                 image_height = image_size.height()
                 
                 # 이미지를 16:9 영역에 맞춰 스케일링 (원본 비율 유지)
-                scale_x = target_width / image_width
-                scale_y = target_height / image_height
+                scale_x = target_width * dpr / image_width
+                scale_y = target_height * dpr / image_height
                 scale = min(scale_x, scale_y)  # 작은 쪽에 맞춰서 전체가 보이도록
                 
-                scaled_width = int(image_width * scale)
-                scaled_height = int(image_height * scale)
+                if abs(scale - 1.0) * max(image_width, image_height) < 1.5:
+                    # 수신 스레드가 이미 표시 크기로 축소함 - 스케일링 없이 1:1 블릿
+                    scale = 1.0
+                    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+                
+                scaled_width = image_width * scale / dpr
+                scaled_height = image_height * scale / dpr
                 
                 # 스케일된 이미지를 16:9 영역 중앙에 배치
-                image_x = target_x + (target_width - scaled_width) // 2
-                image_y = target_y + (target_height - scaled_height) // 2
+                image_x = target_x + round((target_width - scaled_width) / 2)
+                image_y = target_y + round((target_height - scaled_height) / 2)
                 
-                image_rect = QRect(image_x, image_y, scaled_width, scaled_height)
+                image_rect = QRectF(image_x, image_y, scaled_width, scaled_height)
                 
                 # QImage를 위젯에 직접 그리기
                 painter.drawImage(image_rect, self.current_qimage)
+                frame_presented = True
+                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
                 
                 # Display technical info overlay if available
                 if hasattr(self, 'technical_info') and self.technical_info:
-                    self._draw_technical_info(painter, black_rect)
+                    self._draw_technical_info(painter, black_rect, dpr)
                 
             else:
                 # 비디오 프레임이 없을 때 - 텍스트 표시
-                painter.setPen(Qt.GlobalColor.gray)
-                font = painter.font()
-                font.setPointSize(12)
-                painter.setFont(font)
-                painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.no_source_text)
+                self._no_source_layer.blit(painter, self.rect(), dpr, self.no_source_text)
             
             # SRT 스트리밍 중 오버레이 표시
-            if self.is_srt_streaming:
-                self._draw_srt_overlay(painter)
+            if self.is_srt_streaming and self.srt_preview_fps:
+                # 스로틀 프리뷰 - 영상은 보이게 두고 상단 띠만
+                self._srt_banner_layer.blit(painter, QRect(0, 0, self.width(), 36), dpr,
+                                            (self.srt_stream_name, self.srt_preview_fps, self._srt_stats_text()))
+            elif self.is_srt_streaming:
+                self._srt_overlay_layer.blit(painter, self.rect(), dpr,
+                                             (self.srt_stream_name, self._srt_stats_text()))
             
-            # Tally 상태 표시
-            if self.tally_state and self.current_qimage:
-                self._draw_tally_border(painter)
+            # Tally 상태 표시 - 8px 테두리 띠와 라벨 영역만 복사
+            if self.tally_state in ("PGM", "PVW") and self.current_qimage:
+                regions = outline_regions(self.width(), self.height(), 0, 0, 9)
+                regions.append(QRect(20, 20, 80, 30))
+                self._tally_layer.blit(painter, self.rect(), dpr, self.tally_state, regions)
                 
         except Exception as e:
             print(f"Paint event error: {e}")
         finally:
             painter.end()
+            if paint_started:
+                timings.on_paint(paint_started, time.perf_counter_ns())
+            if frame_presented and self.latency_estimator is not None:
+                self.latency_estimator.on_present()
     
     def updateFrame(self, frame_data):
         """🚀 ULTRATHINK: 작업자 스레드로부터 프레임 수신 - 스레드 안전"""
@@ -174,10 +228,31 @@ class VideoDisplayWidget(QWidget):
         self.current_qimage = None
         self.update()  # paintEvent를 통해 "No NDI Source" 텍스트 표시
     
-    def _draw_srt_overlay(self, painter):
-        """SRT 스트리밍 중 오버레이 그리기"""
+    def _render_no_source(self, painter, width, height):
+        """소스 없음 안내 텍스트 레이어"""
+        painter.setPen(Qt.GlobalColor.gray)
+        font = painter.font()
+        font.setPointSize(12)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, self.no_source_text)
+    
+    def _srt_stats_text(self) -> str:
+        """SRT 통계 한 줄 (오버레이 레이어 캐시 키)"""
+        if not self.srt_stats:
+            return ""
+        stats_text = []
+        if 'bitrate' in self.srt_stats:
+            stats_text.append(f"비트레이트: {self.srt_stats['bitrate']}")
+        if 'fps' in self.srt_stats:
+            stats_text.append(f"FPS: {self.srt_stats['fps']}")
+        if 'time' in self.srt_stats:
+            stats_text.append(f"시간: {self.srt_stats['time']}")
+        return " | ".join(stats_text)
+    
+    def _render_srt_overlay(self, painter, width, height):
+        """SRT 스트리밍 중 오버레이 레이어 (스트림 이름/통계가 바뀔 때만 다시 그림)"""
         # 반투명 검은 배경
-        overlay_rect = self.rect()
+        overlay_rect = QRect(0, 0, width, height)
         painter.fillRect(overlay_rect, QColor(0, 0, 0, 180))  # 70% 불투명도
         
         # 빨간 원과 REC 텍스트
@@ -201,38 +276,52 @@ class VideoDisplayWidget(QWidget):
         # 메인 텍스트
         font.setPointSize(24)
         painter.setFont(font)
-        painter.drawText(overlay_rect, Qt.AlignCenter, f"리턴피드 스트림 중\n{self.srt_stream_name}")
+        painter.drawText(overlay_rect, Qt.AlignmentFlag.AlignCenter, f"리턴피드 스트림 중\n{self.srt_stream_name}")
         
         # 통계 정보
-        if self.srt_stats:
+        stats_text = self._srt_stats_text()
+        if stats_text:
             font.setPointSize(12)
             font.setBold(False)
             painter.setFont(font)
-            
-            stats_text = []
-            if 'bitrate' in self.srt_stats:
-                stats_text.append(f"비트레이트: {self.srt_stats['bitrate']}")
-            if 'fps' in self.srt_stats:
-                stats_text.append(f"FPS: {self.srt_stats['fps']}")
-            if 'time' in self.srt_stats:
-                stats_text.append(f"시간: {self.srt_stats['time']}")
-            
-            if stats_text:
-                stats_y = overlay_rect.height() - 50
-                painter.drawText(overlay_rect.adjusted(0, 0, 0, -30), 
-                               Qt.AlignBottom | Qt.AlignHCenter, 
-                               " | ".join(stats_text))
+            painter.drawText(overlay_rect.adjusted(0, 0, 0, -30), 
+                           Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, 
+                           stats_text)
     
-    def set_srt_streaming(self, is_streaming: bool, stream_name: str = "", stats: dict = None):
-        """SRT 스트리밍 상태 설정"""
+    def _render_srt_banner(self, painter, width, height):
+        """스로틀 프리뷰 중 상단 띠 (REC + 스트림 이름 + 프리뷰 fps + 통계)"""
+        painter.fillRect(QRect(0, 0, width, height), QColor(0, 0, 0, 160))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(220, 20, 60))  # Crimson red
+        painter.drawEllipse(12, height // 2 - 6, 12, 12)
+        
+        painter.setPen(QColor(255, 255, 255))
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        painter.setFont(font)
+        text_rect = QRect(32, 0, width - 44, height)
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         f"리턴피드 스트림 중 {self.srt_stream_name}  ·  프리뷰 {self.srt_preview_fps:g}fps")
+        
+        stats_text = self._srt_stats_text()
+        if stats_text:
+            font.setBold(False)
+            painter.setFont(font)
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight, stats_text)
+    
+    def set_srt_streaming(self, is_streaming: bool, stream_name: str = "", stats: dict = None,
+                          throttled_fps: float = 0):
+        """SRT 스트리밍 상태 설정 - throttled_fps가 있으면 프리뷰를 가리지 않고 상단 띠만 표시"""
         self.is_srt_streaming = is_streaming
         self.srt_stream_name = stream_name
+        self.srt_preview_fps = throttled_fps if is_streaming else 0
         if stats:
             self.srt_stats = stats
         self.update()
     
-    def _draw_technical_info(self, painter, video_rect):
-        """Draw technical information overlay"""
+    def _draw_technical_info(self, painter, video_rect, dpr):
+        """Draw technical information overlay - text layer re-rendered only when the text changes"""
         if not self.technical_info:
             return
             
@@ -240,34 +329,48 @@ class VideoDisplayWidget(QWidget):
         info_height = 30
         info_rect = QRect(video_rect.x(), video_rect.bottom() - info_height, 
                          video_rect.width(), info_height)
-        painter.fillRect(info_rect, QColor(0, 0, 0, 180))
-        
+        self._technical_info_layer.blit(painter, info_rect, dpr, self._technical_info_text())
+    
+    def _technical_info_text(self) -> str:
+        """Technical info line (also the overlay layer cache key)"""
         # Prepare info text
         info_parts = []
         if 'resolution' in self.technical_info:
             info_parts.append(self.technical_info['resolution'])
         if 'fps' in self.technical_info:
             info_parts.append(f"{self.technical_info['fps']} fps")
-        if 'bitrate' in self.technical_info:
-            info_parts.append(self.technical_info['bitrate'])
+        if 'throughput' in self.technical_info:
+            info_parts.append(f"{self.technical_info['throughput']} decoded")
         
         # Add bandwidth mode indicator
-        mode = self.parent().parent().get_bandwidth_mode() if hasattr(self.parent().parent(), 'get_bandwidth_mode') else None
+        owner = self.parent().parent() if self.parent() is not None else None
+        mode = owner.get_bandwidth_mode() if hasattr(owner, 'get_bandwidth_mode') else None
         if mode:
             mode_text = "Normal" if mode == "highest" else "Proxy"
             info_parts.append(f"[{mode_text}]")
         
+        # 송신 -> 표시 지연 p50/p95 (0.5초마다 갱신)
+        if self.latency_estimator is not None:
+            latency_text = format_latency(self.latency_estimator.get_stats())
+            if latency_text:
+                info_parts.append(latency_text)
+        
+        return " | ".join(info_parts)
+    
+    def _render_technical_info(self, painter, width, height):
+        """Info strip layer: semi-transparent background + centered text"""
+        info_rect = QRect(0, 0, width, height)
+        painter.fillRect(info_rect, QColor(0, 0, 0, 180))
+        
         # Draw text
         painter.setPen(QColor(255, 255, 255))
         font = QFont()
         font.setPointSize(10)
         painter.setFont(font)
-        
-        info_text = " | ".join(info_parts)
-        painter.drawText(info_rect, Qt.AlignCenter, info_text)
+        painter.drawText(info_rect, Qt.AlignmentFlag.AlignCenter, self._technical_info_text())
     
-    def _draw_tally_border(self, painter):
-        """Draw tally state border"""
+    def _render_tally_border(self, painter, width, height):
+        """Draw tally state border (keyed by tally state)"""
         if self.tally_state == "PGM":
             color = QColor(255, 55, 55)  # Red
             label = "PGM"
@@ -281,7 +384,7 @@ class VideoDisplayWidget(QWidget):
         pen = QPen(color, 8)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRect(self.rect().adjusted(4, 4, -4, -4))
+        painter.drawRect(QRect(0, 0, width, height).adjusted(4, 4, -4, -4))
         
         # Draw tally label in top-left corner
         label_rect = QRect(20, 20, 80, 30)
@@ -308,6 +411,7 @@ class NDIWidget(QWidget):
     source_connect_requested = pyqtSignal(str)  # source name for connection
     source_disconnect_requested = pyqtSignal()
     bandwidth_mode_changed = pyqtSignal(str)  # bandwidth mode (highest/lowest)
+    multiview_toggled = pyqtSignal(bool)  # 멀티뷰 창 열기/닫기
     
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -335,6 +439,13 @@ class NDIWidget(QWidget):
         self.connect_button.clicked.connect(self._on_connect_clicked)
         self.connect_button.setEnabled(False)
         
+        # 멀티뷰 - 발견된 소스(최대 16개)를 프록시 대역폭 그리드로 별도 창에 표시
+        self.multiview_button = QPushButton("Multiview")
+        self.multiview_button.setCheckable(True)
+        self.multiview_button.setEnabled(False)
+        self.multiview_button.setToolTip("Monitor up to 16 sources at once (proxy bandwidth)")
+        self.multiview_button.toggled.connect(self.multiview_toggled)
+        
         # Bandwidth mode selector
         bandwidth_label = QLabel("Mode:")
         self.bandwidth_combo = QComboBox()
@@ -349,6 +460,7 @@ class NDIWidget(QWidget):
         header_layout.addWidget(bandwidth_label)
         header_layout.addWidget(self.bandwidth_combo)
         header_layout.addWidget(self.refresh_button)
+        header_layout.addWidget(self.multiview_button)
         header_layout.addWidget(self.connect_button)
         
         layout.addLayout(header_layout)
@@ -465,6 +577,7 @@ class NDIWidget(QWidget):
             
         # 카운트 업데이트
         self.count_label.setText(f"Sources found: {len(sources)}")
+        self.multiview_button.setEnabled(bool(sources) or self.multiview_button.isChecked())
         
         # 현재 선택된 소스가 없어진 경우 처리
         if self.current_source and not any(s.get("name") == self.current_source for s in sources):
@@ -517,6 +630,7 @@ class NDIWidget(QWidget):
         """소스 목록 클리어"""
         self.sources_list.clear()
         self.count_label.setText("Sources found: 0")
+        self.multiview_button.setEnabled(self.multiview_button.isChecked())
         self.current_source = ""
         self.connect_button.setEnabled(False)
         
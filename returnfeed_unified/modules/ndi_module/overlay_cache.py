@@ -0,0 +1,87 @@
+# overlay_cache.py
+from typing import Callable, Hashable, List, Optional, Sequence
+
+from PyQt6.QtCore import Qt, QPoint, QRect
+from PyQt6.QtGui import QPainter, QPixmap
+
+
+def outline_regions(width: int, height: int, inset_x: int, inset_y: int, thickness: int) -> List[QRect]:
+    """(0, 0, width, height)에서 (inset_x, inset_y)만큼 들어간 사각 테두리 띠 4개 (레이어 좌표)
+
+    테두리/세이프 에어리어처럼 대부분 투명한 레이어는 이 영역만 blit하면 전체 크기
+    알파 블렌딩을 피할 수 있다. 띠끼리는 겹치지 않는다.
+    """
+    inner_width = width - inset_x * 2
+    inner_height = height - inset_y * 2
+    if inner_width <= thickness * 2 or inner_height <= thickness * 2:
+        return [QRect(0, 0, width, height)]
+    return [
+        QRect(inset_x, inset_y, inner_width, thickness),                              # 위
+        QRect(inset_x, inset_y + inner_height - thickness, inner_width, thickness),   # 아래
+        QRect(inset_x, inset_y + thickness, thickness, inner_height - thickness * 2),  # 왼쪽
+        QRect(inset_x + inner_width - thickness, inset_y + thickness,
+              thickness, inner_height - thickness * 2),                              # 오른쪽
+    ]
+
+
+class OverlayLayer:
+    """오버레이 한 장을 QPixmap에 캐시 - 크기/DPR/입력 키가 바뀔 때만 다시 그림
+
+    render(painter, width, height)는 레이어 좌상단 기준 논리 좌표로 그린다. 눈금/라벨/
+    세이프 에어리어 같은 정적 레이어는 키에 크기만, 정보 텍스트 같은 동적 레이어는 표시할
+    문자열을 키로 넘기면 된다. paintEvent는 blit()으로 drawPixmap 몇 번만 한다.
+    """
+
+    def __init__(self, render: Callable[[QPainter, int, int], None]):
+        self.render = render
+        self.pixmap: Optional[QPixmap] = None
+        self._key = None
+        self.renders = 0  # 다시 그린 횟수 (통계/테스트용)
+
+    def invalidate(self):
+        self._key = None
+
+    def get(self, width: int, height: int, dpr: float, key: Hashable = None) -> Optional[QPixmap]:
+        """키가 그대로면 캐시된 픽스맵, 아니면 새로 그린 픽스맵 (빈 크기면 None)"""
+        if width <= 0 or height <= 0:
+            return None
+        full_key = (width, height, dpr, key)
+        if full_key != self._key or self.pixmap is None:
+            self.pixmap = self._render(width, height, dpr)
+            self._key = full_key
+        return self.pixmap
+
+    def blit(self, painter: QPainter, rect: QRect, dpr: float, key: Hashable = None,
+             regions: Optional[Sequence[QRect]] = None):
+        """rect 크기로 (필요하면 다시 그려서) rect 위치에 그리기
+
+        regions(레이어 좌표)를 주면 그 부분만 복사 - 나머지는 투명이라고 약속한 경우.
+        """
+        pixmap = self.get(rect.width(), rect.height(), dpr, key)
+        if pixmap is None:
+            return
+        # 1:1 정수 좌표 복사 - 안티에일리어싱/스무스 변환 힌트가 켜져 있으면 느린 경로를 탐
+        hints = painter.renderHints()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        if regions is None:
+            painter.drawPixmap(QPoint(rect.x(), rect.y()), pixmap)
+        else:
+            for region in regions:
+                source = QRect(int(round(region.x() * dpr)), int(round(region.y() * dpr)),
+                               int(round(region.width() * dpr)), int(round(region.height() * dpr)))
+                painter.drawPixmap(region.translated(rect.x(), rect.y()), pixmap, source)
+        painter.setRenderHints(hints)
+
+    def _render(self, width: int, height: int, dpr: float) -> QPixmap:
+        pixmap = QPixmap(max(1, int(round(width * dpr))), max(1, int(round(height * dpr))))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            self.render(painter, width, height)
+        finally:
+            painter.end()
+        self.renders += 1
+        return pixmap
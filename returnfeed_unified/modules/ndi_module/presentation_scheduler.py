@@ -0,0 +1,176 @@
+# presentation_scheduler.py
+import time
+from collections import deque
+from statistics import median
+from typing import Callable, Dict, List, Optional
+
+
+class PresentationScheduler:
+    """화면 갱신 틱 스케줄러 - 소스 케이던스 추적 + 드리프트 보정 데드라인 + 지터 히스토그램
+
+    고정 16ms QTimer는 60Hz(16.67ms)/59.94Hz(16.68ms)와 맞지 않아 주기적으로 프레임을
+    반복하거나 건너뛴다. 여기서는 다음 틱을 "이전 데드라인 + 틱 간격"으로 잡아 타이머
+    오차가 누적되지 않게 하고, 틱 간격은 소스 프레임 타임스탬프로 잰 케이던스를 따른다
+    (소스가 디스플레이보다 빠르면 디스플레이 주기). 소스 케이던스로 돌 때는 프레임 도착
+    시각과 틱 사이의 위상을 프레임 간격의 절반으로 천천히 끌어당겨 도착 지터에 여유를 둔다.
+    """
+
+    JITTER_BINS_MS = (0.5, 1.0, 2.0, 4.0, 8.0)  # 마지막 구간은 8ms 초과
+    NDI_TIMESTAMP_UNIT = 1e-7  # NDI 타임스탬프는 100ns 단위
+    NDI_TIMESTAMP_UNDEFINED = 0x7FFFFFFFFFFFFFFF
+
+    def __init__(self, display_hz: float = 60.0, clock: Callable[[], float] = time.perf_counter,
+                 cadence_window: int = 32, phase_gain: float = 0.1, target_phase: float = 0.5):
+        self.clock = clock
+        self.display_interval = 1.0 / display_hz
+        self.phase_gain = phase_gain
+        self.target_phase = target_phase
+        self._deltas = deque(maxlen=cadence_window)
+        self.reset()
+
+    def reset(self):
+        self._deltas.clear()
+        self.source_interval: Optional[float] = None
+        self.next_deadline: Optional[float] = None
+        self._last_source_timestamp = None
+        self._last_frame_time = None
+        self._last_present_time = None
+        # 누적 통계
+        self.ticks = 0
+        self.frames_presented = 0
+        self.repeats = 0
+        self.skips = 0
+        self.resyncs = 0
+        self.histogram = [0] * (len(self.JITTER_BINS_MS) + 1)
+        self._reset_report()
+
+    def _reset_report(self):
+        self._report_jitter: List[float] = []
+        self._report_histogram = [0] * (len(self.JITTER_BINS_MS) + 1)
+        self._report_repeats = 0
+        self._report_skips = 0
+
+    def set_display_rate(self, hz: float):
+        """디스플레이 주사율 (QScreen.refreshRate)"""
+        if hz and hz > 1.0:
+            self.display_interval = 1.0 / hz
+
+    @property
+    def tick_interval(self) -> float:
+        """소스가 디스플레이보다 느리면 소스 케이던스, 아니면 디스플레이 주기"""
+        if self.source_interval is None or self.source_interval < self.display_interval * 0.98:
+            return self.display_interval
+        return self.source_interval
+
+    def next_timeout_ms(self, now: Optional[float] = None) -> int:
+        """다음 데드라인까지 남은 시간 (ms) - 내림이라 타이머가 데드라인보다 늦게 울리지 않음"""
+        now = self.clock() if now is None else now
+        if self.next_deadline is None:
+            self.next_deadline = now + self.tick_interval
+        return max(0, int((self.next_deadline - now) * 1000.0))
+
+    def on_tick(self, new_frame: bool, skipped: int = 0, frame_time: Optional[float] = None,
+                source_timestamp: Optional[int] = None, idle: bool = False,
+                now: Optional[float] = None) -> float:
+        """틱 처리 결과 기록 후 다음 데드라인 계산 - 이번 틱의 지터(ms) 반환
+
+        new_frame: 이번 틱에 새 프레임을 표시했는지, skipped: 표시하지 못하고 덮어써진 프레임 수,
+        frame_time: 프레임 수신 시각 (같은 clock), source_timestamp: NDI 프레임 타임스탬프,
+        idle: 표시를 하지 않는 상태 (미연결/송출 중 정지) - 통계 없이 데드라인만 진행
+        """
+        now = self.clock() if now is None else now
+        deadline = self.next_deadline if self.next_deadline is not None else now
+        jitter_ms = abs(now - deadline) * 1000.0
+
+        if not idle:
+            self.ticks += 1
+            self._record_jitter(jitter_ms)
+            if new_frame:
+                self.frames_presented += 1
+                if skipped > 0:
+                    self.skips += skipped
+                    self._report_skips += skipped
+                self._track_cadence(source_timestamp, frame_time, skipped)
+                self._last_present_time = now
+            elif self._source_active(now):
+                self.repeats += 1
+                self._report_repeats += 1
+
+        interval = self.tick_interval
+        next_deadline = deadline + interval
+        if (new_frame and frame_time is not None and self.source_interval is not None
+                and interval == self.source_interval):
+            # 위상 보정 - 도착 후 target_phase 지점에 틱이 오도록 조금씩 이동
+            phase = ((now - frame_time) % interval) / interval
+            next_deadline += self.phase_gain * (self.target_phase - phase) * interval
+        if next_deadline <= now:
+            # 한 틱 이상 밀림 (GUI 정지 등) - 밀린 틱을 연달아 울리지 않고 지금부터 다시 시작
+            self.resyncs += 1
+            next_deadline = now + interval
+        self.next_deadline = next_deadline
+        return jitter_ms
+
+    def _source_active(self, now: float) -> bool:
+        """최근 몇 프레임 간격 안에 새 프레임을 표시했으면 소스가 살아 있는 것으로 봄"""
+        return (self._last_present_time is not None and self.source_interval is not None
+                and now - self._last_present_time < self.source_interval * 4)
+
+    def _track_cadence(self, source_timestamp: Optional[int], frame_time: Optional[float], skipped: int):
+        delta = None
+        if source_timestamp is not None and source_timestamp != self.NDI_TIMESTAMP_UNDEFINED:
+            if self._last_source_timestamp is not None:
+                delta = (source_timestamp - self._last_source_timestamp) * self.NDI_TIMESTAMP_UNIT
+            self._last_source_timestamp = source_timestamp
+        elif frame_time is not None:
+            if self._last_frame_time is not None:
+                delta = frame_time - self._last_frame_time
+        if frame_time is not None:
+            self._last_frame_time = frame_time
+        if delta is None:
+            return
+        delta /= (skipped + 1)  # 건너뛴 프레임만큼 나눠 원래 프레임 간격으로
+        if 0.002 < delta < 0.5:
+            self._deltas.append(delta)
+            self.source_interval = median(self._deltas)
+
+    def _record_jitter(self, jitter_ms: float):
+        index = next((i for i, edge in enumerate(self.JITTER_BINS_MS) if jitter_ms < edge),
+                     len(self.JITTER_BINS_MS))
+        self.histogram[index] += 1
+        self._report_histogram[index] += 1
+        self._report_jitter.append(jitter_ms)
+
+    @classmethod
+    def bin_labels(cls) -> List[str]:
+        labels = [f"<{edge:g}ms" for edge in cls.JITTER_BINS_MS]
+        labels.append(f">{cls.JITTER_BINS_MS[-1]:g}ms")
+        return labels
+
+    def take_report(self) -> Dict:
+        """지난 보고 이후 구간 통계 (지터 히스토그램/p95/max, 반복, 스킵) 반환 후 구간 초기화"""
+        samples = sorted(self._report_jitter)
+        report = {
+            'ticks': len(samples),
+            'histogram': dict(zip(self.bin_labels(), self._report_histogram)),
+            'jitter_p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0,
+            'jitter_max_ms': samples[-1] if samples else 0.0,
+            'repeats': self._report_repeats,
+            'skips': self._report_skips,
+            'source_fps': 1.0 / self.source_interval if self.source_interval else 0.0,
+            'tick_hz': 1.0 / self.tick_interval,
+        }
+        self._reset_report()
+        return report
+
+    def get_stats(self) -> Dict:
+        """누적 통계"""
+        return {
+            'ticks': self.ticks,
+            'frames_presented': self.frames_presented,
+            'repeats': self.repeats,
+            'skips': self.skips,
+            'resyncs': self.resyncs,
+            'histogram': dict(zip(self.bin_labels(), self.histogram)),
+            'source_fps': 1.0 / self.source_interval if self.source_interval else 0.0,
+            'tick_hz': 1.0 / self.tick_interval,
+        }
@@ -0,0 +1,120 @@
+# source_cache.py
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 앱 config 디렉터리 (returnfeed_unified/config) - 실행 위치와 상관없이 같은 파일
+DEFAULT_CACHE_FILE = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "ndi_sources.json")
+)
+
+
+class SourceCache:
+    """발견한 NDI 소스 디스크 캐시 - {name: {address, last_seen}} + 마지막 사용 소스
+
+    시작 시 캐시 목록을 바로 보여주고 마지막 소스에 주소로 바로 연결하기 위해 쓴다.
+    max_age_days 동안 보이지 않은 항목은 라이브 검색과 맞출 때 지운다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str = DEFAULT_CACHE_FILE, max_age_days: float = 30.0):
+        self.logger = logging.getLogger("SourceCache")
+        self.path = path
+        self.max_age = max_age_days * 86400.0
+        self.entries: Dict[str, Dict] = {}
+        self.last_used: Optional[str] = None
+        self._dirty = False
+
+    def load(self) -> bool:
+        """캐시 파일 읽기 - 없거나 깨졌으면 빈 캐시"""
+        try:
+            if not os.path.exists(self.path):
+                return False
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION:
+                return False
+            self.entries = {
+                entry['name']: {'address': entry.get('address', ''), 'last_seen': float(entry.get('last_seen', 0))}
+                for entry in data.get('sources', []) if entry.get('name')
+            }
+            self.last_used = data.get('last_used') or None
+            self._dirty = False
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to load NDI source cache: {e}")
+            self.entries = {}
+            self.last_used = None
+            return False
+
+    def save(self, force: bool = False) -> bool:
+        """변경이 있을 때만 저장 - 임시 파일에 쓴 뒤 교체 (중간에 끊겨도 캐시가 깨지지 않음)"""
+        if not self._dirty and not force:
+            return False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            data = {
+                'version': self.VERSION,
+                'last_used': self.last_used,
+                'sources': [{'name': name, **entry} for name, entry in sorted(self.entries.items())],
+            }
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to save NDI source cache: {e}")
+            return False
+
+    def record_seen(self, sources: Iterable[Tuple[str, str]], now: Optional[float] = None) -> None:
+        """라이브 검색 결과 (name, address) 기록 - 주소가 바뀐 경우만 변경으로 봄
+
+        last_seen만 바뀐 경우는 변경으로 치지 않으므로 스캔마다 파일을 쓰지 않는다.
+        """
+        now = time.time() if now is None else now
+        for name, address in sources:
+            entry = self.entries.get(name)
+            if entry is None or (address and entry['address'] != address):
+                self.entries[name] = {'address': address or (entry or {}).get('address', ''), 'last_seen': now}
+                self._dirty = True
+            else:
+                entry['last_seen'] = now
+
+    def mark_used(self, name: str, address: str = "", now: Optional[float] = None) -> None:
+        """마지막 사용 소스 기록"""
+        if address or name not in self.entries:
+            self.record_seen([(name, address)], now)
+        if self.last_used != name:
+            self.last_used = name
+            self._dirty = True
+
+    def reconcile(self, live_names: Iterable[str], now: Optional[float] = None) -> List[str]:
+        """라이브 검색 완료 후 오래된 항목 제거 - 제거한 이름 목록 반환
+
+        지금 안 보이는 소스라도 max_age 이내면 남겨 둔다 (밤에 꺼 둔 카메라).
+        """
+        now = time.time() if now is None else now
+        live = set(live_names)
+        removed = [name for name, entry in self.entries.items()
+                   if name not in live and now - entry['last_seen'] > self.max_age]
+        for name in removed:
+            del self.entries[name]
+        self._dirty = True  # 제거분 + 검색 중 쌓인 last_seen 갱신분을 이 시점에 한 번 저장
+        return removed
+
+    def get_sources(self) -> List[Dict[str, str]]:
+        """캐시된 소스 목록 (최근에 본 순서)"""
+        ordered = sorted(self.entries.items(), key=lambda item: -item[1]['last_seen'])
+        return [{'name': name, 'address': entry['address']} for name, entry in ordered]
+
+    def get_address(self, name: str) -> str:
+        entry = self.entries.get(name)
+        return entry['address'] if entry else ""
@@ -0,0 +1,158 @@
+# stage_timing.py
+import time
+from typing import Dict, List, Optional, Tuple
+
+# 프리뷰 파이프라인 단계 (수신 스레드 -> 메일박스 -> GUI 스레드)
+#   copy       recv_capture 반환 -> 풀 슬롯 복사/축소/UYVY 변환 완료
+#   free       SDK 프레임 반환 (recv_free_video / framesync_free_video)
+#   qimage     QImage 생성 + 풀 슬롯 연결
+#   emit       메일박스 게시 + frame_ready 시그널
+#   mailbox    게시 -> GUI 픽업 (프레젠테이션 틱 / frame_ready 슬롯)
+#   paint_wait 픽업 -> paintEvent 시작
+#   paint      paintEvent 시작 -> 끝 (새 프레임이 없는 다시 그리기 포함)
+#   total      recv_capture 반환 -> 그 프레임을 그린 paintEvent 끝
+RECEIVER_STAGES = ('copy', 'free', 'qimage', 'emit')
+GUI_STAGES = ('mailbox', 'paint_wait', 'paint', 'total')
+STAGES = RECEIVER_STAGES + GUI_STAGES
+
+SUB_BUCKET_BITS = 3  # 옥타브당 8칸 - 버킷 폭은 값의 12.5% 이하
+NUM_BUCKETS = 64 << SUB_BUCKET_BITS
+
+
+def bucket_index(ns: int) -> int:
+    """ns -> 로그 버킷 번호 (8 미만은 값 그대로, 이상은 상위 4비트로 옥타브 + 칸)"""
+    if ns < (2 << SUB_BUCKET_BITS):
+        return max(ns, 0)
+    bits = ns.bit_length()
+    return ((bits - SUB_BUCKET_BITS) << SUB_BUCKET_BITS) + ((ns >> (bits - SUB_BUCKET_BITS - 1)) & 7)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """버킷이 담는 ns 범위 [low, high)"""
+    if index < (2 << SUB_BUCKET_BITS):
+        return index, index + 1
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    low = (8 + (index & 7)) << shift
+    return low, low + (1 << shift)
+
+
+class StageHistogram:
+    """한 단계의 지연 히스토그램 - 기록하는 스레드가 하나뿐이라 잠금 없이 누적
+
+    record()는 bit_length 한 번과 리스트 원소 증가뿐이다. 읽는 쪽(GUI/통계)은
+    counts 스냅샷을 떠서 백분위를 계산하므로, 동시에 기록 중인 샘플 몇 개가 빠지거나
+    count와 어긋날 수는 있어도 기록 스레드를 막지 않는다.
+    """
+
+    __slots__ = ('counts', 'count', 'total_ns', 'max_ns')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # 리스트를 통째로 바꿔 끼움 - 기록 중인 스레드가 이전 리스트에 쓰면 그 샘플만 사라짐
+        self.counts: List[int] = [0] * NUM_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns: int):
+        if ns < 0:
+            ns = 0
+        self.counts[bucket_index(ns)] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentiles(self, quantiles=(0.5, 0.95, 0.99)) -> List[float]:
+        """분위수별 ns (버킷 중앙값) - 샘플이 없으면 0"""
+        counts = list(self.counts)
+        total = sum(counts)
+        results = []
+        if total == 0:
+            return [0.0] * len(quantiles)
+        for q in quantiles:
+            target = max(1, int(q * total + 0.5))
+            seen = 0
+            for index, n in enumerate(counts):
+                seen += n
+                if seen >= target:
+                    low, high = bucket_bounds(index)
+                    results.append(min((low + high - 1) / 2.0, float(self.max_ns)))
+                    break
+        return results
+
+    def summary(self) -> Dict[str, float]:
+        """count / mean / p50 / p95 / p99 / max (ms)"""
+        p50, p95, p99 = self.percentiles()
+        count = self.count
+        return {
+            'count': count,
+            'mean_ms': self.total_ns / count / 1e6 if count else 0.0,
+            'p50_ms': p50 / 1e6,
+            'p95_ms': p95 / 1e6,
+            'p99_ms': p99 / 1e6,
+            'max_ms': self.max_ns / 1e6,
+        }
+
+
+class PipelineTimings:
+    """NDI 프리뷰 파이프라인의 단계별 지연 (perf_counter_ns)
+
+    수신 스레드 단계(RECEIVER_STAGES)는 NDIReceiver가, GUI 단계(GUI_STAGES)는 프레임을
+    픽업하는 쪽과 paintEvent가 기록하므로 히스토그램마다 기록 스레드는 하나다.
+    프레임 dict의 'timing' = (captured_ns, published_ns)가 두 스레드를 잇는다.
+    enabled가 False면 모든 훅이 속성 확인 한 번으로 끝난다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms: Dict[str, StageHistogram] = {stage: StageHistogram() for stage in STAGES}
+        self._picked: Optional[Tuple[int, int]] = None  # 픽업했지만 아직 안 그린 프레임 (captured_ns, picked_ns)
+
+    def reset(self):
+        for histogram in self.histograms.values():
+            histogram.reset()
+        self._picked = None
+
+    def record_receiver(self, captured_ns: int, copied_ns: int, freed_ns: int, built_ns: int, emitted_ns: int):
+        """수신 스레드 - 프레임 한 장의 구간 기록"""
+        histograms = self.histograms
+        histograms['copy'].record(copied_ns - captured_ns)
+        histograms['free'].record(freed_ns - copied_ns)
+        histograms['qimage'].record(built_ns - freed_ns)
+        histograms['emit'].record(emitted_ns - built_ns)
+
+    def on_pickup(self, frame_data):
+        """GUI 스레드 - 메일박스에서 새 프레임을 가져온 직후"""
+        timing = frame_data.get('timing') if isinstance(frame_data, dict) else None
+        if not self.enabled or timing is None:
+            return
+        now = time.perf_counter_ns()
+        captured_ns, published_ns = timing
+        self.histograms['mailbox'].record(now - published_ns)
+        self._picked = (captured_ns, now)
+
+    def on_paint(self, started_ns: int, finished_ns: int):
+        """GUI 스레드 - paintEvent 한 번 (시작/끝). 픽업한 프레임이 있으면 그 프레임의 끝 구간도 기록"""
+        histograms = self.histograms
+        histograms['paint'].record(finished_ns - started_ns)
+        picked = self._picked
+        if picked is not None:
+            self._picked = None
+            captured_ns, picked_ns = picked
+            histograms['paint_wait'].record(started_ns - picked_ns)
+            histograms['total'].record(finished_ns - captured_ns)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """단계별 summary() - {stage: {'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}}"""
+        return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def format_lines(self) -> List[str]:
+        """디버그 오버레이/로그용 표 (단계별 p50 / p95 / p99 ms)"""
+        lines = [f"{'stage':<10} {'p50':>6} {'p95':>6} {'p99':>6}  n"]
+        for stage, stats in self.get_stats().items():
+            lines.append(f"{stage:<10} {stats['p50_ms']:6.2f} {stats['p95_ms']:6.2f} "
+                         f"{stats['p99_ms']:6.2f}  {stats['count']}")
+        return lines
@@ -0,0 +1,86 @@
+# static_detector.py
+import time
+import zlib
+from typing import Callable, Optional
+
+import numpy as np
+
+# 픽셀 바이트 수 -> 한 번에 읽을 정수형
+_PIXEL_DTYPES = {1: np.uint8, 2: np.uint16, 4: np.uint32, 8: np.uint64}
+
+
+class StaticFrameDetector:
+    """정지 화면 감지 - 프레임 버퍼의 격자 샘플 체크섬이 직전 프레임과 같으면 정지로 판단
+
+    그래픽/슬레이트처럼 몇 분씩 그대로인 소스는 복사/변환/게시/다시 그리기가 전부 낭비다.
+    row_step 행마다 col_step 픽셀씩 뽑은 샘플(1080p BGRA 기준 약 65KB, 원본의 1/128)을
+    미리 할당한 버퍼로 모아 crc32를 계산하므로 프레임 복사보다 한 자릿수 이상 싸다.
+    격자 사이의 작은 변화(시계 숫자 등)는 놓칠 수 있어 refresh_interval마다 한 장은
+    체크섬과 관계없이 통과시킨다 - 변화는 최대 refresh_interval 늦게 보인다.
+
+    enabled가 False면 수신 스레드가 check()를 부르지 않는다 (통계도 멈춤).
+    수신 스레드 한 곳에서만 check()를 호출한다. static / 통계 값은 다른 스레드에서 읽기만 한다.
+    """
+
+    def __init__(self, enabled: bool = True, row_step: int = 8, col_step: int = 16,
+                 refresh_interval: float = 0.5, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.row_step = max(1, row_step)
+        self.col_step = max(1, col_step)
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self._sample: Optional[np.ndarray] = None
+        self.reset()
+
+    def reset(self):
+        """소스 변경/연결 해제 시 - 다음 프레임은 항상 통과"""
+        self._last_checksum: Optional[int] = None
+        self._last_passed = 0.0
+        self.static = False  # 마지막으로 확인한 프레임을 건너뛰었는지 (GUI의 이전 프레임 재표시 판단용)
+        self.frames_checked = 0
+        self.frames_skipped = 0
+
+    def _sample_view(self, data: np.ndarray) -> np.ndarray:
+        if data.ndim == 3 and data.strides[2] == data.itemsize:
+            # 픽셀(BGRA 4바이트, UYVY 2바이트)을 정수 하나로 보고 모음 - 바이트 단위 수집보다 10배 이상 빠름
+            pixel_dtype = _PIXEL_DTYPES.get(data.shape[2] * data.itemsize)
+            if pixel_dtype is not None:
+                data = data.view(pixel_dtype)[..., 0]
+        if data.ndim >= 2:
+            return data[::self.row_step, ::self.col_step]
+        return data[::self.row_step * self.col_step]
+
+    def check(self, data: np.ndarray, now: Optional[float] = None) -> bool:
+        """True면 직전에 통과한 프레임과 내용이 같아 이 프레임은 건너뛰어도 됨"""
+        sample = self._sample_view(data)
+        if self._sample is None or self._sample.shape != sample.shape or self._sample.dtype != sample.dtype:
+            # 해상도/포맷 변경 - 샘플 버퍼를 새로 잡고 다음 비교를 처음부터
+            self._sample = np.empty(sample.shape, dtype=sample.dtype)
+            self._last_checksum = None
+        np.copyto(self._sample, sample)
+        checksum = zlib.crc32(self._sample)
+        now = self.clock() if now is None else now
+        self.frames_checked += 1
+
+        if checksum == self._last_checksum and now - self._last_passed < self.refresh_interval:
+            self.frames_skipped += 1
+            self.static = True
+            return True
+        self.static = checksum == self._last_checksum
+        self._last_checksum = checksum
+        self._last_passed = now
+        return False
+
+    @property
+    def skip_ratio(self) -> float:
+        """확인한 프레임 중 건너뛴 비율 (0.0 ~ 1.0)"""
+        return self.frames_skipped / self.frames_checked if self.frames_checked else 0.0
+
+    def get_stats(self) -> dict:
+        return {
+            'enabled': self.enabled,
+            'static': self.static,
+            'checked': self.frames_checked,
+            'skipped': self.frames_skipped,
+            'skip_ratio': self.skip_ratio,
+        }
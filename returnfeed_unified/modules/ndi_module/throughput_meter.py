@@ -0,0 +1,101 @@
+# throughput_meter.py
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+
+def format_bitrate(bits_per_second: float) -> str:
+    """bps -> 표시 문자열 (Gbps/Mbps/kbps)"""
+    if bits_per_second >= 1e9:
+        return f"{bits_per_second / 1e9:.2f} Gbps"
+    if bits_per_second >= 1e6:
+        return f"{bits_per_second / 1e6:.1f} Mbps"
+    return f"{bits_per_second / 1e3:.0f} kbps"
+
+
+class ThroughputMeter:
+    """실측 디코딩 처리량 - SDK가 넘겨준 (압축 해제된) 프레임 바이트를 슬라이딩 윈도우로 집계
+
+    네트워크 비트레이트가 아니다 - 1080p60 BGRA면 약 4 Gbps로, 실제 NDI 스트림(약 125~250 Mbps)보다
+    한 자릿수 이상 크다. SDK(recv_get_performance)는 프레임 수만 알려주고 압축 크기는 주지 않으므로
+    수신 측에서 알 수 있는 것은 이 값이다. 표시할 때도 '디코딩 처리량'으로 구분한다.
+
+    프레임마다 하는 일은 정수 덧셈뿐이고, 윈도우 계산/문자열 포맷/SDK 카운터 반영은
+    tick()이 interval(기본 1초)마다 한 번 한다. 수신 루프가 깨어날 때마다 tick()을 불러도
+    시간 비교 한 번으로 끝난다.
+    """
+
+    def __init__(self, window_seconds: float = 5.0, interval: float = 1.0,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.window_seconds = window_seconds
+        self.interval = interval
+        self.clock = clock
+        self._buckets: Deque[Tuple[float, int, int, int]] = deque()  # (start_time, video_bytes, audio_bytes, video_frames)
+        self.reset()
+
+    def reset(self):
+        self._buckets.clear()
+        self._video_bytes = 0
+        self._audio_bytes = 0
+        self._video_frames = 0
+        self._bucket_start = self.clock()
+        self.video_bps = 0.0
+        self.audio_bps = 0.0
+        self.frames_per_sec = 0.0
+        self.throughput_text = "측정 중..."
+        # SDK 카운터 (recv_get_performance / recv_get_queue)
+        self.total_video_frames = 0
+        self.dropped_video_frames = 0
+        self.dropped_audio_frames = 0
+        self.queued_video_frames = 0
+
+    def add_video(self, nbytes: int):
+        self._video_bytes += nbytes
+        self._video_frames += 1
+
+    def add_audio(self, nbytes: int):
+        self._audio_bytes += nbytes
+
+    def tick(self, now: Optional[float] = None) -> bool:
+        """interval이 지났으면 현재 구간을 닫고 윈도우 통계 갱신 - 갱신했으면 True"""
+        now = self.clock() if now is None else now
+        if now - self._bucket_start < self.interval:
+            return False
+
+        self._buckets.append((self._bucket_start, self._video_bytes, self._audio_bytes, self._video_frames))
+        self._video_bytes = self._audio_bytes = self._video_frames = 0
+        self._bucket_start = now
+        while len(self._buckets) > 1 and self._buckets[0][0] < now - self.window_seconds:
+            self._buckets.popleft()
+        elapsed = max(now - self._buckets[0][0], 1e-6)
+
+        video_bytes = sum(bucket[1] for bucket in self._buckets)
+        audio_bytes = sum(bucket[2] for bucket in self._buckets)
+        frames = sum(bucket[3] for bucket in self._buckets)
+        self.video_bps = video_bytes * 8 / elapsed
+        self.audio_bps = audio_bytes * 8 / elapsed
+        self.frames_per_sec = frames / elapsed
+        self.throughput_text = format_bitrate(self.video_bps + self.audio_bps)
+        return True
+
+    def set_sdk_counters(self, total_video: int = 0, dropped_video: int = 0,
+                         dropped_audio: int = 0, queued_video: int = 0):
+        """SDK 성능/큐 카운터 반영 (수신기 생성 이후 누적값)"""
+        self.total_video_frames = total_video
+        self.dropped_video_frames = dropped_video
+        self.dropped_audio_frames = dropped_audio
+        self.queued_video_frames = queued_video
+
+    def get_stats(self) -> Dict:
+        return {
+            'decoded_bps': self.video_bps + self.audio_bps,
+            'video_bps': self.video_bps,
+            'audio_bps': self.audio_bps,
+            'throughput': self.throughput_text,
+            'frames_per_sec': self.frames_per_sec,
+            'total_video_frames': self.total_video_frames,
+            'dropped_video_frames': self.dropped_video_frames,
+            'dropped_audio_frames': self.dropped_audio_frames,
+            'queued_video_frames': self.queued_video_frames,
+            'window_seconds': self.window_seconds,
+        }
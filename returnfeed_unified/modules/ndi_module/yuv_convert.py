@@ -0,0 +1,168 @@
+# yuv_convert.py
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+# (Kr, Kb) 휘도 계수 - ITU-R BT.601 / BT.709
+COLORIMETRY = {
+    'bt601': (0.299, 0.114),
+    'bt709': (0.2126, 0.0722),
+}
+
+
+def colorimetry_for(height: int) -> str:
+    """해상도로 색역 선택 - NDI 규약대로 SD는 BT.601, HD 이상은 BT.709"""
+    return 'bt709' if height >= 720 else 'bt601'
+
+
+FIXED_POINT_BITS = 10  # 계수 정밀도 1/1024 - int32 누산에서 넘침 없음
+
+
+def yuv_to_rgb_coefficients(colorimetry: str) -> Dict[str, float]:
+    """제한 범위(16-235/16-240) YCbCr -> 전체 범위 RGB 계수"""
+    kr, kb = COLORIMETRY[colorimetry]
+    kg = 1.0 - kr - kb
+    y_scale = 255.0 / 219.0
+    c_scale = 255.0 / 224.0
+    return {
+        'y': y_scale,
+        'r_v': c_scale * 2.0 * (1.0 - kr),
+        'g_u': -c_scale * 2.0 * kb * (1.0 - kb) / kg,
+        'g_v': -c_scale * 2.0 * kr * (1.0 - kr) / kg,
+        'b_u': c_scale * 2.0 * (1.0 - kb),
+    }
+
+
+def fixed_point_coefficients(colorimetry: str) -> Dict[str, int]:
+    """정수 커널용 2^FIXED_POINT_BITS 배율 계수"""
+    scale = 1 << FIXED_POINT_BITS
+    return {name: int(round(value * scale)) for name, value in yuv_to_rgb_coefficients(colorimetry).items()}
+
+
+class UYVYConverter:
+    """UYVY 4:2:2 -> BGRA(RGB32) 벡터화 변환기 (정수 고정소수점 커널)
+
+    NDI가 UYVY 그대로 보내도록 하면 SDK 측 색변환이 없어지고 복사량이 절반이 된다.
+    변환은 출력 크기 기준으로 수행하므로, 출력이 표시 크기로 작으면 줄이면서
+    동시에 변환한다 (행은 최근접, 열은 매크로픽셀 단위 샘플링 + Y 쌍 평균).
+
+    매크로픽셀을 U/Y0/V/Y1 평면으로 풀어 int32로 계산한다. 크기 2짜리 안쪽 축을
+    만들지 않으므로 모든 연산이 연속 메모리 위에서 돈다. 작업 버퍼와 출력 버퍼는
+    (입력, 출력, 색역) 별로 한 번만 할당해 재사용한다.
+    """
+
+    def __init__(self):
+        self._plan_key = None
+        self._plan: Optional[Dict] = None
+
+        # 통계
+        self.converted_frames = 0
+        self.decimated_frames = 0
+
+    @staticmethod
+    def macropixels(src: np.ndarray) -> np.ndarray:
+        """(H, W, 2) 또는 (H, W*2) UYVY를 (H, W/2, 4) [U, Y0, V, Y1] 뷰로"""
+        return src.reshape(src.shape[0], -1, 4)
+
+    def convert(self, src: np.ndarray, out: np.ndarray, colorimetry: Optional[str] = None) -> np.ndarray:
+        """src(UYVY)를 out (oh, ow, 4) BGRA 버퍼로 변환 - out이 작으면 축소 포함"""
+        mp = self.macropixels(src)
+        plan = self._get_plan(mp.shape, out.shape, colorimetry or colorimetry_for(mp.shape[0]))
+        coeffs, work = plan['coeffs'], plan['work']
+        planes = work['planes']  # int32 (4, h, w) = U, Y0, V, Y1
+
+        if plan['rows'] is None:
+            # 전체 해상도: 크로마는 매크로픽셀(2픽셀)당 한 번만 계산, Y0/Y1 두 평면에 브로드캐스트
+            np.copyto(planes, np.moveaxis(mp, -1, 0))
+            luma = planes[1::2]
+            np.subtract(luma, 16, out=luma)
+            np.multiply(luma, coeffs['y'], out=luma)
+            out_view = out.reshape(out.shape[0], -1, 2, 4)
+            targets = [out_view[..., channel].transpose(2, 0, 1) for channel in range(3)]
+        else:
+            # 축소: 필요한 매크로픽셀만 골라서 변환
+            picked = np.take(np.take(mp, plan['rows'], axis=0), plan['cols'], axis=1)
+            np.copyto(planes, np.moveaxis(picked, -1, 0))
+            luma = work['luma']
+            if plan['pair_average']:
+                np.add(planes[1], planes[3], out=luma[0])
+                np.subtract(luma, 32, out=luma)
+                np.multiply(luma, coeffs['y_pair'], out=luma)
+            else:
+                np.copyto(luma[0], np.where(plan['odd'], planes[3], planes[1]))
+                np.subtract(luma, 16, out=luma)
+                np.multiply(luma, coeffs['y'], out=luma)
+            targets = [out[..., channel][None] for channel in range(3)]
+            self.decimated_frames += 1
+
+        luma += 1 << (FIXED_POINT_BITS - 1)  # 반올림
+        self._matrix(coeffs, planes, luma, targets, work)
+        out[..., 3] = 255
+        self.converted_frames += 1
+        return out
+
+    @staticmethod
+    def _matrix(coeffs: Dict[str, int], planes: np.ndarray, luma: np.ndarray, targets, work: Dict) -> None:
+        """BT.601/709 행렬 적용 - (luma + chroma) >> bits 를 포화시켜 uint8 채널에 기록"""
+        u, v = planes[0], planes[2]
+        np.subtract(u, 128, out=u)
+        np.subtract(v, 128, out=v)
+        chroma, chroma_v, chan = work['chroma'], work['chroma_v'], work['chan']
+
+        for channel, (u_coeff, v_coeff) in enumerate(((coeffs['b_u'], 0),
+                                                      (coeffs['g_u'], coeffs['g_v']),
+                                                      (0, coeffs['r_v']))):
+            if u_coeff and v_coeff:
+                np.multiply(u, u_coeff, out=chroma)
+                np.multiply(v, v_coeff, out=chroma_v)
+                np.add(chroma, chroma_v, out=chroma)
+            elif u_coeff:
+                np.multiply(u, u_coeff, out=chroma)
+            else:
+                np.multiply(v, v_coeff, out=chroma)
+            np.add(luma, chroma, out=chan)
+            np.right_shift(chan, FIXED_POINT_BITS, out=chan)
+            np.clip(chan, 0, 255, out=targets[channel], casting='unsafe')
+
+    def _get_plan(self, mp_shape: Tuple[int, ...], out_shape: Tuple[int, ...], colorimetry: str) -> Dict:
+        key = (mp_shape, tuple(out_shape), colorimetry)
+        if key == self._plan_key:
+            return self._plan
+
+        height, pairs, _ = mp_shape
+        width = pairs * 2
+        out_h, out_w = out_shape[0], out_shape[1]
+        coeffs = fixed_point_coefficients(colorimetry)
+        coeffs['y_pair'] = int(round(yuv_to_rgb_coefficients(colorimetry)['y'] * (1 << FIXED_POINT_BITS) / 2))
+        plan = {'coeffs': coeffs, 'rows': None}
+
+        if (out_h, out_w) == (height, width):
+            plane_shape, luma_planes = (height, pairs), 2  # 휘도는 planes[1::2]에서 직접 계산
+        else:
+            # 출력 픽셀 중심에 해당하는 원본 픽셀 -> 매크로픽셀 인덱스
+            src_x = ((np.arange(out_w) + 0.5) * width / out_w).astype(np.intp)
+            plan['rows'] = ((np.arange(out_h) + 0.5) * height / out_h).astype(np.intp)
+            plan['cols'] = src_x // 2
+            plan['odd'] = (src_x & 1).astype(bool)
+            plan['pair_average'] = width >= 2 * out_w  # 2배 이상 축소면 Y 쌍 평균
+            plane_shape, luma_planes = (out_h, out_w), 1
+
+        plan['work'] = {
+            'planes': np.empty((4,) + plane_shape, dtype=np.int32),
+            'luma': np.empty((1,) + plane_shape, dtype=np.int32) if plan['rows'] is not None else None,
+            'chan': np.empty((luma_planes,) + plane_shape, dtype=np.int32),
+            'chroma': np.empty(plane_shape, dtype=np.int32),
+            'chroma_v': np.empty(plane_shape, dtype=np.int32),
+        }
+        self._plan_key = key
+        self._plan = plan
+        return plan
+
+    def get_stats(self) -> Dict:
+        """변환 통계"""
+        return {
+            'converted_frames': self.converted_frames,
+            'decimated_frames': self.decimated_frames,
+            'colorimetry': self._plan_key[2] if self._plan_key else None,
+        }
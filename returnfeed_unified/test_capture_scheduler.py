@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Test script for the adaptive NDI capture scheduler (simulated source clock)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.capture_scheduler import AdaptiveTimeout, CaptureScheduler
+
+
+class SimulatedSource:
+    """recv_capture_v2 흉내 - 프레임 도착 시 즉시 반환, 없으면 타임아웃까지 대기"""
+
+    def __init__(self, fps, stall_after=None):
+        self.now = 0.0
+        self.interval = 1.0 / fps
+        self.next_frame = self.interval
+        self.stall_after = stall_after
+
+    def clock(self):
+        return self.now
+
+    def capture(self, timeout_ms):
+        deadline = self.now + timeout_ms / 1000.0
+        stalled = self.stall_after is not None and self.next_frame > self.stall_after
+        if not stalled and self.next_frame <= deadline:
+            self.now = max(self.now, self.next_frame)
+            self.next_frame += self.interval
+            return 'video'
+        self.now = deadline
+        return 'none'
+
+    def sleep(self, ms):
+        self.now += ms / 1000.0
+
+
+def run_scheduler(source, seconds):
+    scheduler = CaptureScheduler(clock=source.clock)
+    while source.now < seconds:
+        if source.capture(scheduler.next_timeout_ms()) == 'video':
+            scheduler.on_video_frame()
+        else:
+            scheduler.on_timeout()
+    return scheduler
+
+
+def test_30p_wakes_once_per_frame():
+    """30p 소스: 초당 약 30번 깨어남 (이전 프록시 루프는 0ms + 8ms sleep)"""
+    source = SimulatedSource(30)
+    scheduler = run_scheduler(source, 10.0)
+    stats = scheduler.get_stats()
+    assert abs(stats['source_fps'] - 30) < 0.5, stats
+    assert stats['wakeups_per_sec'] <= 31, stats
+    assert stats['timeout_ms'] == 50, stats
+
+    legacy = SimulatedSource(30)
+    wakeups = 0
+    while legacy.now < 10.0:
+        wakeups += 1
+        if legacy.capture(0) == 'none':
+            legacy.sleep(8)
+    print(f"✅ 30p: {stats['wakeups_per_sec']:.0f} wakeups/s (legacy proxy loop: {wakeups / 10.0:.0f}/s)")
+
+
+def test_59_94_uses_frame_interval():
+    """59.94p 소스: 타임아웃은 프레임 간격 x1.5"""
+    scheduler = run_scheduler(SimulatedSource(60000 / 1001), 5.0)
+    assert scheduler.get_stats()['timeout_ms'] == 25
+    assert scheduler.timeouts == 0
+    print("✅ 59.94p timeout follows measured interval")
+
+
+def test_stall_backs_off_and_recovers():
+    """소스 정지 시 대기를 늘려 빈 깨어남을 줄이고, 재개되면 기본값으로 복귀"""
+    timeout = AdaptiveTimeout()
+    timeout.set_frame_interval(1 / 30)
+    timeout.on_frame_received()
+    for _ in range(20):
+        timeout.on_frame_missed()
+    assert timeout.get_timeout() == 100
+    for _ in range(20):
+        timeout.on_frame_received()
+    assert timeout.get_timeout() == 50
+
+    source = SimulatedSource(30, stall_after=2.0)
+    scheduler = run_scheduler(source, 10.0)
+    assert scheduler.get_stats()['wakeups_per_sec'] <= 10.5
+    print(f"✅ stalled source backs off ({scheduler.get_stats()['wakeups_per_sec']:.0f} wakeups/s)")
+
+
+if __name__ == "__main__":
+    test_30p_wakes_once_per_frame()
+    test_59_94_uses_frame_interval()
+    test_stall_backs_off_and_recovers()
+    print("\nAll capture scheduler tests passed!")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Test script for the latest-frame mailbox between NDI receiver and GUI"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.frame_mailbox import FrameMailbox
+
+
+def test_latest_wins():
+    """GUI가 늦으면 최신 프레임만 전달되고 나머지는 overwritten으로 집계"""
+    mailbox = FrameMailbox()
+    assert mailbox.publish({'n': 1})  # 첫 게시는 알림 필요
+    assert not mailbox.publish({'n': 2})  # 읽히기 전이므로 알림 생략
+    assert not mailbox.publish({'n': 3})
+
+    frame_id, frame = mailbox.fetch(0)
+    assert frame['n'] == 3 and frame_id == 3
+    assert mailbox.fetch(frame_id) == (frame_id, None)  # 새 프레임 없음
+
+    stats = mailbox.get_stats()
+    assert stats['published'] == 3 and stats['delivered'] == 1 and stats['overwritten'] == 2
+    print("✅ latest frame wins")
+
+
+def test_multiple_readers():
+    """읽기는 비파괴적 - 각 소비자가 자신의 last_id로 가져감"""
+    mailbox = FrameMailbox()
+    mailbox.publish('a')
+    id_one, frame_one = mailbox.fetch(0)
+    id_two, frame_two = mailbox.fetch(0)
+    assert frame_one == frame_two == 'a' and id_one == id_two
+    assert mailbox.get_stats()['delivered'] == 1
+
+    mailbox.clear()
+    assert mailbox.fetch(0) == (0, None)
+    assert mailbox.publish('b')
+    assert mailbox.fetch(id_one)[1] == 'b'
+    print("✅ multiple readers supported")
+
+
+def test_bounded_under_producer_burst():
+    """소비자가 멈춰도 보관되는 프레임은 하나뿐"""
+    mailbox = FrameMailbox()
+    notifications = []
+
+    def producer():
+        for i in range(10000):
+            if mailbox.publish(i):
+                notifications.append(i)
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    thread.join()
+
+    assert len(notifications) == 1  # 소비 전까지 알림은 한 번만
+    frame_id, frame = mailbox.fetch(0)
+    assert frame == 9999 and frame_id == 10000
+    print("✅ bounded under producer burst")
+
+
+if __name__ == "__main__":
+    test_latest_wins()
+    test_multiple_readers()
+    test_bounded_under_producer_burst()
+    print("\nAll frame mailbox tests passed!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test script for the NDI receiver frame buffer pool"""
+
+import gc
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.frame_pool import FrameBufferPool
+
+
+class _FakeImage:
+    """QImage 대용 - bind()는 weakref만 필요"""
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+
+def test_slots_reused_after_release():
+    """슬롯은 소유 객체가 사라진 뒤 재사용되어야 함"""
+    pool = FrameBufferPool(num_slots=2)
+    token, buffer = pool.acquire((1080, 1920, 4), np.uint8, 1920 * 4)
+    image = _FakeImage(buffer)
+    pool.bind(image, token)
+    assert pool.get_stats()['in_flight'] == 1
+
+    del image
+    gc.collect()
+    stats = pool.get_stats()
+    assert stats['in_flight'] == 0
+
+    _, buffer_again = pool.acquire((1080, 1920, 4), np.uint8, 1920 * 4)
+    assert buffer_again is buffer
+    assert pool.get_stats()['reallocations'] == 1
+    print("✅ slots reused after release")
+
+
+def test_exhaustion_counts_miss():
+    """풀 고갈 시 임시 버퍼를 반환하고 miss로 집계"""
+    pool = FrameBufferPool(num_slots=2)
+    held = [pool.acquire((4, 4, 4), np.uint8, 16) for _ in range(2)]
+    token, buffer = pool.acquire((4, 4, 4), np.uint8, 16)
+    stats = pool.get_stats()
+    assert token is None
+    assert buffer.shape == (4, 4, 4)
+    assert stats['hits'] == 2 and stats['misses'] == 1 and stats['in_flight'] == 2
+    for held_token, _ in held:
+        pool.release(held_token)
+    assert pool.get_stats()['in_flight'] == 0
+    print("✅ exhaustion counted as miss")
+
+
+def test_reallocate_only_on_layout_change():
+    """xres/yres/stride가 바뀔 때만 재할당"""
+    pool = FrameBufferPool(num_slots=3)
+    for _ in range(10):
+        token, _ = pool.acquire((360, 640, 4), np.uint8, 640 * 4)
+        pool.release(token)
+    assert pool.get_stats()['reallocations'] == 1
+
+    old_token, _ = pool.acquire((360, 640, 4), np.uint8, 640 * 4)
+    pool.acquire((360, 640, 4), np.uint8, 704 * 4)  # 스트라이드 변경
+    assert pool.get_stats()['reallocations'] == 2
+
+    # 이전 세대 토큰 반환은 새 풀에 영향을 주지 않음
+    pool.release(old_token)
+    assert pool.get_stats()['in_flight'] == 1
+    print("✅ reallocation only on layout change")
+
+
+if __name__ == "__main__":
+    test_slots_reused_after_release()
+    test_exhaustion_counts_miss()
+    test_reallocate_only_on_layout_change()
+    print("\nAll frame pool tests passed!")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Test script for worker-thread downscaling to the display size"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.frame_scaler import FrameScaler
+
+
+def test_box_filter_matches_block_mean():
+    """정수 배율은 반올림된 블록 평균과 일치 (NDI 라인 스트라이드 포함)"""
+    src = np.random.randint(0, 256, (1080, 1920, 4), dtype=np.uint8)
+    padded = np.zeros((1080, 2048, 4), dtype=np.uint8)
+    strided = padded[:, :1920]
+    strided[:] = src
+
+    scaler = FrameScaler()
+    for factor in (2, 3):
+        width, height = 1920 // factor, 1080 // factor
+        scaler.set_target_size(width, height)
+        assert scaler.output_shape(src.shape) == (height, width, 4)
+        out = np.empty((height, width, 4), dtype=np.uint8)
+        scaler.scale(strided, out)
+        expected = np.floor(src.reshape(height, factor, width, factor, 4).mean(axis=(1, 3)) + 0.5)
+        assert np.array_equal(out, expected.astype(np.uint8))
+    print("✅ box filter matches block mean")
+
+
+def test_fit_preserves_aspect():
+    """목표 영역 안에 원본 비율로 맞추고, 비정수 배율은 최근접 샘플링"""
+    scaler = FrameScaler()
+    scaler.set_target_size(700, 500)
+    src = np.zeros((1080, 1920, 4), dtype=np.uint8)
+    src[:, 960:] = 255
+    shape = scaler.output_shape(src.shape)
+    assert shape == (394, 700, 4)
+    out = np.empty(shape, dtype=np.uint8)
+    scaler.scale(src, out)
+    assert out[:, :340].max() == 0 and out[:, 360:].min() == 255
+    print("✅ aspect-preserving fit")
+
+
+def test_passthrough_cases():
+    """확대가 필요하거나 패킹된 YUV이면 스케일링하지 않음"""
+    scaler = FrameScaler()
+    assert scaler.output_shape((360, 640, 4)) is None  # 목표 미설정
+    scaler.set_target_size(1280, 720)
+    assert scaler.output_shape((360, 640, 4)) is None  # 확대는 GUI 몫
+    assert scaler.output_shape((1080, 1920, 2)) is None  # UYVY
+    scaler.set_target_size(0, 0)
+    assert scaler.output_shape((1080, 1920, 4)) is None
+    print("✅ passthrough cases")
+
+
+def test_plan_snapshot_survives_target_change():
+    """버퍼 크기를 정한 뒤 GUI 스레드가 목표를 바꿔도 같은 계획으로 scale() - 다음 프레임부터 새 크기"""
+    scaler = FrameScaler()
+    scaler.set_target_size(960, 540)
+    src = np.full((1080, 1920, 4), 200, dtype=np.uint8)
+    plan = scaler.plan(src.shape)
+    out = np.empty(plan['out_shape'], dtype=np.uint8)
+    scaler.set_target_size(640, 360)  # display_size_changed가 중간에 끼어듦
+    scaler.scale(src, out, plan)
+    assert out.shape == (540, 960, 4) and (out == 200).all()
+    assert scaler.plan(src.shape)['out_shape'] == (360, 640, 4)
+    assert scaler.scale(src, np.empty((1080, 1920, 4), dtype=np.uint8), None) is not None  # None = 그대로 복사
+    print("✅ per-frame plan snapshot is immune to target changes")
+
+
+def test_size_limit():
+    """스로틀 프리뷰 상한 - 표시 영역과 상한 중 작은 쪽으로 축소, 해제하면 표시 영역으로 복귀"""
+    scaler = FrameScaler()
+    scaler.set_size_limit(640, 360)
+    assert scaler.output_shape((1080, 1920, 4)) == (360, 640, 4)  # 표시 크기 협상 전에도 적용
+    scaler.set_target_size(1280, 720)
+    assert scaler.output_shape((1080, 1920, 4)) == (360, 640, 4)
+    assert scaler.fit_size(1920, 1080) == (640, 360)  # UYVY 변환 경로도 같은 크기
+    scaler.set_target_size(320, 180)
+    assert scaler.output_shape((1080, 1920, 4)) == (180, 320, 4)
+    scaler.set_size_limit(0, 0)
+    assert scaler.output_shape((1080, 1920, 4)) == (180, 320, 4)
+    scaler.set_target_size(1280, 720)
+    assert scaler.output_shape((1080, 1920, 4)) == (720, 1280, 4)
+    assert scaler.get_stats()['size_limit'] is None
+    print("✅ size limit caps the display size")
+
+
+def benchmark_throttled_preview():
+    """수신 스레드 프리뷰 비용 (초당) - 1080p60 표시 크기 축소 vs 스로틀 프리뷰 (프록시 640x360 5fps)"""
+    full_src = np.random.randint(0, 256, (1080, 1920, 4), dtype=np.uint8)
+    proxy_src = np.random.randint(0, 256, (360, 640, 4), dtype=np.uint8)
+    scaler = FrameScaler()
+    scaler.set_target_size(1280, 720)
+    full_out = np.empty(scaler.output_shape(full_src.shape), dtype=np.uint8)
+    scaler.set_size_limit(640, 360)
+    proxy_out = np.empty_like(proxy_src)
+    assert scaler.output_shape(proxy_src.shape) is None  # 프록시 스트림은 이미 상한 크기 - 복사만
+
+    def per_frame_ms(func, iterations=20):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations * 1000
+
+    scaler.set_size_limit(0, 0)
+    full_ms = per_frame_ms(lambda: scaler.scale(full_src, full_out))
+    scaler.set_size_limit(640, 360)
+    proxy_ms = per_frame_ms(lambda: scaler.scale(proxy_src, proxy_out))
+    full_per_sec, throttled_per_sec = full_ms * 60, proxy_ms * 5
+    reduction = 1 - throttled_per_sec / full_per_sec
+    assert reduction > 0.9, (full_per_sec, throttled_per_sec)
+    print(f"📊 preview cost: {full_per_sec:.0f} ms/s at 1080p60 -> {throttled_per_sec:.1f} ms/s throttled "
+          f"({reduction:.1%} less, excluding SDK decode)")
+
+
+def benchmark_display_scaling():
+    """1080p -> 640x360 축소 시간 (전체 해상도 복사 대비)"""
+    src = np.random.randint(0, 256, (1080, 1920, 4), dtype=np.uint8)
+    scaler = FrameScaler()
+    scaler.set_target_size(640, 360)
+    out = np.empty(scaler.output_shape(src.shape), dtype=np.uint8)
+    full = np.empty_like(src)
+
+    iterations = 30
+    start = time.perf_counter()
+    for _ in range(iterations):
+        scaler.scale(src, out)
+    scale_ms = (time.perf_counter() - start) / iterations * 1000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        np.copyto(full, src)
+    copy_ms = (time.perf_counter() - start) / iterations * 1000
+    print(f"📊 1080p -> 640x360: {scale_ms:.2f} ms (full copy {copy_ms:.2f} ms, output {out.nbytes / full.nbytes:.0%} of bytes)")
+
+
+if __name__ == "__main__":
+    test_box_filter_matches_block_mean()
+    test_fit_preserves_aspect()
+    test_passthrough_cases()
+    test_plan_snapshot_survives_target_change()
+    test_size_limit()
+    benchmark_display_scaling()
+    benchmark_throttled_preview()
+    print("\nAll frame scaler tests passed!")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Test script for sender-to-present (glass-to-glass) latency estimation from NDI timestamps"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QImage, QColor
+
+from modules.ndi_module.glass_latency import (NDI_TIMESTAMP_UNDEFINED, ClockOffsetEstimator,
+                                              GlassToGlassEstimator, format_latency, sender_time_100ns)
+from ui.classic_mode.components.video_display import SingleChannelVideoDisplay
+
+EPOCH_2026 = 17_700_000_000_000_000  # 100ns 단위 UNIX 시각
+
+
+def simulate(estimator, frames=600, sender_ahead_ms=0.0, transit_ms=2.0, jitter_ms=3.0, present_ms=20.0,
+             drift_ppm=0.0, seed=3):
+    """60p 스트림 - 송신 시계가 sender_ahead_ms 앞서고 drift_ppm만큼 빨리 감. 도착 후 present_ms에 표시"""
+    rng = np.random.default_rng(seed)
+    true_latencies = []
+    for index in range(frames):
+        true_send = index / 60.0  # 수신 시계 기준 송신 시각 (초)
+        sender_clock = true_send * (1 + drift_ppm * 1e-6) + sender_ahead_ms / 1000.0
+        arrival = true_send + (transit_ms + rng.uniform(0, jitter_ms)) / 1000.0
+        sender_100ns = EPOCH_2026 + int(sender_clock * 1e7)
+        received_wall = EPOCH_2026 + int(arrival * 1e7)
+        estimator.on_arrival(sender_100ns, 0, received_wall)
+        estimator.on_pickup({'timestamp': sender_100ns, 'timecode': 0, 'received_wall': received_wall,
+                             'received_at': 1000.0 + arrival})
+        presented = arrival + present_ms / 1000.0
+        estimator.on_present(1000.0 + presented)
+        true_latencies.append((presented - true_send) * 1000.0)
+    return np.array(true_latencies)
+
+
+def test_sender_time_selection():
+    assert sender_time_100ns(EPOCH_2026, 0) == EPOCH_2026
+    assert sender_time_100ns(NDI_TIMESTAMP_UNDEFINED, EPOCH_2026 + 5) == EPOCH_2026 + 5  # 합성 timecode로 대체
+    assert sender_time_100ns(None, 12345) is None  # 프레임 카운터 같은 timecode는 쓰지 않음
+    assert sender_time_100ns(0, None) is None
+    print("✅ sender time from timestamp, falling back to synthesized timecode")
+
+
+def test_synced_clocks_report_absolute_latency():
+    estimator = GlassToGlassEstimator()
+    true_latencies = simulate(estimator)
+    stats = estimator.get_stats()
+    assert stats['clock_synced'] and stats['clock_offset_ms'] == 0.0 and stats['samples'] == 300
+    window = true_latencies[-330:-29]  # 마지막 갱신(0.5초마다) 시점의 300프레임
+    assert abs(stats['p50_ms'] - np.percentile(window, 50)) < 0.05, (stats, np.percentile(window, 50))
+    assert abs(stats['p95_ms'] - np.percentile(window, 95)) < 0.05
+    print(f"✅ synced clocks: p50 {stats['p50_ms']:.1f} / p95 {stats['p95_ms']:.1f} ms (exact)")
+
+
+def test_clock_offset_is_removed():
+    """송신 시계가 2.5초 앞서도 도착 지연 최솟값으로 보정 - 오차는 최소 전송 지연 가정치 이내"""
+    estimator = GlassToGlassEstimator()
+    true_latencies = simulate(estimator, sender_ahead_ms=2500.0)
+    stats = estimator.get_stats()
+    assert stats['clock_synced'] is False
+    assert abs(stats['clock_offset_ms'] + 2500.0 - 2.0 + 1.0) < 0.2, stats  # 시계 차이 -2500 + 최소 전송 2 - 가정 1
+    assert abs(stats['p50_ms'] - np.percentile(true_latencies[-300:], 50)) < 1.5, stats
+    print(f"✅ sender 2.5 s ahead: p50 {stats['p50_ms']:.1f} ms (true {np.percentile(true_latencies, 50):.1f})")
+
+
+def test_offset_follows_drift():
+    """송신 시계가 200ppm 빨라도 슬라이딩 윈도우 최솟값이 따라감"""
+    estimator = GlassToGlassEstimator(clock_estimator=ClockOffsetEstimator(window_seconds=2.0))
+    true_latencies = simulate(estimator, frames=60 * 60, sender_ahead_ms=-800.0, drift_ppm=200.0)
+    stats = estimator.get_stats()
+    assert abs(stats['p50_ms'] - np.percentile(true_latencies[-300:], 50)) < 1.5, stats
+    print(f"✅ 200 ppm drift tracked (p50 {stats['p50_ms']:.1f} ms after 60 s)")
+
+
+def test_refresh_and_text():
+    published = []
+    estimator = GlassToGlassEstimator()
+    refresh = estimator._refresh
+    estimator._refresh = lambda: (refresh(), published.append(estimator.get_stats()))
+    simulate(estimator, frames=120)
+    assert len(published) == 4 and 90 <= published[-1]['samples'] <= 95  # 0.5초(약 30프레임)마다
+    assert format_latency(published[-1]).startswith("G2G 2")
+    assert format_latency({'p50_ms': 40.2, 'p95_ms': 55.0, 'clock_synced': False}) == "G2G ≈40/55 ms"
+    assert format_latency(GlassToGlassEstimator().get_stats()) == ""
+    print("✅ stats refreshed twice a second")
+
+
+def test_display_presents_picked_frame():
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = SingleChannelVideoDisplay()
+    display.resize(640, 360)
+    frame = QImage(640, 360, QImage.Format.Format_RGB32)
+    frame.fill(QColor(10, 10, 10))
+    display.set_connected(True)
+    display.update_frame(frame)
+    estimator = GlassToGlassEstimator()
+    display.latency_estimator = estimator
+
+    now_wall = time.time_ns() // 100
+    estimator.on_pickup({'timestamp': now_wall - 300_000, 'received_wall': now_wall, 'received_at': time.perf_counter()})
+    display.render(QImage(640, 360, QImage.Format.Format_ARGB32_Premultiplied))
+    stats = estimator.get_stats()
+    assert estimator.presented == 1 and 30.0 <= stats['p50_ms'] < 1000.0, stats
+    display.update_frame_info({'latency': stats})
+    assert "G2G" in display._info_texts()[0]
+    print(f"✅ display records latency at paint end ({stats['p50_ms']:.1f} ms)")
+
+
+if __name__ == "__main__":
+    test_sender_time_selection()
+    test_synced_clocks_report_absolute_latency()
+    test_clock_offset_is_removed()
+    test_offset_follows_drift()
+    test_refresh_and_text()
+    test_display_presents_picked_frame()
+    print("\nAll glass-to-glass latency tests passed!")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Test script for the BS.1770 loudness meter (momentary / short-term / integrated)"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.loudness import KWeightingFilter, LoudnessMeter, k_weighting_coefficients
+
+SAMPLE_RATE = 48000
+FRAME = 1600  # 30fps 소스의 오디오 프레임 길이
+
+
+def feed(meter, audio, frame=FRAME):
+    for start in range(0, audio.shape[1], frame):
+        meter.process(audio[:, start:start + frame], SAMPLE_RATE)
+    return meter.get_levels()
+
+
+def sine(freq, amplitude, seconds):
+    t = np.arange(int(SAMPLE_RATE * seconds))
+    return (amplitude * np.sin(2 * np.pi * freq * t / SAMPLE_RATE)).astype(np.float32)
+
+
+def reference_filter(x, b, a):
+    """샘플 단위 Direct Form I 기준 구현"""
+    y = np.zeros_like(x, dtype=np.float64)
+    for n in range(len(x)):
+        acc = 0.0
+        for k in range(len(b)):
+            if n - k >= 0:
+                acc += b[k] * x[n - k]
+        for k in range(1, len(a)):
+            if n - k >= 0:
+                acc -= a[k] * y[n - k]
+        y[n] = acc
+    return y
+
+
+def test_coefficients_48k():
+    """48 kHz 계수는 BS.1770 표와 일치"""
+    (shelf_b, shelf_a), (highpass_b, highpass_a) = k_weighting_coefficients(48000)
+    assert np.allclose(shelf_b, [1.53512485958697, -2.69169618940638, 1.19839281085285], atol=1e-9)
+    assert np.allclose(shelf_a, [1.0, -1.69065929318241, 0.73248077421585], atol=1e-9)
+    assert np.allclose(highpass_b, [1.0, -2.0, 1.0])
+    assert np.allclose(highpass_a, [1.0, -1.99004745483398, 0.99007225036621], atol=1e-9)
+    print("✅ K-weighting coefficients match BS.1770 at 48 kHz")
+
+
+def test_block_filter_matches_reference():
+    """블록 처리(불규칙한 프레임 길이 포함)가 샘플 단위 필터와 일치"""
+    x = np.random.uniform(-1, 1, (2, 4000))
+    kfilter = KWeightingFilter(SAMPLE_RATE)
+    pieces, start = [], 0
+    for size in (1600, 3, 1, 800, 1596):
+        pieces.append(kfilter.process(x[:, start:start + size]))
+        start += size
+    blocked = np.concatenate(pieces, axis=1)
+    for channel in range(2):
+        expected = x[channel]
+        for stage in kfilter.stages:
+            expected = reference_filter(expected, stage.b, stage.a)
+        assert np.abs(blocked[channel] - expected).max() < 1e-9
+    print("✅ block filter matches sample-by-sample reference")
+
+
+def test_sine_calibration():
+    """0 dBFS 997 Hz 사인 한 채널 = -3.01 LUFS, 두 채널 = 0 LUFS"""
+    mono = np.zeros((2, SAMPLE_RATE * 4), dtype=np.float32)
+    mono[0] = sine(997, 1.0, 4)
+    levels = feed(LoudnessMeter(), mono)
+    for key in ('momentary', 'short_term', 'integrated'):
+        assert abs(levels[key] - (-3.01)) < 0.05, (key, levels[key])
+
+    stereo = np.stack([sine(997, 1.0, 4)] * 2)
+    levels = feed(LoudnessMeter(), stereo)
+    assert abs(levels['integrated']) < 0.05
+    print("✅ 997 Hz sine calibration")
+
+
+def test_gating():
+    """무음은 절대 게이트로, 작은 구간은 상대 게이트로 제외"""
+    meter = LoudnessMeter()
+    tone = sine(997, 0.1, 10)  # 단일 채널 -23 LUFS 부근
+    feed(meter, tone[None, :])
+    before = meter.get_levels()['integrated']
+    feed(meter, np.zeros((1, SAMPLE_RATE * 10), dtype=np.float32))
+    assert abs(meter.get_levels()['integrated'] - before) < 0.1
+    feed(meter, sine(997, 0.001, 10)[None, :])  # -60dB 아래: 상대 게이트에서 제외
+    assert abs(meter.get_levels()['integrated'] - before) < 0.1
+
+    meter.reset()
+    assert meter.get_levels()['integrated'] is None
+    print(f"✅ gating ({before:.2f} LUFS)")
+
+
+def test_variable_block_lengths():
+    """프레임 싱크 오디오처럼 블록 길이가 매번 달라도 재계산 없이 같은 결과, 캐시는 유한"""
+    rng = np.random.default_rng(7)
+    sizes = rng.integers(700, 900, 300)  # 59.94p에서 800 샘플 안팎
+    x = rng.uniform(-1, 1, (2, int(sizes.sum())))
+
+    whole = KWeightingFilter(SAMPLE_RATE).process(x)
+    kfilter = KWeightingFilter(SAMPLE_RATE)
+    pieces, start = [], 0
+    begin = time.perf_counter()
+    for size in sizes:
+        pieces.append(kfilter.process(x[:, start:start + size]))
+        start += size
+    varying = time.perf_counter() - begin
+    assert np.abs(np.concatenate(pieces, axis=1) - whole).max() < 1e-9
+
+    fixed_filter = KWeightingFilter(SAMPLE_RATE)
+    fixed_filter.process(x[:, :800])
+    begin = time.perf_counter()
+    for index in range(len(sizes)):
+        fixed_filter.process(x[:, index * 800:(index + 1) * 800])
+    fixed = time.perf_counter() - begin
+    assert varying < fixed * 3 + 0.05, (varying, fixed)
+    for stage in kfilter.stages:
+        assert len(stage._h_ffts) <= stage.FFT_CACHE_SIZE and len(stage._rows) <= 2048
+    print(f"✅ 300 blocks of varying length: {varying * 1000:.0f} ms (fixed 800: {fixed * 1000:.0f} ms)")
+
+
+def benchmark_stereo_48k():
+    """스테레오 48 kHz 실시간 대비 CPU 사용률"""
+    meter = LoudnessMeter()
+    audio = np.random.uniform(-0.5, 0.5, (2, FRAME)).astype(np.float32)
+    meter.process(audio, SAMPLE_RATE)
+    iterations = 600
+    start = time.perf_counter()
+    for _ in range(iterations):
+        meter.process(audio, SAMPLE_RATE)
+    elapsed = time.perf_counter() - start
+    audio_seconds = iterations * FRAME / SAMPLE_RATE
+    print(f"📊 stereo 48 kHz: {elapsed / iterations * 1000:.3f} ms/frame, "
+          f"{elapsed / audio_seconds * 100:.2f}% of one core")
+
+
+if __name__ == "__main__":
+    test_coefficients_48k()
+    test_block_filter_matches_reference()
+    test_variable_block_lengths()
+    test_sine_calibration()
+    test_gating()
+    benchmark_stereo_48k()
+    print("\nAll loudness tests passed!")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Test script for multiview layout, compositor and CPU budget"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QImage, QColor
+
+from modules.ndi_module.cpu_budget import CpuBudget
+from modules.ndi_module.multiview_widget import MultiviewWidget, grid_dimensions, tile_rects
+
+
+def test_grid_layout():
+    """4/9/16 타일은 2x2/3x3/4x4, 모든 타일은 16:9이고 겹치지 않음"""
+    assert grid_dimensions(4) == (2, 2)
+    assert grid_dimensions(9) == (3, 3)
+    assert grid_dimensions(16) == (4, 4)
+    for count in (4, 9, 16):
+        rects = tile_rects(1920, 1080, count)
+        for x, y, w, h in rects:
+            assert abs(w / h - 16 / 9) < 0.02
+            assert 0 <= x and x + w <= 1920 and 0 <= y and y + h <= 1080
+        for i, (x, y, w, h) in enumerate(rects):
+            for ox, oy, ow, oh in rects[i + 1:]:
+                assert x + w <= ox or ox + ow <= x or y + h <= oy or oy + oh <= y
+    print("✅ grid layout (2x2/3x3/4x4, 16:9 tiles)")
+
+
+def test_cpu_budget_steps():
+    """포화 시 한 단계씩 낮추고, 여유가 hold_samples번 이어지면 한 단계 복귀"""
+    usage = [0.9]
+    budget = CpuBudget(budget=0.75, hold_samples=3, usage_source=lambda: usage[0])
+    assert budget.fps == 30
+    assert budget.update() == 25
+    assert budget.update() == 15
+    for _ in range(10):
+        budget.update()
+    assert budget.fps == 5  # 최저 단계에서 멈춤
+
+    usage[0] = 0.6  # 예산 안이지만 복귀 기준(0.525) 위 - 유지
+    for _ in range(5):
+        assert budget.update() == 5
+    usage[0] = 0.3
+    assert [budget.update() for _ in range(6)] == [5, 5, 10, 10, 10, 15]
+    print(f"✅ CPU budget steps ({budget.get_stats()})")
+
+
+def test_compositor_paints_tiles_and_tally():
+    """단일 paintEvent로 타일 이미지 + 타일별 tally 테두리"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    widget = MultiviewWidget()
+    sizes = []
+    widget.tile_size_changed.connect(lambda w, h: sizes.append((w, h)))
+    widget.resize(1280, 720)
+    widget.set_sources(["CAM 1", "CAM 2", "CAM 3"])
+    widget.show()
+    app.processEvents()
+    assert widget.tile_count == 4 and sizes, sizes
+
+    tile_w, tile_h = sizes[-1]
+    image = QImage(tile_w, tile_h, QImage.Format.Format_RGB32)
+    image.fill(QColor(0, 0, 255))
+    widget.update_tile(0, image)
+    widget.set_tally_states({"CAM 1": "PGM", "CAM 2": "PVW"})
+
+    out = QImage(1280, 720, QImage.Format.Format_RGB32)
+    widget.render(out)
+    first, second = widget._rects[0], widget._rects[1]
+    assert out.pixelColor(first.center()).getRgb()[:3] == (0, 0, 255)
+    assert out.pixelColor(first.x() + 3, first.y() + 3).getRgb()[:3] == (255, 55, 55)
+    assert out.pixelColor(second.x() + 3, second.y() + 3).getRgb()[:3] == (0, 255, 55)
+    closed = []
+    widget.closed.connect(lambda: closed.append(True))
+    widget.close()
+    assert closed  # 별도 창을 닫으면 엔진 중지를 위해 알림
+    print(f"✅ compositor tiles + tally borders (tile {tile_w}x{tile_h})")
+
+
+if __name__ == "__main__":
+    test_grid_layout()
+    test_cpu_budget_steps()
+    test_compositor_paints_tiles_and_tally()
+    print("\nAll multiview tests passed!")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Test script for event-driven NDI discovery (fake NDIlib finder)"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt6.QtCore import QCoreApplication
+
+from modules.ndi_module.ndi_discovery import FinderAPI, NDIDiscoveryWorker, diff_sources
+from modules.ndi_module.ndi_manager import NDIManager
+from modules.ndi_module.source_cache import SourceCache
+
+
+class FakeFinderLib:
+    """find_wait_for_sources 흉내 - 목록이 바뀌면 즉시, 아니면 타임아웃 후 False"""
+
+    def __init__(self):
+        self.sources = []
+        self.changed = threading.Event()
+        self.get_calls = 0
+        self.wait_calls = 0
+
+    def set_sources(self, *entries):
+        self.sources = [SimpleNamespace(ndi_name=name, url_address=address) for name, address in entries]
+        self.changed.set()
+
+    def find_create_v2(self):
+        return "finder"
+
+    def find_wait_for_sources(self, finder, timeout_ms):
+        self.wait_calls += 1
+        changed = self.changed.wait(timeout_ms / 1000.0)
+        self.changed.clear()
+        return changed
+
+    def find_get_current_sources(self, finder):
+        self.get_calls += 1
+        return list(self.sources)
+
+
+def test_diff_sources():
+    added, removed, changed = diff_sources({"A": "1", "B": "2"}, {"B": "3", "C": "4"})
+    assert (added, removed, changed) == (["C"], ["A"], ["B"])
+    assert diff_sources({"A": "1"}, {"A": "1"}) == ([], [], [])
+    print("✅ diff_sources added/removed/changed")
+
+
+def test_finder_api_resolved_once():
+    lib = FakeFinderLib()
+    api = FinderAPI(lib)
+    assert api.create == lib.find_create_v2 and api.wait == lib.find_wait_for_sources
+    assert api.destroy is None
+    assert api.describe(SimpleNamespace(ndi_name="CAM 1", url_address="10.0.0.1:5961")) == ("CAM 1", "10.0.0.1:5961")
+    assert api._name_attr == "ndi_name" and api._address_attr == "url_address"
+    print("✅ finder API resolved once (ndi_name/url_address)")
+
+
+def test_worker_emits_deltas_only_on_change():
+    """목록이 바뀔 때만 깨어나 읽고 변경분만 보냄 - 유휴 시 목록을 읽지 않음"""
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    lib = FakeFinderLib()
+    worker = NDIDiscoveryWorker(FinderAPI(lib), "finder", wait_timeout_ms=50)
+    deltas = []
+    worker.sources_changed.connect(lambda added, removed, changed: deltas.append(
+        ([a[0] for a in added], removed, [c[0] for c in changed])))
+
+    def pump(seconds):
+        end = time.time() + seconds
+        while time.time() < end:
+            app.processEvents()
+            time.sleep(0.01)
+
+    worker.start()
+    lib.set_sources(("CAM 1", "10.0.0.1:5961"), ("CAM 2", "10.0.0.2:5961"))
+    pump(0.3)
+    idle_gets = lib.get_calls
+    pump(0.5)  # 변경 없음 - 타임아웃으로만 깨어남
+    assert lib.get_calls == idle_gets, "유휴 중에는 소스 목록을 다시 읽지 않음"
+
+    lib.set_sources(("CAM 2", "10.0.0.9:5961"), ("CAM 3", "10.0.0.3:5961"))
+    pump(0.3)
+    lib.set_sources(("CAM 2", "10.0.0.9:5961"), ("CAM 3", "10.0.0.3:5961"))  # 같은 목록 다시 알림
+    pump(0.3)
+    worker.stop()
+    assert worker.wait(2000)
+
+    assert deltas == [(["CAM 1", "CAM 2"], [], []), (["CAM 3"], ["CAM 1"], ["CAM 2"])], deltas
+    print(f"✅ worker deltas only on change ({lib.get_calls} list reads, {lib.wait_calls} waits)")
+
+
+def test_worker_destroys_finder_after_last_wait():
+    """finder는 검색 스레드가 대기를 마친 뒤 스스로 해제 - 대기 중에 해제되지 않음"""
+
+    class DestroyingFinderLib(FakeFinderLib):
+        def __init__(self):
+            super().__init__()
+            self.waiting = False
+            self.destroyed = []
+
+        def find_wait_for_sources(self, finder, timeout_ms):
+            self.waiting = True
+            try:
+                return super().find_wait_for_sources(finder, timeout_ms)
+            finally:
+                self.waiting = False
+
+        def find_destroy(self, finder):
+            self.destroyed.append((finder, self.waiting, threading.current_thread() is not threading.main_thread()))
+
+    lib = DestroyingFinderLib()
+    worker = NDIDiscoveryWorker(FinderAPI(lib), "finder", wait_timeout_ms=200)
+    worker.start()
+    time.sleep(0.05)
+    worker.stop()
+    assert lib.destroyed == []  # 아직 대기 중 - 호출한 쪽에서 해제하면 안 됨
+    assert worker.wait(2000)
+    assert lib.destroyed == [("finder", False, True)] and worker.finder is None, lib.destroyed
+    print("✅ worker destroys its finder after the last wait")
+
+
+def test_manager_publishes_only_real_changes():
+    """같은 목록이면 sources_updated를 다시 보내지 않음 (위젯 재구성 없음)"""
+    manager = NDIManager(source_cache=SourceCache(os.path.join(tempfile.mkdtemp(), "ndi_sources.json")))
+    manager.discovery_settled = True
+    emitted = []
+    manager.sources_updated.connect(lambda sources: emitted.append([s['name'] for s in sources]))
+    manager._on_sources_changed([("CAM 1", "10.0.0.1:5961", object())], [], [])
+    manager._on_sources_changed([], [], [])
+    manager._on_sources_changed([], [], [("CAM 1", "10.0.0.2:5961", object())])
+    manager._on_sources_changed([], ["CAM 1"], [])
+    assert emitted == [["CAM 1"], ["CAM 1"], []], emitted
+    print("✅ manager publishes only real changes")
+
+
+if __name__ == "__main__":
+    test_diff_sources()
+    test_finder_api_resolved_once()
+    test_worker_emits_deltas_only_on_change()
+    test_worker_destroys_finder_after_last_wait()
+    test_manager_publishes_only_real_changes()
+    print("\nAll NDI discovery tests passed!")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Test script for NDI capture trace recording and replay (no network / SDK needed)"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from modules.ndi_module.ndi_trace import (FRAME_TYPE_AUDIO, FRAME_TYPE_NONE, FRAME_TYPE_VIDEO,
+                                          NDIReplayBackend, NDITraceReader, NDITraceRecorder)
+from modules.ndi_module.source_cache import SourceCache
+from modules.ndi_module import ndi_manager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def video_frame(index, width=64, height=36, uyvy=False):
+    channels = 2 if uyvy else 4
+    data = np.full((height, width, channels), index % 256, dtype=np.uint8)
+    return SimpleNamespace(data=data, xres=width, yres=height, FourCC=0x59565955 if uyvy else 0x41524742,
+                           line_stride_in_bytes=width * channels, frame_rate_N=60000, frame_rate_D=1001,
+                           timestamp=index * 166833, timecode=index * 166833)
+
+
+def audio_frame(index, samples=800):
+    data = np.full((2, samples), index / 1000.0, dtype=np.float32)
+    return SimpleNamespace(data=data, sample_rate=48000, no_channels=2, no_samples=samples,
+                           channel_stride_in_bytes=samples * 4, timestamp=index * 166833, timecode=0)
+
+
+def record_trace(path, frames=30):
+    """60p 비디오 + 프레임마다 오디오 한 블록 (수신 시각은 가짜 시계)"""
+    clock = FakeClock()
+    recorder = NDITraceRecorder(path, initial_capacity=4096, clock=clock)  # 작게 시작 - 파일 확장 경로 확인
+    for index in range(frames):
+        clock.now = index / 59.94
+        assert recorder.record(FRAME_TYPE_VIDEO, video_frame(index, uyvy=index % 2 == 1))
+        clock.now += 0.002
+        assert recorder.record(FRAME_TYPE_AUDIO, audio_frame(index))
+    assert not recorder.record(FRAME_TYPE_NONE, None)
+    recorder.close()
+    return recorder
+
+
+def test_record_and_read_back():
+    path = os.path.join(tempfile.mkdtemp(), "trace.rftrace")
+    recorder = record_trace(path)
+    assert recorder.frames_recorded == 60
+
+    reader = NDITraceReader(path)
+    assert len(reader) == 60 and reader.count(FRAME_TYPE_VIDEO) == 30
+    video, audio, uyvy = reader[0], reader[1], reader[2]
+    assert video.data.shape == (36, 64, 4) and video.data.dtype == np.uint8 and video.FourCC == 0x41524742
+    assert uyvy.data.shape == (36, 64, 2) and uyvy.line_stride_in_bytes == 128
+    assert np.all(reader[4].data == 2) and reader[4].timestamp == 2 * 166833
+    assert audio.data.shape == (2, 800) and audio.data.dtype == np.float32 and audio.sample_rate == 48000
+    assert abs(reader[58].received_at - 29 / 59.94) < 1e-9
+    assert video.data.ctypes.data % 64 == 0 and not video.data.flags.writeable  # 정렬된 mmap 뷰
+    reader.close()
+    print(f"✅ trace round trip ({os.path.getsize(path)} bytes, {len(recorder._records)} records)")
+
+
+def test_size_limit_stops_recording():
+    path = os.path.join(tempfile.mkdtemp(), "trace.rftrace")
+    recorder = NDITraceRecorder(path, max_bytes=20000)
+    recorded = sum(recorder.record(FRAME_TYPE_VIDEO, video_frame(i)) for i in range(10))
+    recorder.close()
+    assert recorded == 2 and recorder.frames_dropped == 8
+    assert len(NDITraceReader(path)) == 2
+    print("✅ size limit stops recording, trace stays readable")
+
+
+def test_replay_original_and_accelerated_timing():
+    """원래 간격대로 / 4배속 / 대기 없이 - recv_capture_v2는 타임아웃 안에 올 프레임만 반환"""
+    path = os.path.join(tempfile.mkdtemp(), "trace.rftrace")
+    record_trace(path)
+    for speed, expected in ((1.0, 29 / 59.94 + 0.002), (4.0, (29 / 59.94 + 0.002) / 4), (0.0, 0.0)):
+        clock = FakeClock()
+        backend = NDIReplayBackend(path, speed=speed, loop=False, clock=clock, sleep=clock.sleep)
+        receiver = backend.recv_create_v3(backend.RecvCreateV3())
+        backend.recv_connect(receiver, backend.find_get_current_sources(backend.find_create_v2())[0])
+        types = []
+        while True:
+            frame_type, v_frame, a_frame, _ = backend.recv_capture_v2(receiver, 50)
+            if frame_type == FRAME_TYPE_NONE:
+                break
+            types.append(frame_type)
+            frame = v_frame if frame_type == FRAME_TYPE_VIDEO else a_frame
+            backend.recv_free_video_v2(receiver, frame)
+        assert types == [FRAME_TYPE_VIDEO, FRAME_TYPE_AUDIO] * 30
+        assert abs(clock.now - 0.05 - expected) < 1e-6, (speed, clock.now)  # 마지막 NONE 대기 50ms 제외
+        backend.close()
+    print("✅ replay at original, 4x and unpaced timing")
+
+
+def test_replay_loop_keeps_timestamps_increasing():
+    path = os.path.join(tempfile.mkdtemp(), "trace.rftrace")
+    record_trace(path, frames=10)
+    clock = FakeClock()
+    backend = NDIReplayBackend(path, speed=0.0, loop=True, clock=clock, sleep=clock.sleep)
+    receiver = backend.recv_create_v3()
+    backend.recv_connect(receiver, backend.source)
+    timestamps = []
+    for _ in range(60):
+        frame_type, v_frame, _, _ = backend.recv_capture_v2(receiver, 100)
+        if frame_type == FRAME_TYPE_VIDEO:
+            timestamps.append(v_frame.timestamp)
+    assert len(timestamps) == 30
+    assert all(b - a == 166833 for a, b in zip(timestamps, timestamps[1:])), timestamps
+    print("✅ looped replay keeps source timestamps monotonic")
+
+
+def test_manager_discovers_replay_source():
+    """NDIManager가 NDIlib 대신 재생 백엔드를 쓰면 트레이스 소스 하나가 보임"""
+    path = os.path.join(tempfile.mkdtemp(), "studio_cam.rftrace")
+    record_trace(path, frames=2)
+    backend = NDIReplayBackend(path)
+    saved = ndi_manager.ndi, ndi_manager.NDI_AVAILABLE
+    ndi_manager.ndi, ndi_manager.NDI_AVAILABLE = backend, True
+    try:
+        manager = ndi_manager.NDIManager(source_cache=SourceCache(os.path.join(tempfile.mkdtemp(), "sources.json")))
+        assert manager.initialize()
+        api = manager.finder_api
+        sources = api.get_sources(api.create())
+        assert [api.describe(source) for source in sources] == [("REPLAY (studio_cam)", backend.source.url_address)]
+    finally:
+        ndi_manager.ndi, ndi_manager.NDI_AVAILABLE = saved
+        backend.close()
+    print("✅ manager discovers the replay source")
+
+
+if __name__ == "__main__":
+    test_record_and_read_back()
+    test_size_limit_stops_recording()
+    test_replay_original_and_accelerated_timing()
+    test_replay_loop_keeps_timestamps_increasing()
+    test_manager_discovers_replay_source()
+    print("\nAll NDI trace tests passed!")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Test script for cached overlay layers (offscreen paint timing)"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QImage, QColor
+from PyQt6.QtCore import QRect
+
+from modules.ndi_module.overlay_cache import OverlayLayer, outline_regions
+from ui.classic_mode.components.video_display import SingleChannelVideoDisplay
+
+
+def make_display():
+    display = SingleChannelVideoDisplay()
+    display.resize(1280, 720)
+    frame = QImage(1280, 720, QImage.Format.Format_RGB32)
+    frame.fill(QColor(40, 80, 120))
+    display.update_frame(frame)
+    display.set_source("CAM 1")
+    display.set_connected(True)
+    display.update_frame(frame)
+    display.update_frame_info({'resolution': '1920x1080', 'fps': 59.94, 'throughput': '1.99 Gbps',
+                               'audio_level': -18.0, 'loudness': {'momentary': -23.0, 'integrated': -23.5}})
+    display.show_safe_areas = True
+    display.set_tally_state("PGM")
+    return display
+
+
+def paint_time_ms(display, target, frames=300):
+    levels = [np.full((2, 4), -12.0 - i) for i in range(20)]
+    for _ in range(20):
+        display.render(target)
+    start = time.perf_counter()
+    for i in range(frames):
+        display.update_audio_levels(levels[i % 20])  # 미터 바는 매 프레임 바뀜
+        display.render(target)
+    return (time.perf_counter() - start) / frames * 1000.0
+
+
+def test_layer_renders_only_on_change():
+    app = QApplication.instance() or QApplication(sys.argv)
+    calls = []
+    layer = OverlayLayer(lambda painter, width, height: calls.append((width, height)))
+    first = layer.get(200, 40, 1.0, "A")
+    assert layer.get(200, 40, 1.0, "A") is first
+    layer.get(200, 40, 1.0, "B")      # 입력 변경
+    layer.get(300, 40, 1.0, "B")      # 크기 변경
+    layer.get(300, 40, 2.0, "B")      # DPR 변경
+    assert layer.pixmap.width() == 600 and layer.pixmap.devicePixelRatio() == 2.0
+    assert layer.get(0, 40, 1.0, "B") is None
+    assert calls == [(200, 40), (200, 40), (300, 40), (300, 40)] and layer.renders == 4
+    print("✅ layer re-renders only on key/size/DPR change")
+
+
+def test_outline_regions_do_not_overlap():
+    regions = outline_regions(640, 360, 32, 18, 4)
+    assert len(regions) == 4
+    for i, a in enumerate(regions):
+        for b in regions[i + 1:]:
+            assert not a.intersects(b), (a, b)
+    assert sum(r.width() * r.height() for r in regions) == 2 * 576 * 4 + 2 * 4 * (324 - 8)
+    assert outline_regions(10, 10, 0, 0, 9) == [QRect(0, 0, 10, 10)]
+    print("✅ outline regions cover the border once")
+
+
+def test_display_reuses_layers_across_frames():
+    """미터 레벨만 바뀌는 프레임에서는 어떤 레이어도 다시 그리지 않음"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = make_display()
+    target = QImage(1280, 720, QImage.Format.Format_ARGB32_Premultiplied)
+    paint_time_ms(display, target, frames=30)
+    layers = {name: getattr(display, name) for name in
+              ('_safe_area_layer', '_info_layer', '_audio_text_layer', '_meter_scale_layer',
+               '_meter_border_layer', '_tally_layer')}
+    assert all(layer.renders == 1 for layer in layers.values()), {n: l.renders for n, l in layers.items()}
+
+    display.update_frame_info({'audio_level': -12.5})
+    display.render(target)
+    assert layers['_audio_text_layer'].renders == 2 and layers['_info_layer'].renders == 1
+
+    display.resize(960, 540)
+    display.render(target)
+    assert layers['_safe_area_layer'].renders == 2 and layers['_meter_scale_layer'].renders == 2
+    print("✅ static layers rendered once per size, text layers once per text change")
+
+
+def test_meter_repaints_without_video_frames():
+    """정지 화면/스로틀 프리뷰 - 미터는 비디오 프레임 없이 미터 영역만 다시 그림"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = make_display()
+    requested = []
+    display.update = lambda *args: requested.append(args)
+
+    display.update_audio_levels(np.full((8, 4), -20.0))
+    assert len(requested) == 1 and len(requested[0]) == 1, requested
+    meter_area = requested[0][0]
+    assert display.rect().contains(meter_area) and meter_area.width() < display.width() // 4
+
+    display.set_connected(False)
+    requested.clear()
+    display.update_audio_levels(np.full((8, 4), -20.0))
+    assert requested == []  # 연결이 없으면 미터를 그리지 않음
+    print("✅ meter repaints its own area at the audio publish rate")
+
+
+def test_info_strip_repaints_without_video_frames():
+    """기술 정보는 타이머로 갱신 - 하단 정보 띠만 다시 그림"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = make_display()
+    requested = []
+    display.update = lambda *args: requested.append(args)
+
+    display.update_frame_info({'throughput': '1.50 Gbps', 'loudness': {'momentary': -20.0}})
+    assert len(requested) == 1 and len(requested[0]) == 1, requested
+    info_area = requested[0][0]
+    assert info_area.height() == 40 and info_area.bottom() < display.height()
+    assert display._info_texts()[0].endswith("1.50 Gbps decoded")
+    print("✅ technical info strip repaints without video frames")
+
+
+def test_paint_time():
+    """캐시 레이어 블릿 vs 매 프레임 오버레이를 다시 그리는 경우 (1280x720, 모든 오버레이)"""
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = make_display()
+    target = QImage(1280, 720, QImage.Format.Format_ARGB32_Premultiplied)
+    cached = paint_time_ms(display, target)
+
+    layers = [value for value in vars(display).values() if isinstance(value, OverlayLayer)]
+    original_get = OverlayLayer.get
+
+    def uncached_get(self, *args, **kwargs):
+        self.invalidate()
+        return original_get(self, *args, **kwargs)
+
+    OverlayLayer.get = uncached_get
+    try:
+        redrawn = paint_time_ms(display, target)
+    finally:
+        OverlayLayer.get = original_get
+    assert len(layers) == 10 and display._streaming_banner_layer in layers  # 스로틀 프리뷰 띠 포함
+    assert cached < redrawn, (cached, redrawn)
+    print(f"✅ paint time: cached layers {cached:.2f} ms/frame, re-rendered every frame {redrawn:.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    test_layer_renders_only_on_change()
+    test_outline_regions_do_not_overlap()
+    test_display_reuses_layers_across_frames()
+    test_meter_repaints_without_video_frames()
+    test_info_strip_repaints_without_video_frames()
+    test_paint_time()
+    print("\nAll overlay cache tests passed!")
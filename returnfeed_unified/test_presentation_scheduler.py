@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Test script for the presentation scheduler (simulated source and timer clock)"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.presentation_scheduler import PresentationScheduler
+
+
+def simulate(source_fps, fixed_timer_ms=None, seconds=60, seed=1):
+    """소스 프레임 도착 (0~4ms 지터) + 타이머 기상 지연 (0~2ms) 시뮬레이션 - (반복, 스킵, 스케줄러)
+
+    fixed_timer_ms가 있으면 기존 고정 간격 QTimer, 없으면 스케줄러 데드라인으로 틱.
+    """
+    rnd = random.Random(seed)
+    interval = 1.0 / source_fps
+    arrivals = [k * interval + rnd.uniform(0, 0.004) for k in range(int(seconds * source_fps) + 2)]
+    clock = [0.0]
+    scheduler = PresentationScheduler(display_hz=60.0, clock=lambda: clock[0])
+    shown = arrived = 0
+    repeats = skips = 0
+    while clock[0] < seconds:
+        if fixed_timer_ms is not None:
+            clock[0] += fixed_timer_ms / 1000.0 + rnd.uniform(0, 0.002)
+        else:
+            clock[0] += scheduler.next_timeout_ms() / 1000.0 + rnd.uniform(0, 0.002)
+        while arrived < len(arrivals) and arrivals[arrived] <= clock[0]:
+            arrived += 1
+        new_frame = arrived > shown
+        skipped = arrived - shown - 1 if new_frame else 0
+        if clock[0] > 1.0:  # 케이던스 측정 구간 제외
+            repeats += 0 if new_frame else 1
+            skips += skipped
+        if new_frame:
+            scheduler.on_tick(True, skipped, frame_time=arrivals[arrived - 1],
+                              source_timestamp=int((arrived - 1) * interval * 1e7))
+        else:
+            scheduler.on_tick(False)
+        shown = arrived
+    return repeats, skips, scheduler
+
+
+def test_fixed_16ms_timer_beats_against_59_94():
+    """기존 16ms 고정 타이머는 59.94/60 소스에서 주기적으로 반복/스킵"""
+    repeats, skips, _ = simulate(59.94, fixed_timer_ms=16)
+    assert repeats > 50 and skips > 50, (repeats, skips)
+    print(f"✅ fixed 16ms timer @59.94: {repeats} repeats, {skips} skips per minute")
+
+
+def test_scheduler_locks_to_source_cadence():
+    """데드라인 보정 + 위상 고정으로 반복/스킵 없음 (59.94/60/50/29.97)"""
+    for fps in (59.94, 60.0, 50.0, 29.97):
+        repeats, skips, scheduler = simulate(fps)
+        assert (repeats, skips) == (0, 0), (fps, repeats, skips)
+        assert abs(scheduler.get_stats()['source_fps'] - fps) < 0.05, scheduler.get_stats()
+        assert abs(scheduler.tick_interval - 1.0 / fps) < 1e-4
+    print("✅ scheduler: 0 repeats / 0 skips at 59.94, 60, 50, 29.97 fps")
+
+
+def test_deadline_does_not_accumulate_timer_error():
+    """타이머가 매번 늦게 울려도 데드라인은 이전 데드라인 기준 - 60초 후에도 틱 수 유지"""
+    clock = [0.0]
+    scheduler = PresentationScheduler(display_hz=60.0, clock=lambda: clock[0])
+    ticks = 0
+    while clock[0] < 60.0:
+        clock[0] += scheduler.next_timeout_ms() / 1000.0 + 0.0008  # 매번 0.8ms 늦게 기상
+        scheduler.on_tick(False)
+        ticks += 1
+    assert abs(ticks - 3600) <= 1, ticks
+    print(f"✅ drift-corrected deadline ({ticks} ticks in 60s at 60Hz)")
+
+
+def test_report_histogram_and_resync():
+    clock = [0.0]
+    scheduler = PresentationScheduler(display_hz=60.0, clock=lambda: clock[0])
+    for jitter in (0.0002, 0.0007, 0.0015, 0.003, 0.006):
+        clock[0] += scheduler.next_timeout_ms() / 1000.0 + jitter
+        scheduler.on_tick(True, frame_time=clock[0])
+    clock[0] += 0.5  # GUI 정지 - 밀린 틱을 몰아서 울리지 않고 재동기
+    scheduler.on_tick(True, frame_time=clock[0])
+    report = scheduler.take_report()
+    assert list(report['histogram'].values()) == [1, 1, 1, 1, 1, 1], report['histogram']
+    assert report['jitter_max_ms'] > 400
+    assert scheduler.get_stats()['resyncs'] == 1
+    assert scheduler.take_report()['ticks'] == 0  # 보고 후 구간 초기화
+    print(f"✅ jitter histogram + resync ({report['histogram']})")
+
+
+if __name__ == "__main__":
+    test_fixed_16ms_timer_beats_against_59_94()
+    test_scheduler_locks_to_source_cadence()
+    test_deadline_does_not_accumulate_timer_error()
+    test_report_histogram_and_resync()
+    print("\nAll presentation scheduler tests passed!")
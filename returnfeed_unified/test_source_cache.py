@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test script for the persistent NDI source cache and cached-first discovery"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from PyQt6.QtCore import QCoreApplication
+
+from modules.ndi_module.source_cache import DEFAULT_CACHE_FILE, SourceCache
+from modules.ndi_module.ndi_manager import NDIManager
+
+DAY = 86400.0
+
+
+def test_cache_roundtrip_and_dirty_tracking():
+    """이름/주소/last_seen/last_used 저장 후 복원, 주소가 같으면 스캔마다 다시 쓰지 않음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "config", "ndi_sources.json")
+        cache = SourceCache(path)
+        cache.record_seen([("CAM 1", "192.168.0.10:5961"), ("CAM 2", "192.168.0.11:5961")], now=1000.0)
+        cache.mark_used("CAM 2", now=1000.0)
+        assert cache.save()
+
+        cache.record_seen([("CAM 1", "192.168.0.10:5961")], now=1002.0)
+        assert not cache.save(), "last_seen만 바뀌면 저장하지 않음"
+        cache.record_seen([("CAM 1", "192.168.0.20:5961")], now=1004.0)
+        assert cache.save(), "주소가 바뀌면 저장"
+
+        loaded = SourceCache(path)
+        assert loaded.load()
+        assert loaded.last_used == "CAM 2"
+        assert loaded.get_address("CAM 1") == "192.168.0.20:5961"
+        assert [s['name'] for s in loaded.get_sources()] == ["CAM 1", "CAM 2"]  # 최근에 본 순서
+        assert not os.path.exists(path + ".tmp")
+    print("✅ cache roundtrip + save only on change")
+
+
+def test_reconcile_keeps_recent_and_drops_stale():
+    """라이브 검색에 없는 소스는 max_age를 넘었을 때만 제거"""
+    cache = SourceCache(os.devnull, max_age_days=30)
+    cache.record_seen([("OLD", "10.0.0.1:5961")], now=0.0)
+    cache.record_seen([("NIGHT", "10.0.0.2:5961")], now=40 * DAY)
+    cache.record_seen([("LIVE", "10.0.0.3:5961")], now=40 * DAY)
+    removed = cache.reconcile(["LIVE"], now=45 * DAY)
+    assert removed == ["OLD"], removed
+    assert set(cache.entries) == {"NIGHT", "LIVE"}
+    print("✅ reconcile drops stale entries only")
+
+
+def test_corrupt_cache_is_ignored():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ndi_sources.json")
+        with open(path, 'w') as f:
+            f.write("{not json")
+        cache = SourceCache(path)
+        assert not cache.load()
+        assert cache.entries == {} and cache.last_used is None
+    print("✅ corrupt cache falls back to empty")
+
+
+def test_default_path_is_app_config_dir():
+    """기본 캐시 파일은 실행 위치가 아니라 앱 config 디렉터리 기준"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    assert DEFAULT_CACHE_FILE == os.path.join(app_dir, "config", "ndi_sources.json"), DEFAULT_CACHE_FILE
+    assert SourceCache().path == DEFAULT_CACHE_FILE
+    print("✅ default cache path resolves to the app config dir")
+
+
+def test_manager_shows_cached_list_until_discovery_settles():
+    """시작 즉시 캐시 목록 -> 검색 중에는 캐시 유지 -> 안정 후 라이브 목록만"""
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ndi_sources.json")
+        seed = SourceCache(path)
+        seed.mark_used("CAM 1", "192.168.0.10:5961")
+        seed.save()
+
+        manager = NDIManager(source_cache=SourceCache(path))
+        emitted = []
+        manager.sources_updated.connect(lambda sources: emitted.append([s['name'] for s in sources]))
+
+        assert manager.load_cached_sources() == [{'name': "CAM 1", 'address': "192.168.0.10:5961"}]
+        assert emitted == [["CAM 1"]]
+        assert manager.get_last_used_source() == "CAM 1"
+
+        manager._on_sources_changed([], [], [])  # 라이브 검색이 아직 아무것도 못 찾은 상태
+        assert emitted == [["CAM 1"]], "검색이 안정되기 전에는 캐시 소스 유지 (재발송 없음)"
+
+        manager._on_discovery_settled()
+        assert emitted[-1] == [], "안정 후에는 라이브 목록만"
+        assert "CAM 1" in manager.source_cache.entries, "최근 소스는 캐시에 남음"
+    print(f"✅ manager cached-first discovery ({emitted})")
+
+
+if __name__ == "__main__":
+    test_cache_roundtrip_and_dirty_tracking()
+    test_reconcile_keeps_recent_and_drops_stale()
+    test_corrupt_cache_is_ignored()
+    test_default_path_is_app_config_dir()
+    test_manager_shows_cached_list_until_discovery_settles()
+    print("\nAll source cache tests passed!")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Test script for per-stage preview pipeline latency histograms"""
+
+import os
+import sys
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QImage, QColor
+
+from modules.ndi_module.stage_timing import (NUM_BUCKETS, STAGES, PipelineTimings, StageHistogram,
+                                             bucket_bounds, bucket_index)
+from ui.classic_mode.components.video_display import SingleChannelVideoDisplay
+
+
+def test_buckets_cover_values():
+    """모든 값이 자기 버킷 범위 안에 있고 버킷 폭은 값의 12.5% 이하"""
+    rng = np.random.default_rng(1)
+    values = list(range(200)) + [int(v) for v in rng.integers(1, 1 << 40, 5000)] + [(1 << 62) + 5]
+    for value in values:
+        index = bucket_index(value)
+        low, high = bucket_bounds(index)
+        assert index < NUM_BUCKETS and low <= value < high, (value, index, low, high)
+        assert high - low <= max(1, low / 8), (value, low, high)
+    assert [bucket_index(v) for v in range(32)] == sorted(bucket_index(v) for v in range(32))
+    print("✅ log buckets cover every value within 12.5%")
+
+
+def test_percentiles():
+    histogram = StageHistogram()
+    samples = np.random.default_rng(2).exponential(2e6, 20000).astype(np.int64)  # 평균 2ms
+    for ns in samples:
+        histogram.record(int(ns))
+    p50, p95, p99 = histogram.percentiles()
+    for estimate, q in ((p50, 50), (p95, 95), (p99, 99)):
+        exact = np.percentile(samples, q)
+        assert abs(estimate - exact) / exact < 0.07, (q, estimate, exact)
+    summary = histogram.summary()
+    assert summary['count'] == 20000 and abs(summary['mean_ms'] - samples.mean() / 1e6) < 1e-9
+    assert summary['max_ms'] == samples.max() / 1e6
+    print(f"✅ percentiles p50 {summary['p50_ms']:.2f} / p95 {summary['p95_ms']:.2f} / p99 {summary['p99_ms']:.2f} ms")
+
+
+def test_pipeline_stage_flow():
+    """수신 스레드 구간 -> 픽업 -> paint 한 번 = 프레임 한 장의 전 구간"""
+    timings = PipelineTimings(enabled=True)
+    ms = 1_000_000
+    timings.record_receiver(0, 2 * ms, 2 * ms + 50_000, 3 * ms, 3 * ms + 20_000)
+    frame = {'image': None, 'timing': (0, 3 * ms)}
+    timings.on_pickup(frame)
+    picked = timings._picked[1]
+    timings.on_paint(picked + 4 * ms, picked + 5 * ms)
+    timings.on_paint(picked + 20 * ms, picked + 21 * ms)  # 새 프레임 없는 다시 그리기 - paint만 기록
+    stats = timings.get_stats()
+    assert set(stats) == set(STAGES)
+    assert stats['paint']['count'] == 2 and stats['total']['count'] == 1
+    assert abs(stats['copy']['p50_ms'] - 2.0) < 0.2 and abs(stats['paint_wait']['p50_ms'] - 4.0) < 0.3
+    assert stats['total']['max_ms'] == (picked + 5 * ms) / 1e6
+    timings.enabled = False
+    timings.on_pickup({'timing': (0, 0)})
+    assert timings.get_stats()['mailbox']['count'] == 1
+    print("✅ receiver, pickup and paint stages link into a per-frame total")
+
+
+def test_reader_does_not_block_writer():
+    """기록 스레드 하나 + 읽는 스레드 - 잠금 없이 백분위 계산"""
+    histogram = StageHistogram()
+    done = threading.Event()
+
+    def writer():
+        for i in range(200000):
+            histogram.record(1000 + i % 5000)
+        done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    reads = 0
+    while not done.is_set():
+        histogram.percentiles()
+        reads += 1
+    thread.join()
+    assert histogram.count == 200000 and sum(histogram.counts) == 200000 and reads > 0
+    print(f"✅ {reads} concurrent percentile reads while recording 200k samples")
+
+
+def test_overhead_per_frame():
+    """프레임 한 장 계측 비용 (perf_counter_ns 6번 + 히스토그램 8개) - 16.7ms의 1% 미만"""
+    timings = PipelineTimings(enabled=True)
+    frames = 20000
+    start = time.perf_counter()
+    for _ in range(frames):
+        captured = time.perf_counter_ns()
+        copied = time.perf_counter_ns()
+        freed = time.perf_counter_ns()
+        built = time.perf_counter_ns()
+        frame = {'timing': (captured, time.perf_counter_ns())}
+        timings.record_receiver(captured, copied, freed, built, time.perf_counter_ns())
+        timings.on_pickup(frame)
+        painted = time.perf_counter_ns()
+        timings.on_paint(painted, time.perf_counter_ns())
+    per_frame_us = (time.perf_counter() - start) / frames * 1e6
+    assert per_frame_us < 166.7 / 10, per_frame_us  # 여유 10배
+    print(f"✅ instrumentation cost {per_frame_us:.2f} us/frame ({per_frame_us / 16667 * 100:.3f}% of a 60p frame)")
+
+
+def test_display_records_paint_and_overlay():
+    app = QApplication.instance() or QApplication(sys.argv)
+    display = SingleChannelVideoDisplay()
+    display.resize(1280, 720)
+    frame = QImage(1280, 720, QImage.Format.Format_RGB32)
+    frame.fill(QColor(40, 80, 120))
+    display.set_connected(True)
+    display.update_frame(frame)
+    target = QImage(1280, 720, QImage.Format.Format_ARGB32_Premultiplied)
+
+    timings = PipelineTimings()
+    display.stage_timings = timings
+    display.render(target)
+    assert timings.get_stats()['paint']['count'] == 0  # 꺼져 있으면 기록 안 함
+
+    display.toggle_stage_timings()  # 오버레이를 켜면 기록도 켜짐
+    assert timings.enabled
+    timings.on_pickup({'timing': (time.perf_counter_ns(), time.perf_counter_ns())})
+    for _ in range(5):
+        display.render(target)
+    stats = timings.get_stats()
+    assert stats['paint']['count'] == 5 and stats['total']['count'] == 1
+    assert display._stage_timing_layer.renders == 1  # 텍스트는 0.5초마다만 갱신
+    assert display._stage_timing_text.startswith("stage")
+    print(f"✅ display records paint time ({stats['paint']['p50_ms']:.2f} ms p50) and draws the overlay")
+
+
+if __name__ == "__main__":
+    test_buckets_cover_values()
+    test_percentiles()
+    test_pipeline_stage_flow()
+    test_reader_does_not_block_writer()
+    test_overhead_per_frame()
+    test_display_records_paint_and_overlay()
+    print("\nAll stage timing tests passed!")
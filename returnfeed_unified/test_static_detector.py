@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Test script for static-source detection (strided sample checksum) in the NDI receiver thread"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from modules.ndi_module.static_detector import StaticFrameDetector
+
+WIDTH, HEIGHT = 1920, 1080
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(detector, clock, frames, make_frame, fps=60.0):
+    """프레임마다 check() - 건너뛴 프레임 번호 목록"""
+    skipped = []
+    for index in range(frames):
+        clock.now += 1.0 / fps
+        if detector.check(make_frame(index)):
+            skipped.append(index)
+    return skipped
+
+
+def test_static_frames_are_skipped():
+    clock = FakeClock()
+    detector = StaticFrameDetector(clock=clock)
+    slate = np.random.default_rng(1).integers(0, 256, (HEIGHT, WIDTH, 4), dtype=np.uint8)
+    skipped = run(detector, clock, 600, lambda index: slate)
+    # 첫 프레임 + refresh_interval(0.5초)마다 한 장만 통과
+    assert len(skipped) == 600 - 20 and 0 not in skipped, len(skipped)
+    assert detector.static and abs(detector.skip_ratio - 580 / 600) < 1e-9
+    print(f"✅ static slate: {detector.skip_ratio:.1%} of frames skipped")
+
+
+def test_changing_frames_pass():
+    clock = FakeClock()
+    detector = StaticFrameDetector(clock=clock)
+    frame = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+
+    def moving(index):
+        frame[:, :, 0] = index % 256  # 모든 샘플 위치가 바뀜
+        return frame
+
+    assert run(detector, clock, 120, moving) == []
+    assert not detector.static and detector.skip_ratio == 0.0
+    print("✅ moving content is never skipped")
+
+
+def test_small_change_shows_within_refresh_interval():
+    """격자 사이 픽셀만 바뀌면 체크섬은 같지만 refresh_interval 안에 한 번은 통과"""
+    clock = FakeClock()
+    detector = StaticFrameDetector(clock=clock)
+    frame = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+    assert not detector.check(frame)
+    clock.now += 1 / 60
+    frame[3, 5] = 255  # 샘플 격자(8행 x 16열) 밖
+    assert detector.check(frame)
+    frame[8, 16] = 255  # 샘플 격자 위 - 바로 통과
+    assert not detector.check(frame)
+    passed_at = []
+    for index in range(90):
+        clock.now += 1 / 60
+        frame[3, 5] = index  # 격자 밖 변화가 계속됨
+        if not detector.check(frame):
+            passed_at.append(index)
+    assert len(passed_at) == 2 and 29 <= passed_at[1] - passed_at[0] <= 31, passed_at  # 0.5초 = 30프레임
+    print(f"✅ off-grid changes still reach the screen every {detector.refresh_interval}s")
+
+
+def test_format_change_and_reset():
+    clock = FakeClock()
+    detector = StaticFrameDetector(clock=clock)
+    uyvy = np.zeros((HEIGHT, WIDTH, 2), dtype=np.uint8)
+    bgra = np.zeros((HEIGHT, WIDTH, 4), dtype=np.uint8)
+    p216 = np.zeros(HEIGHT * WIDTH * 2, dtype=np.uint16)  # 1차원 버퍼도 처리
+    for data in (uyvy, bgra, p216):
+        assert not detector.check(data)  # 포맷이 바뀐 첫 프레임은 항상 통과
+        assert detector.check(data)
+    detector.reset()
+    assert not detector.check(p216) and detector.frames_checked == 1
+    assert detector.get_stats()['skip_ratio'] == 0.0
+    print("✅ resolution/format changes and reset restart the comparison")
+
+
+def test_check_is_an_order_of_magnitude_cheaper():
+    """1080p BGRA: 체크섬 vs 건너뛰지 않을 때 최소 비용인 프레임 복사 한 번"""
+    detector = StaticFrameDetector()
+    slate = np.random.default_rng(2).integers(0, 256, (HEIGHT, WIDTH, 4), dtype=np.uint8)
+    copy = np.empty_like(slate)
+    detector.check(slate)
+    runs = 50
+    start = time.perf_counter()
+    for _ in range(runs):
+        detector.check(slate, 0.0)
+    check_ms = (time.perf_counter() - start) / runs * 1000
+    start = time.perf_counter()
+    for _ in range(runs):
+        np.copyto(copy, slate)
+    copy_ms = (time.perf_counter() - start) / runs * 1000
+    assert check_ms * 10 < copy_ms, (check_ms, copy_ms)
+    print(f"✅ 1080p check {check_ms:.3f} ms vs copy {copy_ms:.2f} ms ({copy_ms / check_ms:.0f}x cheaper)")
+
+
+if __name__ == "__main__":
+    test_static_frames_are_skipped()
+    test_changing_frames_pass()
+    test_small_change_shows_within_refresh_interval()
+    test_format_change_and_reset()
+    test_check_is_an_order_of_magnitude_cheaper()
+    print("\nAll static detector tests passed!")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test script for the measured NDI decoded-throughput meter (simulated clock)"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.throughput_meter import ThroughputMeter, format_bitrate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_format_bitrate():
+    assert format_bitrate(3.98e9) == "3.98 Gbps"
+    assert format_bitrate(165.2e6) == "165.2 Mbps"
+    assert format_bitrate(1.536e6) == "1.5 Mbps"
+    assert format_bitrate(96e3) == "96 kbps"
+    print("✅ bitrate formatting")
+
+
+def test_measures_frame_bytes_once_per_second():
+    """1080p60 UYVY (3840 x 1080 바이트) + 48kHz 스테레오 float32 -> 실측 디코딩 처리량"""
+    clock = FakeClock()
+    meter = ThroughputMeter(window_seconds=5.0, clock=clock)
+    frame_bytes = 3840 * 1080
+    audio_bytes = 2 * 800 * 4  # 800 samples @ 60 audio frames/s
+    updates = 0
+    for frame in range(60 * 8):
+        clock.now = (frame + 1) / 60.0
+        meter.add_video(frame_bytes)
+        meter.add_audio(audio_bytes)
+        if meter.tick():
+            updates += 1
+    assert updates == 8, updates  # 프레임마다가 아니라 1초마다 갱신
+    expected_video = frame_bytes * 8 * 60
+    assert abs(meter.video_bps - expected_video) / expected_video < 0.01, meter.video_bps
+    assert abs(meter.audio_bps - 48000 * 2 * 32) / (48000 * 2 * 32) < 0.01, meter.audio_bps
+    assert abs(meter.frames_per_sec - 60) < 0.5
+    assert meter.throughput_text == "1.99 Gbps", meter.throughput_text
+    print(f"✅ measured throughput {meter.throughput_text} ({updates} updates in 8s)")
+
+
+def test_window_tracks_rate_change_and_sdk_counters():
+    """소스가 멈추면 윈도우가 지나면서 0으로 내려가고, SDK 드롭 카운터는 그대로 노출"""
+    clock = FakeClock()
+    meter = ThroughputMeter(window_seconds=3.0, clock=clock)
+    for second in range(1, 4):
+        meter.add_video(1_000_000)
+        clock.now = float(second)
+        meter.tick()
+    assert abs(meter.video_bps - 8e6) < 1
+    for second in range(4, 9):
+        clock.now = float(second)
+        meter.tick()
+    assert meter.video_bps == 0.0
+
+    meter.set_sdk_counters(total_video=1000, dropped_video=12, dropped_audio=3, queued_video=2)
+    stats = meter.get_stats()
+    assert stats['dropped_video_frames'] == 12 and stats['queued_video_frames'] == 2
+    print(f"✅ window follows rate change, SDK counters exposed ({stats['throughput']})")
+
+
+if __name__ == "__main__":
+    test_format_bitrate()
+    test_measures_frame_bytes_once_per_second()
+    test_window_tracks_rate_change_and_sdk_counters()
+    print("\nAll throughput meter tests passed!")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Test script for native UYVY receive conversion (UYVY -> BGRA)"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ndi_module.yuv_convert import COLORIMETRY, UYVYConverter, colorimetry_for
+
+
+def reference_bgr(src: np.ndarray, colorimetry: str) -> np.ndarray:
+    """픽셀 단위 float64 기준 변환 (크로마 최근접 업샘플)"""
+    height = src.shape[0]
+    mp = src.reshape(height, -1, 4).astype(np.float64)
+    y = np.empty((height, mp.shape[1] * 2))
+    y[:, 0::2] = mp[..., 1]
+    y[:, 1::2] = mp[..., 3]
+    u = np.repeat(mp[..., 0], 2, axis=1) - 128.0
+    v = np.repeat(mp[..., 2], 2, axis=1) - 128.0
+
+    kr, kb = COLORIMETRY[colorimetry]
+    kg = 1.0 - kr - kb
+    luma = (y - 16.0) * 255.0 / 219.0
+    c = 255.0 / 224.0
+    r = luma + c * 2 * (1 - kr) * v
+    g = luma - c * 2 * kb * (1 - kb) / kg * u - c * 2 * kr * (1 - kr) / kg * v
+    b = luma + c * 2 * (1 - kb) * u
+    return np.clip(np.rint(np.stack([b, g, r], axis=-1)), 0, 255)
+
+
+def test_matches_reference():
+    """BT.601/BT.709 모두 기준 변환과 ±1 이내 (NDI 라인 스트라이드 포함)"""
+    converter = UYVYConverter()
+    for height, width in ((480, 720), (1080, 1920)):
+        padded = np.random.randint(0, 256, (height, width + 64, 2), dtype=np.uint8)
+        src = padded[:, :width]
+        colorimetry = colorimetry_for(height)
+        out = np.empty((height, width, 4), dtype=np.uint8)
+        converter.convert(src, out)
+        error = np.abs(out[..., :3].astype(np.int16) - reference_bgr(src, colorimetry))
+        assert error.max() <= 1, f"{colorimetry} max error {error.max()}"
+        assert np.all(out[..., 3] == 255)
+    assert colorimetry_for(480) == 'bt601' and colorimetry_for(1080) == 'bt709'
+    print("✅ matches BT.601/BT.709 reference")
+
+
+def test_known_colours():
+    """기준 색: 흑/백과 BT.709 75% 적색"""
+    converter = UYVYConverter()
+    src = np.array([[[128, 16], [128, 16], [128, 235], [128, 235]],
+                    [[102, 63], [240, 63], [102, 63], [240, 63]]], dtype=np.uint8)
+    out = np.empty((2, 4, 4), dtype=np.uint8)
+    converter.convert(src, out, 'bt709')
+    assert out[0, 0, :3].tolist() == [0, 0, 0]
+    assert out[0, 3, :3].tolist() == [255, 255, 255]
+    b, g, r = out[1, 0, :3].astype(int)
+    assert r >= 188 and g <= 3 and b <= 3, out[1, 0]
+    print("✅ known colours")
+
+
+def test_fused_decimation():
+    """축소 출력은 같은 위치를 기준 변환한 값과 일치"""
+    converter = UYVYConverter()
+    src = np.random.randint(0, 256, (1080, 1920, 2), dtype=np.uint8)
+    # 매크로픽셀 내 Y0 == Y1 이면 쌍 평균과 최근접 샘플링이 같아짐
+    src.reshape(1080, 960, 4)[..., 3] = src.reshape(1080, 960, 4)[..., 1]
+    out = np.empty((360, 640, 4), dtype=np.uint8)
+    converter.convert(src, out)
+
+    full = reference_bgr(src, 'bt709')
+    rows = ((np.arange(360) + 0.5) * 1080 / 360).astype(int)
+    cols = ((np.arange(640) + 0.5) * 1920 / 640).astype(int)
+    expected = full[rows][:, cols]
+    assert np.abs(out[..., :3].astype(np.int16) - expected).max() <= 1
+    assert converter.get_stats()['decimated_frames'] == 1
+    print("✅ fused decimation")
+
+
+def benchmark_conversion():
+    """1080p UYVY 변환 처리량 - 전체 해상도 / 640x360 결합 축소"""
+    converter = UYVYConverter()
+    src = np.random.randint(0, 256, (1080, 1920, 2), dtype=np.uint8)
+    for out_shape in ((1080, 1920, 4), (360, 640, 4)):
+        out = np.empty(out_shape, dtype=np.uint8)
+        converter.convert(src, out)
+        iterations = 20
+        start = time.perf_counter()
+        for _ in range(iterations):
+            converter.convert(src, out)
+        elapsed_ms = (time.perf_counter() - start) / iterations * 1000
+        print(f"📊 UYVY 1920x1080 -> {out_shape[1]}x{out_shape[0]}: "
+              f"{elapsed_ms:.2f} ms/frame ({1000 / elapsed_ms:.0f} fps)")
+
+    # 이전 그레이스케일 경로 (flatten + stack + tobytes) 비교
+    start = time.perf_counter()
+    for _ in range(iterations):
+        gray = src.flatten()[::2][:1920 * 1080].reshape(1080, 1920)
+        np.stack([gray, gray, gray], axis=-1).tobytes()
+    legacy_ms = (time.perf_counter() - start) / iterations * 1000
+    print(f"📊 legacy grayscale path: {legacy_ms:.2f} ms/frame")
+
+
+if __name__ == "__main__":
+    test_matches_reference()
+    test_known_colours()
+    test_fused_decimation()
+    benchmark_conversion()
+    print("\nAll YUV conversion tests passed!")
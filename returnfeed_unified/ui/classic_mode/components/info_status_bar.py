@@ -51,11 +51,12 @@ class InfoStatusBar(QFrame):
         sep2.setStyleSheet(f"color: {PREMIERE_COLORS['border']};")
         layout.addWidget(sep2)
         
-        # 비트레이트
-        self.bitrate_label = QLabel("비트레이트: --")
-        self.bitrate_label.setFont(tech_font)
-        self.bitrate_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
-        layout.addWidget(self.bitrate_label)
+        # 디코딩 처리량 (압축 해제된 프레임 기준 - 네트워크 비트레이트 아님)
+        self.throughput_label = QLabel("디코딩 처리량: --")
+        self.throughput_label.setFont(tech_font)
+        self.throughput_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
+        self.throughput_label.setToolTip("수신한 프레임을 압축 해제한 크기 기준 - 네트워크 대역폭은 이보다 훨씬 작음")
+        layout.addWidget(self.throughput_label)
         
         # 구분선
         sep3 = QLabel("|")
@@ -68,6 +69,17 @@ class InfoStatusBar(QFrame):
         self.audio_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
         layout.addWidget(self.audio_label)
         
+        # 구분선
+        sep_latency = QLabel("|")
+        sep_latency.setStyleSheet(f"color: {PREMIERE_COLORS['border']};")
+        layout.addWidget(sep_latency)
+        
+        # 송신 -> 표시 지연 (p50/p95) - 툴팁에 시계 차이 추정 상태
+        self.latency_label = QLabel("지연: --")
+        self.latency_label.setFont(tech_font)
+        self.latency_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
+        layout.addWidget(self.latency_label)
+        
         # Spacer
         layout.addStretch()
         
@@ -86,6 +98,19 @@ class InfoStatusBar(QFrame):
         sep4.setStyleSheet(f"color: {PREMIERE_COLORS['border']};")
         layout.addWidget(sep4)
         
+        # 프레젠테이션 지터 (p95) / 반복 / 스킵 - 툴팁에 지터 히스토그램
+        self.present_label = QLabel("지터: --")
+        self.present_label.setFont(perf_font)
+        self.present_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
+        self.present_label.setFixedWidth(190)
+        self.present_label.setAlignment(Qt.AlignmentFlag.AlignRight)
+        layout.addWidget(self.present_label)
+        
+        # 구분선
+        sep_present = QLabel("|")
+        sep_present.setStyleSheet(f"color: {PREMIERE_COLORS['border']};")
+        layout.addWidget(sep_present)
+        
         # CPU 사용률
         self.cpu_label = QLabel("CPU: 0%")
         self.cpu_label.setFont(perf_font)
@@ -142,11 +167,13 @@ class InfoStatusBar(QFrame):
         else:
             self.resolution_label.setText("해상도: --")
             
-        # 비트레이트
-        if 'bitrate' in info:
-            self.bitrate_label.setText(f"비트레이트: {info['bitrate']}")
+        # 디코딩 처리량 (실측) + SDK 드롭 프레임
+        if 'throughput' in info:
+            dropped = info.get('dropped_frames', 0)
+            dropped_text = f" (드롭 {dropped})" if dropped else ""
+            self.throughput_label.setText(f"디코딩 처리량: {info['throughput']}{dropped_text}")
         else:
-            self.bitrate_label.setText("비트레이트: --")
+            self.throughput_label.setText("디코딩 처리량: --")
             
         # 오디오 레벨
         if 'audio_level' in info:
@@ -166,12 +193,53 @@ class InfoStatusBar(QFrame):
             self.audio_label.setText("오디오: --")
             self.audio_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
             
+        # 송신 -> 표시 지연 (시계가 맞춰지지 않아 추정 보정한 값은 ≈)
+        latency = info.get('latency')
+        if latency and latency.get('p50_ms') is not None:
+            approx = "" if latency.get('clock_synced') else "≈"
+            self.latency_label.setText(f"지연: {approx}{latency['p50_ms']:.0f} ms (p95 {latency['p95_ms']:.0f})")
+            if latency.get('clock_synced'):
+                self.latency_label.setToolTip(f"송신/수신 시계 동기됨 - 샘플 {latency['samples']}")
+            else:
+                self.latency_label.setToolTip(f"시계 차이 추정 {latency['clock_offset_ms']:+.1f} ms 보정 - 샘플 {latency['samples']}")
+        else:
+            self.latency_label.setText("지연: --")
+            self.latency_label.setToolTip("")
+            
     def clear_technical_info(self):
         """기술 정보 지우기"""
         self.resolution_label.setText("해상도: --")
-        self.bitrate_label.setText("비트레이트: --")
+        self.throughput_label.setText("디코딩 처리량: --")
         self.audio_label.setText("오디오: --")
         self.audio_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
+        self.latency_label.setText("지연: --")
+        self.latency_label.setToolTip("")
+        
+    def update_presentation_stats(self, stats: dict):
+        """프레젠테이션 통계 업데이트 (PresentationScheduler.take_report)"""
+        if not stats or not stats.get('ticks'):
+            self.present_label.setText("지터: --")
+            self.present_label.setStyleSheet(f"color: {PREMIERE_COLORS['text_secondary']};")
+            self.present_label.setToolTip("")
+            return
+            
+        p95 = stats.get('jitter_p95_ms', 0.0)
+        repeats = stats.get('repeats', 0)
+        skips = stats.get('skips', 0)
+        self.present_label.setText(f"지터 p95 {p95:.1f}ms 반복 {repeats} 스킵 {skips}")
+        if repeats or skips or p95 >= 4.0:
+            self.present_label.setStyleSheet(f"color: {PREMIERE_COLORS['error']};")
+        elif p95 >= 2.0:
+            self.present_label.setStyleSheet(f"color: {PREMIERE_COLORS['warning']};")
+        else:
+            self.present_label.setStyleSheet(f"color: {PREMIERE_COLORS['success']};")
+            
+        ticks = stats['ticks']
+        lines = [f"프레젠테이션 {stats.get('tick_hz', 0):.2f}Hz / 소스 {stats.get('source_fps', 0):.2f}fps",
+                 f"최대 지터 {stats.get('jitter_max_ms', 0.0):.1f}ms"]
+        for label, count in stats.get('histogram', {}).items():
+            lines.append(f"{label:>7} {count:4d} ({count * 100 / ticks:5.1f}%)")
+        self.present_label.setToolTip("\n".join(lines))
         
     def update_performance_stats(self, fps: int, cpu: float, memory: int):
         """성능 통계 업데이트"""
@@ -241,18 +241,31 @@ class NDIControlPanel(QFrame):
         """사용 가능한 소스 업데이트"""
         current = self.source_combo.currentText()
         
-        self.source_combo.clear()
-        self.source_combo.addItem("소스를 선택하세요...")
-        
-        for source in sources:
-            self.source_combo.addItem(source)
+        # 목록 재구성은 선택 변경이 아님 - 캐시 목록이 라이브 목록으로 바뀔 때 재연결 방지
+        self.source_combo.blockSignals(True)
+        try:
+            self.source_combo.clear()
+            self.source_combo.addItem("소스를 선택하세요...")
             
-        # 이전 선택 복원
-        if current in sources:
-            index = self.source_combo.findText(current)
-            if index >= 0:
-                self.source_combo.setCurrentIndex(index)
+            for source in sources:
+                self.source_combo.addItem(source)
                 
+            # 이전 선택 복원
+            if current in sources:
+                index = self.source_combo.findText(current)
+                if index >= 0:
+                    self.source_combo.setCurrentIndex(index)
+        finally:
+            self.source_combo.blockSignals(False)
+            
+    def set_current_source(self, source_name: str):
+        """연결 요청 없이 콤보 선택만 변경 (이미 연결된 소스 표시용)"""
+        index = self.source_combo.findText(source_name)
+        if index >= 0:
+            self.source_combo.blockSignals(True)
+            self.source_combo.setCurrentIndex(index)
+            self.source_combo.blockSignals(False)
+            
     def set_connected(self, connected: bool, source_name: str = ""):
         """연결 상태 업데이트"""
         self.is_connected = connected
@@ -4,18 +4,33 @@ Optimized for monitoring one NDI source with professional features
 """
 
 from PyQt6.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget
-from PyQt6.QtCore import Qt, QRect, QSize, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize, pyqtSignal, QPropertyAnimation, QEasingCurve, pyqtProperty
 from PyQt6.QtGui import QPainter, QImage, QColor, QFont, QPen
 import logging
+import time
+
+from modules.ndi_module.overlay_cache import OverlayLayer, outline_regions
+from modules.ndi_module.glass_latency import format_latency
 
 logger = logging.getLogger(__name__)
 
+# Column layout of NDIReceiver.audio_levels arrays (see modules/ndi_module/audio_meter.py)
+METER_VU = 0
+METER_PPM = 1
+METER_PEAK_HOLD = 3
+
+METER_DB_MARKS = [0, -6, -12, -18, -24, -36, -48, -60]
+METER_LABEL_WIDTH = 35  # dB 라벨이 미터 왼쪽으로 나가는 폭
+
+STAGE_TIMING_REFRESH = 0.5  # 단계별 지연 오버레이 텍스트 갱신 주기 (초) - 그 사이에는 캐시 레이어 재사용
+
 
 class SingleChannelVideoDisplay(QFrame):
     """Professional single-channel video display with 16:9 aspect ratio"""
     
     # Signals
     double_clicked = pyqtSignal()  # For fullscreen toggle
+    display_size_changed = pyqtSignal(int, int)  # 16:9 area in device pixels (receiver downscales to it)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -27,11 +42,13 @@ class SingleChannelVideoDisplay(QFrame):
         self.source_name = ""
         self.is_connected = False
         self.is_streaming = False  # SRT 스트리밍 상태
+        self.streaming_preview_fps = 0  # 스트리밍 중 스로틀 프리뷰 fps (0 = 페이드 투 블랙)
         self.frame_info = {
             'resolution': '',
             'fps': 0,
-            'bitrate': '',
-            'audio_level': -60
+            'throughput': '',  # 디코딩 처리량 (네트워크 비트레이트 아님)
+            'audio_level': -60,
+            'loudness': None  # {'momentary', 'short_term', 'integrated'} LUFS
         }
         
         # Tally state
@@ -41,10 +58,17 @@ class SingleChannelVideoDisplay(QFrame):
         self.show_safe_areas = False
         self.show_info_overlay = True
         self.show_audio_meter = True
+        self.show_stage_timings = False
         
-        # Audio meter animation
-        self.audio_peak = -60.0  # Peak hold value
-        self.audio_history = [-60.0] * 20  # Smooth audio values
+        # Pipeline stage latency histograms (NDIReceiver.stage_timings) - paintEvent records its duration
+        self.stage_timings = None
+        # Sender-to-present latency (NDIReceiver.latency_estimator) - recorded when a picked-up frame is painted
+        self.latency_estimator = None
+        self._stage_timing_text = ""
+        self._stage_timing_updated = 0.0
+        
+        # Per-channel audio levels (channels x 4, dB) - ballistics are applied by the receiver's meter
+        self.audio_levels = None
         
         # Fade to black animation
         self._fade_opacity = 0.0  # 0.0 = 투명 (비디오 보임), 1.0 = 불투명 (검은색)
@@ -61,6 +85,40 @@ class SingleChannelVideoDisplay(QFrame):
         self.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen, False)
         self.setUpdatesEnabled(True)
         
+        self._published_display_size = None
+        
+        # Overlay layers cached as pixmaps - re-rendered only when size or inputs change
+        self._safe_area_layer = OverlayLayer(self._render_safe_areas)
+        self._info_layer = OverlayLayer(self._render_info_overlay)
+        self._audio_text_layer = OverlayLayer(self._render_audio_text)
+        self._meter_scale_layer = OverlayLayer(self._render_meter_scale)
+        self._meter_border_layer = OverlayLayer(self._render_meter_border)
+        self._placeholder_layer = OverlayLayer(self._render_placeholder)
+        self._tally_layer = OverlayLayer(self._render_tally_border)
+        self._streaming_text_layer = OverlayLayer(self._render_streaming_text)
+        self._streaming_banner_layer = OverlayLayer(self._render_streaming_banner)
+        self._stage_timing_layer = OverlayLayer(self._render_stage_timings)
+        
+    def resizeEvent(self, event):
+        """Publish new display size so frames arrive pre-scaled"""
+        super().resizeEvent(event)
+        self._publish_display_size()
+        
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._publish_display_size()
+        
+    def _publish_display_size(self):
+        """Emit the 16:9 area size in device pixels when it changes"""
+        if not self.isVisible():
+            return
+        rect = self._calculate_display_rect()
+        dpr = self.devicePixelRatioF()
+        size = (int(round(rect.width() * dpr)), int(round(rect.height() * dpr)))
+        if size != self._published_display_size:
+            self._published_display_size = size
+            self.display_size_changed.emit(*size)
+        
     def mouseDoubleClickEvent(self, event):
         """Handle double-click for fullscreen"""
         self.double_clicked.emit()
@@ -68,9 +126,12 @@ class SingleChannelVideoDisplay(QFrame):
         
     def paintEvent(self, event):
         """Paint the video frame with overlays"""
+        timings = self.stage_timings
+        paint_started = time.perf_counter_ns() if timings is not None and timings.enabled else 0
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        frame_presented = False  # latency is recorded only when a frame actually reaches the screen
         
         try:
             # Fill background
@@ -78,48 +139,78 @@ class SingleChannelVideoDisplay(QFrame):
             
             # Calculate 16:9 display area
             display_rect = self._calculate_display_rect()
+            dpr = self.devicePixelRatioF()
             
             if self.current_frame and not self.current_frame.isNull():
                 # Draw video frame
-                painter.drawImage(display_rect, self.current_frame)
+                self._draw_frame(painter, display_rect)
+                frame_presented = self._fade_opacity < 1.0  # fully faded out = nothing visible
                 
                 # Draw overlays
                 if self.show_safe_areas:
-                    self._draw_safe_areas(painter, display_rect)
+                    self._safe_area_layer.blit(painter, display_rect, dpr,
+                                               regions=self._safe_area_regions(display_rect))
                     
                 if self.show_info_overlay:
-                    self._draw_info_overlay(painter, display_rect)
+                    self._draw_info_overlay(painter, display_rect, dpr)
                     
                 if self.show_audio_meter:
-                    self._draw_audio_meter(painter, display_rect)
+                    self._draw_audio_meter(painter, display_rect, dpr)
+                    
+                if self.show_stage_timings:
+                    self._draw_stage_timings(painter, display_rect, dpr)
                     
             else:
                 # Draw placeholder
-                self._draw_placeholder(painter, display_rect)
+                self._placeholder_layer.blit(painter, display_rect, dpr,
+                                             (self.is_streaming, self.source_name, self.is_connected))
                 
             # Draw tally border
-            if self.tally_state:
-                self._draw_tally_border(painter, display_rect)
+            if self.tally_state in ("PGM", "PVW"):
+                # 8px 테두리 띠와 라벨 영역만 복사
+                regions = outline_regions(display_rect.width(), display_rect.height(), 0, 0, 9)
+                regions.append(QRect(20, 20, 80, 30))
+                self._tally_layer.blit(painter, display_rect, dpr, self.tally_state, regions)
                 
             # 페이드 투 블랙 효과 적용
             if self._fade_opacity > 0:
                 painter.fillRect(self.rect(), QColor(0, 0, 0, int(255 * self._fade_opacity)))
                 
             # 스트리밍 중 오버레이 텍스트 (페이드 효과 위에 그리기)
-            if self.is_streaming and self._fade_opacity > 0.7:
-                # 텍스트 영역
+            if self.is_streaming and self.streaming_preview_fps:
+                # 스로틀 프리뷰 - 영상은 보이게 두고 상단 띠만
+                self._streaming_banner_layer.blit(painter, QRect(0, 0, self.width(), 36), dpr,
+                                                  self.streaming_preview_fps)
+            elif self.is_streaming and self._fade_opacity > 0.7:
                 text_rect = QRect(0, display_rect.center().y() - 30, self.width(), 60)
-                
-                # 회색 텍스트
-                painter.setPen(QColor(180, 180, 180))  # 회색
-                font = QFont("Gmarket Sans", 28, QFont.Weight.Bold)
-                painter.setFont(font)
-                painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, "리턴피드로 스트리밍 중")
+                self._streaming_text_layer.blit(painter, text_rect, dpr)
                 
         except Exception as e:
             logger.error(f"Paint error: {e}")
         finally:
             painter.end()
+            if paint_started:
+                timings.on_paint(paint_started, time.perf_counter_ns())
+            if frame_presented and self.latency_estimator is not None:
+                self.latency_estimator.on_present()
+            
+    def _draw_frame(self, painter: QPainter, rect: QRect):
+        """Blit 1:1 when the receiver already scaled to this size, otherwise smooth-scale"""
+        dpr = self.devicePixelRatioF()
+        frame_width = self.current_frame.width()
+        frame_height = self.current_frame.height()
+        if (abs(frame_width - rect.width() * dpr) < 1.5 or abs(frame_height - rect.height() * dpr) < 1.5) \
+                and frame_width <= rect.width() * dpr + 1 and frame_height <= rect.height() * dpr + 1:
+            width = frame_width / dpr
+            height = frame_height / dpr
+            x = rect.x() + round((rect.width() - width) / 2)
+            y = rect.y() + round((rect.height() - height) / 2)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+            painter.drawImage(QRectF(x, y, width, height), self.current_frame)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        else:
+            # Transitional frame (resize in flight) or upscaling
+            painter.drawImage(rect, self.current_frame)
             
     def _calculate_display_rect(self) -> QRect:
         """Calculate 16:9 display area centered in widget"""
@@ -140,8 +231,10 @@ class SingleChannelVideoDisplay(QFrame):
         
         return QRect(x, y, target_width, target_height)
         
-    def _draw_placeholder(self, painter: QPainter, rect: QRect):
-        """비디오가 없을 때 플레이스홀더 그리기"""
+    def _render_placeholder(self, painter: QPainter, width: int, height: int):
+        """비디오가 없을 때 플레이스홀더 그리기 (키: 스트리밍/소스 이름/연결 상태)"""
+        rect = QRect(0, 0, width, height)
+        
         # 어두운 회색 배경
         painter.fillRect(rect, QColor(40, 40, 40))
         
@@ -175,8 +268,28 @@ class SingleChannelVideoDisplay(QFrame):
             
         painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
         
-    def _draw_tally_border(self, painter: QPainter, rect: QRect):
-        """Draw tally state border"""
+    def _render_streaming_text(self, painter: QPainter, width: int, height: int):
+        """스트리밍 중 안내 텍스트 (페이드 위에 표시)"""
+        # 회색 텍스트
+        painter.setPen(QColor(180, 180, 180))  # 회색
+        font = QFont("Gmarket Sans", 28, QFont.Weight.Bold)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, "리턴피드로 스트리밍 중")
+        
+    def _render_streaming_banner(self, painter: QPainter, width: int, height: int):
+        """스로틀 프리뷰 중 상단 띠 (키: 프리뷰 fps)"""
+        painter.fillRect(QRect(0, 0, width, height), QColor(0, 0, 0, 160))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(220, 20, 60))  # Crimson red
+        painter.drawEllipse(12, height // 2 - 6, 12, 12)
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(QFont("Gmarket Sans", 11, QFont.Weight.Bold))
+        painter.drawText(QRect(32, 0, width - 44, height), Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                         f"리턴피드로 스트리밍 중  ·  프리뷰 {self.streaming_preview_fps:g}fps")
+        
+    def _render_tally_border(self, painter: QPainter, width: int, height: int):
+        """Draw tally state border (keyed by tally state)"""
+        rect = QRect(0, 0, width, height)
         if self.tally_state == "PGM":
             color = QColor(255, 55, 55)  # Red
         elif self.tally_state == "PVW":
@@ -191,15 +304,16 @@ class SingleChannelVideoDisplay(QFrame):
         painter.drawRect(rect.adjusted(4, 4, -4, -4))
         
         # Draw tally label
-        label_rect = QRect(rect.x() + 20, rect.y() + 20, 80, 30)
+        label_rect = QRect(20, 20, 80, 30)
         painter.fillRect(label_rect, color)
         painter.setPen(QColor(255, 255, 255))
         font = QFont("Arial", 14, QFont.Weight.Bold)
         painter.setFont(font)
         painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, self.tally_state)
         
-    def _draw_safe_areas(self, painter: QPainter, rect: QRect):
-        """Draw broadcast safe areas (90% and 80%)"""
+    def _render_safe_areas(self, painter: QPainter, width: int, height: int):
+        """Draw broadcast safe areas (90% and 80%) - static, re-rendered per size only"""
+        rect = QRect(0, 0, width, height)
         painter.setPen(QPen(QColor(255, 255, 255, 60), 1, Qt.PenStyle.DashLine))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         
@@ -221,42 +335,176 @@ class SingleChannelVideoDisplay(QFrame):
         )
         painter.drawRect(safe_80)
         
-    def _draw_info_overlay(self, painter: QPainter, rect: QRect):
-        """Draw information overlay"""
+    @staticmethod
+    def _safe_area_regions(rect: QRect):
+        """Bands around the dashed 90%/80% lines - the rest of the safe area layer is transparent"""
+        regions = []
+        for ratio in (0.05, 0.1):
+            inset_x = int(rect.width() * ratio)
+            inset_y = int(rect.height() * ratio)
+            regions += outline_regions(rect.width(), rect.height(), inset_x - 2, inset_y - 2, 4)
+        return regions
+        
+    def _draw_info_overlay(self, painter: QPainter, rect: QRect, dpr: float):
+        """Draw information overlay - each text layer is re-rendered only when its text changes"""
         if not self.is_connected:
             return
             
+        info_rect = self._info_rect(rect)
+        info_text, audio_text = self._info_texts()
+        # Source/format text changes about once a second, audio text with every level update
+        self._info_layer.blit(painter, info_rect, dpr, info_text)
+        self._audio_text_layer.blit(painter, info_rect, dpr, audio_text)
+        
+    @staticmethod
+    def _info_rect(rect: QRect) -> QRect:
+        """Info strip along the bottom of the video area"""
+        return QRect(rect.x(), rect.bottom() - 40, rect.width(), 40)
+        
+    def _info_texts(self):
+        """(left info text, right audio text) - the cache keys of the two text layers"""
+        info_text = f"{self.source_name} | {self.frame_info['resolution']} @ {self.frame_info['fps']}fps | {self.frame_info['throughput']} decoded"
+        latency_text = format_latency(self.frame_info.get('latency'))
+        if latency_text:
+            info_text += f" | {latency_text}"
+        
+        audio_text = f"Audio: {self.frame_info['audio_level']:.1f}dB"
+        loudness = self.frame_info.get('loudness') or {}
+        if loudness.get('momentary') is not None:
+            integrated = loudness.get('integrated')
+            integrated_text = f"{integrated:.1f}" if integrated is not None else "--"
+            audio_text += f" | M {loudness['momentary']:.1f} / I {integrated_text} LUFS"
+        return info_text, audio_text
+        
+    def _render_info_overlay(self, painter: QPainter, width: int, height: int):
+        """Info strip: semi-transparent background and source info on the left"""
+        info_rect = QRect(0, 0, width, height)
+        
         # Semi-transparent background
-        info_rect = QRect(rect.x(), rect.bottom() - 40, rect.width(), 40)
         painter.fillRect(info_rect, QColor(0, 0, 0, 180))
         
         # Info text
         painter.setPen(QColor(255, 255, 255))
         font = QFont("Consolas", 11)
         painter.setFont(font)
-        
-        info_text = f"{self.source_name} | {self.frame_info['resolution']} @ {self.frame_info['fps']}fps | {self.frame_info['bitrate']}"
         painter.drawText(info_rect.adjusted(10, 0, -10, 0), 
                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
-                        info_text)
+                        self._info_texts()[0])
         
-        # Audio level on right
-        audio_text = f"Audio: {self.frame_info['audio_level']:.1f}dB"
-        painter.drawText(info_rect.adjusted(10, 0, -10, 0),
+    def _render_audio_text(self, painter: QPainter, width: int, height: int):
+        """Audio level / loudness text on the right of the info strip"""
+        painter.setPen(QColor(255, 255, 255))
+        font = QFont("Consolas", 11)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, width, height).adjusted(10, 0, -10, 0),
                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight,
-                        audio_text)
+                        self._info_texts()[1])
     
-    def _draw_audio_meter(self, painter: QPainter, rect: QRect):
-        """반투명 오디오 레벨 미터 그리기"""
+    def _draw_stage_timings(self, painter: QPainter, rect: QRect, dpr: float):
+        """Debug overlay: per-stage latency percentiles (top right), text refreshed twice a second"""
+        if self.stage_timings is None:
+            return
+        now = time.monotonic()
+        if now - self._stage_timing_updated >= STAGE_TIMING_REFRESH:
+            self._stage_timing_updated = now
+            self._stage_timing_text = "\n".join(self.stage_timings.format_lines())
+        lines = self._stage_timing_text.count("\n") + 1
+        panel = QRect(rect.right() - 290, rect.y() + 10, 280, lines * 15 + 12)
+        self._stage_timing_layer.blit(painter, panel, dpr, self._stage_timing_text)
+        
+    def _render_stage_timings(self, painter: QPainter, width: int, height: int):
+        """Stage latency table on a semi-transparent panel"""
+        painter.fillRect(QRect(0, 0, width, height), QColor(0, 0, 0, 180))
+        painter.setPen(QColor(120, 255, 120))
+        painter.setFont(QFont("Consolas", 9))
+        painter.drawText(QRect(0, 0, width, height).adjusted(8, 6, -8, -6),
+                        Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                        self._stage_timing_text)
+        
+    def _draw_audio_meter(self, painter: QPainter, rect: QRect, dpr: float):
+        """반투명 오디오 레벨 미터 그리기 - 눈금/라벨은 캐시 레이어, 채널 바만 매번 그림"""
         if not self.is_connected:
             return
             
-        # 미터 크기와 위치 (우측, 세로)
-        meter_width = 25  # 40 → 25로 줄임
+        # 채널별 레벨 (없으면 프레임 정보의 단일 레벨로 표시)
+        if self.audio_levels is not None and len(self.audio_levels):
+            ppm_levels = self.audio_levels[:, METER_PPM]
+            vu_levels = self.audio_levels[:, METER_VU]
+            hold_levels = self.audio_levels[:, METER_PEAK_HOLD]
+        else:
+            level = self.frame_info.get('audio_level', -60)
+            ppm_levels = vu_levels = hold_levels = [level]
+        channel_count = len(ppm_levels)
+        meter_rect = self._meter_rect(rect, channel_count)
+        if meter_rect is None:
+            return
+        meter_x, meter_y = meter_rect.x(), meter_rect.y()
+        meter_width, meter_height = meter_rect.width(), meter_rect.height()
+        
+        # 배경 + dB 눈금/라벨 (미터 크기가 바뀔 때만 다시 그림)
+        self._meter_scale_layer.blit(painter, self._meter_scale_rect(meter_rect), dpr)
+        
+        # 채널 바: PPM(트루 피크) 레벨, 안쪽 밝은 선은 VU(RMS), 흰 선은 피크 홀드
+        # 정수 좌표 사각형뿐이라 안티에일리어싱 없이 채움 (결과 동일, 빠른 경로)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        inner_width = meter_width - 4
+        bar_step = inner_width / channel_count
+        bar_width = max(2, int(bar_step) - 1)
+        for index in range(channel_count):
+            bar_x = meter_x + 2 + int(index * bar_step)
+            ppm_db = float(ppm_levels[index])
+            level_height = int(((ppm_db + 60) / 60.0) * meter_height)
+            level_height = max(0, min(level_height, meter_height))
+            
+            if level_height > 0:
+                # 색상 결정 (레벨에 따라)
+                if ppm_db > -6:
+                    color = QColor(255, 50, 50, 200)  # 빨간색 (클리핑 경고)
+                elif ppm_db > -12:
+                    color = QColor(200, 180, 0, 200)  # 노란색 (높은 레벨)
+                else:
+                    color = QColor(0, 150, 0, 200)  # 초록색 (정상 레벨)
+                painter.fillRect(QRect(bar_x, meter_y + meter_height - level_height, bar_width, level_height), color)
+            
+            vu_db = float(vu_levels[index])
+            if vu_db > -60:
+                vu_y = meter_y + meter_height - int(((min(vu_db, 0) + 60) / 60.0) * meter_height)
+                painter.fillRect(QRect(bar_x, vu_y, bar_width, 2), QColor(180, 255, 180, 230))
+            
+            hold_db = float(hold_levels[index])
+            if hold_db > -60:
+                hold_y = meter_y + meter_height - int(((min(hold_db, 0) + 60) / 60.0) * meter_height)
+                painter.fillRect(QRect(bar_x, hold_y, bar_width, 2), QColor(255, 255, 255, 250))
+            
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # 미터 테두리 (바 위에 겹침)
+        border_rect = meter_rect.adjusted(-1, -1, 2, 2)
+        self._meter_border_layer.blit(painter, border_rect, dpr,
+                                      regions=outline_regions(border_rect.width(), border_rect.height(), 0, 0, 3))
+        
+    @staticmethod
+    def _meter_rect(rect: QRect, channel_count: int):
+        """미터 크기와 위치 (우측, 세로) - 채널당 6px, 최소 25px. 공간이 없으면 None"""
+        meter_width = max(25, channel_count * 6 + 4)
         meter_margin = 20
-        meter_x = rect.right() - meter_width - meter_margin
-        meter_y = rect.y() + meter_margin
         meter_height = rect.height() - (meter_margin * 2) - 50  # 하단 정보 오버레이 공간 확보
+        if meter_height <= 0:
+            return None
+        return QRect(rect.right() - meter_width - meter_margin, rect.y() + meter_margin, meter_width, meter_height)
+        
+    @staticmethod
+    def _meter_scale_rect(meter_rect: QRect) -> QRect:
+        """눈금/라벨과 배경까지 포함한 미터 전체 영역"""
+        return QRect(meter_rect.x() - METER_LABEL_WIDTH, meter_rect.y() - 8,
+                     meter_rect.width() + METER_LABEL_WIDTH + 5, meter_rect.height() + 16)
+        
+    def _render_meter_scale(self, painter: QPainter, width: int, height: int):
+        """미터 배경과 dB 눈금/라벨 (-60 to 0 dB) - 정적 레이어, 미터 크기마다 한 번"""
+        meter_x = METER_LABEL_WIDTH
+        meter_y = 8
+        meter_width = width - METER_LABEL_WIDTH - 5
+        meter_height = height - 16
         
         # 반투명 배경
         bg_rect = QRect(meter_x - 5, meter_y - 5, meter_width + 10, meter_height + 10)
@@ -266,14 +514,13 @@ class SingleChannelVideoDisplay(QFrame):
         meter_rect = QRect(meter_x, meter_y, meter_width, meter_height)
         painter.fillRect(meter_rect, QColor(30, 30, 30, 200))
         
-        # 데시벨 스케일 (-60 to 0 dB)
+        # 데시벨 스케일
         painter.setPen(QColor(200, 200, 200, 200))
         font = QFont("Consolas", 8)
         painter.setFont(font)
         
         # 스케일 마크와 라벨
-        db_marks = [0, -6, -12, -18, -24, -36, -48, -60]
-        for db in db_marks:
+        for db in METER_DB_MARKS:
             y_pos = meter_y + int(((-db) / 60.0) * meter_height)
             
             # 마크 라인
@@ -288,46 +535,14 @@ class SingleChannelVideoDisplay(QFrame):
             
             # 라벨
             painter.setPen(QColor(200, 200, 200, 200))
-            label_rect = QRect(meter_x - 35, y_pos - 8, 30, 16)
+            label_rect = QRect(meter_x - METER_LABEL_WIDTH, y_pos - 8, 30, 16)
             painter.drawText(label_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, f"{db}")
         
-        # 현재 오디오 레벨 (평균값 계산)
-        avg_level = sum(self.audio_history[-5:]) / 5  # 최근 5개 샘플 평균
-        level_height = int(((avg_level + 60) / 60.0) * meter_height)
-        level_height = max(0, min(level_height, meter_height))
-        
-        # 레벨 바 그리기 (그라디언트)
-        if level_height > 0:
-            level_rect = QRect(meter_x + 3, meter_y + meter_height - level_height, 
-                             meter_width - 6, level_height)  # 좌우 여백도 조정
-            
-            # 색상 결정 (레벨에 따라)
-            if avg_level > -6:
-                # 빨간색 (클리핑 경고)
-                color_bottom = QColor(255, 50, 50, 200)
-                color_top = QColor(255, 100, 100, 200)
-            elif avg_level > -12:
-                # 노란색 (높은 레벨)
-                color_bottom = QColor(200, 180, 0, 200)
-                color_top = QColor(255, 230, 0, 200)
-            else:
-                # 초록색 (정상 레벨)
-                color_bottom = QColor(0, 150, 0, 200)
-                color_top = QColor(0, 255, 100, 200)
-                
-            # 채우기
-            painter.fillRect(level_rect, color_bottom)
-            
-        # 피크 홀드 라인
-        if self.audio_peak > -60:
-            peak_y = meter_y + meter_height - int(((self.audio_peak + 60) / 60.0) * meter_height)
-            painter.setPen(QPen(QColor(255, 255, 255, 250), 2))
-            painter.drawLine(meter_x + 3, peak_y, meter_x + meter_width - 3, peak_y)
-            
-        # 미터 테두리
+    def _render_meter_border(self, painter: QPainter, width: int, height: int):
+        """미터 테두리 - 레이어는 테두리보다 1px 크게 잡음 (안티에일리어싱 번짐)"""
         painter.setPen(QPen(QColor(100, 100, 100, 200), 1))
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRect(meter_rect)
+        painter.drawRect(QRect(1, 1, width - 3, height - 3))
         
     def update_frame(self, frame: QImage):
         """Update video frame"""
@@ -353,23 +568,22 @@ class SingleChannelVideoDisplay(QFrame):
         self.update()
         
     def update_frame_info(self, info: dict):
-        """Update frame information"""
+        """Update frame information (called on a timer, not per frame) - repaints only the info strip"""
         self.frame_info.update(info)
+        if self.show_info_overlay and self.is_connected:
+            self.update(self._info_rect(self._calculate_display_rect()))
         
-        # Update audio history for smooth meter
-        if 'audio_level' in info:
-            level = info['audio_level']
-            self.audio_history.pop(0)
-            self.audio_history.append(level)
-            
-            # Update peak hold
-            if level > self.audio_peak:
-                self.audio_peak = level
-            else:
-                # Peak decay
-                self.audio_peak = max(self.audio_peak - 0.5, level)
-        
-        self.update()
+    def update_audio_levels(self, levels):
+        """Update per-channel meter levels (published by the receiver at a fixed rate)
+
+        Repaints the meter area itself so ballistics keep their own rate on static
+        sources and under the throttled streaming preview.
+        """
+        self.audio_levels = levels
+        if self.show_audio_meter and self.is_connected and levels is not None:
+            meter_rect = self._meter_rect(self._calculate_display_rect(), max(1, len(levels)))
+            if meter_rect is not None:
+                self.update(self._meter_scale_rect(meter_rect))
         
     def toggle_safe_areas(self):
         """Toggle safe area display"""
@@ -386,12 +600,20 @@ class SingleChannelVideoDisplay(QFrame):
         self.show_audio_meter = not self.show_audio_meter
         self.update()
         
+    def toggle_stage_timings(self):
+        """Toggle the stage latency debug overlay (enables recording while shown)"""
+        self.show_stage_timings = not self.show_stage_timings
+        if self.stage_timings is not None and self.show_stage_timings and not self.stage_timings.enabled:
+            self.stage_timings.reset()
+            self.stage_timings.enabled = True
+        self._stage_timing_updated = 0.0
+        self.update()
+        
     def clear_display(self):
         """Clear the display"""
         self.current_frame = None
         self.is_connected = False
-        self.audio_history = [-60.0] * 20
-        self.audio_peak = -60.0
+        self.audio_levels = None
         self.update()
         
     @pyqtProperty(float)
@@ -405,25 +627,31 @@ class SingleChannelVideoDisplay(QFrame):
         self._fade_opacity = value
         self.update()
         
-    def set_streaming_mode(self, is_streaming: bool):
-        """SRT 스트리밍 모드 설정 - 스트리밍 중일 때 프리뷰 중지"""
+    def set_streaming_mode(self, is_streaming: bool, preview_fps: float = 0):
+        """SRT 스트리밍 모드 설정 - preview_fps가 있으면 프리뷰를 가리지 않고 상단 띠만, 없으면 페이드 투 블랙"""
         self.is_streaming = is_streaming
+        self.streaming_preview_fps = preview_fps if is_streaming else 0
         
         # 페이드 애니메이션 실행
-        if is_streaming:
+        if is_streaming and preview_fps:
+            # 스로틀 프리뷰 - 화면은 계속 보임
+            self.update()
+        elif is_streaming:
             # 페이드 투 블랙
             self.fade_animation.setStartValue(0.0)
             self.fade_animation.setEndValue(1.0)
             self.fade_animation.finished.connect(self._on_fade_to_black_complete)
             self.fade_animation.start()
-        else:
+        elif self._fade_opacity > 0:
             # 페이드 인 (블랙에서 비디오로)
             self.fade_animation.setStartValue(1.0)
             self.fade_animation.setEndValue(0.0)
             self.fade_animation.start()
+        else:
+            self.update()
             
     def _on_fade_to_black_complete(self):
         """페이드 투 블랙 완료 시 프레임 업데이트 중지"""
-        if self.is_streaming:
+        if self.is_streaming and not self.streaming_preview_fps:
             self.current_frame = None
             self.update()
\ No newline at end of file
@@ -21,6 +21,7 @@ from .components.stream_control_panel import StreamControlPanel
 from .components.info_status_bar import InfoStatusBar
 from .components.custom_dialog import ConfirmDialog
 from .styles.dark_theme import apply_theme
+from modules.ndi_module.presentation_scheduler import PresentationScheduler
 
 
 logger = logging.getLogger(__name__)
@@ -106,18 +107,31 @@ class ClassicMainWindow(QMainWindow):
         # Performance monitoring
         self.performance_monitor = PerformanceMonitor()
         
-        # Frame processing queue and timer for stable 60fps
-        self.frame_queue = []
-        self.frame_queue_lock = QThread.currentThread()  # For thread safety
-        self.max_frame_buffer = 2  # 적절한 버퍼링
-        self.frame_skip_count = 0
+        # Frame presentation: 수신 스레드의 메일박스에서 화면 갱신 시점에 최신 프레임을 가져옴
+        self.frame_mailbox = None
+        self.stage_timings = None
+        self.latency_estimator = None
+        self.static_detector = None  # 정지 화면이면 프록시 모드에서도 이전 프레임을 다시 그리지 않음
+        self.request_frame = None  # 프레임 싱크 모드: 프레젠테이션 틱마다 수신 스레드에 한 장 요청
+        self.last_frame_id = 0
         self.current_bandwidth_mode = "normal"  # Track current mode
         
-        # 60fps precise timing (16.67ms)
+        # Presentation ticks: single-shot timer re-armed from a drift-corrected deadline
+        # (source cadence from frame timestamps, display refresh when the source is faster)
+        self.presentation_scheduler = PresentationScheduler()
+        screen = QApplication.primaryScreen()
+        if screen is not None:
+            self.presentation_scheduler.set_display_rate(screen.refreshRate())
         self.frame_timer = QTimer()
-        self.frame_timer.timeout.connect(self._process_frame_queue)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.timeout.connect(self._on_present_tick)
         self.frame_timer.setTimerType(Qt.TimerType.PreciseTimer)  # High precision timer
-        self.frame_timer.setInterval(16)  # 60fps = 16.67ms
+        
+        # 기술 정보/라우드니스 텍스트 - 프레임과 별개로 주기적으로 갱신 (정지 화면/스로틀 프리뷰에서도 흐름)
+        self.get_technical_info = None
+        self.technical_info_timer = QTimer()
+        self.technical_info_timer.setInterval(200)
+        self.technical_info_timer.timeout.connect(self._refresh_technical_info)
         
         # 프레임 타이밍 추적
         self.last_process_time = 0
@@ -140,8 +154,9 @@ class ClassicMainWindow(QMainWindow):
         self.stream_control_panel.update_server_status(True, "00:00:00", 0)
         
         # Start frame processing timer
-        self.frame_timer.start()
-        logger.info("Frame processing timer started at 60fps")
+        self.frame_timer.start(self.presentation_scheduler.next_timeout_ms())
+        logger.info("Presentation scheduler started "
+                    f"({1.0 / self.presentation_scheduler.display_interval:.2f} Hz display)")
         
         # Auto-save timer
         self.auto_save_timer = QTimer()
@@ -242,6 +257,9 @@ class ClassicMainWindow(QMainWindow):
         # A - Toggle audio meter
         QShortcut(QKeySequence(Qt.Key.Key_A), self, self.video_display.toggle_audio_meter)
         
+        # L - Toggle stage latency overlay
+        QShortcut(QKeySequence(Qt.Key.Key_L), self, self.video_display.toggle_stage_timings)
+        
         # Escape - Exit fullscreen
         QShortcut(QKeySequence(Qt.Key.Key_Escape), self, self._exit_fullscreen)
         
@@ -255,10 +273,26 @@ class ClassicMainWindow(QMainWindow):
         if hasattr(self.ndi_module, 'manager') and self.ndi_module.manager:
             self.ndi_module.manager.sources_updated.connect(self._on_sources_updated)
             
-        # Connect NDI receiver signals (frames)
+        # Connect NDI receiver (frames are pulled from its mailbox by frame_timer)
         if hasattr(self.ndi_module, 'receiver') and self.ndi_module.receiver:
-            self.ndi_module.receiver.frame_received.connect(self._on_frame_received)
+            # This window presents the frames - the module's own preview stops picking them up
+            if hasattr(self.ndi_module, 'set_preview_owner'):
+                self.ndi_module.set_preview_owner(False)
+            self.frame_mailbox = getattr(self.ndi_module.receiver, 'frame_mailbox', None)
+            self.request_frame = getattr(self.ndi_module.receiver, 'request_frame', None)
+            # Stage latency histograms - pickup and paint stages are recorded on the GUI thread
+            self.stage_timings = getattr(self.ndi_module.receiver, 'stage_timings', None)
+            self.video_display.stage_timings = self.stage_timings
+            # Sender-to-present latency - pickup here, present at the end of the display's paintEvent
+            self.latency_estimator = getattr(self.ndi_module.receiver, 'latency_estimator', None)
+            self.video_display.latency_estimator = self.latency_estimator
+            self.static_detector = getattr(self.ndi_module.receiver, 'static_detector', None)
+            self.get_technical_info = getattr(self.ndi_module.receiver, 'get_technical_info', None)
             self.ndi_module.receiver.status_changed.connect(self._on_ndi_receiver_status_changed)
+            # Display size negotiation - receiver downscales to the video area before QImage creation
+            self.video_display.display_size_changed.connect(self.ndi_module.receiver.set_display_size)
+            # Per-channel audio meter levels (fixed publish rate, independent of video frames)
+            self.ndi_module.receiver.audio_levels.connect(self.video_display.update_audio_levels)
             
         # Connect NDI widget for connection status
         if hasattr(self.ndi_module, 'widget') and self.ndi_module.widget:
@@ -292,9 +326,26 @@ class ClassicMainWindow(QMainWindow):
                 lambda status, msg: self.command_bar.update_status("NDI", "online" if status == "running" else "offline")
             )
             
+        # Show the cached/current source list right away and reflect an auto-reconnect
+        # that already happened during module start (before this window existed)
+        self._sync_initial_source_state()
+        
         # Request initial source list
         QTimer.singleShot(100, self._refresh_sources)
         
+    def _sync_initial_source_state(self):
+        """Populate sources from the manager and show the already-connected source"""
+        manager = getattr(self.ndi_module, 'manager', None)
+        if manager and hasattr(manager, 'get_sources'):
+            self._on_sources_updated(manager.get_sources())
+            
+        receiver = getattr(self.ndi_module, 'receiver', None)
+        if receiver and receiver.isRunning() and getattr(receiver, 'source_name', None):
+            self.current_source = receiver.source_name
+            self.ndi_control_panel.set_current_source(receiver.source_name)
+            self.video_display.set_source(receiver.source_name)
+            self._on_connection_changed(True, receiver.source_name)
+        
     def _refresh_sources(self):
         """Refresh NDI source list"""
         if self.ndi_module:
@@ -303,7 +354,7 @@ class ClassicMainWindow(QMainWindow):
                 self.ndi_module.widget.refresh_requested.emit()
             elif hasattr(self.ndi_module, 'manager') and self.ndi_module.manager:
                 # Direct manager call if available
-                self.ndi_module.manager._scan_sources()
+                self.ndi_module.manager.refresh_sources()
             
     def _on_sources_updated(self, sources: list):
         """Handle NDI sources update"""
@@ -323,34 +374,59 @@ class ClassicMainWindow(QMainWindow):
         self.ndi_control_panel.update_sources(source_names)
         self.command_bar.update_status("NDI", "online" if sources else "offline")
         
-    def _on_frame_received(self, frame_data):
-        """Handle received NDI frame - add to queue for stable timing"""
+    def _on_present_tick(self):
+        """Presentation tick - present, then re-arm the timer for the next deadline"""
+        try:
+            self._present_latest_frame()
+        finally:
+            self.frame_timer.start(self.presentation_scheduler.next_timeout_ms())
+            
+    def _present_latest_frame(self):
+        """Pull the newest frame from the receiver mailbox at presentation time"""
+        if self.frame_mailbox is None:
+            self.presentation_scheduler.on_tick(False, idle=True)
+            return
+            
         # SRT 스트리밍 중이고 페이드가 완료된 경우 프레임 처리 생략 (자원 절약)
         if self.is_srt_streaming and hasattr(self.video_display, '_fade_opacity') and self.video_display._fade_opacity >= 1.0:
+            self.presentation_scheduler.on_tick(False, idle=True)
             return
             
-        # 프레임 큐에 추가
-        if len(self.frame_queue) < self.max_frame_buffer:
-            self.frame_queue.append(frame_data)
-        else:
-            # 버퍼가 가득 찬 경우 가장 오래된 프레임 교체
-            self.frame_skip_count += 1
-            self.frame_queue[0] = frame_data
+        # 프레임 싱크 모드: 이 틱에 다음 프레임을 요청 (요청한 프레임은 다음 틱에 표시)
+        frame_synced = self.request_frame is not None and self.request_frame()
             
-    def _process_frame_queue(self):
-        """Process frames from queue at precise intervals"""
-        if not self.frame_queue:
-            # 프록시 모드에서 프레임이 없으면 이전 프레임 재사용
-            if self.current_bandwidth_mode == "proxy" and self.last_displayed_frame:
+        frame_id, frame_data = self.frame_mailbox.fetch(self.last_frame_id)
+        if frame_data is None:
+            self.presentation_scheduler.on_tick(False)
+            # 프록시 모드에서 새 프레임이 없으면 이전 프레임 재사용 (프레임 싱크는 SDK가 반복 처리)
+            source_static = self.static_detector is not None and self.static_detector.static
+            if (self.current_bandwidth_mode == "proxy" and self.last_displayed_frame and not frame_synced
+                    and not source_static and not self.is_srt_streaming):
                 # 이전 프레임을 다시 표시하여 60fps 유지
                 self._display_frame(self.last_displayed_frame, is_interpolated=True)
             return
             
-        # 큐에서 프레임 처리
-        frame_data = self.frame_queue.pop(0)
+        # 읽히지 않고 덮어써진 프레임은 스킵으로 기록 (메일박스 통계 overwritten과 동일)
+        skipped = frame_id - self.last_frame_id - 1 if self.last_frame_id else 0
+        if isinstance(frame_data, dict):
+            self.presentation_scheduler.on_tick(True, skipped, frame_time=frame_data.get('received_at'),
+                                                source_timestamp=frame_data.get('timestamp'))
+        else:
+            self.presentation_scheduler.on_tick(True, skipped)
+        if self.stage_timings is not None:
+            self.stage_timings.on_pickup(frame_data)
+        if self.latency_estimator is not None:
+            self.latency_estimator.on_pickup(frame_data)
+        self.last_frame_id = frame_id
         self.last_displayed_frame = frame_data  # 나중에 재사용하기 위해 저장
         self._display_frame(frame_data)
         
+    def get_frame_delivery_stats(self) -> dict:
+        """Mailbox delivery statistics (published/delivered/overwritten)"""
+        if self.frame_mailbox is None:
+            return {}
+        return self.frame_mailbox.get_stats()
+        
     def _display_frame(self, frame_data, is_interpolated=False):
         """Display a frame immediately"""
         # Handle both QImage directly or dict with image
@@ -364,15 +440,14 @@ class ClassicMainWindow(QMainWindow):
                 self.video_display.update_frame(image)
                 self.performance_monitor.count_frame()
                 
-            # Update technical info from dict
-            info = {
-                'resolution': frame_data.get('resolution', ''),
-                'fps': frame_data.get('fps', 0),
-                'bitrate': frame_data.get('bitrate', ''),
-                'audio_level': frame_data.get('audio_level', -60)
-            }
-            self.video_display.update_frame_info(info)
-            self.info_status_bar.update_technical_info(info)
+    def _refresh_technical_info(self):
+        """Technical info timer - independent of video frames (static sources publish none)"""
+        if self.get_technical_info is None:
+            return
+        info = self.get_technical_info()
+        info['latency'] = self.latency_estimator.get_stats() if self.latency_estimator is not None else None
+        self.video_display.update_frame_info(info)
+        self.info_status_bar.update_technical_info(info)
         
     def _on_ndi_receiver_status_changed(self, status: str, message: str = ""):
         """Handle NDI receiver status change"""
@@ -385,6 +460,10 @@ class ClassicMainWindow(QMainWindow):
         self.video_display.set_connected(connected)
         self.ndi_control_panel.set_connected(connected, source_name)
         self.info_status_bar.update_source_info(source_name, connected)
+        if connected:
+            self.technical_info_timer.start()
+        else:
+            self.technical_info_timer.stop()
         
         # SRT 스트리밍 버튼 활성화 상태 설정
         self.stream_control_panel.set_streaming_enabled(connected)
@@ -471,14 +550,10 @@ class ClassicMainWindow(QMainWindow):
                 bandwidth = "highest" if bandwidth_mode == "normal" else "lowest"
                 self.ndi_module.receiver.set_bandwidth_mode(bandwidth)
                 
-            # 프레임 큐 초기화 및 버퍼 크기 조정
-            self.frame_queue.clear()
-            if bandwidth_mode == "proxy":
-                self.max_frame_buffer = 1  # 프록시 모드: 최소 버퍼로 지연 방지
-            else:
-                self.max_frame_buffer = 2  # 일반 모드: 안정적인 버퍼링
+            # 이전 소스의 프레임 재사용 방지
+            self.last_displayed_frame = None
                 
-            logger.info(f"{bandwidth_mode} 모드로 NDI 연결 시도 (버퍼: {self.max_frame_buffer})")
+            logger.info(f"{bandwidth_mode} 모드로 NDI 연결 시도")
             
             # Use the widget's connect signal
             if hasattr(self.ndi_module, 'widget') and self.ndi_module.widget:
@@ -515,15 +590,27 @@ class ClassicMainWindow(QMainWindow):
                 self.stream_control_panel.set_srt_streaming(True, "Starting...")
                 self.command_bar.update_status("리턴피드 스트림", "online")
                 
-                # 스트리밍 시작 시 프리뷰 중지 및 NDI 수신 일시정지
+                # 스트리밍 시작 시 인코더에 CPU를 넘김 - 스로틀 프리뷰(기본) 또는 프리뷰 중지
                 self.is_srt_streaming = True
-                self.video_display.set_streaming_mode(True)
-                
-                # NDI receiver 일시정지로 CPU 자원 절약
+                preview_fps = 0
                 if self.ndi_module and hasattr(self.ndi_module, 'receiver') and self.ndi_module.receiver:
-                    self.ndi_module.receiver.pause_receiving()
+                    receiver = self.ndi_module.receiver
+                    settings = getattr(self.ndi_module, 'settings', None) or {}
+                    if (settings.get("streaming_preview", "throttled") == "throttled"
+                            and hasattr(receiver, 'set_preview_throttle')):
+                        # 수신은 유지하고 낮은 fps/해상도로만 변환 (대역폭 전환은 수신 스레드가 처리)
+                        preview_fps = settings.get("streaming_preview_fps", 5)
+                        width, height = settings.get("streaming_preview_size", (640, 360))
+                        receiver.set_preview_throttle(preview_fps, width, height)
+                    else:
+                        # NDI receiver 일시정지로 CPU 자원 절약
+                        receiver.pause_receiving()
+                self.video_display.set_streaming_mode(True, preview_fps)
                     
-                logger.info("리턴피드 스트리밍 시작 - 프리뷰 중지 및 NDI 수신 일시정지")
+                if preview_fps:
+                    logger.info(f"리턴피드 스트리밍 시작 - 프리뷰 {preview_fps}fps로 스로틀")
+                else:
+                    logger.info("리턴피드 스트리밍 시작 - 프리뷰 중지 및 NDI 수신 일시정지")
                 
     def _on_srt_stop_clicked(self):
         """Handle SRT stop click"""
@@ -539,12 +626,15 @@ class ClassicMainWindow(QMainWindow):
                 
                 # NDI receiver 재개
                 if self.ndi_module and hasattr(self.ndi_module, 'receiver') and self.ndi_module.receiver:
-                    # 프레임 큐 초기화하여 새로운 프레임을 즉시 받을 준비
-                    self.frame_queue.clear()
+                    # 이전 프레임 재사용을 막고 새로운 프레임을 즉시 받을 준비
                     self.last_displayed_frame = None
                     
-                    # NDI 수신 재개
-                    self.ndi_module.receiver.resume_receiving()
+                    # NDI 수신 재개 (스로틀 프리뷰였으면 켜기 전의 fps 상한/대역폭으로 복귀)
+                    receiver = self.ndi_module.receiver
+                    if getattr(receiver, 'preview_throttle', None) is not None:
+                        receiver.set_preview_throttle(0)
+                    else:
+                        receiver.resume_receiving()
                     
                     # 연결 상태 확인 및 UI 업데이트
                     if self.current_source:
@@ -578,12 +668,8 @@ class ClassicMainWindow(QMainWindow):
         # 프록시/일반 모드 모두 동일한 60fps 유지
         logger.info(f"대역폭 모드 변경: {mode}")
         
-        # 모드 변경 시 프레임 큐 초기화 및 버퍼 크기 조정
-        self.frame_queue.clear()
-        if mode == "proxy":
-            self.max_frame_buffer = 1
-        else:
-            self.max_frame_buffer = 2
+        # 모드 변경 시 이전 모드의 프레임 재사용 방지
+        self.last_displayed_frame = None
             
     def _toggle_connection(self):
         """NDI 연결 토글"""
@@ -634,6 +720,19 @@ class ClassicMainWindow(QMainWindow):
     def _update_performance_stats(self, fps: int, cpu: float, memory: int):
         """Update performance statistics"""
         self.info_status_bar.update_performance_stats(fps, cpu, memory)
+        # Present-time jitter histogram / repeats / skips since the last report
+        self.info_status_bar.update_presentation_stats(self.presentation_scheduler.take_report())
+        
+    def showEvent(self, event):
+        """Follow the refresh rate of the screen the window is shown on"""
+        super().showEvent(event)
+        screen = self.screen()
+        if screen is not None:
+            self.presentation_scheduler.set_display_rate(screen.refreshRate())
+            
+    def get_presentation_stats(self) -> dict:
+        """Cumulative presentation statistics (jitter histogram, repeats, skips, resyncs)"""
+        return self.presentation_scheduler.get_stats()
         
     def _auto_save_settings(self):
         """Auto-save settings"""
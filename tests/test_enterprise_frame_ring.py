@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""엔터프라이즈 FrameRing 테스트 - SPSC 링 소유권 / SDK 버퍼 해제 후 사용 없음 / 처리량"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import enterprise.ndi_manager_enterprise as enterprise_manager
+from enterprise.ndi_manager_enterprise import FrameProcessor, FrameRing, NDIWorkerEnterprise
+
+POISON = 0xEE
+
+
+class PoisoningSDK:
+    """recv_capture_v2 / recv_free_video_v2만 흉내 - 해제된 버퍼는 바로 재사용되고 POISON으로 덮임
+
+    링이 SDK 메모리를 참조한 채로 프레임을 넘기면 소비자가 POISON이나 다음 프레임 값을 보게 된다.
+    """
+    FRAME_TYPE_NONE = 0
+    FRAME_TYPE_VIDEO = 1
+    FRAME_TYPE_AUDIO = 2
+
+    def __init__(self, frames, width=1280, height=720, buffers=2):
+        self.remaining = frames
+        self.free_buffers = [np.empty((height, width, 4), dtype=np.uint8) for _ in range(buffers)]
+        self.captured = 0
+        self.outstanding = 0
+
+    def recv_capture_v2(self, receiver, timeout):
+        if self.remaining == 0 or not self.free_buffers:
+            return self.FRAME_TYPE_NONE, None, None, None
+        self.remaining -= 1
+        self.captured += 1
+        data = self.free_buffers.pop()
+        data.fill(self.captured % 251)
+        frame = type("VideoFrame", (), {})()
+        frame.data, frame.xres, frame.yres = data, data.shape[1], data.shape[0]
+        self.outstanding += 1
+        return self.FRAME_TYPE_VIDEO, frame, None, None
+
+    def recv_free_video_v2(self, receiver, frame):
+        frame.data.fill(POISON)
+        self.free_buffers.append(frame.data)
+        self.outstanding -= 1
+        frame.data = None
+
+
+def make_worker(sdk, capacity=4):
+    enterprise_manager.ndi = sdk
+    worker = NDIWorkerEnterprise()
+    worker.receiver = object()
+    worker.actual_fps = worker.target_fps  # 품질 저하 경로 제외
+    worker.frame_ring = FrameRing(capacity=capacity)
+    return worker
+
+
+def test_push_pop_ownership():
+    ring = FrameRing(capacity=2)
+    frame = np.zeros((4, 8, 4), dtype=np.uint8)
+    for value in (1, 2):
+        frame.fill(value)
+        assert ring.push(frame, 0.0, 8, 4, value)
+    frame.fill(3)
+    assert not ring.push(frame, 0.0, 8, 4, 3)  # 가득 차면 새 프레임을 버림 (읽는 슬롯은 건드리지 않음)
+
+    held = ring.pop()
+    assert held.frame_number == 1 and (held.data == 1).all()
+    assert ring.pop() is None  # 한 번에 한 슬롯만 빌림
+    assert not ring.push(frame, 0.0, 8, 4, 3)  # 빌린 슬롯은 반환 전까지 재사용되지 않음
+    held.release()
+    assert held.data is None
+    assert ring.push(frame, 0.0, 8, 4, 3)
+
+    latest = ring.pop_latest()
+    assert latest.frame_number == 3 and (latest.data == 3).all() and ring.skipped_frames == 1
+    latest.release()
+    latest.release()  # 두 번 해제해도 카운터는 한 번만 진행
+    assert len(ring) == 0 and ring.pop_latest() is None
+    assert ring.stats()["dropped_frames"] == 2 and ring.reallocations == 2
+    print("✅ slots are lent until release, full ring drops the incoming frame")
+
+
+def test_slot_reallocated_only_when_larger():
+    ring = FrameRing(capacity=2)
+    for shape in ((720, 1280, 4), (360, 640, 4), (720, 1280, 4), (1080, 1920, 4), (360, 640, 4)):
+        assert ring.push(np.ones(shape, dtype=np.uint8), 0.0, shape[1], shape[0], 0)
+        frame = ring.pop()
+        assert frame.data.shape == shape
+        frame.release()
+    assert ring.reallocations == 3  # 슬롯0 720p, 슬롯1 360p, 슬롯0 재사용, 슬롯1 1080p로 확장, 슬롯0 축소 재사용
+    print("✅ slot storage grows only for larger frames")
+
+
+def test_qimage_detached_from_slot():
+    ring = FrameRing(capacity=1)
+    ring.push(np.full((36, 64, 4), 10, dtype=np.uint8), 0.0, 64, 36, 1)
+    frame = ring.pop()
+    image = FrameProcessor.convert_to_qimage(frame)
+    frame.release()
+    ring.push(np.full((36, 64, 4), 200, dtype=np.uint8), 0.0, 64, 36, 2)  # 같은 슬롯 덮어쓰기
+    assert image.pixelColor(5, 5).red() == 10
+    print("✅ QImage owns its pixels after the slot is reused")
+
+
+def test_worker_stress_no_use_after_free(frames=1500):
+    """실제 _process_frames 경로 - SDK가 해제 즉시 버퍼를 POISON으로 덮어도 소비자는 항상 원래 값을 봄"""
+    sdk = PoisoningSDK(frames)
+    worker = make_worker(sdk)
+    ring = worker.frame_ring
+    received = []
+    errors = []
+    done = threading.Event()
+
+    def consumer():
+        last = 0
+        while not (done.is_set() and len(ring) == 0):
+            frame = ring.pop()
+            if frame is None:
+                time.sleep(0)
+                continue
+            try:
+                expected = frame.frame_number % 251
+                if frame.frame_number <= last:
+                    errors.append(f"out of order {frame.frame_number} after {last}")
+                if frame.data.min() != expected or frame.data.max() != expected:
+                    errors.append(f"frame {frame.frame_number}: {frame.data.min()}..{frame.data.max()}")
+                last = frame.frame_number
+                received.append(last)
+            finally:
+                frame.release()
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    start = time.perf_counter()
+    while sdk.remaining:
+        worker._process_frames()
+    done.set()
+    thread.join()
+    elapsed = time.perf_counter() - start
+
+    stats = ring.stats()
+    assert not errors, errors[:5]
+    assert sdk.outstanding == 0  # 모든 SDK 프레임이 반환됨
+    assert stats["total_frames"] + stats["dropped_frames"] == frames == sdk.captured
+    assert len(received) == stats["total_frames"] and ring.reallocations <= ring.capacity
+    fps = frames / elapsed
+    gbps = stats["total_frames"] * 1280 * 720 * 4 / elapsed / 1e9
+    print(f"✅ {frames} poisoned 720p frames, 0 use-after-free, {stats['dropped_frames']} dropped: "
+          f"{fps:,.0f} fps ({gbps:.1f} GB/s copied)")
+
+
+def test_lock_free_counters_throughput(frames=100000):
+    """작은 프레임으로 링 자체 비용 측정 - push/pop 당 잠금 없음 (비었거나 가득 차면 GIL만 양보)"""
+    ring = FrameRing(capacity=8)
+    payload = np.zeros((2, 4, 4), dtype=np.uint8)
+    total = [0]
+
+    def consumer():
+        seen = 0
+        while seen < frames:
+            frame = ring.pop()
+            if frame is None:
+                time.sleep(0)
+                continue
+            seen += 1
+            total[0] += frame.frame_number
+            frame.release()
+
+    thread = threading.Thread(target=consumer)
+    start = time.perf_counter()
+    thread.start()
+    number = 1
+    while number <= frames:
+        if ring.push(payload, 0.0, 4, 2, number):
+            number += 1
+        else:
+            time.sleep(0)
+    thread.join()
+    elapsed = time.perf_counter() - start
+    assert total[0] == frames * (frames + 1) // 2  # 빠짐/중복 없음
+    print(f"✅ ring handoff: {frames / elapsed:,.0f} frames/s between two threads")
+
+
+if __name__ == "__main__":
+    test_push_pop_ownership()
+    test_slot_reallocated_only_when_larger()
+    test_qimage_detached_from_slot()
+    test_worker_stress_no_use_after_free()
+    test_lock_free_counters_throughput()
+    print("\nAll enterprise frame ring tests passed!")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""엔터프라이즈 QualityLadder 테스트 - 정수 배율 평균 축소 / 할당 없음 / 처리 시간 히스테리시스"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import enterprise.ndi_manager_enterprise as enterprise_manager
+from enterprise.ndi_manager_enterprise import FrameQuality, NDIWorkerEnterprise, QualityLadder
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def reference_box_average(data, factor):
+    height = data.shape[0] // factor * factor
+    width = data.shape[1] // factor * factor
+    blocks = data[:height, :width].reshape(height // factor, factor, width // factor, factor, -1)
+    return np.floor(blocks.astype(np.float64).mean(axis=(1, 3)) + 0.5).astype(np.uint8)
+
+
+def test_plans_are_precomputed():
+    ladder = QualityLadder()
+    sizes = {quality: ladder.plan((2160, 3840, 4), np.uint8, quality) for quality in FrameQuality}
+    assert sizes[FrameQuality.FULL] is None
+    assert sizes[FrameQuality.HIGH].size == (1920, 1080) and sizes[FrameQuality.HIGH].factor == 2
+    assert sizes[FrameQuality.PREVIEW].size == (640, 360) and sizes[FrameQuality.PREVIEW].factor == 6
+    assert sizes[FrameQuality.HIGH].kind == 'halve'  # cv2 없이 NumPy로
+    assert ladder.plan((1080, 1920, 4), np.uint8, FrameQuality.HIGH) is None  # 이미 한도 이하
+    medium = ladder.plan((1080, 1920, 4), np.uint8, FrameQuality.MEDIUM)
+    if enterprise_manager.cv2 is None:
+        assert medium.size == (960, 540) and medium.factor == 2  # 1.5배는 한도 안의 정수 배율로
+    else:
+        assert medium.size == (1280, 720) and medium.kind == 'cv2'
+    low = ladder.plan((1080, 1920, 4), np.uint8, FrameQuality.LOW)
+    assert low is ladder.plan((1080, 1920, 4), np.uint8, FrameQuality.LOW)  # 같은 포맷이면 재사용
+    print("✅ target sizes and buffers precomputed per level")
+
+
+def test_strided_average_matches_reference():
+    """2의 거듭제곱 배율은 uint32 SWAR 평균 (채널당 오차 1 이하), 나머지 정수 배율은 정확한 반올림 평균"""
+    rng = np.random.default_rng(5)
+    ladder = QualityLadder()
+    for shape, level, factor, kind in (((2160, 3840, 4), FrameQuality.HIGH, 2, 'halve'),
+                                       ((2160, 3840, 4), FrameQuality.LOW, 5, 'sum'),  # 4.5배 -> 5배
+                                       ((1081, 1923, 4), FrameQuality.PREVIEW, 4, 'halve'),  # 나머지 행/열은 잘라냄
+                                       ((1080, 1920, 4), FrameQuality.PREVIEW, 3, 'sum'),
+                                       ((2160, 3840, 4), FrameQuality.PREVIEW, 6, 'sum')):
+        data = rng.integers(0, 256, shape, dtype=np.uint8)
+        ladder.set_level(level)
+        out = ladder.apply(data)
+        plan = ladder.plan(shape, np.uint8, level)
+        if plan.kind == 'cv2':
+            continue
+        assert (plan.factor, plan.kind) == (factor, kind), (shape, plan.factor, plan.kind)
+        error = out.astype(np.int16) - reference_box_average(data, factor)
+        assert np.abs(error).max() <= (1 if kind == 'halve' else 0), shape
+        assert abs(error.mean()) < 0.2, (shape, error.mean())
+    print("✅ box average matches the reference (x2, x4 halving; x3, x5, x6 uint16 sum)")
+
+
+def test_apply_is_allocation_free():
+    data = np.random.default_rng(6).integers(0, 256, (2160, 3840, 4), dtype=np.uint8)
+    ladder = QualityLadder()
+    ladder.set_level(FrameQuality.HIGH)
+    first = ladder.apply(data)  # 계획/버퍼 생성
+    tracemalloc.start()
+    for _ in range(5):
+        out = ladder.apply(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert out is first and peak < 64 * 1024, peak  # 프레임(8MB) 크기 할당 없음
+    start = time.perf_counter()
+    for _ in range(20):
+        ladder.apply(data)
+    per_frame = (time.perf_counter() - start) / 20 * 1000
+    print(f"✅ 4K -> 1080p into the same buffer, peak {peak / 1024:.0f} KB extra, {per_frame:.1f} ms/frame")
+
+
+def test_hysteresis_on_processing_time():
+    clock = FakeClock()
+    ladder = QualityLadder(target_fps=60, clock=clock)
+    budget = 1 / 60
+    changes = []
+
+    def run(seconds, process_time):
+        for _ in range(int(seconds * 60)):
+            clock.now += budget
+            level = ladder.record(process_time)
+            if level is not None:
+                changes.append((round(clock.now, 2), level))
+
+    run(2.0, budget * 0.6)  # 감시선 사이 - 그대로
+    assert not changes
+    run(0.3, budget * 1.2)  # 짧은 스파이크 - 머무름 시간 미달
+    run(1.2, budget * 0.6)
+    assert not changes
+    run(0.6, budget * 1.5)  # 지속 과부하 - 0.5초마다 한 단계씩
+    assert [level for _, level in changes] == [FrameQuality.HIGH], changes
+    run(0.55, budget * 1.5)
+    assert changes[-1][1] == FrameQuality.MEDIUM
+    down = len(changes)
+    run(2.0, budget * 0.5)  # 회복했지만 low watermark(0.4) 위 - 올리지 않음
+    assert len(changes) == down
+    run(3.5, budget * 0.2)  # 3초 이상 여유 - 한 단계만 올림
+    assert len(changes) == down + 1 and changes[-1][1] == FrameQuality.HIGH
+    run(3.5, budget * 0.2)
+    assert changes[-1][1] == FrameQuality.FULL and ladder.transitions == 4
+    print(f"✅ hysteresis: {[(t, level.value) for t, level in changes]}")
+
+
+def test_worker_follows_ladder():
+    worker = NDIWorkerEnterprise()
+    clock = FakeClock()
+    worker.quality_ladder = QualityLadder(clock=clock)
+    frame = type("VideoFrame", (), {})()
+    frame.data = np.full((2160, 3840, 4), 128, dtype=np.uint8)
+    assert worker._copy_to_ring(frame, 0.0)  # FULL - 원본 그대로
+    held = worker.frame_ring.pop()
+    assert held.data.shape == (2160, 3840, 4)
+    held.release()
+
+    worker._decrease_quality()
+    assert worker.quality_ladder.level == FrameQuality.HIGH
+    assert worker._copy_to_ring(frame, 0.0)
+    held = worker.frame_ring.pop()
+    assert held.data.shape == (1080, 1920, 4) and held.quality == FrameQuality.HIGH and (held.data == 128).all()
+    held.release()
+    print("✅ worker downscales through the ladder before copying into the ring")
+
+
+if __name__ == "__main__":
+    test_plans_are_precomputed()
+    test_strided_average_matches_reference()
+    test_apply_is_allocation_free()
+    test_hysteresis_on_processing_time()
+    test_worker_follows_ladder()
+    print("\nAll enterprise quality ladder tests passed!")
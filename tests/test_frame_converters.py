@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""FourCC별 RGB32 변환기 테스트 - 색 정확도 / 버퍼 재사용 / 포맷별 마이크로벤치마크"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtGui import QImage
+
+from ndi_app.ndi_core import frame_converters
+from ndi_app.ndi_core.frame_converters import CONVERTERS, RGB32FrameConverter
+
+WIDTH, HEIGHT = 1920, 1080
+
+
+def yuv_reference(y, u, v):
+    """BT.601 limited range 부동소수점 기준값 (B, G, R)"""
+    c, d, e = y.astype(np.float64) - 16, u.astype(np.float64) - 128, v.astype(np.float64) - 128
+    r = 1.164 * c + 1.596 * e
+    g = 1.164 * c - 0.391 * d - 0.813 * e
+    b = 1.164 * c + 2.018 * d
+    return np.clip(np.stack([b, g, r], axis=-1), 0, 255)
+
+
+def make_sources(width, height, seed=1):
+    """포맷별 원본 바이트와 픽셀 단위 기준 BGR"""
+    rng = np.random.default_rng(seed)
+    bgra = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    y = rng.integers(16, 236, (height, width), dtype=np.uint8)
+    u = rng.integers(16, 241, (height, width // 2), dtype=np.uint8)
+    v = rng.integers(16, 241, (height, width // 2), dtype=np.uint8)
+
+    uyvy = np.empty((height, width, 2), dtype=np.uint8)
+    uyvy[..., 1] = y
+    uyvy[:, 0::2, 0] = u
+    uyvy[:, 1::2, 0] = v
+    ref_422 = yuv_reference(y, np.repeat(u, 2, axis=1), np.repeat(v, 2, axis=1))
+
+    p216 = np.empty(height * width * 2, dtype=np.uint16)
+    p216[:height * width] = (y.astype(np.uint16) << 8).ravel() | 0x55
+    uv = np.empty((height, width), dtype=np.uint16)
+    uv[:, 0::2] = u.astype(np.uint16) << 8
+    uv[:, 1::2] = v.astype(np.uint16) << 8
+    p216[height * width:] = uv.ravel()
+
+    u420, v420 = u[0::2], v[0::2]
+    nv12 = np.empty(height * width * 3 // 2, dtype=np.uint8)
+    nv12[:height * width] = y.ravel()
+    uv420 = np.empty((height // 2, width), dtype=np.uint8)
+    uv420[:, 0::2] = u420
+    uv420[:, 1::2] = v420
+    nv12[height * width:] = uv420.ravel()
+    ref_420 = yuv_reference(y, np.repeat(np.repeat(u420, 2, axis=1), 2, axis=0),
+                            np.repeat(np.repeat(v420, 2, axis=1), 2, axis=0))
+
+    return {
+        'BGRA': (bgra.ravel(), bgra[..., :3].astype(np.float64)),
+        'RGBA': (bgra[..., [2, 1, 0, 3]].ravel(), bgra[..., :3].astype(np.float64)),
+        'UYVY': (uyvy.ravel(), ref_422),
+        'P216': (p216.view(np.uint8), ref_422),
+        'NV12': (nv12, ref_420),
+    }
+
+
+def test_registry():
+    for fourcc in ('BGRA', 'BGRX', 'RGBA', 'RGBX', 'UYVY', 'UYVA', 'P216', 'PA16', 'NV12'):
+        assert fourcc in CONVERTERS, fourcc
+    assert not RGB32FrameConverter.supports('I420')
+    print(f"✅ converters registered for {len(CONVERTERS)} FourCCs (cv2 {'on' if frame_converters.cv2 else 'off'})")
+
+
+def test_conversion_accuracy():
+    converter = RGB32FrameConverter()
+    for fourcc, (src, reference) in make_sources(320, 180).items():
+        out = converter.convert(src, 320, 180, fourcc)
+        assert out.shape == (180, 320, 4) and out.dtype == np.uint8
+        error = np.abs(out[..., :3] - reference).max()
+        assert error <= 1.0, (fourcc, error)  # 고정소수점 반올림 차이
+        if fourcc != 'BGRA':
+            assert (out[..., 3] == 255).all() or fourcc == 'RGBA'
+        del out
+    print("✅ BGRA / RGBA / UYVY / P216 / NV12 within 1 level of the BT.601 reference")
+
+
+def test_stride_and_odd_width():
+    converter = RGB32FrameConverter()
+    src, reference = make_sources(64, 8)['UYVY']
+    padded = np.zeros((8, 64 * 2 + 32), dtype=np.uint8)
+    padded[:, :128] = src.reshape(8, 128)
+    out = converter.convert(padded.ravel(), 64, 8, 'UYVY', stride=64 * 2 + 32)
+    assert np.abs(out[..., :3] - reference).max() <= 1.0
+    bgra = np.arange(7 * 4 * 4, dtype=np.uint8)
+    assert converter.convert(bgra, 7, 4, 'BGRA').shape == (4, 6, 4)  # 크로마 쌍 단위로 짝수 폭
+    print("✅ padded rows and odd widths")
+
+
+def test_qimage_wraps_without_conversion():
+    converter = RGB32FrameConverter()
+    src, _ = make_sources(64, 36)['UYVY']
+    out = converter.convert(src, 64, 36, 'UYVY')
+    image = QImage(out.data, 64, 36, out.strides[0], QImage.Format.Format_RGB32)
+    color = image.pixelColor(10, 5)
+    assert (color.blue(), color.green(), color.red()) == tuple(out[5, 10, :3])
+    print("✅ output is QImage Format_RGB32 as-is")
+
+
+def test_buffers_reused_only_when_released():
+    converter = RGB32FrameConverter(max_buffers=3)
+    src, _ = make_sources(64, 36)['BGRA']
+    address = lambda buffer: buffer.__array_interface__['data'][0]
+    held = [converter.convert(src, 64, 36, 'BGRA') for _ in range(3)]
+    assert len({address(buffer) for buffer in held}) == 3
+    assert converter.convert(src, 64, 36, 'BGRA') is None and converter.dropped_frames == 1  # 모두 사용 중
+    first_address = address(held[0])
+    held.pop(0)
+    again = converter.convert(src, 64, 36, 'BGRA')
+    assert address(again) == first_address and converter.allocated_buffers == 3
+    view = again[:10]
+    del again
+    assert converter.convert(src, 64, 36, 'BGRA') is None  # 뷰가 남아 있으면 재사용하지 않음
+    image = QImage(view.data, 64, 10, view.strides[0], QImage.Format.Format_RGB32)
+    del view
+    assert converter.convert(src, 64, 36, 'BGRA') is None  # QImage가 감싼 버퍼도 참조로 유지
+    del image
+    assert converter.convert(src, 64, 36, 'BGRA') is not None
+    print("✅ output buffers come back only after every reference is gone")
+
+
+def test_microbenchmarks():
+    """1080p 포맷별 변환 시간과 변환 중 추가 할당량"""
+    converter = RGB32FrameConverter()
+    lines = []
+    for fourcc, (src, _) in make_sources(WIDTH, HEIGHT).items():
+        converter.convert(src, WIDTH, HEIGHT, fourcc)  # 버퍼/중간 버퍼 할당
+        tracemalloc.start()
+        converter.convert(src, WIDTH, HEIGHT, fourcc)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert peak < 64 * 1024, (fourcc, peak)
+
+        runs = 5
+        start = time.perf_counter()
+        for _ in range(runs):
+            converter.convert(src, WIDTH, HEIGHT, fourcc)
+        per_frame = (time.perf_counter() - start) / runs * 1000
+        lines.append(f"{fourcc} {per_frame:.1f} ms")
+    assert converter.allocated_buffers == 1
+    print(f"✅ 1080p -> RGB32 ({'cv2' if frame_converters.cv2 else 'NumPy'}): " + ", ".join(lines))
+
+
+if __name__ == "__main__":
+    test_registry()
+    test_conversion_accuracy()
+    test_stride_and_odd_width()
+    test_qimage_wraps_without_conversion()
+    test_buffers_reused_only_when_released()
+    test_microbenchmarks()
+    print("\nAll frame converter tests passed!")
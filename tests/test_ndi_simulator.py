@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""NDI 시뮬레이터 테스트 - 포맷/제로 카피 패턴/절대 데드라인 페이싱/드롭/처리량"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pd_app.core.ndi_simulator import (FRAME_TYPE_AUDIO, FRAME_TYPE_NONE, FRAME_TYPE_VIDEO,
+                                       FOURCC_VIDEO_TYPE_P216, FOURCC_VIDEO_TYPE_UYVY,
+                                       NDISimulator, RecvCreateV3, SimulatorConfig)
+
+
+class FakeClock:
+    """sleep은 시간을 정확히 진행 - 바쁜 대기 구간은 호출마다 조금씩 진행"""
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        self.now += 1e-6
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def connect(config, clock=None):
+    clock = clock or FakeClock()
+    sim = NDISimulator(config, clock=clock, sleep=getattr(clock, 'sleep', time.sleep))
+    sim.initialize()
+    source = sim.find_get_current_sources(sim.find_create_v2())[0]
+    receiver = sim.recv_create_v3(RecvCreateV3(source))
+    sim.recv_connect(receiver, source)
+    return sim, receiver, clock
+
+
+def capture_video(sim, receiver, count, timeout=100):
+    frames = []
+    while len(frames) < count:
+        frame_type, video, audio, _ = sim.recv_capture_v2(receiver, timeout)
+        if frame_type == FRAME_TYPE_VIDEO:
+            frames.append(video)
+    return frames
+
+
+def test_pixel_formats():
+    for pixel_format, shape, dtype in (("BGRA", (72, 128, 4), np.uint8), ("UYVY", (72, 128, 2), np.uint8),
+                                       ("P216", (144, 128), np.uint16)):
+        sim, receiver, _ = connect(SimulatorConfig(width=128, height=72, pixel_format=pixel_format, paced=False))
+        video = capture_video(sim, receiver, 1)[0]
+        assert video.data.shape == shape and video.data.dtype == dtype, (pixel_format, video.data.shape)
+        assert video.line_stride_in_bytes == 128 * video.data.itemsize * (shape[2] if len(shape) == 3 else 1)
+        assert (video.xres, video.yres) == (128, 72)
+    assert video.FourCC == FOURCC_VIDEO_TYPE_P216 and video.data[0, 64] == 63 << 8  # 마젠타 바 Y
+    print("✅ BGRA / UYVY / P216 frame layouts")
+
+
+def test_patterns_are_shared_views():
+    sim, receiver, _ = connect(SimulatorConfig(width=256, height=144, pixel_format="UYVY", pattern_frames=4,
+                                               paced=False))
+    frames = capture_video(sim, receiver, 8)
+    assert frames[0].FourCC == FOURCC_VIDEO_TYPE_UYVY
+    assert np.shares_memory(frames[0].data, frames[4].data) and not frames[0].data.flags.writeable
+    assert not np.array_equal(frames[0].data, frames[1].data)  # 이동 막대
+    print("✅ frames are read-only views of the precomputed patterns")
+
+
+def test_absolute_deadline_pacing():
+    """59.94p 600프레임 - 타임스탬프/도착 시각 모두 누적 오차 없음, 오디오는 800/801 샘플"""
+    config = SimulatorConfig(width=64, height=36, fps=59.94, audio_channels=2)
+    sim, receiver, clock = connect(config)
+    start = receiver.start_time
+    arrivals, timestamps, samples = [], [], []
+    while len(arrivals) < 600:
+        frame_type, video, audio, _ = sim.recv_capture_v2(receiver, 5)
+        if frame_type == FRAME_TYPE_VIDEO:
+            arrivals.append(clock.now - start)
+            timestamps.append(video.timestamp)
+        elif frame_type == FRAME_TYPE_AUDIO:
+            samples.append(audio.no_samples)
+            assert audio.data.shape == (2, audio.no_samples)
+    assert config.frame_rate == (60000, 1001)
+    assert abs(arrivals[-1] - 599 * 1001 / 60000) < 1e-4, arrivals[-1]
+    assert timestamps[-1] == 599 * 10_000_000 * 1001 // 60000
+    assert set(samples) == {800, 801} and sum(samples[:5]) == 4004
+    assert sim.get_stats(receiver)['max_late_ms'] < 0.1
+    print(f"✅ absolute-deadline pacing (frame 599 at {arrivals[-1] * 1000:.3f} ms)")
+
+
+def test_jitter_and_drops():
+    config = SimulatorConfig(width=64, height=36, fps=60, jitter_ms=4.0, drop_rate=0.1, seed=7, audio_channels=0)
+    sim, receiver, clock = connect(config)
+    start = receiver.start_time
+    frames = capture_video(sim, receiver, 500)
+    indices = [round(frame.timestamp * 60 / 10_000_000) for frame in frames]
+    stats = sim.get_stats(receiver)
+    assert stats['frames_dropped'] == indices[-1] + 1 - 500 and 20 < stats['frames_dropped'] < 90
+    assert clock.now - start < (indices[-1] + 1) / 60 + 0.004  # 지터가 누적되지 않음
+    print(f"✅ jitter/drops ({stats['frames_dropped']} dropped of {indices[-1] + 1})")
+
+
+def test_unpaced_4k60_throughput():
+    """대기 없이 4K UYVY - 수신 경로 부하 측정용 프레임 공급 속도"""
+    sim, receiver, _ = connect(SimulatorConfig(width=3840, height=2160, pixel_format="UYVY", paced=False),
+                               clock=time.perf_counter)
+    capture_video(sim, receiver, 10)
+    start = time.perf_counter()
+    capture_video(sim, receiver, 600)
+    fps = 600 / (time.perf_counter() - start)
+    assert fps > 60 * 10, fps
+    print(f"✅ unpaced 4K60 UYVY supply: {fps:,.0f} fps")
+
+
+def test_timeout_returns_none():
+    sim, receiver, clock = connect(SimulatorConfig(width=64, height=36, fps=1, audio_channels=0))
+    capture_video(sim, receiver, 1)
+    assert sim.recv_capture_v2(receiver, 100)[0] == FRAME_TYPE_NONE
+    print("✅ capture returns NONE when no frame is due within the timeout")
+
+
+if __name__ == "__main__":
+    test_pixel_formats()
+    test_patterns_are_shared_views()
+    test_absolute_deadline_pacing()
+    test_jitter_and_drops()
+    test_unpaced_4k60_throughput()
+    test_timeout_returns_none()
+    print("\nAll NDI simulator tests passed!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""공유 메모리 프레임 링 테스트 - 프로세스 간 슬롯 인덱스 전달"""
+
+import gc
+import multiprocessing as mp
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ndi_app.ndi_core.shared_frame_ring import SharedFrameRing
+
+
+def _producer(index_queue, status_queue, frame_count):
+    """워커 프로세스 흉내 - 링을 만들고 (slot, seq)만 전송"""
+    ring = SharedFrameRing.create(4, 360 * 640 * 4)
+    status_queue.put(ring.name)
+    for i in range(frame_count):
+        frame = np.full((360, 640, 4), i % 256, dtype=np.uint8)
+        written = ring.write(frame, fourcc=0x41524742)
+        if written is not None:
+            index_queue.put(written)
+        time.sleep(0.002)
+    index_queue.put(None)
+    status_queue.get(timeout=10)  # 소비자가 끝날 때까지 링 유지
+    ring.close()
+
+
+def test_cross_process_zero_copy():
+    """다른 프로세스가 쓴 프레임을 복사 없이 읽을 수 있어야 함"""
+    index_queue = mp.Queue()
+    status_queue = mp.Queue()
+    process = mp.Process(target=_producer, args=(index_queue, status_queue, 30))
+    process.start()
+    try:
+        ring = SharedFrameRing.attach(status_queue.get(timeout=10))
+        received = 0
+        while True:
+            item = index_queue.get(timeout=10)
+            if item is None:
+                break
+            slot, seq = item
+            view = ring.view(slot, seq)
+            if view is None:
+                continue  # 이미 덮어써진 프레임
+            assert view.shape == (360, 640, 4)
+            assert view.base is not None  # 복사본이 아닌 공유 메모리 뷰
+            assert np.all(view == view[0, 0, 0])  # 찢어진 프레임 없음
+            assert ring.fourcc(slot) == 0x41524742
+            received += 1
+            del view
+        assert received > 0
+        gc.collect()
+        assert ring.close()
+        status_queue.put('done')
+    finally:
+        process.join(timeout=10)
+    print(f"✅ received {received} frames through shared memory")
+
+
+def test_held_slot_not_overwritten():
+    """GUI가 붙잡고 있는 슬롯은 워커가 덮어쓰지 않아야 함"""
+    ring = SharedFrameRing.create(2, 16 * 16 * 4)
+    try:
+        slot, seq = ring.write(np.full((16, 16, 4), 7, dtype=np.uint8))
+        held = ring.view(slot, seq)
+        for value in range(5):
+            ring.write(np.full((16, 16, 4), value, dtype=np.uint8))
+        assert np.all(held == 7)
+        assert not ring.close()  # 뷰가 살아있는 동안 닫히지 않음
+        del held
+        gc.collect()
+    finally:
+        assert ring.close()
+    print("✅ held slot protected")
+
+
+def test_claimed_slot_cannot_be_viewed():
+    """워커가 쓰기용으로 고른 슬롯은 hold 확인 전에 이미 무효화되어 GUI가 뷰를 만들 수 없어야 함"""
+    ring = SharedFrameRing.create(2, 16 * 16 * 4)
+    try:
+        slot, seq = ring.write(np.full((16, 16, 4), 1, dtype=np.uint8))
+        ring._next_slot = slot
+        assert ring._acquire_slot() == slot
+        assert ring.view(slot, seq) is None  # 덮어쓰는 중인 슬롯
+        assert ring._ctrl[slot, SharedFrameRing.F_HOLD] == 0
+    finally:
+        assert ring.close()
+    print("✅ claimed slot invalidated before the hold check")
+
+
+if __name__ == "__main__":
+    test_held_slot_not_overwritten()
+    test_claimed_slot_cannot_be_viewed()
+    test_cross_process_zero_copy()
+    print("\nAll shared frame ring tests passed!")